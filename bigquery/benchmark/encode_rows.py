@@ -0,0 +1,76 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the per-row cost of converting rows for streaming inserts."""
+
+import datetime
+import sys
+import timeit
+
+import pandas
+
+from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import _row_encoder
+
+SCHEMA = [
+    SchemaField('id', 'INTEGER', mode='REQUIRED'),
+    SchemaField('name', 'STRING'),
+    SchemaField('score', 'FLOAT'),
+    SchemaField('active', 'BOOLEAN'),
+    SchemaField('created', 'TIMESTAMP'),
+    SchemaField('comment', 'STRING'),
+]
+
+
+def per_field_lookup(rows):
+    """The conversion loop used before rows were encoded per schema."""
+    json_rows = []
+    for row in rows:
+        json_row = {}
+        for field, value in zip(SCHEMA, row):
+            converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+            if converter is not None:
+                value = converter(value)
+            json_row[field.name] = value
+        json_rows.append(json_row)
+    return json_rows
+
+
+def compiled_encoder(rows):
+    return _row_encoder(SCHEMA).encode_rows(rows)
+
+
+def main(num_rows=100000, repeat=5):
+    now = datetime.datetime.utcnow()
+    rows = [
+        (index, 'name', index * 0.5, bool(index % 2), now, None)
+        for index in range(num_rows)
+    ]
+    dataframe = pandas.DataFrame.from_records(
+        rows, columns=[field.name for field in SCHEMA])
+
+    cases = (
+        ('per-field lookup', lambda: per_field_lookup(rows)),
+        ('compiled encoder', lambda: compiled_encoder(rows)),
+        ('dataframe columns',
+         lambda: _row_encoder(SCHEMA).encode_dataframe(dataframe)),
+    )
+    for label, case in cases:
+        best = min(timeit.repeat(case, number=1, repeat=repeat))
+        print('{0}: {1:.2f} usec/row'.format(label, best / num_rows * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,111 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare sequential and concurrent ``Client.list_rows`` paging.
+
+Runs a local fake ``tabledata.list`` server which adds a fixed latency to
+every response, so no project or credentials are needed.
+"""
+
+import json
+import sys
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib.parse import parse_qs
+from six.moves.urllib.parse import urlparse
+import requests
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import bigquery
+from google.cloud.bigquery import _http
+
+NUM_ROWS = 100000
+PAGE_SIZE = 5000
+LATENCY = 0.2
+SCHEMA = [
+    bigquery.SchemaField('id', 'INTEGER', mode='REQUIRED'),
+    bigquery.SchemaField('name', 'STRING'),
+]
+
+
+class FakeTableDataHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        if 'startIndex' in params:
+            start = int(params['startIndex'][0])
+        else:
+            start = int(params.get('pageToken', ['0'])[0])
+        count = int(params.get('maxResults', [PAGE_SIZE])[0])
+        end = min(start + count, NUM_ROWS)
+        response = {
+            'totalRows': str(NUM_ROWS),
+            'rows': [
+                {'f': [{'v': str(index)}, {'v': 'name-{}'.format(index)}]}
+                for index in range(start, end)
+            ],
+        }
+        if end < NUM_ROWS:
+            response['pageToken'] = str(end)
+
+        time.sleep(LATENCY)
+        body = json.dumps(response).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def main(worker_counts=(None, 2, 4, 8)):
+    server = FakeServer(('127.0.0.1', 0), FakeTableDataHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    _http.Connection.API_BASE_URL = 'http://127.0.0.1:{}'.format(
+        server.server_address[1])
+
+    client = bigquery.Client(
+        project='benchmark', credentials=AnonymousCredentials(),
+        _http=requests.Session())
+    table = client.dataset('dataset').table('table')
+
+    for max_workers in worker_counts:
+        start_time = time.time()
+        rows = client.list_rows(
+            table, selected_fields=SCHEMA, page_size=PAGE_SIZE,
+            max_workers=max_workers)
+        num_rows = sum(1 for _ in rows)
+        elapsed = time.time() - start_time
+        print('max_workers={0}: {1} rows in {2:.2f} sec'.format(
+            max_workers, num_rows, elapsed))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main()
@@ -0,0 +1,88 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare row-by-row and columnar DataFrame construction.
+
+Serves synthetic ``tabledata.list`` pages from memory, so no project or
+credentials are needed.
+"""
+
+import sys
+import time
+
+import pandas
+
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import RowIterator
+
+SCHEMA = [
+    SchemaField('id', 'INTEGER', mode='REQUIRED'),
+    SchemaField('name', 'STRING'),
+    SchemaField('score', 'FLOAT'),
+    SchemaField('active', 'BOOLEAN'),
+    SchemaField('created', 'TIMESTAMP'),
+]
+
+
+def make_pages(num_rows, page_size):
+    rows = [
+        {'f': [
+            {'v': str(index)},
+            {'v': 'name-{}'.format(index)},
+            {'v': str(index * 0.5)},
+            {'v': 'true' if index % 2 else 'false'},
+            {'v': '{}.0'.format(1500000000 + index)},
+        ]}
+        for index in range(num_rows)
+    ]
+    pages = []
+    for start in range(0, num_rows, page_size):
+        page = {'rows': rows[start:start + page_size]}
+        if start + page_size < num_rows:
+            page['pageToken'] = str(start + page_size)
+        pages.append(page)
+    return pages
+
+
+def make_iterator(pages):
+    responses = iter(pages)
+
+    def api_request(method, path, query_params):
+        return next(responses)
+
+    return RowIterator(None, api_request, '/benchmark', SCHEMA)
+
+
+def row_path(iterator):
+    column_names = [field.name for field in iterator.schema]
+    rows = (row.values() for row in iter(iterator))
+    return pandas.DataFrame(rows, columns=column_names)
+
+
+def columnar_path(iterator):
+    return iterator.to_dataframe()
+
+
+def main(num_rows=500000, page_size=50000):
+    pages = make_pages(num_rows, page_size)
+    for label, build in (('rows', row_path), ('columnar', columnar_path)):
+        start_time = time.time()
+        df = build(make_iterator(pages))
+        elapsed = time.time() - start_time
+        print('{0}: {1} rows in {2:.2f} sec ({3:.0f} rows/sec)'.format(
+            label, len(df), elapsed, len(df) / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
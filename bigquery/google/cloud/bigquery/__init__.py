@@ -42,6 +42,7 @@ from google.cloud.bigquery.external_config import BigtableColumn
 from google.cloud.bigquery.external_config import CSVOptions
 from google.cloud.bigquery.external_config import GoogleSheetsOptions
 from google.cloud.bigquery.external_config import ExternalSourceFormat
+from google.cloud.bigquery.insert_batcher import InsertBatcher
 from google.cloud.bigquery.job import Compression
 from google.cloud.bigquery.job import CopyJob
 from google.cloud.bigquery.job import CopyJobConfig
@@ -58,8 +59,10 @@ from google.cloud.bigquery.job import QueryPriority
 from google.cloud.bigquery.job import SchemaUpdateOption
 from google.cloud.bigquery.job import SourceFormat
 from google.cloud.bigquery.job import UnknownJob
+from google.cloud.bigquery.job import wait_for_jobs
 from google.cloud.bigquery.job import WriteDisposition
 from google.cloud.bigquery.query import ArrayQueryParameter
+from google.cloud.bigquery.query_cache import QueryResultCache
 from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
@@ -81,6 +84,7 @@ __all__ = [
     'ArrayQueryParameter',
     'ScalarQueryParameter',
     'StructQueryParameter',
+    'QueryResultCache',
     # Datasets
     'Dataset',
     'DatasetReference',
@@ -97,8 +101,11 @@ __all__ = [
     'LoadJob',
     'LoadJobConfig',
     'UnknownJob',
+    'wait_for_jobs',
     'TimePartitioningType',
     'TimePartitioning',
+    # Streaming inserts
+    'InsertBatcher',
     # Shared helpers
     'SchemaField',
     'UDFResource',
@@ -21,13 +21,13 @@ import decimal
 from google.cloud._helpers import UTC
 from google.cloud._helpers import _date_from_iso8601_date
 from google.cloud._helpers import _datetime_from_microseconds
-from google.cloud._helpers import _microseconds_from_datetime
 from google.cloud._helpers import _RFC3339_NO_FRACTION
 from google.cloud._helpers import _to_bytes
 
 _RFC3339_MICROS_NO_ZULU = '%Y-%m-%dT%H:%M:%S.%f'
 _TIMEONLY_WO_MICROS = '%H:%M:%S'
 _TIMEONLY_W_MICROS = '%H:%M:%S.%f'
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC)
 
 
 def _not_null(value, field):
@@ -221,6 +221,50 @@ def _row_tuple_from_json(row, schema):
     return tuple(row_data)
 
 
+def _columns_from_json(rows, schema):
+    """Convert JSON row data to per-column lists with appropriate types.
+
+    Each field's converter is looked up once and applied down its column, so
+    no intermediate row tuple is built.
+
+    Note:  ``row['f']`` and ``schema`` are presumed to be of the same length.
+
+    :type rows: Sequence[dict]
+    :param rows: JSON response rows to be converted.
+
+    :type schema: tuple
+    :param schema: A tuple of
+                   :class:`~google.cloud.bigquery.schema.SchemaField`.
+
+    :rtype: list
+    :returns: One list of native values per field in ``schema``.
+    """
+    return [_column_from_json(rows, index, field)
+            for index, field in enumerate(schema)]
+
+
+def _column_from_json(rows, index, field):
+    """Convert one column of JSON row data to a list of native values.
+
+    :type rows: Sequence[dict]
+    :param rows: JSON response rows to be converted.
+
+    :type index: int
+    :param index: Position of the column in each row.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The schema field of the column.
+
+    :rtype: list
+    :returns: The converted value of the column in each row.
+    """
+    converter = _CELLDATA_FROM_JSON[field.field_type]
+    if field.mode == 'REPEATED':
+        return [[converter(item['v'], field) for item in row['f'][index]['v']]
+                for row in rows]
+    return [converter(row['f'][index]['v'], field) for row in rows]
+
+
 def _rows_from_json(values, schema):
     """Convert JSON row data to rows with appropriate types."""
     from google.cloud.bigquery import Row
@@ -283,7 +327,13 @@ def _timestamp_to_json_row(value):
     This version returns floating-point seconds value used in row data.
     """
     if isinstance(value, datetime.datetime):
-        value = _microseconds_from_datetime(value) * 1e-6
+        if not value.tzinfo:
+            value = value.replace(tzinfo=UTC)
+        # Same result as ``google.cloud._helpers._microseconds_from_datetime``,
+        # without building a time tuple.
+        delta = value - _EPOCH
+        value = ((delta.days * 86400 + delta.seconds) * 1000000 +
+                 delta.microseconds) * 1e-6
     return value
 
 
@@ -0,0 +1,200 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helpers for loading pandas DataFrames into BigQuery."""
+
+import os
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+
+_NO_PYARROW_ERROR = (
+    'The pyarrow library is not installed, please install '
+    'pyarrow to use the load_table_from_dataframe() function.'
+)
+_DEFAULT_ROW_GROUP_SIZE = 100000
+
+
+def _iter_row_groups(dataframes, row_group_size):
+    """Split DataFrames into slices of at most ``row_group_size`` rows.
+
+    An empty DataFrame yields one empty slice, so that its columns still
+    determine the schema of the file.
+    """
+    for dataframe in dataframes:
+        for start in range(0, max(len(dataframe), 1), row_group_size):
+            yield dataframe.iloc[start:start + row_group_size]
+
+
+class _ByteSink(object):
+    """Writable file-like object which appends to a ``bytearray``."""
+
+    closed = False
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._position = 0
+
+    def write(self, data):
+        self._buffer.extend(data)
+        self._position += len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+
+class ParquetStream(object):
+    """Readable stream of Parquet file bytes, encoded as they are read.
+
+    DataFrames are converted and written one row group at a time, only when
+    a :meth:`read` needs more bytes, so at most one row group of encoded
+    data is buffered, regardless of the total size of the data.
+
+    To allow an upload to resend its last chunk, the stream can
+    :meth:`seek` back to the position at which the last :meth:`read`
+    started, but no further.
+
+    Args:
+        dataframes (Union[ \
+            pandas.DataFrame, \
+            Iterable[pandas.DataFrame], \
+        ]):
+            A DataFrame, or DataFrames to write in order. All of them must
+            have the same columns and column types.
+        row_group_size (int):
+            (Optional) Maximum number of rows in each Parquet row group.
+
+    Raises:
+        ImportError: If :mod:`pyarrow` is not installed.
+        ValueError: If ``dataframes`` is empty.
+    """
+
+    def __init__(self, dataframes, row_group_size=_DEFAULT_ROW_GROUP_SIZE):
+        if pyarrow is None:
+            raise ImportError(_NO_PYARROW_ERROR)
+        if pandas is not None and isinstance(dataframes, pandas.DataFrame):
+            dataframes = (dataframes,)
+
+        self._row_groups = _iter_row_groups(dataframes, row_group_size)
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._position = 0
+        self._schema = None
+        self._columns = None
+        self._writer = None
+        self._finished = False
+
+        if not self._write_row_group():
+            raise ValueError('No DataFrames to load.')
+
+    def _write_row_group(self):
+        """Encode the next row group, or the file footer after the last.
+
+        Returns:
+            bool: False if the stream was already complete.
+
+        Raises:
+            ValueError:
+                If the DataFrame has other columns than the first one.
+        """
+        if self._finished:
+            return False
+
+        dataframe = next(self._row_groups, None)
+        if dataframe is None:
+            self._finished = True
+            if self._writer is None:
+                return False
+            self._writer.close()
+            return True
+
+        columns = list(dataframe.columns)
+        if self._columns is not None and columns != self._columns:
+            raise ValueError(
+                'All DataFrames must have the same columns: expected {}, '
+                'got {}.'.format(self._columns, columns))
+
+        table = pyarrow.Table.from_pandas(dataframe, schema=self._schema)
+        if self._writer is None:
+            self._schema = table.schema
+            self._columns = columns
+            self._writer = pyarrow.parquet.ParquetWriter(
+                _ByteSink(self._buffer), self._schema)
+        self._writer.write_table(table)
+        return True
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes, encoding more row groups as needed.
+
+        Args:
+            size (int):
+                (Optional) Maximum number of bytes to read. If negative,
+                read until the end of the stream.
+
+        Returns:
+            bytes: The data read. Empty once the stream is exhausted.
+        """
+        # Bytes before the current position are never needed again.
+        del self._buffer[:self._position - self._buffer_start]
+        self._buffer_start = self._position
+
+        while size < 0 or len(self._buffer) < size:
+            if not self._write_row_group():
+                break
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """Return the current position in the stream."""
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move back to an already-read position which is still buffered.
+
+        Args:
+            offset (int): Position in the stream, from its start.
+            whence (int): (Optional) Must be :data:`os.SEEK_SET`.
+
+        Returns:
+            int: The new position.
+
+        Raises:
+            ValueError:
+                If ``whence`` is not :data:`os.SEEK_SET`, or if ``offset``
+                is outside the buffered data.
+        """
+        if whence != os.SEEK_SET:
+            raise ValueError('Parquet streams only support os.SEEK_SET.')
+        if not (self._buffer_start <= offset <= self._position):
+            raise ValueError(
+                'Cannot seek to {}: only positions {} to {} are '
+                'buffered.'.format(
+                    offset, self._buffer_start, self._position))
+        self._position = offset
+        return offset
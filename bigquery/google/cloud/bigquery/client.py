@@ -33,9 +33,9 @@ import google.cloud._helpers
 from google.cloud import exceptions
 from google.cloud.client import ClientWithProject
 
-from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
 from google.cloud.bigquery._helpers import _str_or_none
 from google.cloud.bigquery._http import Connection
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery.dataset import Dataset
 from google.cloud.bigquery.dataset import DatasetListItem
 from google.cloud.bigquery.dataset import DatasetReference
@@ -47,7 +47,7 @@ from google.cloud.bigquery.table import TableListItem
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import RowIterator
 from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
-from google.cloud.bigquery.table import _row_from_mapping
+from google.cloud.bigquery.table import _row_encoder
 
 
 _DEFAULT_CHUNKSIZE = 1048576  # 1024 * 1024 B = 1 MB
@@ -113,6 +113,9 @@ class Client(ClientWithProject):
         default_query_job_config (google.cloud.bigquery.job.QueryJobConfig):
             (Optional) Default ``QueryJobConfig``.
             Will be merged into job configs passed into the ``query`` method.
+        query_cache (google.cloud.bigquery.query_cache.QueryResultCache):
+            (Optional) Cache in which to keep the results of queries, so that
+            repeating a query can be answered without running a job.
 
     Raises:
         google.auth.exceptions.DefaultCredentialsError:
@@ -126,18 +129,26 @@ class Client(ClientWithProject):
 
     def __init__(
             self, project=None, credentials=None, _http=None,
-            location=None, default_query_job_config=None):
+            location=None, default_query_job_config=None, query_cache=None):
         super(Client, self).__init__(
             project=project, credentials=credentials, _http=_http)
         self._connection = Connection(self)
         self._location = location
         self._default_query_job_config = default_query_job_config
+        self._query_cache = query_cache
 
     @property
     def location(self):
         """Default location for jobs / datasets / tables."""
         return self._location
 
+    @property
+    def query_cache(self):
+        """Union[google.cloud.bigquery.query_cache.QueryResultCache, None]:
+        Cache of query results used by :meth:`query`, if any.
+        """
+        return self._query_cache
+
     def get_service_account_email(self, project=None):
         """Get the email address of the project's BigQuery service account
 
@@ -913,7 +924,7 @@ class Client(ClientWithProject):
             self, file_obj, destination, rewind=False, size=None,
             num_retries=_DEFAULT_NUM_RETRIES, job_id=None,
             job_id_prefix=None, location=None, project=None,
-            job_config=None):
+            job_config=None, chunk_size=None):
         """Upload the contents of this table from a file-like object.
 
         Similar to :meth:`load_table_from_uri`, this method creates, starts and
@@ -952,6 +963,10 @@ class Client(ClientWithProject):
                 to the client's project.
             job_config (google.cloud.bigquery.job.LoadJobConfig):
                 (Optional) Extra configuration options for the job.
+            chunk_size (int):
+                (Optional) The number of bytes sent in each request of a
+                resumable upload. Must be a multiple of 256 KB. Defaults to
+                1 MB.
 
         Returns:
             google.cloud.bigquery.job.LoadJob: A new load job.
@@ -986,7 +1001,8 @@ class Client(ClientWithProject):
         try:
             if size is None or size >= _MAX_MULTIPART_SIZE:
                 response = self._do_resumable_upload(
-                    file_obj, job_resource, num_retries)
+                    file_obj, job_resource, num_retries,
+                    chunk_size=chunk_size)
             else:
                 response = self._do_multipart_upload(
                     file_obj, job_resource, size, num_retries)
@@ -999,15 +1015,24 @@ class Client(ClientWithProject):
                                   num_retries=_DEFAULT_NUM_RETRIES,
                                   job_id=None, job_id_prefix=None,
                                   location=None, project=None,
-                                  job_config=None):
+                                  job_config=None, chunk_size=None):
         """Upload the contents of a table from a pandas DataFrame.
 
         Similar to :meth:`load_table_from_uri`, this method creates, starts and
         returns a :class:`~google.cloud.bigquery.job.LoadJob`.
 
+        The data is encoded as Parquet while it is uploaded, one row group at
+        a time, so it is never copied into memory as a whole.
+
         Arguments:
-            dataframe (pandas.DataFrame):
-                A :class:`~pandas.DataFrame` containing the data to load.
+            dataframe (Union[ \
+                pandas.DataFrame, \
+                Iterable[pandas.DataFrame], \
+            ]):
+                A :class:`~pandas.DataFrame` containing the data to load, or
+                an iterable of DataFrames with the same columns, such as a
+                generator which reads the data in pieces. The DataFrames are
+                loaded in order, as a single file.
             destination (google.cloud.bigquery.table.TableReference):
                 The destination table to use for loading the data. If it is an
                 existing table, the schema of the :class:`~pandas.DataFrame`
@@ -1034,17 +1059,20 @@ class Client(ClientWithProject):
                 to the client's project.
             job_config (google.cloud.bigquery.job.LoadJobConfig, optional):
                 Extra configuration options for the job.
+            chunk_size (int, optional):
+                The number of bytes sent in each upload request. Must be a
+                multiple of 256 KB. Defaults to 1 MB.
 
         Returns:
             google.cloud.bigquery.job.LoadJob: A new load job.
 
         Raises:
             ImportError:
-                If a usable parquet engine cannot be found. This method
-                requires :mod:`pyarrow` to be installed.
+                If :mod:`pyarrow` is not installed.
+            ValueError:
+                If ``dataframe`` is an empty iterable.
         """
-        buffer = six.BytesIO()
-        dataframe.to_parquet(buffer)
+        stream = _pandas_helpers.ParquetStream(dataframe)
 
         if job_config is None:
             job_config = job.LoadJobConfig()
@@ -1054,17 +1082,18 @@ class Client(ClientWithProject):
             location = self.location
 
         return self.load_table_from_file(
-            buffer, destination,
+            stream, destination,
             num_retries=num_retries,
-            rewind=True,
             job_id=job_id,
             job_id_prefix=job_id_prefix,
             location=location,
             project=project,
             job_config=job_config,
+            chunk_size=chunk_size,
         )
 
-    def _do_resumable_upload(self, stream, metadata, num_retries):
+    def _do_resumable_upload(self, stream, metadata, num_retries,
+                             chunk_size=None):
         """Perform a resumable upload.
 
         :type stream: IO[bytes]
@@ -1077,19 +1106,24 @@ class Client(ClientWithProject):
         :param num_retries: Number of upload retries. (Deprecated: This
                             argument will be removed in a future release.)
 
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes sent in each
+                           request. Defaults to 1 MB.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
         """
         upload, transport = self._initiate_resumable_upload(
-            stream, metadata, num_retries)
+            stream, metadata, num_retries, chunk_size=chunk_size)
 
         while not upload.finished:
             response = upload.transmit_next_chunk(transport)
 
         return response
 
-    def _initiate_resumable_upload(self, stream, metadata, num_retries):
+    def _initiate_resumable_upload(self, stream, metadata, num_retries,
+                                   chunk_size=None):
         """Initiate a resumable upload.
 
         :type stream: IO[bytes]
@@ -1102,6 +1136,10 @@ class Client(ClientWithProject):
         :param num_retries: Number of upload retries. (Deprecated: This
                             argument will be removed in a future release.)
 
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes sent in each
+                           request. Defaults to 1 MB.
+
         :rtype: tuple
         :returns:
             Pair of
@@ -1110,7 +1148,8 @@ class Client(ClientWithProject):
               that was created
             * The ``transport`` used to initiate the upload.
         """
-        chunk_size = _DEFAULT_CHUNKSIZE
+        if chunk_size is None:
+            chunk_size = _DEFAULT_CHUNKSIZE
         transport = self._http
         headers = _get_upload_headers(self._connection.USER_AGENT)
         upload_url = _RESUMABLE_URL_TEMPLATE.format(project=self.project)
@@ -1345,7 +1384,11 @@ class Client(ClientWithProject):
                 (Optional) How to retry the RPC.
 
         Returns:
-            google.cloud.bigquery.job.QueryJob: A new query job instance.
+            google.cloud.bigquery.job.QueryJob:
+                A new query job instance. If the client's ``query_cache``
+                holds the result of the same query, the job is instead a
+                finished one, loaded from the cache, whose rows are read
+                without any API requests.
         """
         job_id = _make_job_id(job_id, job_id_prefix)
 
@@ -1369,6 +1412,9 @@ class Client(ClientWithProject):
         job_ref = job._JobReference(job_id, project=project, location=location)
         query_job = job.QueryJob(
             job_ref, query, client=self, job_config=job_config)
+        if (self._query_cache is not None and
+                self._query_cache._use_cached_result(query_job)):
+            return query_job
         query_job._begin(retry=retry)
 
         return query_job
@@ -1414,6 +1460,58 @@ class Client(ClientWithProject):
         Raises:
             ValueError: if table's schema is not set
         """
+        table, schema = self._insert_schema(table, selected_fields)
+        json_rows = _row_encoder(schema).encode_rows(rows)
+
+        return self.insert_rows_json(table, json_rows, **kwargs)
+
+    def insert_rows_from_dataframe(self, table, dataframe,
+                                   selected_fields=None, **kwargs):
+        """Insert the rows of a DataFrame into a table via the streaming API.
+
+        The DataFrame is converted column by column, rather than row by row.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                The destination table for the row data, or a reference to it.
+            dataframe (pandas.DataFrame):
+                Row data to be inserted. Columns must include all required
+                fields in the schema. Columns which do not correspond to a
+                field in the schema are ignored.
+            selected_fields (Sequence[ \
+                :class:`~google.cloud.bigquery.schema.SchemaField`, \
+            ]):
+                The fields to insert. Required if ``table`` is a
+                :class:`~google.cloud.bigquery.table.TableReference`.
+            kwargs (dict):
+                Keyword arguments to
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+
+        Returns:
+            Sequence[Mappings]:
+                One mapping per row with insert errors: the "index" key
+                identifies the row, and the "errors" key contains a list of
+                the mappings describing one or more problems with the row.
+
+        Raises:
+            ValueError: if table's schema is not set
+        """
+        table, schema = self._insert_schema(table, selected_fields)
+        json_rows = _row_encoder(schema).encode_dataframe(dataframe)
+
+        return self.insert_rows_json(table, json_rows, **kwargs)
+
+    def _insert_schema(self, table, selected_fields):
+        """Resolve the destination table and schema for streaming inserts.
+
+        Returns:
+            Tuple[Union[Table, TableReference], List[SchemaField]]:
+                The destination table and the fields of the rows.
+        """
         if isinstance(table, str):
             table = TableReference.from_string(
                 table, default_project=self.project)
@@ -1429,22 +1527,7 @@ class Client(ClientWithProject):
         else:
             raise TypeError('table should be Table or TableReference')
 
-        json_rows = []
-
-        for index, row in enumerate(rows):
-            if isinstance(row, dict):
-                row = _row_from_mapping(row, schema)
-            json_row = {}
-
-            for field, value in zip(schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                json_row[field.name] = value
-
-            json_rows.append(json_row)
-
-        return self.insert_rows_json(table, json_rows, **kwargs)
+        return table, schema
 
     def insert_rows_json(self, table, json_rows, row_ids=None,
                          skip_invalid_rows=None, ignore_unknown_values=None,
@@ -1560,7 +1643,7 @@ class Client(ClientWithProject):
 
     def list_rows(self, table, selected_fields=None, max_results=None,
                   page_token=None, start_index=None, page_size=None,
-                  retry=DEFAULT_RETRY):
+                  retry=DEFAULT_RETRY, max_workers=None):
         """List the rows of the table.
 
         See
@@ -1601,6 +1684,10 @@ class Client(ClientWithProject):
                 the iterator.
             retry (:class:`google.api_core.retry.Retry`):
                 (Optional) How to retry the RPC.
+            max_workers (int):
+                (Optional) Fetch the pages after the first one concurrently,
+                by ``startIndex``, with up to this many threads. Pages are
+                still returned in order. Ignored if ``page_token`` is set.
 
         Returns:
             google.cloud.bigquery.table.RowIterator:
@@ -1641,7 +1728,8 @@ class Client(ClientWithProject):
             page_token=page_token,
             max_results=max_results,
             page_size=page_size,
-            extra_params=params)
+            extra_params=params,
+            max_workers=max_workers)
         return row_iterator
 
 
@@ -15,6 +15,7 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
+import concurrent.futures
 
 import six
 
@@ -51,6 +52,15 @@ class Cursor(object):
         # Per PEP 249: The arraysize attribute defaults to 1, meaning to fetch
         # a single row at a time.
         self.arraysize = 1
+        # Number of threads used to fetch result pages concurrently. The
+        # default of None fetches pages one at a time.
+        self.max_workers = None
+        # When true, the next page of ``arraysize`` rows is fetched in the
+        # background while the current page is consumed.
+        self.prefetch = False
+        # Number of query jobs ``executemany()`` runs at once. The default of
+        # None runs them one after another.
+        self.max_concurrent_queries = None
         self._query_data = None
         self._query_job = None
 
@@ -134,6 +144,27 @@ class Cursor(object):
         """
         self._query_data = None
         self._query_job = None
+        self._set_query_job(
+            self._run_query(operation, parameters=parameters, job_id=job_id))
+
+    def _run_query(self, operation, parameters=None, job_id=None):
+        """Run a query and wait for it to finish.
+
+        :type operation: str
+        :param operation: A Google BigQuery query string.
+
+        :type parameters: Mapping[str, Any] or Sequence[Any]
+        :param parameters:
+            (Optional) dictionary or sequence of parameter values.
+
+        :type job_id: str
+        :param job_id: (Optional) The job_id to use.
+
+        :rtype: :class:`~google.cloud.bigquery.job.QueryJob`
+        :returns: The finished query job.
+        :raises: :class:`~google.cloud.bigquery.dbapi.DatabaseError`
+            if the query failed.
+        """
         client = self.connection._client
 
         # The DB-API uses the pyformat formatting, since the way BigQuery does
@@ -147,30 +178,65 @@ class Cursor(object):
         config = job.QueryJobConfig()
         config.query_parameters = query_parameters
         config.use_legacy_sql = False
-        self._query_job = client.query(
+        query_job = client.query(
             formatted_operation, job_config=config, job_id=job_id)
 
         # Wait for the query to finish.
         try:
-            self._query_job.result()
+            query_job.result()
         except google.cloud.exceptions.GoogleCloudError as exc:
             raise exceptions.DatabaseError(exc)
+        return query_job
+
+    def _set_query_job(self, query_job):
+        """Make a finished query job the source of results.
 
-        query_results = self._query_job._query_results
+        :type query_job: :class:`~google.cloud.bigquery.job.QueryJob`
+        :param query_job: The finished query job.
+        """
+        self._query_job = query_job
+        query_results = query_job._query_results
         self._set_rowcount(query_results)
         self._set_description(query_results.schema)
 
     def executemany(self, operation, seq_of_parameters):
         """Prepare and execute a database operation multiple times.
 
+        When the ``max_concurrent_queries`` attribute is set, up to that many
+        query jobs run at once. Either way, the cursor is left with the
+        results of the last set of parameters.
+
         :type operation: str
         :param operation: A Google BigQuery query string.
 
         :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
         :param parameters: Sequence of many sets of parameter values.
         """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+        if self.max_concurrent_queries is None:
+            for parameters in seq_of_parameters:
+                self.execute(operation, parameters)
+            return
+
+        self._query_data = None
+        self._query_job = None
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrent_queries)
+        futures = []
+        try:
+            for parameters in seq_of_parameters:
+                futures.append(executor.submit(
+                    self._run_query, operation, parameters=parameters))
+            query_job = None
+            for future in futures:
+                query_job = future.result()
+        finally:
+            # Don't start the remaining queries if one of them failed.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        if query_job is not None:
+            self._set_query_job(query_job)
 
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
@@ -193,9 +259,13 @@ class Cursor(object):
             rows_iter = client.list_rows(
                 self._query_job.destination,
                 selected_fields=self._query_job._query_results.schema,
-                page_size=self.arraysize
+                page_size=self.arraysize,
+                max_workers=self.max_workers,
             )
-            self._query_data = iter(rows_iter)
+            if self.prefetch:
+                self._query_data = _prefetch_rows(rows_iter.pages)
+            else:
+                self._query_data = iter(rows_iter)
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -262,6 +332,29 @@ class Cursor(object):
         """No-op."""
 
 
+def _prefetch_rows(pages):
+    """Yield the rows of each page while the next page is fetched.
+
+    :type pages: Iterator[:class:`~google.api_core.page_iterator.Page`]
+    :param pages: Pages of rows, fetched as the iterator advances.
+
+    :rtype: Iterator[:class:`~google.cloud.bigquery.table.Row`]
+    :returns: The rows of all pages, in order.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        next_page = executor.submit(six.next, pages, None)
+        while True:
+            page = next_page.result()
+            if page is None:
+                return
+            next_page = executor.submit(six.next, pages, None)
+            for row in page:
+                yield row
+    finally:
+        executor.shutdown(wait=False)
+
+
 def _format_operation_list(operation, parameters):
     """Formats parameters in operation in the way BigQuery expects.
 
@@ -0,0 +1,422 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch streaming inserts into size-limited, concurrent requests."""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+import uuid
+
+import six
+
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.table import TableReference
+
+
+_LOGGER = logging.getLogger(__name__)
+_DEFAULT_MAX_ROWS = 500
+_DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+_DEFAULT_MAX_LATENCY = 0.05
+_DEFAULT_MAX_IN_FLIGHT = 4
+_DEFAULT_MAX_ATTEMPTS = 3
+
+# Row-level ``insertErrors`` reasons for which resending the row may succeed.
+# Rows are ``stopped`` when another row of the same request is invalid.
+_RETRYABLE_ROW_REASONS = frozenset([
+    'backendError',
+    'internalError',
+    'stopped',
+    'timeout',
+])
+
+InsertRequestMetrics = collections.namedtuple(
+    'InsertRequestMetrics',
+    ['num_rows', 'num_bytes', 'num_failed_rows', 'num_retried_rows',
+     'latency'])
+"""Statistics about one ``insertAll`` request sent by an
+:class:`InsertBatcher`.
+
+Attributes:
+    num_rows (int): Rows sent in the request.
+    num_bytes (int): Approximate serialized size of the rows.
+    num_failed_rows (int): Rows which failed and will not be retried.
+    num_retried_rows (int): Rows which failed and were queued to be resent.
+    latency (float): Seconds between sending the request and its response.
+"""
+
+
+def _index_insert_errors(response):
+    """Map the index of each failed row to its errors.
+
+    Args:
+        response (Dict[str, object]): An ``insertAll`` response.
+
+    Returns:
+        Dict[int, List[Dict[str, object]]]: The errors of each failed row.
+
+    Raises:
+        ValueError: If ``insertErrors`` is malformed.
+    """
+    insert_errors = response.get('insertErrors', ())
+    errors_by_index = {}
+    try:
+        for insert_error in insert_errors:
+            errors_by_index[int(insert_error['index'])] = [
+                dict(error) for error in insert_error['errors']]
+    except (AttributeError, KeyError, TypeError):
+        raise ValueError(
+            'Malformed insertErrors in response: {!r}'.format(insert_errors))
+    return errors_by_index
+
+
+def _resolve_future(future, result=None, exception=None):
+    """Set the outcome of a row's future, unless it was cancelled.
+
+    Args:
+        future (concurrent.futures.Future): The future of the row.
+        result (List[Dict[str, object]]): The errors of the row, if any.
+        exception (Exception): The error which failed the request, if any.
+    """
+    if not future.set_running_or_notify_cancel():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+class _PendingRow(object):
+    """A row waiting to be sent, along with its future."""
+
+    __slots__ = ('info', 'num_bytes', 'future', 'attempts')
+
+    def __init__(self, info, num_bytes, future):
+        self.info = info
+        self.num_bytes = num_bytes
+        self.future = future
+        self.attempts = 0
+
+
+class InsertBatcher(object):
+    """Stream rows into a table in batched ``insertAll`` requests.
+
+    Rows passed to :meth:`insert` are buffered and sent once a batch reaches
+    ``max_rows`` rows or ``max_bytes`` serialized bytes, or once the oldest
+    buffered row has waited ``max_latency`` seconds. Up to ``max_in_flight``
+    requests are sent concurrently; when that many are outstanding,
+    :meth:`insert` blocks until one completes.
+
+    Rows which fail with a transient reason, including valid rows which were
+    ``stopped`` because another row in their request was invalid, are resent
+    with their original insert ID, so the service can de-duplicate them.
+
+    See
+    https://cloud.google.com/bigquery/docs/reference/rest/v2/tabledata/insertAll
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to send requests.
+        table (Union[ \
+            :class:`~google.cloud.bigquery.table.Table`, \
+            :class:`~google.cloud.bigquery.table.TableReference`, \
+            str, \
+        ]):
+            The destination table for the row data, or a reference to it.
+        max_rows (int):
+            (Optional) Maximum number of rows in each request.
+        max_bytes (int):
+            (Optional) Maximum serialized size of the rows in each request.
+        max_latency (float):
+            (Optional) Seconds a row may wait for its batch to fill up
+            before the batch is sent anyway.
+        max_in_flight (int):
+            (Optional) Maximum number of concurrent requests.
+        max_attempts (int):
+            (Optional) Maximum number of times a row is sent.
+        skip_invalid_rows (bool):
+            (Optional) Insert all valid rows of a request, even if invalid
+            rows exist.
+        ignore_unknown_values (bool):
+            (Optional) Accept rows that contain values that do not match the
+            schema. The unknown values are ignored.
+        template_suffix (str):
+            (Optional) Treat the table as a template table and provide a
+            suffix.
+        retry (:class:`google.api_core.retry.Retry`):
+            (Optional) How to retry each request.
+        metrics_callback (Callable[[InsertRequestMetrics], None]):
+            (Optional) Called with an :class:`InsertRequestMetrics` after
+            each request completes, from a background thread.
+    """
+
+    def __init__(self, client, table, max_rows=_DEFAULT_MAX_ROWS,
+                 max_bytes=_DEFAULT_MAX_BYTES,
+                 max_latency=_DEFAULT_MAX_LATENCY,
+                 max_in_flight=_DEFAULT_MAX_IN_FLIGHT,
+                 max_attempts=_DEFAULT_MAX_ATTEMPTS,
+                 skip_invalid_rows=None, ignore_unknown_values=None,
+                 template_suffix=None, retry=DEFAULT_RETRY,
+                 metrics_callback=None):
+        if isinstance(table, six.string_types):
+            table = TableReference.from_string(
+                table, default_project=client.project)
+
+        self._client = client
+        self._path = '%s/insertAll' % (table.path,)
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._max_attempts = max_attempts
+        self._retry = retry
+        self._metrics_callback = metrics_callback
+
+        self._options = {}
+        if skip_invalid_rows is not None:
+            self._options['skipInvalidRows'] = skip_invalid_rows
+        if ignore_unknown_values is not None:
+            self._options['ignoreUnknownValues'] = ignore_unknown_values
+        if template_suffix is not None:
+            self._options['templateSuffix'] = template_suffix
+
+        self._condition = threading.Condition()
+        self._pending = collections.deque()
+        self._pending_bytes = 0
+        self._pending_since = None
+        self._num_outstanding = 0
+        self._num_flushing = 0
+        self._closed = False
+
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_in_flight)
+        self._monitor = threading.Thread(
+            name='Thread-InsertBatcherMonitor', target=self._monitor_pending)
+        self._monitor.daemon = True
+        self._monitor.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def insert(self, json_row, row_id=None):
+        """Queue one row to be inserted.
+
+        Args:
+            json_row (dict):
+                Row data to be inserted. Keys must match the table schema
+                fields and values must be JSON-compatible representations.
+            row_id (str):
+                (Optional) Unique ID of the row. If omitted, a unique ID is
+                created.
+
+        Returns:
+            concurrent.futures.Future:
+                Resolves to the list of mappings describing the problems
+                with the row, which is empty if the row was inserted, or
+                raises the exception which made its request fail.
+
+        Raises:
+            ValueError:
+                If the batcher is closed, or the row alone is larger than
+                ``max_bytes``.
+        """
+        if row_id is None:
+            row_id = str(uuid.uuid4())
+        info = {'json': json_row, 'insertId': row_id}
+        num_bytes = len(json.dumps(info)) + 1  # Allow for the separator.
+        if num_bytes > self._max_bytes:
+            raise ValueError(
+                'Row is {} bytes, larger than max_bytes ({}).'.format(
+                    num_bytes, self._max_bytes))
+
+        future = concurrent.futures.Future()
+        with self._condition:
+            if self._closed:
+                raise ValueError('Cannot insert rows into a closed batcher.')
+            self._num_outstanding += 1
+            self._append_pending(_PendingRow(info, num_bytes, future))
+            batches = self._take_full_batches()
+
+        for batch in batches:
+            self._send(batch)
+        return future
+
+    def insert_many(self, json_rows, row_ids=None):
+        """Queue many rows to be inserted.
+
+        Args:
+            json_rows (Sequence[dict]): Row data to be inserted.
+            row_ids (Sequence[str]):
+                (Optional) Unique IDs, one per row being inserted. If
+                omitted, unique IDs are created.
+
+        Returns:
+            List[concurrent.futures.Future]:
+                One future per row. See :meth:`insert`.
+        """
+        if row_ids is None:
+            row_ids = [None] * len(json_rows)
+        return [self.insert(json_row, row_id=row_id)
+                for json_row, row_id in zip(json_rows, row_ids)]
+
+    def flush(self):
+        """Send all buffered rows and wait until every row is resolved."""
+        with self._condition:
+            self._num_flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._num_outstanding:
+                    self._condition.wait()
+            finally:
+                self._num_flushing -= 1
+
+    def close(self):
+        """Flush buffered rows and stop the background threads.
+
+        No rows can be inserted after the batcher is closed.
+        """
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._monitor.join()
+        self._executor.shutdown()
+
+    def _append_pending(self, row):
+        """Add a row to the buffer. Must hold the lock."""
+        if not self._pending:
+            self._pending_since = time.time()
+        self._pending.append(row)
+        self._pending_bytes += row.num_bytes
+        self._condition.notify_all()
+
+    def _take_batch(self):
+        """Remove up to one request's worth of rows. Must hold the lock."""
+        batch = []
+        num_bytes = 0
+        while self._pending and len(batch) < self._max_rows:
+            row = self._pending[0]
+            if batch and num_bytes + row.num_bytes > self._max_bytes:
+                break
+            batch.append(self._pending.popleft())
+            num_bytes += row.num_bytes
+        self._pending_bytes -= num_bytes
+        self._pending_since = time.time() if self._pending else None
+        return batch
+
+    def _take_full_batches(self):
+        """Remove the batches which are ready to send. Must hold the lock."""
+        batches = []
+        while (len(self._pending) >= self._max_rows or
+               self._pending_bytes >= self._max_bytes):
+            batches.append(self._take_batch())
+        return batches
+
+    def _monitor_pending(self):
+        """Send partial batches once they have waited ``max_latency``."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                if not self._num_flushing:
+                    remaining = (
+                        self._pending_since + self._max_latency - time.time())
+                    if remaining > 0:
+                        self._condition.wait(remaining)
+                        continue
+                batch = self._take_batch()
+            self._send(batch)
+
+    def _send(self, batch):
+        """Send a batch once fewer than ``max_in_flight`` are outstanding."""
+        self._in_flight.acquire()
+        try:
+            self._executor.submit(self._commit, batch)
+        except Exception:
+            self._in_flight.release()
+            raise
+
+    def _commit(self, batch):
+        """Send one ``insertAll`` request and resolve or requeue its rows."""
+        data = {'rows': [row.info for row in batch]}
+        data.update(self._options)
+        num_bytes = sum(row.num_bytes for row in batch)
+        start_time = time.time()
+        try:
+            # We can always retry, because every row has an insert ID.
+            response = self._client._call_api(
+                self._retry, method='POST', path=self._path, data=data)
+        except Exception as exc:
+            response = None
+            request_error = exc
+        latency = time.time() - start_time
+        self._in_flight.release()
+
+        num_failed_rows = 0
+        retried = []
+        try:
+            if response is not None:
+                try:
+                    errors_by_index = _index_insert_errors(response)
+                except ValueError as exc:
+                    response = None
+                    request_error = exc
+            if response is None:
+                num_failed_rows = len(batch)
+                for row in batch:
+                    _resolve_future(row.future, exception=request_error)
+            else:
+                for index, row in enumerate(batch):
+                    row.attempts += 1
+                    errors = errors_by_index.get(index, [])
+                    if (errors and row.attempts < self._max_attempts and
+                            not row.future.cancelled() and
+                            all(error.get('reason') in _RETRYABLE_ROW_REASONS
+                                for error in errors)):
+                        retried.append(row)
+                        continue
+                    if errors:
+                        num_failed_rows += 1
+                    _resolve_future(row.future, result=errors)
+        finally:
+            # Account for the rows even if resolving them failed, or flush()
+            # and close() would never return.
+            with self._condition:
+                for row in retried:
+                    self._append_pending(row)
+                self._num_outstanding -= len(batch) - len(retried)
+                self._condition.notify_all()
+
+        if self._metrics_callback is not None:
+            # A failing callback must not stop the batcher from accounting
+            # for the rows, or flush() and close() would never return.
+            try:
+                self._metrics_callback(InsertRequestMetrics(
+                    num_rows=len(batch),
+                    num_bytes=num_bytes,
+                    num_failed_rows=num_failed_rows,
+                    num_retried_rows=len(retried),
+                    latency=latency))
+            except Exception:
+                _LOGGER.exception('Error in the insert metrics callback.')
@@ -14,9 +14,13 @@
 
 """Define API Jobs."""
 
+import collections
+import concurrent.futures
 import copy
 import threading
+import time
 
+import six
 from six.moves import http_client
 
 import google.api_core.future.polling
@@ -33,6 +37,7 @@ from google.cloud.bigquery.retry import DEFAULT_RETRY
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.table import _EmptyRowIterator
 from google.cloud.bigquery.table import EncryptionConfiguration
+from google.cloud.bigquery.table import RowIterator
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TimePartitioning
@@ -41,6 +46,12 @@ from google.cloud.bigquery import _helpers
 _DONE_STATE = 'DONE'
 _STOPPED_REASON = 'stopped'
 _TIMEOUT_BUFFER_SECS = 0.1
+_MIN_POLL_INTERVAL = 0.1
+_MAX_POLL_INTERVAL = 10.0
+_POLL_MULTIPLIER = 1.5
+# Up to this many unfinished jobs are refreshed with one ``jobs.get`` each by
+# :func:`wait_for_jobs`; beyond it, their states are read from ``jobs.list``.
+_MAX_JOBS_TO_GET = 5
 
 _ERROR_REASON_TO_EXCEPTION = {
     'accessDenied': http_client.FORBIDDEN,
@@ -86,6 +97,31 @@ def _error_result_to_exception(error_result):
         status_code, error_result.get('message', ''), errors=[error_result])
 
 
+def _next_poll_interval(previous, remaining=None):
+    """Choose how long to wait before polling an unfinished job again.
+
+    Without an estimate, the interval grows geometrically from
+    :data:`_MIN_POLL_INTERVAL`, so short jobs are noticed quickly and long
+    ones are not polled needlessly often. With an estimate of the time left,
+    poll halfway to the expected completion.
+
+    :type previous: float
+    :param previous: The previous interval, or 0 for the first one.
+
+    :type remaining: float
+    :param remaining: (Optional) Estimated seconds until the job completes.
+
+    :rtype: float
+    :returns: Seconds to wait, between :data:`_MIN_POLL_INTERVAL` and
+              :data:`_MAX_POLL_INTERVAL`.
+    """
+    if remaining is not None:
+        interval = remaining / 2.0
+    else:
+        interval = previous * _POLL_MULTIPLIER
+    return min(max(interval, _MIN_POLL_INTERVAL), _MAX_POLL_INTERVAL)
+
+
 class Compression(object):
     """The compression type to use for exported files. The default value is
     :attr:`NONE`.
@@ -643,6 +679,67 @@ class _AsyncJob(google.api_core.future.polling.PollingFuture):
     # compatibility. The only "overloaded" method is :meth:`cancel`, which
     # satisfies both interfaces.
 
+    def _estimated_seconds_remaining(self):
+        """Estimate how long the job will take to complete.
+
+        :rtype: float, or ``NoneType``
+        :returns: Seconds, or None if the job does not report its progress.
+        """
+        return None
+
+    def _poll_interval(self, previous):
+        """Choose how long :meth:`_blocking_poll` waits between polls.
+
+        :type previous: float
+        :param previous: The previous interval, or 0 for the first one.
+
+        :rtype: float
+        :returns: Seconds to wait.
+        """
+        return _next_poll_interval(
+            previous, self._estimated_seconds_remaining())
+
+    def _blocking_poll(self, timeout=None):
+        """Poll the job until it is complete.
+
+        Unlike the fixed exponential backoff of
+        :class:`~google.api_core.future.polling.PollingFuture`, the interval
+        between polls is chosen by :meth:`_poll_interval`, from the job's
+        reported progress when it is available.
+
+        :type timeout: float
+        :param timeout:
+            How long (in seconds) to wait for the job to complete. If None,
+            wait indefinitely.
+
+        :raises: :class:`concurrent.futures.TimeoutError` if the job did not
+                 complete in the given timeout.
+        """
+        if self._result_set:
+            return
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+        interval = 0
+        while True:
+            try:
+                if self.done():
+                    return
+            except Exception as exc:
+                if not google.api_core.future.polling.RETRY_PREDICATE(exc):
+                    raise
+
+            interval = self._poll_interval(interval)
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise concurrent.futures.TimeoutError(
+                        'Operation did not complete within the designated '
+                        'timeout.')
+                interval = min(interval, remaining)
+            time.sleep(interval)
+
     def _set_future_result(self):
         """Set the result or exception from the job if it is complete."""
         # This must be done in a lock to prevent the polling thread
@@ -2271,6 +2368,8 @@ class QueryJob(_AsyncJob):
         self._configuration = job_config
         self._query_results = None
         self._done_timeout = None
+        self._cached_rows = None
+        self._result_recorder = None
 
     @property
     def allow_large_results(self):
@@ -2698,11 +2797,51 @@ class QueryJob(_AsyncJob):
 
         return self.state == _DONE_STATE
 
+    def _estimated_seconds_remaining(self):
+        """Extrapolate the time left from the progress of the query plan.
+
+        The latest :attr:`timeline` sample is used if there is one, and the
+        completed parallel inputs of the :attr:`query_plan` stages since the
+        job started otherwise.
+
+        :rtype: float, or ``NoneType``
+        :returns: Seconds, or None if no progress has been reported yet.
+        """
+        timeline = self.timeline
+        if timeline:
+            sample = timeline[-1]
+            completed = sample.completed_units or 0
+            total = completed + (sample.pending_units or 0)
+            elapsed = (sample.elapsed_ms or 0) / 1000.0
+        else:
+            start_time = self._properties.get(
+                'statistics', {}).get('startTime')
+            if start_time is None:
+                return None
+            completed = total = 0
+            for entry in self.query_plan:
+                total += entry.parallel_inputs or 0
+                completed += entry.completed_parallel_inputs or 0
+            elapsed = max(time.time() - float(start_time) / 1000.0, 0.0)
+
+        if not completed or not total:
+            return None
+        return elapsed * (total - completed) / completed
+
+    def _poll_interval(self, previous):
+        """Choose how long :meth:`_blocking_poll` waits between polls.
+
+        :meth:`done` asks the server to wait for the query to complete before
+        answering, so there is no need to wait long on the client side too.
+        """
+        return _MIN_POLL_INTERVAL
+
     def _blocking_poll(self, timeout=None):
         self._done_timeout = timeout
         super(QueryJob, self)._blocking_poll(timeout=timeout)
 
-    def result(self, timeout=None, retry=DEFAULT_RETRY):
+    def result(self, timeout=None, retry=DEFAULT_RETRY, max_workers=None,
+               page_size=None):
         """Start the job and wait for it to complete and get the result.
 
         :type timeout: float
@@ -2713,6 +2852,16 @@ class QueryJob(_AsyncJob):
         :type retry: :class:`google.api_core.retry.Retry`
         :param retry: (Optional) How to retry the call that retrieves rows.
 
+        :type max_workers: int
+        :param max_workers:
+            (Optional) Fetch result pages concurrently with up to this many
+            threads. See
+            :meth:`~google.cloud.bigquery.client.Client.list_rows`.
+
+        :type page_size: int
+        :param page_size:
+            (Optional) The maximum number of rows in each page of results.
+
         :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns:
             Iterator of row data :class:`~google.cloud.bigquery.table.Row`-s.
@@ -2743,11 +2892,31 @@ class QueryJob(_AsyncJob):
         schema = self._query_results.schema
         dest_table_ref = self.destination
         dest_table = Table(dest_table_ref, schema=schema)
-        return self._client.list_rows(dest_table, retry=retry)
-
-    def to_dataframe(self):
+        if self._cached_rows is not None:
+            # Served by the client's query cache; no need for threads.
+            return RowIterator(
+                self._client, self._cached_rows.api_request,
+                '%s/data' % (dest_table.path,), schema, page_size=page_size)
+
+        rows = self._client.list_rows(
+            dest_table, retry=retry, max_workers=max_workers,
+            page_size=page_size)
+        if self._result_recorder is not None:
+            self._result_recorder.record(self, rows)
+        return rows
+
+    def to_dataframe(self, dtypes=None):
         """Return a pandas DataFrame from a QueryJob
 
+        Args:
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                Optional. A dictionary of column names to pandas ``dtype``s.
+                The provided ``dtype`` is used when constructing the series
+                for the column specified. Otherwise, the default pandas
+                behavior is used.
+
         Returns:
             A :class:`~pandas.DataFrame` populated with row data and column
             headers from the query results. The column headers are derived
@@ -2756,7 +2925,35 @@ class QueryJob(_AsyncJob):
         Raises:
             ValueError: If the `pandas` library cannot be imported.
         """
-        return self.result().to_dataframe()
+        return self.result().to_dataframe(dtypes=dtypes)
+
+    def iter_dataframes(self, dtypes=None, page_size=None,
+                        max_rows_per_frame=None):
+        """Iterate over the results of a QueryJob as pandas DataFrames.
+
+        Args:
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                Optional. A dictionary of column names to pandas ``dtype``s,
+                used to keep column types the same across frames.
+            page_size (int):
+                Optional. The maximum number of rows in each page of results.
+                By default, one frame is yielded per page.
+            max_rows_per_frame (int):
+                Optional. The number of rows in each frame, except possibly
+                the last.
+
+        Returns:
+            Iterator[pandas.DataFrame]:
+                A generator of :class:`~pandas.DataFrame` objects. See
+                :meth:`.RowIterator.iter_dataframes`.
+
+        Raises:
+            ValueError: If the `pandas` library cannot be imported.
+        """
+        return self.result(page_size=page_size).iter_dataframes(
+            dtypes=dtypes, max_rows_per_frame=max_rows_per_frame)
 
     def __iter__(self):
         return iter(self.result())
@@ -3115,3 +3312,139 @@ class UnknownJob(_AsyncJob):
         resource['jobReference'] = job_ref_properties
         job._properties = resource
         return job
+
+
+DoneAndNotDoneJobs = collections.namedtuple(
+    'DoneAndNotDoneJobs', ['done', 'not_done'])
+"""Result of :func:`wait_for_jobs`.
+
+Attributes:
+    done (Set[_AsyncJob]): The jobs which are complete.
+    not_done (Set[_AsyncJob]): The jobs which are still pending or running.
+"""
+
+
+def _wait_complete(done, not_done, return_when):
+    """Check if :func:`wait_for_jobs` can return."""
+    if not not_done:
+        return True
+    if return_when == concurrent.futures.FIRST_COMPLETED:
+        return bool(done)
+    if return_when == concurrent.futures.FIRST_EXCEPTION:
+        return any(job.error_result is not None for job in done)
+    return False
+
+
+def _refresh_jobs_from_list(client, project, jobs, retry):
+    """Update jobs of one project from a single ``jobs.list`` listing.
+
+    Only jobs created since the oldest of ``jobs`` are listed.
+
+    Returns:
+        List[_AsyncJob]: The jobs which were not found in the listing.
+    """
+    pending = {job.job_id: job for job in jobs}
+    min_creation_time = min(job.created for job in jobs)
+    listed_jobs = client.list_jobs(
+        project=project, min_creation_time=min_creation_time, retry=retry)
+    for listed_job in listed_jobs:
+        job = pending.pop(listed_job.job_id, None)
+        if job is not None:
+            job._set_properties(listed_job._properties)
+            if not pending:
+                break
+    return list(pending.values())
+
+
+def _refresh_jobs(jobs, retry):
+    """Reload unfinished jobs, using shared requests for many of them.
+
+    Up to :data:`_MAX_JOBS_TO_GET` jobs are reloaded individually. Beyond
+    that, jobs are refreshed from a ``jobs.list`` listing per project, and
+    only the jobs missing from it, e.g. because they were created by
+    another user, are reloaded individually.
+    """
+    to_get = []
+    by_project = collections.defaultdict(list)
+    for job in jobs:
+        if len(jobs) <= _MAX_JOBS_TO_GET or job.created is None:
+            to_get.append(job)
+        else:
+            by_project[(job._client, job.project)].append(job)
+
+    for (client, project), project_jobs in six.iteritems(by_project):
+        to_get.extend(
+            _refresh_jobs_from_list(client, project, project_jobs, retry))
+    for job in to_get:
+        job.reload(retry=retry)
+
+
+def wait_for_jobs(jobs, timeout=None,
+                  return_when=concurrent.futures.ALL_COMPLETED,
+                  retry=DEFAULT_RETRY):
+    """Wait for many jobs to complete, without polling each one.
+
+    Similar to :func:`concurrent.futures.wait`. When more than a few jobs
+    are unfinished, their states are refreshed with one paged ``jobs.list``
+    request per project, rather than one ``jobs.get`` request per job. The
+    interval between refreshes adapts to the progress reported by the
+    running jobs, as when waiting for a single job.
+
+    Jobs which have not been started yet are started first.
+
+    Args:
+        jobs (Iterable[_AsyncJob]): The jobs to wait for.
+        timeout (float):
+            (Optional) Maximum number of seconds to wait. If None, wait
+            until ``return_when`` is satisfied.
+        return_when (str):
+            (Optional) One of :data:`concurrent.futures.ALL_COMPLETED`,
+            :data:`concurrent.futures.FIRST_COMPLETED` or
+            :data:`concurrent.futures.FIRST_EXCEPTION`, which returns once
+            any job has failed, or all are complete.
+        retry (google.api_core.retry.Retry):
+            (Optional) How to retry each request.
+
+    Returns:
+        DoneAndNotDoneJobs:
+            The sets of complete and unfinished jobs. Unlike a job's
+            ``result()``, no exception is raised for failed jobs or on
+            timeout.
+    """
+    done = set()
+    not_done = set()
+    for job in jobs:
+        if job.state is None:
+            job._begin(retry=retry)
+        if job.state == _DONE_STATE:
+            done.add(job)
+        else:
+            not_done.add(job)
+
+    deadline = None
+    if timeout is not None:
+        deadline = time.time() + timeout
+    interval = 0
+    while not _wait_complete(done, not_done, return_when):
+        _refresh_jobs(not_done, retry)
+        finished = set(job for job in not_done if job.state == _DONE_STATE)
+        done |= finished
+        not_done -= finished
+        if _wait_complete(done, not_done, return_when):
+            break
+
+        estimates = [
+            remaining for remaining in (
+                job._estimated_seconds_remaining() for job in not_done)
+            if remaining is not None
+        ]
+        interval = _next_poll_interval(
+            interval, min(estimates) if estimates else None)
+        if deadline is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            interval = min(interval, remaining)
+        time.sleep(interval)
+
+    return DoneAndNotDoneJobs(done, not_done)
@@ -0,0 +1,512 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of query results."""
+
+from __future__ import absolute_import
+
+import collections
+import copy
+import errno
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from google.api_core import exceptions
+
+
+_DEFAULT_MAX_ENTRIES = 128
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_DEFAULT_MAX_ROWS = 100000
+_DEFAULT_TTL = 300.0
+_FILE_SUFFIX = '.json'
+
+# Functions whose results can change between runs of the same query.
+_NON_DETERMINISTIC_RE = re.compile(
+    r'\b(?:CURRENT_(?:DATE|DATETIME|TIME|TIMESTAMP)|NOW|RAND|GENERATE_UUID|'
+    r'SESSION_USER)\s*\(',
+    re.IGNORECASE)
+
+# Quoted strings, identifiers and block comments, whose whitespace is kept;
+# a line comment and the whitespace after it, whose line end is kept; or a
+# run of whitespace outside of them.
+_QUERY_TOKEN_RE = re.compile(
+    r"('''[\s\S]*?'''|\"\"\"[\s\S]*?\"\"\"|'(?:[^'\\]|\\.)*'|"
+    r'"(?:[^"\\]|\\.)*"|`[^`]*`|/\*[\s\S]*?\*/)|'
+    r'((?:--|#)[^\n]*)\s*|\s+')
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _normalize_token(match):
+    """Return the normalized form of a :data:`_QUERY_TOKEN_RE` match."""
+    if match.group(1):
+        return match.group(1)
+    if match.group(2):
+        # The comment ends at the line end, which must not become a space.
+        return match.group(2).rstrip() + '\n'
+    return ' '
+
+
+def _normalize_query(query):
+    """Collapse whitespace which is not part of a literal or identifier."""
+    return _QUERY_TOKEN_RE.sub(_normalize_token, query).strip()
+
+
+def _job_key(query_job):
+    """Hash the parts of a query job which determine its results.
+
+    Args:
+        query_job (google.cloud.bigquery.job.QueryJob): A job not yet begun.
+
+    Returns:
+        str: Hex digest identifying the query and its configuration.
+    """
+    resource = query_job.to_api_repr()
+    configuration = resource['configuration']
+    configuration.pop('labels', None)
+    configuration['query']['query'] = _normalize_query(query_job.query)
+    key = {
+        'configuration': configuration,
+        'projectId': query_job.project,
+        'location': query_job.location,
+    }
+    data = json.dumps(key, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def _is_cacheable(query_job):
+    """Check if the results of a query job not yet begun may be cached."""
+    return (
+        query_job.destination is None and
+        not query_job.dry_run and
+        query_job.use_query_cache is not False and
+        not _NON_DETERMINISTIC_RE.search(query_job.query))
+
+
+class _CachedRows(object):
+    """Serve ``tabledata.list`` responses from cached rows.
+
+    Pages can be addressed both by page token and by ``startIndex``, so a
+    :class:`~google.cloud.bigquery.table.RowIterator` reads them exactly as
+    it would from the API.
+
+    Args:
+        rows (List[dict]): Rows in the ``tabledata.list`` JSON format.
+    """
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def api_request(self, method, path, query_params=None):
+        """Return the page of rows described by ``query_params``."""
+        query_params = query_params or {}
+        if 'startIndex' in query_params:
+            start = int(query_params['startIndex'])
+        else:
+            start = int(query_params.get('pageToken', 0))
+        end = len(self._rows)
+        if 'maxResults' in query_params:
+            end = min(end, start + int(query_params['maxResults']))
+
+        response = {
+            'totalRows': str(len(self._rows)),
+            'rows': self._rows[start:end],
+        }
+        if end < len(self._rows):
+            response['pageToken'] = str(end)
+        return response
+
+
+class _RecordedPages(object):
+    """The pages of a query result read through one row iterator.
+
+    Pages fetched by page token follow each other from the first row, while
+    pages fetched by ``startIndex`` may arrive out of order and from several
+    threads. Each iterator reads the result from its start, so its pages are
+    kept apart from those of other iterators over the same result.
+
+    Args:
+        total_rows (int): Number of rows in the result.
+    """
+
+    def __init__(self, total_rows):
+        self._total_rows = total_rows
+        self._pages = {}
+        self._num_rows = 0
+        self._next_start = 0
+
+    def add(self, query_params, rows):
+        """Add a page of rows. Must be called with the recorder's lock held.
+
+        Args:
+            query_params (dict): Parameters of the ``tabledata.list`` request.
+            rows (List[dict]): Rows of the response.
+
+        Returns:
+            bool: True once every row of the result has been read.
+        """
+        if 'startIndex' in query_params:
+            start = int(query_params['startIndex'])
+        else:
+            start = self._next_start
+            self._next_start = start + len(rows)
+        if start not in self._pages:
+            self._num_rows += len(rows)
+        self._pages[start] = rows
+        return self._num_rows >= self._total_rows
+
+    def rows(self):
+        """Join the pages into the rows of the result.
+
+        Returns:
+            Union[List[dict], None]: The rows, or :data:`None` if pages
+            overlap or are missing.
+        """
+        all_rows = []
+        for start in sorted(self._pages):
+            if start != len(all_rows):
+                return None
+            all_rows.extend(self._pages[start])
+        return all_rows
+
+
+class _ResultRecorder(object):
+    """Collect the pages of a query result as they are read.
+
+    Once every row has been read through one row iterator, the result is
+    stored in the cache, and later iterators are no longer recorded.
+
+    Args:
+        cache (QueryResultCache): The cache to store the result in.
+        key (str): Key of the query job.
+    """
+
+    def __init__(self, cache, key):
+        self._cache = cache
+        self._key = key
+        self._lock = threading.Lock()
+        self._done = False
+
+    def record(self, query_job, row_iterator):
+        """Start recording the rows read through ``row_iterator``.
+
+        Results of statements other than ``SELECT``, and results with more
+        than the cache's ``max_rows`` rows, are not recorded.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob):
+                The completed job.
+            row_iterator (google.cloud.bigquery.table.RowIterator):
+                A new iterator over the job's destination table.
+        """
+        if self._done:
+            return
+        total_rows = query_job._query_results.total_rows
+        if query_job.statement_type not in (None, 'SELECT'):
+            return
+        if total_rows is None or total_rows > self._cache.max_rows:
+            return
+
+        api_request = row_iterator.api_request
+        pages = _RecordedPages(total_rows)
+
+        def recording_api_request(method, path, query_params=None):
+            response = api_request(
+                method=method, path=path, query_params=query_params)
+            self._add_page(query_job, pages, query_params or {},
+                           response.get('rows', []))
+            return response
+
+        row_iterator.api_request = recording_api_request
+
+    def _add_page(self, query_job, pages, query_params, rows):
+        with self._lock:
+            if self._done or not pages.add(query_params, rows):
+                return
+            self._done = True
+
+        all_rows = pages.rows()
+        if all_rows is not None:
+            self._cache._store(self._key, query_job, all_rows)
+
+
+class QueryResultCache(object):
+    """Opt-in client-side cache of query results.
+
+    Pass an instance as the ``query_cache`` of a
+    :class:`~google.cloud.bigquery.client.Client`. When
+    :meth:`~google.cloud.bigquery.client.Client.query` is called with the
+    same query text (ignoring insignificant whitespace), parameters and
+    configuration as a previous query whose results were read completely,
+    it returns a finished :class:`~google.cloud.bigquery.job.QueryJob`
+    whose :meth:`~google.cloud.bigquery.job.QueryJob.result` and
+    :meth:`~google.cloud.bigquery.job.QueryJob.to_dataframe` read the cached
+    rows, without creating a job or fetching rows.
+
+    Before using a cached result, the ``etag`` of each table referenced by
+    the query is checked against the one recorded with the result, costing
+    one ``tables.get`` request per table. Disable this with
+    ``validate_tables`` to serve results with no requests at all, relying
+    on ``ttl`` alone for freshness.
+
+    Queries with a destination table, dry runs, queries which disable the
+    query cache and queries calling non-deterministic functions, such as
+    ``CURRENT_TIMESTAMP()`` or ``RAND()``, are never cached. Neither are
+    the results of DML and DDL statements.
+
+    Args:
+        max_entries (int):
+            (Optional) Maximum number of results kept in memory and, if
+            ``directory`` is set, on disk.
+        max_bytes (int):
+            (Optional) Maximum total serialized size of the results kept in
+            memory and, if ``directory`` is set, on disk.
+        max_rows (int):
+            (Optional) Results with more rows than this are not cached.
+        ttl (float):
+            (Optional) Seconds for which a result may be served. If
+            :data:`None`, results are kept until evicted by size.
+        directory (str):
+            (Optional) Directory in which to also store results, so that
+            they can be shared by processes and survive restarts.
+        validate_tables (bool):
+            (Optional) Whether to check that the tables referenced by a
+            query are unchanged before serving its cached result.
+    """
+
+    def __init__(self, max_entries=_DEFAULT_MAX_ENTRIES,
+                 max_bytes=_DEFAULT_MAX_BYTES, max_rows=_DEFAULT_MAX_ROWS,
+                 ttl=_DEFAULT_TTL, directory=None, validate_tables=True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_rows = max_rows
+        self.ttl = ttl
+        self.directory = directory
+        self.validate_tables = validate_tables
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._num_bytes = 0
+
+        if directory is not None:
+            try:
+                os.makedirs(directory)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    raise
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        """Remove every cached result, from memory and from disk."""
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+        for path in self._disk_paths():
+            self._remove_file(path)
+
+    def _use_cached_result(self, query_job):
+        """Load a cached result into a query job which is not yet begun.
+
+        On a miss, the job is set up to record its result instead.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob): The new job.
+
+        Returns:
+            bool: True if the job was loaded from the cache.
+        """
+        from google.cloud.bigquery.query import _QueryResults
+
+        if not _is_cacheable(query_job):
+            return False
+
+        key = _job_key(query_job)
+        entry = self._get(key)
+        if entry is not None and not self._tables_unchanged(
+                query_job._client, entry):
+            self._discard(key)
+            entry = None
+        if entry is None:
+            query_job._result_recorder = _ResultRecorder(self, key)
+            return False
+
+        query_job._set_properties(copy.deepcopy(entry['job']))
+        query_job._query_results = _QueryResults.from_api_repr(
+            entry['queryResults'])
+        query_job._cached_rows = _CachedRows(entry['rows'])
+        return True
+
+    def _tables_unchanged(self, client, entry):
+        if not self.validate_tables:
+            return True
+        for table_id, etag in entry['tables']:
+            try:
+                table = client.get_table(table_id)
+            except exceptions.NotFound:
+                return False
+            if table.etag != etag:
+                return False
+        return True
+
+    def _store(self, key, query_job, rows):
+        """Add a completely read result to the cache.
+
+        The result is not cached if a referenced table was modified after
+        the query started, since its ``etag`` no longer matches the result.
+        """
+        tables = []
+        if self.validate_tables:
+            try:
+                for table_ref in query_job.referenced_tables:
+                    table = query_job._client.get_table(table_ref)
+                    if (query_job.started is None or table.modified is None or
+                            table.modified >= query_job.started):
+                        return
+                    tables.append(['{}.{}.{}'.format(
+                        table.project, table.dataset_id, table.table_id),
+                        table.etag])
+            except exceptions.GoogleAPICallError:
+                return
+
+        entry = {
+            'created': time.time(),
+            'job': query_job._properties,
+            'queryResults': query_job._query_results._properties,
+            'rows': rows,
+            'tables': tables,
+        }
+        data = json.dumps(entry)
+        if len(data) > self.max_bytes:
+            return
+        # Cache a copy, independent of the job.
+        entry = json.loads(data)
+
+        with self._lock:
+            self._discard_locked(key)
+            self._entries[key] = (entry, len(data))
+            self._num_bytes += len(data)
+            while (len(self._entries) > self.max_entries or
+                   self._num_bytes > self.max_bytes):
+                _, (_, num_bytes) = self._entries.popitem(last=False)
+                self._num_bytes -= num_bytes
+
+        if self.directory is not None:
+            self._write_file(key, data)
+
+    def _get(self, key):
+        """Look up a result in memory, then on disk.
+
+        Returns:
+            Union[dict, None]: The entry, or :data:`None` if it is missing
+            or expired.
+        """
+        with self._lock:
+            item = self._entries.pop(key, None)
+            if item is not None:
+                if self._expired(item[0]):
+                    self._num_bytes -= item[1]
+                    item = None
+                else:
+                    # Re-insert to mark as most recently used.
+                    self._entries[key] = item
+                    return item[0]
+
+        if self.directory is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path) as file_obj:
+                data = file_obj.read()
+            entry = json.loads(data)
+        except (IOError, OSError, ValueError):
+            return None
+        if self._expired(entry):
+            self._remove_file(path)
+            return None
+
+        with self._lock:
+            self._discard_locked(key)
+            self._entries[key] = (entry, len(data))
+            self._num_bytes += len(data)
+        return entry
+
+    def _expired(self, entry):
+        return (self.ttl is not None and
+                entry['created'] + self.ttl < time.time())
+
+    def _discard(self, key):
+        with self._lock:
+            self._discard_locked(key)
+        if self.directory is not None:
+            self._remove_file(self._disk_path(key))
+
+    def _discard_locked(self, key):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._num_bytes -= item[1]
+
+    def _disk_path(self, key):
+        return os.path.join(self.directory, key + _FILE_SUFFIX)
+
+    def _disk_paths(self):
+        if self.directory is None:
+            return []
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(_FILE_SUFFIX)
+        ]
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _write_file(self, key, data):
+        """Atomically write an entry, then evict files beyond the limits."""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as file_obj:
+                file_obj.write(data)
+            _replace(temp_path, self._disk_path(key))
+        except (IOError, OSError):
+            self._remove_file(temp_path)
+            return
+
+        files = []
+        for path in self._disk_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort(reverse=True)
+
+        now = time.time()
+        num_bytes = 0
+        for index, (mtime, size, path) in enumerate(files):
+            num_bytes += size
+            if (index >= self.max_entries or num_bytes > self.max_bytes or
+                    (self.ttl is not None and mtime + self.ttl < now)):
+                self._remove_file(path)
@@ -16,6 +16,8 @@
 
 from __future__ import absolute_import
 
+import collections
+import concurrent.futures
 import copy
 import datetime
 import operator
@@ -28,6 +30,7 @@ except ImportError:  # pragma: NO COVER
     pandas = None
 
 from google.api_core.page_iterator import HTTPIterator
+from google.api_core.page_iterator import Page
 
 import google.cloud._helpers
 from google.cloud.bigquery import _helpers
@@ -989,6 +992,198 @@ def _row_from_mapping(mapping, schema):
     return tuple(row)
 
 
+class _RowEncoder(object):
+    """Convert rows to the JSON representation used by ``insertAll``.
+
+    The converter for each field is resolved once, when the encoder is
+    created, rather than for every cell. Use :func:`_row_encoder` to share
+    encoders between calls with the same schema.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the table destination for the rows.
+    """
+
+    def __init__(self, schema):
+        self._schema = tuple(schema)
+        self._names = [field.name for field in self._schema]
+        self._converters = {}
+        for field in self._schema:
+            converter = _helpers._SCALAR_VALUE_TO_JSON_ROW.get(
+                field.field_type)
+            # Values of some types, e.g. STRING or FLOAT, are sent as-is.
+            if converter not in (None, _helpers._float_to_json):
+                self._converters[field.name] = converter
+        self._row_converters = [
+            (index, field.name, self._converters[field.name])
+            for index, field in enumerate(self._schema)
+            if field.name in self._converters
+        ]
+
+    def encode(self, row):
+        """Convert one row.
+
+        Args:
+            row (Union[Tuple, Dict[str, object]]):
+                Row data, either a sequence ordered as the schema or a
+                mapping as accepted by :func:`_row_from_mapping`.
+
+        Returns:
+            Dict[str, object]: The JSON-compatible row.
+        """
+        if isinstance(row, dict):
+            row = _row_from_mapping(row, self._schema)
+        json_row = dict(zip(self._names, row))
+        num_values = len(json_row)
+        for index, name, converter in self._row_converters:
+            if index < num_values:
+                json_row[name] = converter(json_row[name])
+        return json_row
+
+    def encode_rows(self, rows):
+        """Convert many rows.
+
+        Args:
+            rows (Iterable[Union[Tuple, Dict[str, object]]]):
+                Row data. See :meth:`encode`.
+
+        Returns:
+            List[Dict[str, object]]: The JSON-compatible rows.
+        """
+        encode = self.encode
+        return [encode(row) for row in rows]
+
+    def _missing_column(self, field, num_rows):
+        """Values for a field with no column, as for a missing mapping key."""
+        if field.mode == 'REQUIRED':
+            raise KeyError(field.name)
+        if field.mode == 'REPEATED':
+            return [()] * num_rows
+        return [None] * num_rows
+
+    def _zip_columns(self, columns):
+        """Turn converted columns, in schema order, into row mappings."""
+        names = self._names
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def encode_columns(self, columns, num_rows):
+        """Convert column-oriented data, one column at a time.
+
+        Args:
+            columns (Mapping[str, Sequence]):
+                Values of each field, keyed by field name. Columns for
+                fields which are not ``REQUIRED`` may be omitted. Nulls must
+                be represented as :data:`None`.
+            num_rows (int): The number of rows in each column.
+
+        Returns:
+            List[Dict[str, object]]: The JSON-compatible rows.
+
+        Raises:
+            KeyError: If the column of a ``REQUIRED`` field is missing.
+        """
+        if len(self._schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+
+        encoded = []
+        for field in self._schema:
+            if field.name not in columns:
+                encoded.append(self._missing_column(field, num_rows))
+                continue
+            values = columns[field.name]
+            converter = self._converters.get(field.name)
+            if converter is not None:
+                values = [converter(value) for value in values]
+            encoded.append(values)
+        return self._zip_columns(encoded)
+
+    def _encode_series(self, field, series):
+        """Convert a column of a DataFrame, using NumPy where possible."""
+        kind = series.dtype.kind
+        nulls = series.isnull()
+        has_nulls = nulls.any()
+
+        if kind in 'iu' and field.field_type in ('INTEGER', 'INT64'):
+            # Integer dtypes can't hold nulls.
+            return series.astype(str).tolist()
+        if kind == 'b' and field.field_type in ('BOOLEAN', 'BOOL'):
+            return series.map({True: 'true', False: 'false'}).tolist()
+        if kind == 'M' and field.field_type == 'TIMESTAMP':
+            # datetime64 values are nanoseconds since the epoch, in UTC.
+            micros = series.values.astype('int64') // 1000
+            values = (micros * 1e-6).tolist()
+        else:
+            values = series.tolist()
+            converter = self._converters.get(field.name)
+            if converter is not None:
+                values = [
+                    None if null else converter(value)
+                    for value, null in zip(values, nulls.tolist())
+                ]
+                return values
+
+        if has_nulls:
+            values = [None if null else value
+                      for value, null in zip(values, nulls.tolist())]
+        return values
+
+    def encode_dataframe(self, dataframe):
+        """Convert the rows of a DataFrame, one column at a time.
+
+        Integer, boolean and timestamp columns are converted with vectorized
+        NumPy operations. Nulls (``NaN``, ``NaT``, :data:`None`) are mapped
+        to :data:`None`. Columns which do not correspond to a field in the
+        schema are ignored.
+
+        Args:
+            dataframe (pandas.DataFrame): The rows to convert.
+
+        Returns:
+            List[Dict[str, object]]: The JSON-compatible rows.
+
+        Raises:
+            KeyError: If the column of a ``REQUIRED`` field is missing.
+        """
+        if len(self._schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+
+        num_rows = len(dataframe)
+        encoded = []
+        for field in self._schema:
+            if field.name in dataframe.columns:
+                encoded.append(
+                    self._encode_series(field, dataframe[field.name]))
+            else:
+                encoded.append(self._missing_column(field, num_rows))
+        return self._zip_columns(encoded)
+
+
+_ROW_ENCODERS = {}
+_MAX_ROW_ENCODERS = 128
+
+
+def _row_encoder(schema):
+    """Get a cached :class:`_RowEncoder` for a schema.
+
+    Encoders are keyed on the schema's fields, so changing a table's schema
+    gives a new encoder.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the table destination for the rows.
+
+    Returns:
+        _RowEncoder: An encoder for rows with the given schema.
+    """
+    key = tuple(schema)
+    encoder = _ROW_ENCODERS.get(key)
+    if encoder is None:
+        if len(_ROW_ENCODERS) >= _MAX_ROW_ENCODERS:
+            _ROW_ENCODERS.clear()
+        encoder = _ROW_ENCODERS[key] = _RowEncoder(key)
+    return encoder
+
+
 class StreamingBuffer(object):
     """Information about a table's streaming buffer.
 
@@ -1109,6 +1304,9 @@ class Row(object):
     def __len__(self):
         return len(self._xxx_values)
 
+    def __iter__(self):
+        return iter(self._xxx_values)
+
     def __getitem__(self, key):
         if isinstance(key, six.string_types):
             value = self._xxx_field_to_index.get(key)
@@ -1127,6 +1325,11 @@ class Row(object):
     def __ne__(self, other):
         return not self == other
 
+    def __reduce__(self):
+        # ``__getattr__`` needs the fields, which unpickling by slots would
+        # only set after looking up ``__setstate__``.
+        return Row, (self._xxx_values, self._xxx_field_to_index)
+
     def __repr__(self):
         # sort field dict by value, for determinism
         items = sorted(self._xxx_field_to_index.items(),
@@ -1135,6 +1338,143 @@ class Row(object):
         return 'Row({}, {})'.format(self._xxx_values, f2i)
 
 
+class _RowBatch(object):
+    """The rows of one page of results, decoded a column at a time.
+
+    The raw JSON cells are kept until every column has been decoded, so
+    columns which are never read are never converted.
+
+    Args:
+        rows (Sequence[Dict[str, object]]): The JSON rows of the page.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+    """
+
+    __slots__ = ('_rows', '_schema', '_columns', '_num_rows')
+
+    def __init__(self, rows, schema):
+        self._rows = rows
+        self._schema = schema
+        self._columns = [None] * len(schema)
+        self._num_rows = len(rows)
+
+    def __len__(self):
+        return self._num_rows
+
+    def column(self, index):
+        """Return the decoded values of a column, decoding it if needed.
+
+        Args:
+            index (int): Position of the column in the schema.
+
+        Returns:
+            list: The value of the column in each row.
+        """
+        # The raw cells are released only once every column is decoded, so
+        # grab them before checking the column. No lock is needed: threads
+        # racing on a column may both decode it, and they store equal values.
+        rows = self._rows
+        column = self._columns[index]
+        if column is None:
+            column = _helpers._column_from_json(
+                rows, index, self._schema[index])
+            self._columns[index] = column
+            if None not in self._columns:
+                # Everything is decoded: the raw cells are not needed.
+                self._rows = None
+        return column
+
+    def columns(self):
+        """Return the decoded values of every column.
+
+        Returns:
+            List[list]: One list of values per field in the schema.
+        """
+        if self._rows is not None:
+            for index in range(len(self._columns)):
+                self.column(index)
+        return self._columns
+
+    def row_values(self):
+        """Return a lazy sequence of values for each row.
+
+        Returns:
+            List[_RowValues]: The values of each row, in order.
+        """
+        return [_RowValues(self, index) for index in range(self._num_rows)]
+
+
+class _RowValues(object):
+    """Read-only sequence of the values of one row in a :class:`_RowBatch`.
+
+    Once every column of the batch is decoded, the row keeps a tuple of its
+    own values and drops its reference to the batch. It compares equal to,
+    and copies and pickles as, a tuple of the same values.
+
+    Args:
+        batch (_RowBatch): The batch which holds the row.
+        index (int): Position of the row in the batch.
+    """
+
+    __slots__ = ('_batch', '_index', '_values')
+
+    def __init__(self, batch, index):
+        self._batch = batch
+        self._index = index
+        self._values = None
+
+    def _detach(self):
+        """Decode the whole row and stop referencing the batch.
+
+        Returns:
+            tuple: The values of the row.
+        """
+        batch = self._batch
+        if batch is None:
+            return self._values
+        index = self._index
+        values = tuple(column[index] for column in batch.columns())
+        # Set the values first: readers check the batch, then the values.
+        self._values = values
+        self._batch = None
+        return values
+
+    def __len__(self):
+        batch = self._batch
+        if batch is None:
+            return len(self._values)
+        return len(batch._columns)
+
+    def __getitem__(self, key):
+        batch = self._batch
+        if batch is None or isinstance(key, slice):
+            return self._detach()[key]
+        value = batch.column(key)[self._index]
+        if batch._rows is None:
+            self._detach()
+        return value
+
+    def __iter__(self):
+        return iter(self._detach())
+
+    def __eq__(self, other):
+        if not isinstance(other, (_RowValues, tuple)):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._detach(), memo)
+
+    def __reduce__(self):
+        return tuple, (self._detach(),)
+
+    def __repr__(self):
+        return repr(self._detach())
+
+
 class RowIterator(HTTPIterator):
     """A class for iterating through HTTP/JSON API row list responses.
 
@@ -1149,10 +1489,17 @@ class RowIterator(HTTPIterator):
         page_size (int, optional): The number of items to return per page.
         extra_params (Dict[str, object]):
             Extra query string parameters for the API call.
+        max_workers (int, optional):
+            If set, fetch the pages following the first one concurrently
+            with up to this many threads, addressing them by ``startIndex``
+            rather than by page token. At most ``max_workers`` pages are
+            requested ahead of the consumer, and pages are always delivered
+            in order.
     """
 
     def __init__(self, client, api_request, path, schema, page_token=None,
-                 max_results=None, page_size=None, extra_params=None):
+                 max_results=None, page_size=None, extra_params=None,
+                 max_workers=None):
         super(RowIterator, self).__init__(
             client, api_request, path, item_to_value=_item_to_row,
             items_key='rows', page_token=page_token, max_results=max_results,
@@ -1162,6 +1509,162 @@ class RowIterator(HTTPIterator):
         self._field_to_index = _helpers._field_to_index_mapping(schema)
         self._total_rows = None
         self._page_size = page_size
+        self._max_workers = max_workers
+
+    def _new_page(self, response):
+        """Wrap a ``tabledata.list`` response in a page of rows.
+
+        The rows of the page share a :class:`_RowBatch`, which decodes a
+        column only when it is first read. Columnar consumers, such as
+        :meth:`to_dataframe`, read the batch without creating rows.
+
+        Args:
+            response (Dict[str, object]): The JSON API response.
+
+        Returns:
+            Page: The page of rows.
+        """
+        batch = _RowBatch(response.get(self._items_key, ()), self.schema)
+        page = Page(self, batch.row_values(), self.item_to_value)
+        page._row_batch = batch
+        self._page_start(self, page, response)
+        return page
+
+    def _next_page(self):
+        """Get the next page in the iterator.
+
+        Returns:
+            Optional[Page]: The next page in the iterator or :data:`None` if
+                there are no pages left.
+        """
+        if not self._has_next_page():
+            return None
+        response = self._get_next_page_response()
+        page = self._new_page(response)
+        self.next_page_token = response.get(self._next_token)
+        return page
+
+    def _page_iter(self, increment):
+        """Generator of pages of API responses.
+
+        When ``max_workers`` is set and the first response reports the
+        total number of rows, the remaining pages are fetched concurrently.
+        Otherwise, pages are followed one at a time by page token.
+
+        Args:
+            increment (bool): Flag indicating if the total number of results
+                should be incremented on each page.
+
+        Yields:
+            Page: each page of items from the API.
+        """
+        parent_iter = super(RowIterator, self)._page_iter(increment)
+        if self._max_workers is None or self.next_page_token is not None:
+            for page in parent_iter:
+                yield page
+            return
+
+        first_page = six.next(parent_iter, None)
+        if first_page is None:
+            return
+        first_count = first_page.num_items
+        yield first_page
+
+        if (self.next_page_token is None or self._total_rows is None or
+                first_count == 0):
+            # Everything fit in one page, or the table size is unknown.
+            for page in parent_iter:
+                yield page
+            return
+
+        start_index = int(self.extra_params.get('startIndex', 0))
+        end_index = self._total_rows
+        if self.max_results is not None:
+            end_index = min(end_index, start_index + self.max_results)
+        stride = self._page_size or first_count
+        offsets = six.moves.range(
+            start_index + first_count, end_index, stride)
+
+        for response in self._fetch_ranges_concurrently(
+                offsets, stride, end_index):
+            page = self._new_page(response)
+            self.page_number += 1
+            if increment:
+                self.num_results += page.num_items
+            yield page
+        self.next_page_token = None
+
+    def _fetch_ranges_concurrently(self, offsets, stride, end_index):
+        """Fetch row ranges on a thread pool and yield responses in order.
+
+        Args:
+            offsets (Iterable[int]): Start index of each range to fetch.
+            stride (int): Number of rows in each range.
+            end_index (int): Index one past the last row to fetch.
+
+        Yields:
+            Dict[str, object]: The ``tabledata.list`` responses.
+        """
+        offsets = iter(offsets)
+        pending = collections.deque()
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers)
+
+        def submit_next():
+            offset = six.next(offsets, None)
+            if offset is not None:
+                end = min(offset + stride, end_index)
+                pending.append(
+                    executor.submit(self._fetch_range, offset, end))
+
+        try:
+            for _ in six.moves.range(self._max_workers):
+                submit_next()
+            while pending:
+                responses = pending.popleft().result()
+                submit_next()
+                for response in responses:
+                    yield response
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _fetch_range(self, start, end):
+        """Request the rows in ``[start, end)`` by ``startIndex``.
+
+        The API may return fewer rows than requested, e.g. when the response
+        would be too large, so keep requesting until the range is covered.
+
+        Args:
+            start (int): Index of the first row to fetch.
+            end (int): Index one past the last row to fetch.
+
+        Returns:
+            List[Dict[str, object]]: The responses covering the range.
+
+        Raises:
+            ValueError:
+                If a response has no rows before the range is covered, e.g.
+                when the table shrank after the first page was read.
+        """
+        responses = []
+        while start < end:
+            params = dict(self.extra_params)
+            params['startIndex'] = start
+            params['maxResults'] = end - start
+            response = self.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                query_params=params)
+            num_rows = len(response.get(self._items_key, ()))
+            if num_rows == 0:
+                raise ValueError(
+                    'Expected rows up to index {} of {}, but got no rows '
+                    'from index {}.'.format(end, self._total_rows, start))
+            responses.append(response)
+            start += num_rows
+        return responses
 
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
@@ -1188,9 +1691,32 @@ class RowIterator(HTTPIterator):
         """int: The total number of rows in the table."""
         return self._total_rows
 
-    def to_dataframe(self):
+    def _to_dataframe_page(self, page, column_names, dtypes):
+        """Decode one page of ``tabledata.list`` rows into a DataFrame.
+
+        Cells are converted column by column straight from the raw JSON
+        response, bypassing the per-row :class:`Row` objects.
+        """
+        columns = page._row_batch.columns()
+        data = {}
+        for name, values in zip(column_names, columns):
+            if name in dtypes:
+                values = pandas.Series(values, dtype=dtypes[name])
+            data[name] = values
+        return pandas.DataFrame(data, columns=column_names)
+
+    def to_dataframe(self, dtypes=None):
         """Create a pandas DataFrame from the query results.
 
+        Args:
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                Optional. A dictionary of column names to pandas ``dtype``s.
+                The provided ``dtype`` is used when constructing the series
+                for the column specified. Otherwise, the default pandas
+                behavior is used.
+
         Returns:
             pandas.DataFrame:
                 A :class:`~pandas.DataFrame` populated with row data and column
@@ -1203,12 +1729,93 @@ class RowIterator(HTTPIterator):
         """
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
+        if dtypes is None:
+            dtypes = {}
+
+        # Build one frame per page so that only the decoded columns of the
+        # pages, rather than a Row object per record, are held in memory.
+        frames = list(self._iter_page_dataframes(dtypes))
+
+        if not frames:
+            column_names = [field.name for field in self._schema]
+            return pandas.DataFrame(columns=column_names)
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True)
+
+    def _iter_page_dataframes(self, dtypes):
+        """Yield one DataFrame per non-empty page of results."""
+        column_names = [field.name for field in self._schema]
+        for page in self.pages:
+            if page.num_items:
+                yield self._to_dataframe_page(page, column_names, dtypes)
+
+    def _iter_dataframes(self, dtypes, max_rows_per_frame):
+        """Yield DataFrames holding at most ``max_rows_per_frame`` rows."""
+        frames = self._iter_page_dataframes(dtypes)
+        if max_rows_per_frame is None:
+            for frame in frames:
+                yield frame
+            return
+
+        buffered = []
+        num_buffered = 0
+        for frame in frames:
+            buffered.append(frame)
+            num_buffered += len(frame)
+            if num_buffered < max_rows_per_frame:
+                continue
+            combined = pandas.concat(buffered, ignore_index=True)
+            start = 0
+            while num_buffered - start >= max_rows_per_frame:
+                end = start + max_rows_per_frame
+                yield combined.iloc[start:end].reset_index(drop=True)
+                start = end
+            buffered = [combined.iloc[start:].reset_index(drop=True)]
+            num_buffered -= start
+
+        if num_buffered:
+            yield pandas.concat(buffered, ignore_index=True)
+
+    def iter_dataframes(self, dtypes=None, max_rows_per_frame=None):
+        """Iterate over the query results as a series of pandas DataFrames.
+
+        Unlike :meth:`to_dataframe`, only the rows of the frame being built
+        are held in memory, so results larger than memory can be processed
+        frame by frame. Each frame has the columns of the destination table's
+        schema, in order, and its own zero-based index.
 
-        column_headers = [field.name for field in self.schema]
-        # Use generator, rather than pulling the whole rowset into memory.
-        rows = (row.values() for row in iter(self))
+        Args:
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                Optional. A dictionary of column names to pandas ``dtype``s.
+                Pass this to keep column types the same across frames, for
+                example when some pages contain nulls in an integer column.
+            max_rows_per_frame (int):
+                Optional. The number of rows in each frame, except possibly
+                the last. By default, one frame is yielded per page of
+                results; use the ``page_size`` argument of
+                :meth:`~google.cloud.bigquery.client.Client.list_rows` to set
+                the page size.
+
+        Returns:
+            Iterator[pandas.DataFrame]:
+                A generator of :class:`~pandas.DataFrame` objects. No frames
+                are generated if there are no rows.
 
-        return pandas.DataFrame(rows, columns=column_headers)
+        Raises:
+            ValueError:
+                If the :mod:`pandas` library cannot be imported or if
+                ``max_rows_per_frame`` is not positive.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        if max_rows_per_frame is not None and max_rows_per_frame < 1:
+            raise ValueError('max_rows_per_frame must be a positive integer')
+        if dtypes is None:
+            dtypes = {}
+        return self._iter_dataframes(dtypes, max_rows_per_frame)
 
 
 class _EmptyRowIterator(object):
@@ -1222,11 +1829,37 @@ class _EmptyRowIterator(object):
     pages = ()
     total_rows = 0
 
-    def to_dataframe(self):
+    def to_dataframe(self, dtypes=None):
+        """Create an empty dataframe.
+
+        Args:
+            dtypes (Any):
+                Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            pandas.DataFrame:
+                An empty :class:`~pandas.DataFrame`.
+        """
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
         return pandas.DataFrame()
 
+    def iter_dataframes(self, dtypes=None, max_rows_per_frame=None):
+        """Iterate over no dataframes.
+
+        Args:
+            dtypes (Any):
+                Ignored. Added for compatibility with RowIterator.
+            max_rows_per_frame (Any):
+                Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            Iterator[pandas.DataFrame]: An empty iterator.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        return iter(())
+
     def __iter__(self):
         return iter(())
 
@@ -1375,26 +2008,21 @@ class TimePartitioning(object):
         return 'TimePartitioning({})'.format(','.join(key_vals))
 
 
-def _item_to_row(iterator, resource):
-    """Convert a JSON row to the native object.
-
-    .. note::
-
-        This assumes that the ``schema`` attribute has been
-        added to the iterator after being created, which
-        should be done by the caller.
+def _item_to_row(iterator, values):
+    """Wrap the values of a row in the native object.
 
     :type iterator: :class:`~google.api_core.page_iterator.Iterator`
     :param iterator: The iterator that is currently in use.
 
-    :type resource: dict
-    :param resource: An item to be converted to a row.
+    :type values: :class:`_RowValues`
+    :param values:
+        The lazily decoded values of a row, as set up by
+        :meth:`RowIterator._new_page`.
 
     :rtype: :class:`~google.cloud.bigquery.table.Row`
     :returns: The next row in the page.
     """
-    return Row(_helpers._row_tuple_from_json(resource, iterator.schema),
-               iterator._field_to_index)
+    return Row(values, iterator._field_to_index)
 
 
 # pylint: disable=unused-argument
@@ -536,6 +536,53 @@ class Test_row_tuple_from_json(unittest.TestCase):
             ],))
 
 
+class Test_columns_from_json(unittest.TestCase):
+
+    def _call_fut(self, rows, schema):
+        from google.cloud.bigquery._helpers import _columns_from_json
+
+        return _columns_from_json(rows, schema)
+
+    def test_w_empty_rows(self):
+        col = _Field('REQUIRED', 'col', 'INTEGER')
+        self.assertEqual(self._call_fut([], schema=[col]), [[]])
+
+    def test_w_scalar_array_and_struct_columns(self):
+        name = _Field('REQUIRED', 'name', 'STRING')
+        age = _Field('NULLABLE', 'age', 'INTEGER')
+        tags = _Field('REPEATED', 'tags', 'INTEGER')
+        sub = _Field('REQUIRED', 'sub', 'BOOLEAN')
+        struct = _Field('NULLABLE', 'struct', 'RECORD', fields=[sub])
+        rows = [
+            {u'f': [
+                {u'v': u'Phred'},
+                {u'v': u'32'},
+                {u'v': [{u'v': u'1'}, {u'v': u'2'}]},
+                {u'v': {u'f': [{u'v': u'true'}]}},
+            ]},
+            {u'f': [
+                {u'v': u'Bharney'},
+                {u'v': None},
+                {u'v': []},
+                {u'v': None},
+            ]},
+        ]
+        schema = [name, age, tags, struct]
+
+        columns = self._call_fut(rows, schema)
+
+        self.assertEqual(columns, [
+            [u'Phred', u'Bharney'],
+            [32, None],
+            [[1, 2], []],
+            [{u'sub': True}, None],
+        ])
+        # Matches the row-oriented conversion, transposed.
+        from google.cloud.bigquery._helpers import _row_tuple_from_json
+        row_tuples = [_row_tuple_from_json(row, schema) for row in rows]
+        self.assertEqual([list(col) for col in zip(*row_tuples)], columns)
+
+
 class Test_rows_from_json(unittest.TestCase):
 
     def _call_fut(self, rows, schema):
@@ -765,6 +812,19 @@ class Test_timestamp_to_json_row(unittest.TestCase):
         self.assertEqual(
             self._call_fut(when), _microseconds_from_datetime(when) / 1e6)
 
+    def test_w_datetime_w_non_utc_zone_before_epoch(self):
+        from google.cloud._helpers import _microseconds_from_datetime
+
+        class _Zone(datetime.tzinfo):
+
+            def utcoffset(self, _):
+                return datetime.timedelta(minutes=-240)
+
+        when = datetime.datetime(
+            1965, 12, 20, 15, 58, 27, 339328, tzinfo=_Zone())
+        self.assertEqual(
+            self._call_fut(when), _microseconds_from_datetime(when) / 1e6)
+
 
 class Test_datetime_to_json(unittest.TestCase):
 
@@ -0,0 +1,176 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
+
+class Test_ByteSink(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._pandas_helpers import _ByteSink
+
+        return _ByteSink
+
+    def test_write(self):
+        buffer = bytearray(b'abc')
+        sink = self._get_target_class()(buffer)
+
+        sink.write(b'de')
+        sink.write(b'f')
+        sink.flush()
+
+        self.assertEqual(buffer, bytearray(b'abcdef'))
+        self.assertEqual(sink.tell(), 3)
+        self.assertFalse(sink.closed)
+
+
+@unittest.skipIf(pandas is None, 'Requires `pandas`')
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class TestParquetStream(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._pandas_helpers import ParquetStream
+
+        return ParquetStream
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _read_dataframe(data):
+        return pyarrow.parquet.read_table(
+            pyarrow.BufferReader(data)).to_pandas()
+
+    @staticmethod
+    def _make_dataframe(start, stop):
+        return pandas.DataFrame(
+            {'n': range(start, stop),
+             'name': ['name-{}'.format(n) for n in range(start, stop)]},
+            index=range(start, stop))
+
+    def test_ctor_wo_pyarrow(self):
+        with mock.patch(
+                'google.cloud.bigquery._pandas_helpers.pyarrow', new=None):
+            with self.assertRaises(ImportError):
+                self._make_one(self._make_dataframe(0, 1))
+
+    def test_ctor_w_empty_iterable(self):
+        with self.assertRaises(ValueError):
+            self._make_one(iter(()))
+
+    def test_read_w_dataframe(self):
+        dataframe = self._make_dataframe(0, 10)
+        stream = self._make_one(dataframe, row_group_size=3)
+
+        data = stream.read()
+
+        self.assertEqual(stream.tell(), len(data))
+        self.assertEqual(stream.read(), b'')
+        self.assertTrue(self._read_dataframe(data).equals(dataframe))
+        metadata = pyarrow.parquet.ParquetFile(
+            pyarrow.BufferReader(data)).metadata
+        self.assertEqual(metadata.num_row_groups, 4)
+
+    def test_read_w_empty_dataframe(self):
+        dataframe = pandas.DataFrame({'n': []}, dtype='int64')
+        stream = self._make_one(dataframe)
+
+        result = self._read_dataframe(stream.read())
+
+        self.assertEqual(list(result.columns), ['n'])
+        self.assertEqual(len(result), 0)
+
+    def test_read_w_iterable_is_lazy(self):
+        produced = []
+
+        def dataframes():
+            for start in range(0, 9, 3):
+                produced.append(start)
+                yield self._make_dataframe(start, start + 3)
+
+        stream = self._make_one(dataframes())
+        self.assertEqual(produced, [0])
+
+        chunks = []
+        chunk = stream.read(16)
+        while chunk:
+            chunks.append(chunk)
+            chunk = stream.read(16)
+
+        self.assertEqual(produced, [0, 3, 6])
+        self.assertTrue(
+            self._read_dataframe(b''.join(chunks)).equals(
+                self._make_dataframe(0, 9)))
+
+    def test_read_w_mismatched_dataframes(self):
+        stream = self._make_one(iter([
+            self._make_dataframe(0, 3),
+            pandas.DataFrame({'other': [1.5]}),
+        ]))
+
+        with self.assertRaises(ValueError):
+            stream.read()
+
+    def test_read_discards_data_before_last_read(self):
+        stream = self._make_one(self._make_dataframe(0, 1000))
+
+        stream.read(100)
+        stream.read(100)
+
+        self.assertEqual(stream._buffer_start, 100)
+
+    def test_seek_to_start_of_last_read(self):
+        stream = self._make_one(self._make_dataframe(0, 10))
+        stream.read(8)
+        chunk = stream.read(8)
+
+        self.assertEqual(stream.seek(8), 8)
+
+        self.assertEqual(stream.tell(), 8)
+        self.assertEqual(stream.read(8), chunk)
+
+    def test_seek_before_buffered_data(self):
+        stream = self._make_one(self._make_dataframe(0, 10))
+        stream.read(8)
+        stream.read(8)
+
+        with self.assertRaises(ValueError):
+            stream.seek(0)
+
+    def test_seek_past_position(self):
+        stream = self._make_one(self._make_dataframe(0, 10))
+
+        with self.assertRaises(ValueError):
+            stream.seek(1)
+
+    def test_seek_w_whence_end(self):
+        stream = self._make_one(self._make_dataframe(0, 10))
+
+        with self.assertRaises(ValueError):
+            stream.seek(0, os.SEEK_END)
@@ -31,6 +31,7 @@ except (ImportError, AttributeError):  # pragma: NO COVER
     pandas = None
 try:
     import pyarrow
+    import pyarrow.parquet
 except (ImportError, AttributeError):  # pragma: NO COVER
     pyarrow = None
 
@@ -101,6 +102,16 @@ class TestClient(unittest.TestCase):
         self.assertIs(client._connection.credentials, creds)
         self.assertIs(client._connection.http, http)
         self.assertIsNone(client.location)
+        self.assertIsNone(client.query_cache)
+
+    def test_ctor_w_query_cache(self):
+        from google.cloud.bigquery.query_cache import QueryResultCache
+
+        creds = _make_credentials()
+        cache = QueryResultCache()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=object(), query_cache=cache)
+        self.assertIs(client.query_cache, cache)
 
     def test_ctor_w_location(self):
         from google.cloud.bigquery._http import Connection
@@ -2385,7 +2396,8 @@ class TestClient(unittest.TestCase):
         fake_transport.request.return_value = fake_response
         return fake_transport
 
-    def _initiate_resumable_upload_helper(self, num_retries=None):
+    def _initiate_resumable_upload_helper(
+            self, num_retries=None, chunk_size=None):
         from google.resumable_media.requests import ResumableUpload
         from google.cloud.bigquery.client import _DEFAULT_CHUNKSIZE
         from google.cloud.bigquery.client import _GENERIC_CONTENT_TYPE
@@ -2410,7 +2422,7 @@ class TestClient(unittest.TestCase):
         job = LoadJob(None, None, self.TABLE_REF, client, job_config=config)
         metadata = job.to_api_repr()
         upload, transport = client._initiate_resumable_upload(
-            stream, metadata, num_retries)
+            stream, metadata, num_retries, chunk_size=chunk_size)
 
         # Check the returned values.
         self.assertIsInstance(upload, ResumableUpload)
@@ -2422,7 +2434,10 @@ class TestClient(unittest.TestCase):
         expected_headers = _get_upload_headers(conn.USER_AGENT)
         self.assertEqual(upload._headers, expected_headers)
         self.assertFalse(upload.finished)
-        self.assertEqual(upload._chunk_size, _DEFAULT_CHUNKSIZE)
+        if chunk_size is None:
+            self.assertEqual(upload._chunk_size, _DEFAULT_CHUNKSIZE)
+        else:
+            self.assertEqual(upload._chunk_size, chunk_size)
         self.assertIs(upload._stream, stream)
         self.assertIsNone(upload._total_bytes)
         self.assertEqual(upload._content_type, _GENERIC_CONTENT_TYPE)
@@ -2456,6 +2471,9 @@ class TestClient(unittest.TestCase):
     def test__initiate_resumable_upload_with_retry(self):
         self._initiate_resumable_upload_helper(num_retries=11)
 
+    def test__initiate_resumable_upload_with_chunk_size(self):
+        self._initiate_resumable_upload_helper(chunk_size=256 * 1024)
+
     def _do_multipart_upload_success_helper(
             self, get_boundary, num_retries=None):
         from google.cloud.bigquery.client import _get_upload_headers
@@ -3712,6 +3730,67 @@ class TestClient(unittest.TestCase):
                 project, ds_id, table_id),
             data=sent)
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_insert_rows_from_dataframe(self):
+        from google.cloud.bigquery.table import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        PATH = 'projects/%s/datasets/%s/tables/%s/insertAll' % (
+            self.PROJECT, self.DS_ID, self.TABLE_ID)
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        conn = client._connection = _make_connection({})
+        schema = [
+            SchemaField('full_name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+            SchemaField('score', 'FLOAT', mode='NULLABLE'),
+            SchemaField('active', 'BOOLEAN', mode='NULLABLE'),
+        ]
+        table = Table(self.TABLE_REF, schema=schema)
+        dataframe = pandas.DataFrame({
+            'full_name': ['Phred Phlyntstone', 'Bharney Rhubble'],
+            'age': [32, 33],
+            'score': [1.5, float('nan')],
+            'ignored': ['x', 'y'],
+        })
+
+        with mock.patch('uuid.uuid4', side_effect=map(str, range(2))):
+            errors = client.insert_rows_from_dataframe(table, dataframe)
+
+        self.assertEqual(len(errors), 0)
+        SENT = {
+            'rows': [
+                {'json': {'full_name': 'Phred Phlyntstone', 'age': '32',
+                          'score': 1.5, 'active': None},
+                 'insertId': '0'},
+                {'json': {'full_name': 'Bharney Rhubble', 'age': '33',
+                          'score': None, 'active': None},
+                 'insertId': '1'},
+            ],
+        }
+        conn.api_request.assert_called_once_with(
+            method='POST',
+            path='/%s' % PATH,
+            data=SENT)
+        # The request body must be serializable.
+        json.dumps(SENT)
+        sent_age = conn.api_request.call_args[1]['data']['rows'][0]['json']
+        self.assertIs(type(sent_age['age']), str)
+
+    def test_insert_rows_from_dataframe_wo_schema(self):
+        from google.cloud.bigquery.table import Table
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        table = Table(self.TABLE_REF)
+
+        with self.assertRaises(ValueError):
+            client.insert_rows_from_dataframe(table, mock.sentinel.dataframe)
+
     def test_insert_rows_json(self):
         from google.cloud.bigquery.table import Table, SchemaField
         from google.cloud.bigquery.dataset import DatasetReference
@@ -3962,6 +4041,35 @@ class TestClient(unittest.TestCase):
             self.assertEqual(req[1]['query_params'], test[1],
                              'for kwargs %s' % test[0])
 
+    def test_list_rows_w_max_workers(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        table = Table(self.TABLE_REF,
+                      schema=[SchemaField('age', 'INTEGER', mode='NULLABLE')])
+        responses = [
+            {'rows': [{'f': [{'v': '1'}]}], 'totalRows': '3',
+             'pageToken': 'next'},
+            {'rows': [{'f': [{'v': '2'}]}], 'totalRows': '3'},
+            {'rows': [{'f': [{'v': '3'}]}], 'totalRows': '3'},
+        ]
+        conn = client._connection = _make_connection(*responses)
+
+        iterator = client.list_rows(table, max_workers=1)
+        ages = [row.age for row in iterator]
+
+        self.assertEqual(ages, [1, 2, 3])
+        params = [call[1]['query_params']
+                  for call in conn.api_request.call_args_list]
+        self.assertEqual(params, [
+            {},
+            {'startIndex': 1, 'maxResults': 1},
+            {'startIndex': 2, 'maxResults': 1},
+        ])
+
     def test_list_rows_repeated_fields(self):
         from google.cloud.bigquery.table import SchemaField
 
@@ -4222,7 +4330,8 @@ class TestClientUpload(object):
         do_upload.assert_called_once_with(
             file_obj,
             self.EXPECTED_CONFIGURATION,
-            _DEFAULT_NUM_RETRIES)
+            _DEFAULT_NUM_RETRIES,
+            chunk_size=None)
 
     def test_load_table_from_file_w_explicit_project(self):
         from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
@@ -4244,7 +4353,8 @@ class TestClientUpload(object):
         do_upload.assert_called_once_with(
             file_obj,
             expected_resource,
-            _DEFAULT_NUM_RETRIES)
+            _DEFAULT_NUM_RETRIES,
+            chunk_size=None)
 
     def test_load_table_from_file_w_client_location(self):
         from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
@@ -4273,7 +4383,8 @@ class TestClientUpload(object):
         do_upload.assert_called_once_with(
             file_obj,
             expected_resource,
-            _DEFAULT_NUM_RETRIES)
+            _DEFAULT_NUM_RETRIES,
+            chunk_size=None)
 
     def test_load_table_from_file_resumable_metadata(self):
         from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
@@ -4330,7 +4441,8 @@ class TestClientUpload(object):
         do_upload.assert_called_once_with(
             file_obj,
             expected_config,
-            _DEFAULT_NUM_RETRIES)
+            _DEFAULT_NUM_RETRIES,
+            chunk_size=None)
 
     def test_load_table_from_file_multipart(self):
         from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
@@ -4368,7 +4480,8 @@ class TestClientUpload(object):
         do_upload.assert_called_once_with(
             file_obj,
             self.EXPECTED_CONFIGURATION,
-            num_retries)
+            num_retries,
+            chunk_size=None)
 
     def test_load_table_from_file_with_rewind(self):
         client = self._make_client()
@@ -4398,7 +4511,8 @@ class TestClientUpload(object):
         do_upload.assert_called_once_with(
             gzip_file,
             self.EXPECTED_CONFIGURATION,
-            _DEFAULT_NUM_RETRIES)
+            _DEFAULT_NUM_RETRIES,
+            chunk_size=None)
 
     def test_load_table_from_file_with_writable_gzip(self):
         client = self._make_client()
@@ -4460,13 +4574,13 @@ class TestClientUpload(object):
 
         load_table_from_file.assert_called_once_with(
             client, mock.ANY, self.TABLE_REF, num_retries=_DEFAULT_NUM_RETRIES,
-            rewind=True, job_id=None, job_id_prefix=None, location=None,
-            project=None, job_config=mock.ANY)
+            job_id=None, job_id_prefix=None, location=None,
+            project=None, job_config=mock.ANY, chunk_size=None)
 
         sent_file = load_table_from_file.mock_calls[0][1][1]
-        sent_bytes = sent_file.getvalue()
-        assert isinstance(sent_bytes, bytes)
-        assert len(sent_bytes) > 0
+        sent_table = pyarrow.parquet.read_table(
+            pyarrow.BufferReader(sent_file.read()))
+        assert sent_table.to_pandas().equals(dataframe)
 
         sent_config = load_table_from_file.mock_calls[0][2]['job_config']
         assert sent_config.source_format == job.SourceFormat.PARQUET
@@ -4493,15 +4607,16 @@ class TestClientUpload(object):
         load_table_from_file.assert_called_once_with(
             client, mock.ANY, self.TABLE_REF,
             num_retries=_DEFAULT_NUM_RETRIES,
-            rewind=True, job_id=None,
+            job_id=None,
             job_id_prefix=None,
             location=self.LOCATION,
             project=None,
             job_config=mock.ANY,
+            chunk_size=None,
         )
 
         sent_file = load_table_from_file.mock_calls[0][1][1]
-        sent_bytes = sent_file.getvalue()
+        sent_bytes = sent_file.read()
         assert isinstance(sent_bytes, bytes)
         assert len(sent_bytes) > 0
 
@@ -4534,18 +4649,53 @@ class TestClientUpload(object):
         load_table_from_file.assert_called_once_with(
             client, mock.ANY, self.TABLE_REF,
             num_retries=_DEFAULT_NUM_RETRIES,
-            rewind=True,
             job_id=None,
             job_id_prefix=None,
             location=self.LOCATION,
             project=None,
             job_config=mock.ANY,
+            chunk_size=None,
         )
 
         sent_config = load_table_from_file.mock_calls[0][2]['job_config']
         assert sent_config is job_config
         assert sent_config.source_format == job.SourceFormat.PARQUET
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_load_table_from_dataframe_w_iterable(self):
+        from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
+
+        client = self._make_client()
+        dataframes = (
+            pandas.DataFrame({'name': [name], 'age': [age]})
+            for name, age in (('Monty', 100), ('Python', 60)))
+
+        load_patch = mock.patch(
+            'google.cloud.bigquery.client.Client.load_table_from_file',
+            autospec=True)
+        with load_patch as load_table_from_file:
+            client.load_table_from_dataframe(
+                dataframes, self.TABLE_REF, chunk_size=256 * 1024)
+
+        load_table_from_file.assert_called_once_with(
+            client, mock.ANY, self.TABLE_REF,
+            num_retries=_DEFAULT_NUM_RETRIES,
+            job_id=None,
+            job_id_prefix=None,
+            location=None,
+            project=None,
+            job_config=mock.ANY,
+            chunk_size=256 * 1024,
+        )
+
+        sent_file = load_table_from_file.mock_calls[0][1][1]
+        sent_table = pyarrow.parquet.read_table(
+            pyarrow.BufferReader(sent_file.read()))
+        sent_dataframe = sent_table.to_pandas()
+        assert list(sent_dataframe['name']) == ['Monty', 'Python']
+        assert list(sent_dataframe['age']) == [100, 60]
+
     # Low-level tests
 
     @classmethod
@@ -161,6 +161,57 @@ class TestCursor(unittest.TestCase):
         third_page = cursor.fetchmany()
         self.assertEqual(third_page, [])
 
+    def test_fetchmany_w_max_workers(self):
+        from google.cloud.bigquery import dbapi
+        client = self._mock_client(rows=[(1, 2, 3), (4, 5, 6)])
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.max_workers = 4
+        cursor.execute('SELECT a, b, c;')
+        rows = cursor.fetchmany(size=2)
+        self.assertEqual(rows, [(1, 2, 3), (4, 5, 6)])
+        _, kwargs = client.list_rows.call_args
+        self.assertEqual(kwargs['max_workers'], 4)
+
+    def test_fetchmany_w_prefetch(self):
+        from google.cloud.bigquery import dbapi
+
+        def pages():
+            for page in ([(1,), (2,)], [(3,), (4,)], [(5,)]):
+                yield page
+
+        client = self._mock_client()
+        client.list_rows.return_value = mock.Mock(pages=pages())
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.arraysize = 2
+        cursor.prefetch = True
+        cursor.execute('SELECT a;')
+
+        self.assertEqual(cursor.fetchmany(), [(1,), (2,)])
+        self.assertEqual(cursor.fetchall(), [(3,), (4,), (5,)])
+        self.assertEqual(cursor.fetchone(), None)
+        _, kwargs = client.list_rows.call_args
+        self.assertEqual(kwargs['page_size'], 2)
+
+    def test_fetchone_w_prefetch_error(self):
+        from google.cloud.bigquery import dbapi
+
+        def pages():
+            yield [(1,)]
+            raise ValueError('boom')
+
+        client = self._mock_client()
+        client.list_rows.return_value = mock.Mock(pages=pages())
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.prefetch = True
+        cursor.execute('SELECT a;')
+
+        self.assertEqual(cursor.fetchone(), (1,))
+        with self.assertRaises(ValueError):
+            cursor.fetchone()
+
     def test_fetchall_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
@@ -269,6 +320,74 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, 12)
 
+    def test_executemany_w_max_concurrent_queries(self):
+        import threading
+        from google.cloud.bigquery import client as client_module
+        from google.cloud.bigquery.dbapi import connect
+
+        # The first query only finishes once the second one has started.
+        second_started = threading.Event()
+        jobs = {
+            'first': self._mock_job(num_dml_affected_rows=3),
+            'second': self._mock_job(num_dml_affected_rows=5),
+        }
+
+        def query(operation, job_config=None, job_id=None):
+            value = job_config.query_parameters[0].value
+            if value == 'second':
+                second_started.set()
+            else:
+                self.assertTrue(second_started.wait(5))
+            return jobs[value]
+
+        client = mock.create_autospec(client_module.Client)
+        client.query.side_effect = query
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.max_concurrent_queries = 2
+
+        cursor.executemany(
+            'DELETE FROM UserSessions WHERE user_id = %s;',
+            (('first',), ('second',)))
+
+        self.assertEqual(client.query.call_count, 2)
+        self.assertIsNone(cursor.description)
+        # The cursor holds the results of the last parameters.
+        self.assertEqual(cursor.rowcount, 5)
+        self.assertEqual(cursor.fetchall(), [])
+
+    def test_executemany_w_max_concurrent_queries_error(self):
+        import google.cloud.exceptions
+
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.dbapi import exceptions
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        client.query.return_value.result.side_effect = (
+            google.cloud.exceptions.GoogleCloudError(''))
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.max_concurrent_queries = 2
+
+        with self.assertRaises(exceptions.DatabaseError):
+            cursor.executemany(
+                'DELETE FROM UserSessions WHERE user_id = %s;',
+                (('test',), ('anothertest',)))
+        self.assertEqual(cursor.rowcount, -1)
+
+    def test_executemany_w_max_concurrent_queries_wo_parameters(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client()
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.max_concurrent_queries = 2
+
+        cursor.executemany('SELECT 1;', [])
+
+        client.query.assert_not_called()
+        self.assertEqual(cursor.rowcount, -1)
+
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
         formatted_operation = cursor._format_operation(
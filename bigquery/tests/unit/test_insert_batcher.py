@@ -0,0 +1,322 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestInsertBatcher(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+    DS_ID = 'dataset_name'
+    TABLE_ID = 'table_name'
+    PATH = '/projects/prahj-ekt/datasets/dataset_name/tables/table_name'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.insert_batcher import InsertBatcher
+        return InsertBatcher
+
+    def _make_one(self, client, **kw):
+        table = '{}.{}'.format(self.DS_ID, self.TABLE_ID)
+        kw.setdefault('max_latency', 60.0)
+        return self._get_target_class()(client, table, **kw)
+
+    def _make_client(self, *responses):
+        client = mock.Mock(spec=['project', '_call_api'])
+        client.project = self.PROJECT
+        if responses:
+            client._call_api.side_effect = list(responses)
+        else:
+            client._call_api.return_value = {}
+        return client
+
+    @staticmethod
+    def _sent_row_ids(client):
+        return [
+            [row['insertId'] for row in call[1]['data']['rows']]
+            for call in client._call_api.call_args_list
+        ]
+
+    def test_insert_batches_by_max_rows(self):
+        from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+        client = self._make_client()
+        batcher = self._make_one(client, max_rows=2, max_in_flight=1)
+
+        futures = batcher.insert_many(
+            [{'n': n} for n in range(5)], row_ids=list('abcde'))
+        batcher.close()
+
+        self.assertEqual(
+            self._sent_row_ids(client), [['a', 'b'], ['c', 'd'], ['e']])
+        for future in futures:
+            self.assertEqual(future.result(), [])
+        args, kwargs = client._call_api.call_args_list[0]
+        self.assertEqual(args, (DEFAULT_RETRY,))
+        self.assertEqual(kwargs['method'], 'POST')
+        self.assertEqual(kwargs['path'], self.PATH + '/insertAll')
+        self.assertEqual(kwargs['data']['rows'][0], {
+            'json': {'n': 0}, 'insertId': 'a'})
+
+    def test_insert_batches_by_max_bytes(self):
+        client = self._make_client()
+        batcher = self._make_one(client, max_bytes=150, max_in_flight=1)
+
+        for row_id in 'abc':
+            batcher.insert({'value': 'x' * 20}, row_id=row_id)
+        batcher.flush()
+
+        self.assertEqual(self._sent_row_ids(client), [['a', 'b'], ['c']])
+        batcher.close()
+
+    def test_insert_generates_row_ids(self):
+        client = self._make_client()
+        batcher = self._make_one(client)
+
+        batcher.insert({'n': 1})
+        batcher.close()
+
+        (row_ids,) = self._sent_row_ids(client)
+        self.assertEqual(len(row_ids), 1)
+        self.assertEqual(len(row_ids[0]), 36)
+
+    def test_insert_w_options(self):
+        client = self._make_client()
+        batcher = self._make_one(
+            client, skip_invalid_rows=True, ignore_unknown_values=True,
+            template_suffix='_suffix', retry=None)
+
+        batcher.insert({'n': 1}, row_id='a')
+        batcher.close()
+
+        args, kwargs = client._call_api.call_args
+        self.assertEqual(args, (None,))
+        data = kwargs['data']
+        self.assertTrue(data['skipInvalidRows'])
+        self.assertTrue(data['ignoreUnknownValues'])
+        self.assertEqual(data['templateSuffix'], '_suffix')
+
+    def test_insert_w_table_reference(self):
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_client()
+        table = TableReference.from_string(
+            '{}.{}.{}'.format(self.PROJECT, self.DS_ID, self.TABLE_ID))
+        batcher = self._get_target_class()(client, table)
+
+        batcher.insert({'n': 1})
+        batcher.close()
+
+        self.assertEqual(
+            client._call_api.call_args[1]['path'], self.PATH + '/insertAll')
+
+    def test_insert_retries_only_failed_rows(self):
+        invalid = {'reason': 'invalid', 'message': 'bad'}
+        stopped = {'reason': 'stopped', 'message': ''}
+        client = self._make_client(
+            {'insertErrors': [
+                {'index': 0, 'errors': [invalid]},
+                {'index': 2, 'errors': [stopped]},
+            ]},
+            {},
+        )
+        batcher = self._make_one(client, max_rows=3)
+
+        futures = batcher.insert_many(
+            [{'n': n} for n in range(3)], row_ids=list('abc'))
+        batcher.flush()
+
+        self.assertEqual(self._sent_row_ids(client), [['a', 'b', 'c'], ['c']])
+        self.assertEqual(futures[0].result(), [invalid])
+        self.assertEqual(futures[1].result(), [])
+        self.assertEqual(futures[2].result(), [])
+        batcher.close()
+
+    def test_insert_gives_up_after_max_attempts(self):
+        backend_error = {'reason': 'backendError', 'message': ''}
+        response = {'insertErrors': [{'index': 0, 'errors': [backend_error]}]}
+        client = self._make_client(response, response)
+        batcher = self._make_one(client, max_attempts=2)
+
+        future = batcher.insert({'n': 1}, row_id='a')
+        batcher.close()
+
+        self.assertEqual(client._call_api.call_count, 2)
+        self.assertEqual(future.result(), [backend_error])
+
+    def test_insert_w_request_error(self):
+        from google.api_core.exceptions import BadRequest
+
+        exc = BadRequest('too big')
+        client = self._make_client(exc)
+        batcher = self._make_one(client)
+
+        futures = batcher.insert_many([{'n': 1}, {'n': 2}])
+        batcher.close()
+
+        for future in futures:
+            self.assertIs(future.exception(), exc)
+
+    def test_insert_w_malformed_insert_errors(self):
+        client = self._make_client(
+            {'insertErrors': [{'index': 'first', 'errors': []}]},
+            {'insertErrors': [{'index': 0}]},
+            {'insertErrors': [{'index': 0, 'errors': ['bad']}]},
+        )
+        batcher = self._make_one(client, max_rows=1)
+
+        futures = batcher.insert_many([{'n': 1}, {'n': 2}, {'n': 3}])
+        batcher.close()
+
+        self.assertEqual(client._call_api.call_count, 3)
+        for future in futures:
+            self.assertIsInstance(future.exception(timeout=0), ValueError)
+
+    def test_insert_w_cancelled_future(self):
+        backend_error = {'reason': 'backendError', 'message': ''}
+        client = self._make_client(
+            {'insertErrors': [{'index': 0, 'errors': [backend_error]}]})
+        batcher = self._make_one(client)
+
+        cancelled, kept = batcher.insert_many([{'n': 1}, {'n': 2}])
+        self.assertTrue(cancelled.cancel())
+        batcher.close()
+
+        # The cancelled row is neither resolved nor resent.
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(kept.result(timeout=0), [])
+        self.assertEqual(client._call_api.call_count, 1)
+
+    def test_insert_w_request_error_and_cancelled_future(self):
+        from google.api_core.exceptions import BadRequest
+
+        exc = BadRequest('too big')
+        client = self._make_client(exc)
+        batcher = self._make_one(client)
+
+        cancelled, kept = batcher.insert_many([{'n': 1}, {'n': 2}])
+        cancelled.cancel()
+        batcher.close()
+
+        self.assertTrue(cancelled.cancelled())
+        self.assertIs(kept.exception(timeout=0), exc)
+
+    def test_insert_w_resolve_error_does_not_hang(self):
+        client = self._make_client()
+        batcher = self._make_one(client)
+
+        batcher.insert({'n': 1})
+        with mock.patch(
+                'google.cloud.bigquery.insert_batcher._resolve_future',
+                side_effect=RuntimeError('unexpected state')):
+            batcher.close()
+
+        client._call_api.assert_called_once()
+
+    def test_insert_sends_partial_batch_after_max_latency(self):
+        client = self._make_client()
+        batcher = self._make_one(client, max_latency=0.01)
+
+        future = batcher.insert({'n': 1}, row_id='a')
+
+        self.assertEqual(future.result(timeout=5), [])
+        self.assertEqual(self._sent_row_ids(client), [['a']])
+        batcher.close()
+
+    def test_insert_w_row_larger_than_max_bytes(self):
+        client = self._make_client()
+        batcher = self._make_one(client, max_bytes=10)
+
+        with self.assertRaises(ValueError):
+            batcher.insert({'value': 'x' * 20})
+        batcher.close()
+
+    def test_insert_after_close(self):
+        client = self._make_client()
+        batcher = self._make_one(client)
+        batcher.close()
+
+        with self.assertRaises(ValueError):
+            batcher.insert({'n': 1})
+
+    def test_send_w_submit_error_releases_slot(self):
+        client = self._make_client()
+        batcher = self._make_one(client, max_in_flight=1)
+        self.addCleanup(batcher.close)
+
+        with mock.patch.object(
+                batcher._executor, 'submit', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                batcher._send([])
+
+        self.assertTrue(batcher._in_flight.acquire(False))
+        batcher._in_flight.release()
+
+    def test_context_manager_flushes(self):
+        client = self._make_client()
+
+        with self._make_one(client) as batcher:
+            future = batcher.insert({'n': 1})
+
+        self.assertEqual(future.result(timeout=0), [])
+
+    def test_metrics_callback(self):
+        backend_error = {'reason': 'backendError', 'message': ''}
+        invalid = {'reason': 'invalid', 'message': ''}
+        client = self._make_client(
+            {'insertErrors': [
+                {'index': 0, 'errors': [backend_error]},
+                {'index': 1, 'errors': [invalid]},
+            ]},
+            {},
+        )
+        metrics = []
+        batcher = self._make_one(client, metrics_callback=metrics.append)
+
+        batcher.insert_many([{'n': 1}, {'n': 2}, {'n': 3}])
+        batcher.close()
+
+        # The retried row may be sent before the first callback runs.
+        self.assertEqual(len(metrics), 2)
+        first, second = sorted(
+            metrics, key=lambda metric: metric.num_rows, reverse=True)
+        self.assertEqual(first.num_rows, 3)
+        self.assertEqual(first.num_failed_rows, 1)
+        self.assertEqual(first.num_retried_rows, 1)
+        self.assertGreater(first.num_bytes, 0)
+        self.assertGreaterEqual(first.latency, 0)
+        self.assertEqual(second.num_rows, 1)
+        self.assertEqual(second.num_failed_rows, 0)
+        self.assertEqual(second.num_retried_rows, 0)
+
+    def test_metrics_callback_error(self):
+        backend_error = {'reason': 'backendError', 'message': ''}
+        client = self._make_client(
+            {'insertErrors': [{'index': 0, 'errors': [backend_error]}]},
+            {},
+        )
+        callback = mock.Mock(side_effect=ValueError('callback failed'))
+        batcher = self._make_one(client, metrics_callback=callback)
+
+        future = batcher.insert({'n': 1})
+        with mock.patch(
+                'google.cloud.bigquery.insert_batcher._LOGGER') as logger:
+            batcher.close()
+
+        # The retried row is still resent, and close() does not hang.
+        self.assertEqual(future.result(timeout=0), [])
+        self.assertEqual(client._call_api.call_count, 2)
+        self.assertEqual(callback.call_count, 2)
+        self.assertEqual(logger.exception.call_count, 2)
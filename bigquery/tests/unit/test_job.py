@@ -73,6 +73,36 @@ class Test__error_result_to_exception(unittest.TestCase):
         self.assertEqual(exception.code, http_client.INTERNAL_SERVER_ERROR)
 
 
+class Test__next_poll_interval(unittest.TestCase):
+
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.bigquery import job
+
+        return job._next_poll_interval(*args, **kwargs)
+
+    def test_first_interval(self):
+        from google.cloud.bigquery.job import _MIN_POLL_INTERVAL
+
+        self.assertEqual(self._call_fut(0), _MIN_POLL_INTERVAL)
+
+    def test_grows_geometrically(self):
+        self.assertEqual(self._call_fut(1.0), 1.5)
+
+    def test_capped(self):
+        from google.cloud.bigquery.job import _MAX_POLL_INTERVAL
+
+        self.assertEqual(self._call_fut(100.0), _MAX_POLL_INTERVAL)
+        self.assertEqual(
+            self._call_fut(0, remaining=3600.0), _MAX_POLL_INTERVAL)
+
+    def test_w_remaining(self):
+        from google.cloud.bigquery.job import _MIN_POLL_INTERVAL
+
+        self.assertEqual(self._call_fut(8.0, remaining=3.0), 1.5)
+        self.assertEqual(
+            self._call_fut(8.0, remaining=0.0), _MIN_POLL_INTERVAL)
+
+
 class Test_JobReference(unittest.TestCase):
     JOB_ID = 'job-id'
     PROJECT = 'test-project-123'
@@ -848,6 +878,74 @@ class Test_AsyncJob(unittest.TestCase):
 
         self.assertTrue(job.done())
 
+    @mock.patch('time.sleep')
+    def test__blocking_poll_adapts_interval(self, sleep):
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        states = iter([False, False, False, True])
+        job.done = mock.Mock(side_effect=lambda: next(states))
+        remaining = iter([None, None, 4.0])
+        job._estimated_seconds_remaining = mock.Mock(
+            side_effect=lambda: next(remaining))
+
+        job._blocking_poll()
+
+        self.assertEqual(job.done.call_count, 4)
+        self.assertEqual(
+            [call[0][0] for call in sleep.call_args_list],
+            [0.1, 0.1 * 1.5, 2.0])
+
+    @mock.patch('time.sleep')
+    def test__blocking_poll_retries_transient_errors(self, sleep):
+        from google.api_core.exceptions import InternalServerError
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        job.done = mock.Mock(side_effect=[InternalServerError('oops'), True])
+
+        job._blocking_poll()
+
+        self.assertEqual(job.done.call_count, 2)
+        sleep.assert_called_once()
+
+    def test__blocking_poll_w_error(self):
+        from google.api_core.exceptions import BadRequest
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        job.done = mock.Mock(side_effect=BadRequest('invalid'))
+
+        with self.assertRaises(BadRequest):
+            job._blocking_poll()
+
+    @mock.patch('time.sleep')
+    def test__blocking_poll_w_timeout(self, sleep):
+        import concurrent.futures
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        job.done = mock.Mock(return_value=False)
+
+        with mock.patch('time.time', side_effect=[100.0, 100.0, 100.125,
+                                                  100.25]):
+            with self.assertRaises(concurrent.futures.TimeoutError):
+                job._blocking_poll(timeout=0.25)
+
+        # Never sleeps past the deadline, and polls once more at it.
+        self.assertEqual(job.done.call_count, 3)
+        self.assertEqual(
+            sleep.call_args_list, [mock.call(0.1), mock.call(0.125)])
+
+    def test__blocking_poll_w_result_set(self):
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        job._result_set = True
+        job.done = mock.Mock()
+
+        job._blocking_poll()
+
+        job.done.assert_not_called()
+
     @mock.patch('google.api_core.future.polling.PollingFuture.result')
     def test_result_default_wo_state(self, result):
         client = _make_client(project=self.PROJECT)
@@ -4078,6 +4176,52 @@ class TestQueryJob(unittest.TestCase, _Base):
         self.assertEqual(job.timeline[0].completed_units, 44)
         self.assertEqual(job.timeline[0].slot_millis, 101)
 
+    def test__estimated_seconds_remaining_wo_progress(self):
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        self.assertIsNone(job._estimated_seconds_remaining())
+
+        job._properties['statistics'] = {
+            'startTime': 1000.0,
+            'query': {'queryPlan': [{'parallelInputs': '4'}]},
+        }
+        self.assertIsNone(job._estimated_seconds_remaining())
+
+    def test__estimated_seconds_remaining_w_timeline(self):
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+        job._properties['statistics'] = {'query': {'timeline': [
+            {'elapsedMs': '1000', 'pendingUnits': '30',
+             'completedUnits': '10'},
+            {'elapsedMs': '2000', 'pendingUnits': '20',
+             'completedUnits': '20'},
+        ]}}
+
+        self.assertEqual(job._estimated_seconds_remaining(), 2.0)
+
+    def test__estimated_seconds_remaining_w_query_plan(self):
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+        job._properties['statistics'] = {
+            'startTime': 10000.0,
+            'query': {'queryPlan': [
+                {'parallelInputs': '4', 'completedParallelInputs': '4'},
+                {'parallelInputs': '4', 'completedParallelInputs': '0'},
+            ]},
+        }
+
+        with mock.patch('time.time', return_value=13.0):
+            self.assertEqual(job._estimated_seconds_remaining(), 3.0)
+
+    def test__poll_interval(self):
+        from google.cloud.bigquery.job import _MIN_POLL_INTERVAL
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        self.assertEqual(job._poll_interval(5.0), _MIN_POLL_INTERVAL)
+
     def test_undeclared_query_parameters(self):
         from google.cloud.bigquery.query import ArrayQueryParameter
         from google.cloud.bigquery.query import ScalarQueryParameter
@@ -4814,6 +4958,44 @@ class TestQueryJob(unittest.TestCase, _Base):
         self.assertEqual(len(df), 4)  # verify the number of rows
         self.assertEqual(list(df), ['name', 'age'])  # verify the column names
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_iter_dataframes(self):
+        begun_resource = self._make_resource()
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'totalRows': '3',
+            'schema': {
+                'fields': [
+                    {'name': 'name', 'type': 'STRING', 'mode': 'NULLABLE'},
+                    {'name': 'age', 'type': 'INTEGER', 'mode': 'NULLABLE'},
+                ],
+            },
+        }
+        rows = [
+            {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}]},
+            {'f': [{'v': 'Bharney Rhubble'}, {'v': '33'}]},
+            {'f': [{'v': 'Wylma Phlyntstone'}, {'v': '29'}]},
+        ]
+        done_resource = copy.deepcopy(begun_resource)
+        done_resource['status'] = {'state': 'DONE'}
+        connection = _make_connection(
+            begun_resource, query_resource, done_resource,
+            {'rows': rows[:2], 'pageToken': 'next'}, {'rows': rows[2:]})
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        frames = list(job.iter_dataframes(page_size=2))
+
+        self.assertEqual([len(frame) for frame in frames], [2, 1])
+        for frame in frames:
+            self.assertEqual(list(frame), ['name', 'age'])
+        _, kwargs = connection.api_request.call_args_list[3]
+        self.assertEqual(kwargs['query_params'], {'maxResults': 2})
+
     def test_iter(self):
         import types
 
@@ -5093,3 +5275,187 @@ class TestTimelineEntry(unittest.TestCase, _Base):
         self.assertEqual(entry.pending_units, self.PENDING_UNITS)
         self.assertEqual(entry.completed_units, self.COMPLETED_UNITS)
         self.assertEqual(entry.slot_millis, self.SLOT_MILLIS)
+
+
+class Test_wait_for_jobs(unittest.TestCase):
+    PROJECT = 'test-project'
+
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.bigquery.job import wait_for_jobs
+
+        return wait_for_jobs(*args, **kwargs)
+
+    def _make_job(self, client, job_id, state='RUNNING', created=1000.0):
+        from google.cloud.bigquery.job import CopyJob
+
+        job = CopyJob(job_id, [], None, client)
+        job._properties['status'] = {'state': state}
+        job._properties['statistics'] = {'creationTime': created}
+        return job
+
+    def _make_resource(self, job_id, state='DONE', error_result=None):
+        resource = {
+            'jobReference': {'projectId': self.PROJECT, 'jobId': job_id},
+            'configuration': {'copy': {
+                'sourceTables': [],
+                'destinationTable': {
+                    'projectId': self.PROJECT,
+                    'datasetId': 'dataset',
+                    'tableId': 'table',
+                },
+            }},
+            'status': {'state': state},
+            'statistics': {'creationTime': 1000.0},
+        }
+        if error_result is not None:
+            resource['status']['errorResult'] = error_result
+        return resource
+
+    def test_wo_pending_jobs(self):
+        connection = _make_connection()
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_job(client, 'job-1', state='DONE')
+
+        result = self._call_fut([job])
+
+        self.assertEqual(result.done, {job})
+        self.assertEqual(result.not_done, set())
+        connection.api_request.assert_not_called()
+
+    def test_begins_jobs_wo_state(self):
+        connection = _make_connection()
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_job(client, 'job-1', state='DONE')
+        del job._properties['status']
+
+        def begin(retry=None):
+            job._properties['status'] = {'state': 'DONE'}
+
+        job._begin = mock.Mock(side_effect=begin)
+
+        result = self._call_fut([job])
+
+        job._begin.assert_called_once()
+        self.assertEqual(result.done, {job})
+
+    @mock.patch('time.sleep')
+    def test_few_jobs_reloaded_individually(self, sleep):
+        connection = _make_connection(
+            self._make_resource('job-1', state='RUNNING'),
+            self._make_resource('job-2'),
+            self._make_resource('job-1'),
+        )
+        client = _make_client(project=self.PROJECT, connection=connection)
+        jobs = [self._make_job(client, 'job-1'),
+                self._make_job(client, 'job-2')]
+
+        result = self._call_fut(jobs)
+
+        self.assertEqual(result.done, set(jobs))
+        self.assertEqual(result.not_done, set())
+        paths = set(call[1]['path']
+                    for call in connection.api_request.call_args_list)
+        self.assertEqual(paths, {
+            '/projects/test-project/jobs/job-1',
+            '/projects/test-project/jobs/job-2',
+        })
+        sleep.assert_called_once()
+
+    def test_many_jobs_refreshed_from_list(self):
+        from google.cloud.bigquery.job import _MAX_JOBS_TO_GET
+
+        job_ids = ['job-{}'.format(index)
+                   for index in range(_MAX_JOBS_TO_GET + 2)]
+        listed = [self._make_resource(job_id) for job_id in job_ids[1:]]
+        listed.append(self._make_resource('other-job'))
+        connection = _make_connection(
+            {'jobs': listed},
+            self._make_resource(job_ids[0]),
+        )
+        client = _make_client(project=self.PROJECT, connection=connection)
+        jobs = [self._make_job(client, job_id, created=1000.0 + index)
+                for index, job_id in enumerate(job_ids)]
+
+        result = self._call_fut(jobs)
+
+        self.assertEqual(result.done, set(jobs))
+        list_call, get_call = connection.api_request.call_args_list
+        self.assertEqual(list_call[1]['path'], '/projects/test-project/jobs')
+        self.assertEqual(
+            list_call[1]['query_params']['minCreationTime'], '1000')
+        self.assertEqual(
+            get_call[1]['path'], '/projects/test-project/jobs/job-0')
+
+    def test_listing_stops_once_all_jobs_found(self):
+        from google.cloud.bigquery.job import _MAX_JOBS_TO_GET
+
+        job_ids = ['job-{}'.format(index)
+                   for index in range(_MAX_JOBS_TO_GET + 1)]
+        listed = [self._make_resource(job_id) for job_id in job_ids]
+        connection = _make_connection(
+            {'jobs': listed, 'nextPageToken': 'more'})
+        client = _make_client(project=self.PROJECT, connection=connection)
+        jobs = [self._make_job(client, job_id) for job_id in job_ids]
+
+        result = self._call_fut(jobs)
+
+        self.assertEqual(result.done, set(jobs))
+        # The next page of the listing is not requested.
+        connection.api_request.assert_called_once()
+
+    @mock.patch('time.sleep')
+    def test_first_completed(self, sleep):
+        connection = _make_connection(
+            self._make_resource('job-1', state='RUNNING'),
+            self._make_resource('job-2'),
+        )
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job_1 = self._make_job(client, 'job-1')
+        job_2 = self._make_job(client, 'job-2')
+
+        with mock.patch(
+                'google.cloud.bigquery.job._refresh_jobs') as refresh:
+            refresh.side_effect = lambda jobs, retry: [
+                job.reload() for job in sorted(jobs, key=lambda j: j.job_id)]
+            result = self._call_fut(
+                [job_1, job_2], return_when='FIRST_COMPLETED')
+
+        self.assertEqual(result.done, {job_2})
+        self.assertEqual(result.not_done, {job_1})
+        sleep.assert_not_called()
+
+    def test_first_exception(self):
+        connection = _make_connection(
+            self._make_resource('job-1', state='RUNNING'),
+            self._make_resource('job-2', error_result={'reason': 'invalid'}),
+        )
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job_1 = self._make_job(client, 'job-1')
+        job_2 = self._make_job(client, 'job-2')
+
+        with mock.patch(
+                'google.cloud.bigquery.job._refresh_jobs') as refresh:
+            refresh.side_effect = lambda jobs, retry: [
+                job.reload() for job in sorted(jobs, key=lambda j: j.job_id)]
+            result = self._call_fut(
+                [job_1, job_2], return_when='FIRST_EXCEPTION')
+
+        self.assertEqual(result.done, {job_2})
+        self.assertIsNotNone(job_2.exception())
+
+    @mock.patch('time.sleep')
+    def test_w_timeout(self, sleep):
+        connection = _make_connection(
+            self._make_resource('job-1', state='RUNNING'),
+            self._make_resource('job-1', state='RUNNING'),
+        )
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_job(client, 'job-1')
+
+        with mock.patch('time.time', side_effect=[100.0, 100.0, 101.0]):
+            result = self._call_fut([job], timeout=1.0)
+
+        self.assertEqual(result.done, set())
+        self.assertEqual(result.not_done, {job})
+        self.assertEqual(connection.api_request.call_count, 2)
+        sleep.assert_called_once_with(0.1)
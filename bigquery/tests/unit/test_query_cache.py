@@ -0,0 +1,666 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+
+
+PROJECT = 'prahj-ekt'
+JOB_ID = 'job-id'
+DATASET_ID = 'dataset_id'
+TABLE_ID = 'table_id'
+TABLE_PATH = '/projects/%s/datasets/%s/tables/%s' % (
+    PROJECT, DATASET_ID, TABLE_ID)
+DEST_PATH = '/projects/%s/datasets/_anon/tables/anon_table' % (PROJECT,)
+QUERY = 'SELECT name, age FROM `dataset_id.table_id` WHERE age > @age'
+ROWS = [
+    {'f': [{'v': 'Phred'}, {'v': '32'}]},
+    {'f': [{'v': 'Bharney'}, {'v': '33'}]},
+    {'f': [{'v': 'Wylma'}, {'v': '29'}]},
+]
+
+
+class _FakeConnection(object):
+    """Answer the requests made to run a query and read its rows."""
+
+    def __init__(self, statement_type='SELECT', modified_ms=1000.0):
+        self.calls = []
+        self.statement_type = statement_type
+        self.etag = 'etag-1'
+        self.modified_ms = modified_ms
+
+    def api_request(self, method, path, query_params=None, data=None,
+                    **kwargs):
+        from google.api_core.exceptions import NotFound
+
+        self.calls.append((method, path))
+        if method == 'POST' and path == '/projects/%s/jobs' % (PROJECT,):
+            return self._job_resource(data)
+        if path == '/projects/%s/queries/%s' % (PROJECT, JOB_ID):
+            return {
+                'jobReference': {'projectId': PROJECT, 'jobId': JOB_ID},
+                'jobComplete': True,
+                'totalRows': str(len(ROWS)),
+                'schema': {'fields': [
+                    {'name': 'name', 'type': 'STRING', 'mode': 'NULLABLE'},
+                    {'name': 'age', 'type': 'INTEGER', 'mode': 'NULLABLE'},
+                ]},
+            }
+        if path == DEST_PATH + '/data':
+            query_params = query_params or {}
+            start = int(query_params.get(
+                'startIndex', query_params.get('pageToken', 0)))
+            end = min(start + int(query_params.get('maxResults', 2)),
+                      len(ROWS))
+            response = {'totalRows': str(len(ROWS)), 'rows': ROWS[start:end]}
+            if end < len(ROWS):
+                response['pageToken'] = str(end)
+            return response
+        if path == TABLE_PATH:
+            if self.etag is None:
+                raise NotFound('gone')
+            return {
+                'tableReference': {
+                    'projectId': PROJECT,
+                    'datasetId': DATASET_ID,
+                    'tableId': TABLE_ID,
+                },
+                'etag': self.etag,
+                'lastModifiedTime': str(self.modified_ms),
+            }
+        raise NotFound(path)  # pragma: NO COVER
+
+    def _job_resource(self, data):
+        resource = {
+            'jobReference': {'projectId': PROJECT, 'jobId': JOB_ID},
+            'configuration': data['configuration'],
+            'status': {'state': 'DONE'},
+            'statistics': {
+                'creationTime': 1500.0,
+                'startTime': 2000.0,
+                'endTime': 3000.0,
+                'query': {
+                    'statementType': self.statement_type,
+                    'referencedTables': [{
+                        'projectId': PROJECT,
+                        'datasetId': DATASET_ID,
+                        'tableId': TABLE_ID,
+                    }],
+                },
+            },
+        }
+        resource['configuration']['query']['destinationTable'] = {
+            'projectId': PROJECT,
+            'datasetId': '_anon',
+            'tableId': 'anon_table',
+        }
+        return resource
+
+    def job_inserts(self):
+        return [call for call in self.calls if call[0] == 'POST']
+
+
+def _make_client(cache, connection=None):
+    import google.auth.credentials
+    from google.cloud.bigquery.client import Client
+
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    client = Client(
+        project=PROJECT, credentials=credentials, _http=object(),
+        query_cache=cache)
+    client._connection = connection or _FakeConnection()
+    return client
+
+
+def _make_job_config(age=30):
+    from google.cloud.bigquery.job import QueryJobConfig
+    from google.cloud.bigquery.query import ScalarQueryParameter
+
+    config = QueryJobConfig()
+    config.query_parameters = [ScalarQueryParameter('age', 'INT64', age)]
+    return config
+
+
+def _read_names(query_job):
+    return [row.name for row in query_job.result()]
+
+
+class Test_normalize_query(unittest.TestCase):
+
+    def _call_fut(self, query):
+        from google.cloud.bigquery.query_cache import _normalize_query
+
+        return _normalize_query(query)
+
+    def test_collapses_whitespace(self):
+        self.assertEqual(
+            self._call_fut('\n  SELECT  a,\n\tb\nFROM t  \n'),
+            'SELECT a, b FROM t')
+
+    def test_keeps_quoted_whitespace(self):
+        query = "SELECT 'a  b', \"c\\\"  d\", `my  col`, '''e\n  f''' FROM t"
+        self.assertEqual(self._call_fut(query), query)
+
+    def test_keeps_line_comment_ends(self):
+        self.assertEqual(
+            self._call_fut('SELECT a  -- c  \n  FROM t # d'),
+            'SELECT a -- c\nFROM t # d')
+        self.assertEqual(
+            self._call_fut('#standardSQL\nSELECT 1'), '#standardSQL\nSELECT 1')
+        self.assertNotEqual(
+            self._call_fut('SELECT a -- c\nFROM t'),
+            self._call_fut('SELECT a -- c FROM t'))
+
+    def test_keeps_comments_whole(self):
+        query = "SELECT a /* it's  a\n  -- */ FROM t -- don't  \"quote\""
+        self.assertEqual(self._call_fut(query), query)
+
+
+class Test_is_cacheable(unittest.TestCase):
+
+    def _call_fut(self, query, job_config=None):
+        from google.cloud.bigquery.job import QueryJob
+        from google.cloud.bigquery.query_cache import _is_cacheable
+
+        client = mock.Mock(project=PROJECT, spec=['project'])
+        return _is_cacheable(QueryJob(JOB_ID, query, client, job_config))
+
+    def test_select(self):
+        self.assertTrue(self._call_fut(QUERY))
+
+    def test_w_non_deterministic_function(self):
+        self.assertFalse(self._call_fut('SELECT current_timestamp()'))
+        self.assertFalse(self._call_fut('SELECT RAND ()'))
+
+    def test_w_destination(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.table import TableReference
+
+        config = QueryJobConfig()
+        config.destination = TableReference.from_string(
+            'prahj-ekt.dataset_id.dest')
+
+        self.assertFalse(self._call_fut(QUERY, config))
+
+    def test_w_dry_run(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        config = QueryJobConfig()
+        config.dry_run = True
+
+        self.assertFalse(self._call_fut(QUERY, config))
+
+    def test_wo_query_cache(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        config = QueryJobConfig()
+        config.use_query_cache = False
+
+        self.assertFalse(self._call_fut(QUERY, config))
+
+
+class Test_job_key(unittest.TestCase):
+
+    def _call_fut(self, query, job_config=None, location=None):
+        from google.cloud.bigquery.job import _JobReference
+        from google.cloud.bigquery.job import QueryJob
+        from google.cloud.bigquery.query_cache import _job_key
+
+        client = mock.Mock(project=PROJECT, spec=['project'])
+        job_ref = _JobReference(JOB_ID, PROJECT, location)
+        return _job_key(QueryJob(job_ref, query, client, job_config))
+
+    def test_ignores_whitespace_and_labels(self):
+        config = _make_job_config()
+        config.labels = {'dashboard': 'sales'}
+
+        self.assertEqual(
+            self._call_fut(QUERY, _make_job_config()),
+            self._call_fut('  ' + QUERY.replace(' ', '\n  '), config))
+
+    def test_depends_on_parameters(self):
+        self.assertNotEqual(
+            self._call_fut(QUERY, _make_job_config(30)),
+            self._call_fut(QUERY, _make_job_config(31)))
+
+    def test_depends_on_location(self):
+        self.assertNotEqual(
+            self._call_fut(QUERY, location='US'),
+            self._call_fut(QUERY, location='EU'))
+
+
+class Test_CachedRows(unittest.TestCase):
+
+    def _make_one(self, rows):
+        from google.cloud.bigquery.query_cache import _CachedRows
+
+        return _CachedRows(rows)
+
+    def test_api_request_w_page_token(self):
+        cached = self._make_one(ROWS)
+
+        first = cached.api_request('GET', '/data', {'maxResults': 2})
+        second = cached.api_request(
+            'GET', '/data', {'maxResults': 2, 'pageToken': '2'})
+
+        self.assertEqual(first, {
+            'totalRows': '3', 'rows': ROWS[:2], 'pageToken': '2'})
+        self.assertEqual(second, {'totalRows': '3', 'rows': ROWS[2:]})
+
+    def test_api_request_w_start_index(self):
+        cached = self._make_one(ROWS)
+
+        response = cached.api_request(
+            'GET', '/data', {'startIndex': 1, 'maxResults': 1})
+
+        self.assertEqual(response, {
+            'totalRows': '3', 'rows': ROWS[1:2], 'pageToken': '2'})
+
+
+class Test_RecordedPages(unittest.TestCase):
+
+    def _make_one(self, total_rows):
+        from google.cloud.bigquery.query_cache import _RecordedPages
+
+        return _RecordedPages(total_rows)
+
+    def test_add_out_of_order(self):
+        pages = self._make_one(3)
+
+        self.assertFalse(pages.add({}, ROWS[:1]))
+        self.assertFalse(pages.add({'startIndex': 2}, ROWS[2:]))
+        self.assertFalse(pages.add({'startIndex': 2}, ROWS[2:]))
+        self.assertTrue(pages.add({'startIndex': 1}, ROWS[1:2]))
+
+        self.assertEqual(pages.rows(), ROWS)
+
+    def test_rows_w_overlapping_pages(self):
+        pages = self._make_one(3)
+        pages.add({}, ROWS[:2])
+
+        self.assertTrue(pages.add({'startIndex': 1}, ROWS[1:]))
+
+        self.assertIsNone(pages.rows())
+
+
+class Test_ResultRecorder(unittest.TestCase):
+
+    def test_not_stored_w_overlapping_pages(self):
+        from google.cloud.bigquery.query_cache import _RecordedPages
+        from google.cloud.bigquery.query_cache import _ResultRecorder
+
+        cache = mock.Mock(spec=['_store'])
+        recorder = _ResultRecorder(cache, 'key')
+        pages = _RecordedPages(3)
+        pages.add({}, ROWS[:2])
+
+        recorder._add_page(
+            mock.sentinel.query_job, pages, {'startIndex': 1}, ROWS[1:])
+
+        cache._store.assert_not_called()
+
+
+class TestQueryResultCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.query_cache import QueryResultCache
+
+        return QueryResultCache
+
+    def _make_one(self, **kw):
+        return self._get_target_class()(**kw)
+
+    def _make_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return directory
+
+    def test_hit_reads_rows_without_running_job(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        connection = client._connection
+
+        first = client.query(QUERY, job_config=_make_job_config())
+        self.assertEqual(_read_names(first), ['Phred', 'Bharney', 'Wylma'])
+        self.assertEqual(len(cache), 1)
+        del connection.calls[:]
+
+        second = client.query(
+            QUERY + '\n', job_config=_make_job_config(), job_id='other')
+
+        self.assertEqual(second.job_id, JOB_ID)
+        self.assertEqual(second.state, 'DONE')
+        self.assertEqual(
+            _read_names(second), ['Phred', 'Bharney', 'Wylma'])
+        self.assertEqual(connection.calls, [('GET', TABLE_PATH)])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_hit_to_dataframe(self):
+        cache = self._make_one(validate_tables=False)
+        client = _make_client(cache)
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+        del client._connection.calls[:]
+
+        dataframe = client.query(
+            QUERY, job_config=_make_job_config()).to_dataframe()
+
+        self.assertEqual(client._connection.calls, [])
+        self.assertEqual(list(dataframe['age']), [32, 33, 29])
+
+    def test_miss_w_other_parameters(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        _read_names(client.query(QUERY, job_config=_make_job_config(30)))
+
+        _read_names(client.query(QUERY, job_config=_make_job_config(31)))
+
+        self.assertEqual(len(client._connection.job_inserts()), 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_miss_after_table_changed(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+        client._connection.etag = 'etag-2'
+
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(client._connection.job_inserts()), 2)
+
+    def test_miss_after_table_deleted(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+        client._connection.etag = None
+
+        client.query(QUERY, job_config=_make_job_config())
+
+        self.assertEqual(len(client._connection.job_inserts()), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_not_stored_if_table_modified_during_query(self):
+        cache = self._make_one()
+        client = _make_client(cache, _FakeConnection(modified_ms=2500.0))
+
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_not_stored_if_partially_read(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+
+        rows = client.query(QUERY, job_config=_make_job_config()).result()
+        next(iter(rows))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_stored_after_partial_then_full_read(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        job = client.query(QUERY, job_config=_make_job_config())
+        next(iter(job.result()))
+
+        self.assertEqual(_read_names(job), ['Phred', 'Bharney', 'Wylma'])
+        self.assertEqual(len(cache), 1)
+
+        hit = client.query(QUERY, job_config=_make_job_config())
+        self.assertEqual(_read_names(hit), ['Phred', 'Bharney', 'Wylma'])
+        self.assertEqual(len(client._connection.job_inserts()), 1)
+
+    def test_not_recorded_after_stored(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        job = client.query(QUERY, job_config=_make_job_config())
+        _read_names(job)
+
+        with mock.patch.object(cache, '_store') as store:
+            self.assertEqual(
+                _read_names(job), ['Phred', 'Bharney', 'Wylma'])
+
+        store.assert_not_called()
+
+    def test_stored_w_max_workers(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        job = client.query(QUERY, job_config=_make_job_config())
+
+        rows = job.result(page_size=1, max_workers=2)
+        self.assertEqual(
+            [row.name for row in rows], ['Phred', 'Bharney', 'Wylma'])
+
+        hit = client.query(QUERY, job_config=_make_job_config())
+        self.assertEqual(_read_names(hit), ['Phred', 'Bharney', 'Wylma'])
+        self.assertEqual(len(client._connection.job_inserts()), 1)
+
+    def test_not_cacheable(self):
+        cache = self._make_one()
+        client = _make_client(cache)
+        query = QUERY + ' AND RAND() < 0.5'
+
+        for _ in range(2):
+            _read_names(client.query(query, job_config=_make_job_config()))
+
+        self.assertEqual(len(client._connection.job_inserts()), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_not_stored_if_table_missing(self):
+        connection = _FakeConnection()
+        connection.etag = None
+        cache = self._make_one()
+        client = _make_client(cache, connection)
+
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_not_stored_for_dml(self):
+        cache = self._make_one()
+        client = _make_client(cache, _FakeConnection(statement_type='UPDATE'))
+
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_not_stored_over_max_rows(self):
+        cache = self._make_one(max_rows=2)
+        client = _make_client(cache)
+
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_expires_after_ttl(self):
+        cache = self._make_one(ttl=10.0)
+        client = _make_client(cache)
+        with mock.patch('time.time', return_value=100.0):
+            _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        with mock.patch('time.time', return_value=111.0):
+            client.query(QUERY, job_config=_make_job_config())
+
+        self.assertEqual(len(client._connection.job_inserts()), 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._make_one(max_entries=2, validate_tables=False)
+        client = _make_client(cache)
+        for age in (1, 2, 1, 3):
+            _read_names(client.query(QUERY, job_config=_make_job_config(age)))
+        self.assertEqual(len(client._connection.job_inserts()), 3)
+
+        client.query(QUERY, job_config=_make_job_config(1))
+        client.query(QUERY, job_config=_make_job_config(2))
+
+        self.assertEqual(len(client._connection.job_inserts()), 4)
+
+    def test_evicts_over_max_bytes(self):
+        cache = self._make_one(max_bytes=10)
+        client = _make_client(cache)
+
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_ctor_w_existing_directory(self):
+        directory = self._make_directory()
+
+        cache = self._make_one(directory=directory)
+
+        self.assertEqual(cache.directory, directory)
+
+    def test_ctor_w_directory_error(self):
+        import errno
+
+        error = OSError(errno.EACCES, 'denied')
+        with mock.patch('os.makedirs', side_effect=error):
+            with self.assertRaises(OSError):
+                self._make_one(directory='/denied')
+
+    def test_directory_shared_by_caches(self):
+        directory = self._make_directory()
+        client = _make_client(self._make_one(directory=directory))
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        other_cache = self._make_one(directory=directory)
+        other_client = _make_client(other_cache)
+        job = other_client.query(QUERY, job_config=_make_job_config())
+
+        self.assertEqual(other_client._connection.job_inserts(), [])
+        self.assertEqual(_read_names(job), ['Phred', 'Bharney', 'Wylma'])
+        self.assertEqual(len(other_cache), 1)
+
+    def test_directory_evicts_over_max_entries(self):
+        import os
+
+        directory = self._make_directory()
+        cache = self._make_one(
+            directory=directory, max_entries=1, validate_tables=False)
+        client = _make_client(cache)
+
+        for age in (1, 2):
+            _read_names(client.query(QUERY, job_config=_make_job_config(age)))
+
+        self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_clear(self):
+        import os
+
+        directory = self._make_directory()
+        cache = self._make_one(directory=directory)
+        client = _make_client(cache)
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_clear_wo_directory(self):
+        cache = self._make_one(validate_tables=False)
+        client = _make_client(cache)
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+
+    def test_directory_miss_after_table_changed(self):
+        import os
+
+        directory = self._make_directory()
+        cache = self._make_one(directory=directory)
+        client = _make_client(cache)
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+        client._connection.etag = 'etag-2'
+
+        client.query(QUERY, job_config=_make_job_config())
+
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_directory_w_corrupt_file(self):
+        import os
+
+        directory = self._make_directory()
+        client = _make_client(self._make_one(directory=directory))
+        _read_names(client.query(QUERY, job_config=_make_job_config()))
+        for name in os.listdir(directory):
+            with open(os.path.join(directory, name), 'w') as file_obj:
+                file_obj.write('{')
+
+        other_client = _make_client(self._make_one(directory=directory))
+        other_client.query(QUERY, job_config=_make_job_config())
+
+        self.assertEqual(len(other_client._connection.job_inserts()), 1)
+
+    def test_directory_expires_after_ttl(self):
+        import os
+
+        directory = self._make_directory()
+        client = _make_client(self._make_one(directory=directory, ttl=10.0))
+        with mock.patch('time.time', return_value=100.0):
+            _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        other_client = _make_client(
+            self._make_one(directory=directory, ttl=10.0))
+        with mock.patch('time.time', return_value=111.0):
+            other_client.query(QUERY, job_config=_make_job_config())
+
+        self.assertEqual(len(other_client._connection.job_inserts()), 1)
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_directory_write_error(self):
+        import os
+
+        directory = self._make_directory()
+        cache = self._make_one(directory=directory)
+        client = _make_client(cache)
+
+        with mock.patch(
+                'google.cloud.bigquery.query_cache._replace',
+                side_effect=OSError('full')):
+            _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_directory_file_removed_during_eviction(self):
+        import os
+
+        directory = self._make_directory()
+        cache = self._make_one(directory=directory)
+        client = _make_client(cache)
+        missing = os.path.join(directory, 'missing.json')
+
+        with mock.patch.object(
+                cache, '_disk_paths', return_value=[missing]):
+            _read_names(client.query(QUERY, job_config=_make_job_config()))
+
+        self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_remove_missing_file(self):
+        import os
+
+        directory = self._make_directory()
+
+        self._get_target_class()._remove_file(
+            os.path.join(directory, 'missing.json'))
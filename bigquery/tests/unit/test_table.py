@@ -1070,6 +1070,184 @@ class Test_row_from_mapping(unittest.TestCase, _SchemaBase):
             ('Phred Phlyntstone', 32, ['red', 'green'], None))
 
 
+class Test_RowEncoder(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.table import _RowEncoder
+        return _RowEncoder
+
+    def _make_one(self, schema):
+        return self._get_target_class()(schema)
+
+    def _make_schema(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        return [
+            SchemaField('full_name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+            SchemaField('colors', 'STRING', mode='REPEATED'),
+            SchemaField('active', 'BOOLEAN', mode='NULLABLE'),
+        ]
+
+    def test_encode_w_tuple(self):
+        encoder = self._make_one(self._make_schema())
+
+        json_row = encoder.encode(('Phred', 32, ['red'], True))
+
+        self.assertEqual(json_row, {
+            'full_name': 'Phred',
+            'age': '32',
+            'colors': ['red'],
+            'active': 'true',
+        })
+
+    def test_encode_w_short_tuple(self):
+        encoder = self._make_one(self._make_schema())
+
+        json_row = encoder.encode(('Phred', 32))
+
+        self.assertEqual(json_row, {'full_name': 'Phred', 'age': '32'})
+
+    def test_encode_w_dict(self):
+        encoder = self._make_one(self._make_schema())
+
+        json_row = encoder.encode(
+            {'full_name': 'Phred', 'age': 32, 'unknown': 'ignored'})
+
+        self.assertEqual(json_row, {
+            'full_name': 'Phred',
+            'age': '32',
+            'colors': (),
+            'active': None,
+        })
+
+    def test_encode_w_dict_missing_required(self):
+        encoder = self._make_one(self._make_schema())
+
+        with self.assertRaises(KeyError):
+            encoder.encode({'full_name': 'Phred'})
+
+    def test_encode_rows_matches_encode(self):
+        encoder = self._make_one(self._make_schema())
+        rows = [('Phred', 32, [], None), {'full_name': 'Bharney', 'age': 33}]
+
+        self.assertEqual(
+            encoder.encode_rows(rows), [encoder.encode(row) for row in rows])
+
+    def test_encode_columns(self):
+        encoder = self._make_one(self._make_schema())
+
+        json_rows = encoder.encode_columns(
+            {'full_name': ['Phred', 'Bharney'], 'age': [32, 33],
+             'active': [False, None]},
+            2)
+
+        self.assertEqual(json_rows, [
+            {'full_name': 'Phred', 'age': '32', 'colors': (),
+             'active': 'false'},
+            {'full_name': 'Bharney', 'age': '33', 'colors': (),
+             'active': None},
+        ])
+
+    def test_encode_columns_missing_required(self):
+        encoder = self._make_one(self._make_schema())
+
+        with self.assertRaises(KeyError):
+            encoder.encode_columns({'full_name': ['Phred']}, 1)
+
+    def test_encode_columns_wo_schema(self):
+        encoder = self._make_one([])
+
+        with self.assertRaises(ValueError):
+            encoder.encode_columns({}, 0)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_encode_dataframe(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.bigquery.table import SchemaField
+
+        when = datetime.datetime(2018, 1, 2, 3, 4, 5, tzinfo=UTC)
+        schema = [
+            SchemaField('age', 'INTEGER', mode='NULLABLE'),
+            SchemaField('score', 'FLOAT', mode='NULLABLE'),
+            SchemaField('created', 'TIMESTAMP', mode='NULLABLE'),
+        ]
+        encoder = self._make_one(schema)
+        dataframe = pandas.DataFrame({
+            'age': [32, 33],
+            'score': [float('nan'), 2.5],
+            'created': [when, None],
+        })
+
+        json_rows = encoder.encode_dataframe(dataframe)
+
+        self.assertEqual(json_rows, [
+            {'age': '32', 'score': None, 'created': 1514862245.0},
+            {'age': '33', 'score': 2.5, 'created': None},
+        ])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_encode_dataframe_w_converters(self):
+        import datetime
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('active', 'BOOLEAN', mode='NULLABLE'),
+            SchemaField('born', 'DATE', mode='NULLABLE'),
+        ]
+        encoder = self._make_one(schema)
+        dataframe = pandas.DataFrame({
+            'active': [True, False],
+            'born': [datetime.date(2018, 1, 2), None],
+        })
+
+        json_rows = encoder.encode_dataframe(dataframe)
+
+        self.assertEqual(json_rows, [
+            {'active': 'true', 'born': '2018-01-02'},
+            {'active': 'false', 'born': None},
+        ])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_encode_dataframe_wo_schema(self):
+        encoder = self._make_one([])
+
+        with self.assertRaises(ValueError):
+            encoder.encode_dataframe(pandas.DataFrame({'age': [32]}))
+
+
+class Test_row_encoder(unittest.TestCase):
+
+    def _call_fut(self, schema):
+        from google.cloud.bigquery.table import _row_encoder
+
+        return _row_encoder(schema)
+
+    def test_cached_by_schema(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER')]
+        encoder = self._call_fut(schema)
+
+        self.assertIs(self._call_fut(list(schema)), encoder)
+        self.assertIs(
+            self._call_fut([SchemaField('age', 'INTEGER')]), encoder)
+        self.assertIsNot(
+            self._call_fut([SchemaField('age', 'FLOAT')]), encoder)
+
+    def test_cache_is_bounded(self):
+        from google.cloud.bigquery import table
+        from google.cloud.bigquery.table import SchemaField
+
+        with mock.patch.object(table, '_ROW_ENCODERS', new={}) as encoders:
+            with mock.patch.object(table, '_MAX_ROW_ENCODERS', new=2):
+                for index in range(5):
+                    self._call_fut([SchemaField('f%d' % index, 'INTEGER')])
+                    self.assertLessEqual(len(encoders), 2)
+
+
 class TestTableListItem(unittest.TestCase):
 
     @staticmethod
@@ -1268,6 +1446,157 @@ class TestRow(unittest.TestCase):
             row['z']
 
 
+class Test_RowBatch(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.table import _RowBatch
+
+        return _RowBatch
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_batch(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='NULLABLE'),
+            SchemaField('tags', 'STRING', mode='REPEATED'),
+        ]
+        rows = [
+            {'f': [{'v': 'Phred'}, {'v': '32'}, {'v': [{'v': 'a'}]}]},
+            {'f': [{'v': 'Bharney'}, {'v': None}, {'v': []}]},
+        ]
+        return self._make_one(rows, schema)
+
+    def test_column_decodes_once(self):
+        from google.cloud.bigquery._helpers import _column_from_json
+
+        batch = self._make_batch()
+
+        with mock.patch(
+                'google.cloud.bigquery._helpers._column_from_json',
+                wraps=_column_from_json) as decode:
+            self.assertEqual(batch.column(1), [32, None])
+            self.assertEqual(batch.column(1), [32, None])
+
+        decode.assert_called_once()
+        self.assertIsNone(batch._columns[0])
+        self.assertIsNone(batch._columns[2])
+        self.assertIsNotNone(batch._rows)
+
+    def test_column_decoded_by_another_thread(self):
+        batch = self._make_batch()
+        decoded = [['Phred', 'Bharney'], [32, None], [['a'], []]]
+
+        def decode(rows, index, field):
+            # Another thread finishes the other columns meanwhile.
+            batch._columns[:] = decoded[:index] + [None] + decoded[index + 1:]
+            return decoded[index]
+
+        with mock.patch(
+                'google.cloud.bigquery._helpers._column_from_json',
+                side_effect=decode):
+            self.assertIs(batch.column(1), decoded[1])
+
+        self.assertEqual(batch._columns, decoded)
+        self.assertIsNone(batch._rows)
+
+    def test_columns_releases_raw_rows(self):
+        batch = self._make_batch()
+
+        columns = batch.columns()
+
+        self.assertEqual(columns, [
+            ['Phred', 'Bharney'], [32, None], [['a'], []]])
+        self.assertIsNone(batch._rows)
+        self.assertEqual(len(batch), 2)
+
+    def test_row_values(self):
+        import copy
+
+        batch = self._make_batch()
+        first, second = batch.row_values()
+
+        self.assertEqual(second[0], 'Bharney')
+        self.assertIsNone(batch._columns[1])
+        self.assertEqual(len(first), 3)
+        self.assertEqual(first[-1], ['a'])
+        self.assertEqual(first[:2], ('Phred', 32))
+        self.assertEqual(list(second), ['Bharney', None, []])
+        self.assertEqual(first, ('Phred', 32, ['a']))
+        self.assertEqual(first, batch.row_values()[0])
+        self.assertNotEqual(first, second)
+        self.assertFalse(first == ['Phred', 32, ['a']])
+        self.assertEqual(repr(second), "('Bharney', None, [])")
+        with self.assertRaises(IndexError):
+            first[3]
+
+        copied = copy.deepcopy(first)
+        self.assertEqual(copied, ('Phred', 32, ['a']))
+        self.assertIsNot(copied[2], first[2])
+
+    def test_row_values_detach_once_decoded(self):
+        batch = self._make_batch()
+        first, second = batch.row_values()
+
+        self.assertEqual(first[0], 'Phred')
+        self.assertEqual(first[1], 32)
+        self.assertIs(first._batch, batch)
+        self.assertEqual(first[2], ['a'])
+
+        self.assertIsNone(first._batch)
+        self.assertEqual(len(first), 3)
+        self.assertEqual(first[1], 32)
+        self.assertEqual(first, ('Phred', 32, ['a']))
+        self.assertEqual(second[0], 'Bharney')
+        self.assertIsNone(second._batch)
+
+    def test_row_values_pickle(self):
+        import pickle
+
+        batch = self._make_batch()
+        first = batch.row_values()[0]
+
+        self.assertEqual(first[1], 32)
+        unpickled = pickle.loads(pickle.dumps(first))
+
+        self.assertIsInstance(unpickled, tuple)
+        self.assertEqual(unpickled, ('Phred', 32, ['a']))
+        self.assertIsNone(first._batch)
+
+    def test_row_api(self):
+        from google.cloud.bigquery.table import Row
+
+        batch = self._make_batch()
+        row = Row(batch.row_values()[0], {'name': 0, 'age': 1, 'tags': 2})
+
+        self.assertEqual(row.name, 'Phred')
+        self.assertEqual(row['age'], 32)
+        self.assertEqual(row.values(), ('Phred', 32, ['a']))
+        self.assertEqual(
+            row, Row(('Phred', 32, ['a']), {'name': 0, 'age': 1, 'tags': 2}))
+        self.assertEqual(
+            repr(row),
+            "Row(('Phred', 32, ['a']), {'name': 0, 'age': 1, 'tags': 2})")
+
+    def test_row_pickle(self):
+        import pickle
+        from google.cloud.bigquery.table import Row
+
+        batch = self._make_batch()
+        row = Row(batch.row_values()[1], {'name': 0, 'age': 1, 'tags': 2})
+
+        unpickled = pickle.loads(pickle.dumps(row))
+
+        self.assertEqual(
+            unpickled,
+            Row(('Bharney', None, []), {'name': 0, 'age': 1, 'tags': 2}))
+        self.assertEqual(unpickled.name, 'Bharney')
+
+
 class Test_EmptyRowIterator(unittest.TestCase):
 
     @mock.patch('google.cloud.bigquery.table.pandas', new=None)
@@ -1285,6 +1614,19 @@ class Test_EmptyRowIterator(unittest.TestCase):
         self.assertIsInstance(df, pandas.DataFrame)
         self.assertEqual(len(df), 0)  # verify the number of rows
 
+    @mock.patch('google.cloud.bigquery.table.pandas', new=None)
+    def test_iter_dataframes_error_if_pandas_is_none(self):
+        from google.cloud.bigquery.table import _EmptyRowIterator
+        row_iterator = _EmptyRowIterator()
+        with self.assertRaises(ValueError):
+            row_iterator.iter_dataframes()
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_iter_dataframes(self):
+        from google.cloud.bigquery.table import _EmptyRowIterator
+        row_iterator = _EmptyRowIterator()
+        self.assertEqual(list(row_iterator.iter_dataframes()), [])
+
 
 class TestRowIterator(unittest.TestCase):
 
@@ -1369,6 +1711,197 @@ class TestRowIterator(unittest.TestCase):
             method='GET', path=path, query_params={
                 'maxResults': row_iterator._page_size})
 
+    def _make_startindex_api_request(self, rows, max_page_rows=None):
+        # Serve ``rows`` like tabledata.list, honoring startIndex/maxResults.
+        def api_request(method, path, query_params):
+            start = int(query_params.get('startIndex', 0))
+            if 'pageToken' in query_params:
+                start = int(query_params['pageToken'])
+            count = query_params.get('maxResults', 2)
+            if max_page_rows is not None:
+                count = min(count, max_page_rows)
+            end = min(start + count, len(rows))
+            response = {'rows': rows[start:end], 'totalRows': str(len(rows))}
+            if end < len(rows):
+                response['pageToken'] = str(end)
+            return response
+
+        return mock.Mock(side_effect=api_request)
+
+    def test_iterate_w_max_workers(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(7)]
+        path = '/foo'
+        api_request = self._make_startindex_api_request(rows)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            page_size=2, max_workers=3)
+
+        ages = [row.age for row in row_iterator]
+
+        self.assertEqual(ages, list(range(7)))
+        self.assertEqual(row_iterator.num_results, 7)
+        self.assertEqual(row_iterator.total_rows, 7)
+        self.assertIsNone(row_iterator.next_page_token)
+        calls = api_request.call_args_list
+        self.assertEqual(calls[0][1]['query_params'], {'maxResults': 2})
+        self.assertEqual(
+            sorted(call[1]['query_params']['startIndex']
+                   for call in calls[1:]),
+            [2, 4, 6])
+        for call in calls[1:]:
+            self.assertNotIn('pageToken', call[1]['query_params'])
+
+    def test__page_iter_w_max_workers_when_exhausted(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(3)]
+        api_request = self._make_startindex_api_request(rows)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, '/foo', schema,
+            page_size=2, max_workers=2)
+        self.assertEqual(len(list(row_iterator)), 3)
+        num_calls = api_request.call_count
+
+        self.assertEqual(list(row_iterator._page_iter(increment=True)), [])
+        self.assertEqual(api_request.call_count, num_calls)
+
+    def test_pages_w_max_workers_and_short_responses(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(9)]
+        path = '/foo'
+        # The first page sets the stride to 3, but later responses are
+        # capped at 2 rows, so each range needs a follow-up request.
+        responses = iter([
+            {'rows': rows[:3], 'totalRows': '9', 'pageToken': 'x'},
+        ])
+        token_request = self._make_startindex_api_request(
+            rows, max_page_rows=2)
+
+        def api_request(**kwargs):
+            if 'startIndex' in kwargs['query_params']:
+                return token_request(**kwargs)
+            return six.next(responses)
+
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            extra_params={'selectedFields': 'age'}, max_workers=2)
+
+        pages = [[row.age for row in page] for page in row_iterator.pages]
+
+        self.assertEqual(pages, [[0, 1, 2], [3, 4], [5], [6, 7], [8]])
+        self.assertEqual(row_iterator.num_results, 9)
+        for call in token_request.call_args_list:
+            self.assertEqual(
+                call[1]['query_params']['selectedFields'], 'age')
+
+    def test_iterate_w_max_workers_and_missing_rows(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(6)]
+        path = '/foo'
+        token_request = self._make_startindex_api_request(rows[:3])
+
+        def api_request(**kwargs):
+            # The first page reports 6 rows, but only 3 are left to fetch.
+            response = token_request(**kwargs)
+            response['totalRows'] = '6'
+            return response
+
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            page_size=2, max_workers=2)
+
+        with self.assertRaises(ValueError):
+            list(row_iterator)
+
+    def test_iterate_w_max_workers_w_start_index_and_max_results(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(10)]
+        path = '/foo'
+        api_request = self._make_startindex_api_request(rows)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            max_results=5, page_size=2, extra_params={'startIndex': 3},
+            max_workers=4)
+
+        ages = [row.age for row in row_iterator]
+
+        self.assertEqual(ages, [3, 4, 5, 6, 7])
+        last_params = max(
+            (call[1]['query_params'] for call in api_request.call_args_list),
+            key=lambda params: params['startIndex'])
+        self.assertEqual(last_params['startIndex'], 7)
+        self.assertEqual(last_params['maxResults'], 1)
+
+    def test_iterate_w_max_workers_wo_total_rows(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(3)]
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[
+            {'rows': rows[:2], 'pageToken': 'next'},
+            {'rows': rows[2:]},
+        ])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema, max_workers=2)
+
+        ages = [row.age for row in row_iterator]
+
+        self.assertEqual(ages, [0, 1, 2])
+        api_request.assert_called_with(
+            method='GET', path=path, query_params={'pageToken': 'next'})
+
+    def test_iterate_w_max_workers_w_page_token(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(5)]
+        path = '/foo'
+        api_request = self._make_startindex_api_request(rows)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            page_token='1', max_workers=2)
+
+        ages = [row.age for row in row_iterator]
+
+        self.assertEqual(ages, [1, 2, 3, 4])
+        for call in api_request.call_args_list:
+            self.assertNotIn('startIndex', call[1]['query_params'])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_max_workers(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('age', 'INTEGER', mode='REQUIRED')]
+        rows = [{'f': [{'v': str(age)}]} for age in range(7)]
+        path = '/foo'
+        api_request = self._make_startindex_api_request(rows)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema, max_workers=3)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(list(df.age), list(range(7)))
+        self.assertEqual(list(df.index), list(range(7)))
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     def test_to_dataframe(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1498,6 +2031,150 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.complete.dtype.name, 'bool')
         self.assertEqual(df.date.dtype.name, 'object')
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_dtypes(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+            SchemaField('miles', 'FLOAT'),
+        ]
+        rows = [
+            {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}, {'v': '1.5'}]},
+            {'f': [{'v': 'Bharney Rhubble'}, {'v': '33'}, {'v': None}]},
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': rows})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe(
+            dtypes={'age': 'int32', 'miles': 'float32'})
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(list(df), ['name', 'age', 'miles'])
+        self.assertEqual(df.name.dtype.name, 'object')
+        self.assertEqual(df.age.dtype.name, 'int32')
+        self.assertEqual(df.miles.dtype.name, 'float32')
+        self.assertEqual(list(df.age), [32, 33])
+        self.assertEqual(df.miles[0], 1.5)
+        self.assertTrue(pandas.isnull(df.miles[1]))
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_multiple_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+            SchemaField('colors', 'STRING', mode='REPEATED'),
+        ]
+        page_1 = {
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'},
+                       {'v': [{'v': 'red'}, {'v': 'blue'}]}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': '33'},
+                       {'v': []}]},
+            ],
+            'pageToken': 'next-page',
+        }
+        page_2 = {
+            'rows': [
+                {'f': [{'v': 'Wylma Phlyntstone'}, {'v': '29'},
+                       {'v': [{'v': 'green'}]}]},
+            ],
+        }
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[page_1, page_2])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(api_request.call_count, 2)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(list(df.index), [0, 1, 2])
+        self.assertEqual(
+            list(df.name),
+            ['Phred Phlyntstone', 'Bharney Rhubble', 'Wylma Phlyntstone'])
+        self.assertEqual(df.age.dtype.name, 'int64')
+        self.assertEqual(list(df.age), [32, 33, 29])
+        self.assertEqual(list(df.colors), [['red', 'blue'], [], ['green']])
+
+    def _make_paged_iterator(self, page_sizes):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER'),
+        ]
+        responses = []
+        age = 0
+        for page_size in page_sizes:
+            rows = []
+            for _ in range(page_size):
+                rows.append({'f': [{'v': 'name-{}'.format(age)},
+                                   {'v': str(age)}]})
+                age += 1
+            responses.append({'rows': rows, 'pageToken': 'next'})
+        del responses[-1]['pageToken']
+        api_request = mock.Mock(side_effect=responses)
+        return RowIterator(mock.sentinel.client, api_request, '/foo', schema)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_iter_dataframes(self):
+        row_iterator = self._make_paged_iterator([2, 0, 3])
+
+        frames = list(row_iterator.iter_dataframes())
+
+        self.assertEqual([len(frame) for frame in frames], [2, 3])
+        for frame in frames:
+            self.assertEqual(list(frame), ['name', 'age'])
+            self.assertEqual(frame.age.dtype.name, 'int64')
+        self.assertEqual(list(frames[1].index), [0, 1, 2])
+        self.assertEqual(list(frames[1].age), [2, 3, 4])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_iter_dataframes_w_max_rows_per_frame(self):
+        row_iterator = self._make_paged_iterator([3, 1, 5, 2])
+
+        frames = list(row_iterator.iter_dataframes(
+            dtypes={'age': 'int32'}, max_rows_per_frame=4))
+
+        self.assertEqual([len(frame) for frame in frames], [4, 4, 3])
+        self.assertEqual(
+            [list(frame.age) for frame in frames],
+            [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10]])
+        for frame in frames:
+            self.assertEqual(list(frame.index), list(range(len(frame))))
+            self.assertEqual(frame.age.dtype.name, 'int32')
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_iter_dataframes_w_empty_results(self):
+        row_iterator = self._make_paged_iterator([0])
+
+        frames = list(row_iterator.iter_dataframes(max_rows_per_frame=10))
+
+        self.assertEqual(frames, [])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_iter_dataframes_w_invalid_max_rows_per_frame(self):
+        row_iterator = self._make_paged_iterator([1])
+
+        with self.assertRaises(ValueError):
+            row_iterator.iter_dataframes(max_rows_per_frame=0)
+
+    @mock.patch('google.cloud.bigquery.table.pandas', new=None)
+    def test_iter_dataframes_error_if_pandas_is_none(self):
+        row_iterator = self._make_paged_iterator([1])
+
+        with self.assertRaises(ValueError):
+            row_iterator.iter_dataframes()
+
     @mock.patch('google.cloud.bigquery.table.pandas', new=None)
     def test_to_dataframe_error_if_pandas_is_none(self):
         from google.cloud.bigquery.table import RowIterator
@@ -0,0 +1,110 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure publisher throughput against an in-process fake Pub/Sub server.
+
+The fake server answers each ``Publish`` request after a fixed delay, so
+the results show how well the client overlaps requests and how many threads
+it needs to do so, without a project or credentials.
+"""
+
+from __future__ import print_function
+
+import argparse
+import itertools
+import threading
+import time
+
+from concurrent import futures
+import grpc
+
+from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1.proto import pubsub_pb2
+from google.cloud.pubsub_v1.proto import pubsub_pb2_grpc
+
+
+class FakePublisher(pubsub_pb2_grpc.PublisherServicer):
+    """Answer ``Publish`` requests after ``latency`` seconds."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.requests = 0
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def Publish(self, request, context):
+        time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            message_ids = [
+                str(next(self._ids)) for _ in request.messages]
+        return pubsub_pb2.PublishResponse(message_ids=message_ids)
+
+
+def start_server(servicer):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=64))
+    pubsub_pb2_grpc.add_PublisherServicer_to_server(servicer, server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+    return server, port
+
+
+def publish(client, topics, messages, payload):
+    """Publish ``messages`` round-robin over ``topics`` and wait for all."""
+    peak_threads = 0
+    pending = []
+    for index in range(messages):
+        topic = topics[index % len(topics)]
+        pending.append(client.publish(topic, payload))
+        if index % 1000 == 0:
+            peak_threads = max(peak_threads, threading.active_count())
+    for future in pending:
+        future.result()
+    return peak_threads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--topics', type=int, default=200)
+    parser.add_argument('--messages', type=int, default=50000)
+    parser.add_argument('--size', type=int, default=100,
+                        help='The size of each message, in bytes.')
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='The seconds taken by each Publish request.')
+    args = parser.parse_args()
+
+    servicer = FakePublisher(args.latency)
+    server, port = start_server(servicer)
+    try:
+        channel = grpc.insecure_channel('localhost:{}'.format(port))
+        client = pubsub_v1.PublisherClient(channel=channel)
+        topics = [
+            client.topic_path('project', 'topic-{}'.format(index))
+            for index in range(args.topics)]
+        payload = b'x' * args.size
+
+        start = time.time()
+        peak_threads = publish(client, topics, args.messages, payload)
+        elapsed = time.time() - start
+    finally:
+        server.stop(None)
+
+    print('{} messages over {} topics in {:.2f}s: {:.0f} messages/s, '
+          '{} requests, peak of {} threads'.format(
+              args.messages, args.topics, elapsed,
+              args.messages / elapsed, servicer.requests, peak_threads))
+
+
+if __name__ == '__main__':
+    main()
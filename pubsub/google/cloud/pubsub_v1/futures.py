@@ -49,6 +49,9 @@ class Future(google.api_core.future.Future):
         self._result = self._SENTINEL
         self._exception = self._SENTINEL
         self._callbacks = []
+        # Guards against a callback being added while the future completes,
+        # which could otherwise leave the callback uncalled.
+        self._callbacks_lock = threading.Lock()
         if completed is None:
             completed = threading.Event()
         self._completed = completed
@@ -146,9 +149,11 @@ class Future(google.api_core.future.Future):
         The provided function is called, with this future as its only argument,
         when the future finishes running.
         """
-        if self.done():
-            return fn(self)
-        self._callbacks.append(fn)
+        with self._callbacks_lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        return fn(self)
 
     def set_result(self, result):
         """Set the result of the future to the provided result.
@@ -156,12 +161,15 @@ class Future(google.api_core.future.Future):
         Args:
             result (Any): The result
         """
-        # Sanity check: A future can only complete once.
-        if self.done():
-            raise RuntimeError('set_result can only be called once.')
+        with self._callbacks_lock:
+            # Sanity check: A future can only complete once.
+            if self.done():
+                raise RuntimeError('set_result can only be called once.')
+
+            # Set the result.
+            self._result = result
 
-        # Set the result and trigger the future.
-        self._result = result
+        # Trigger the future.
         self._trigger()
 
     def set_exception(self, exception):
@@ -170,12 +178,15 @@ class Future(google.api_core.future.Future):
         Args:
             exception (:exc:`Exception`): The exception raised.
         """
-        # Sanity check: A future can only complete once.
-        if self.done():
-            raise RuntimeError('set_exception can only be called once.')
+        with self._callbacks_lock:
+            # Sanity check: A future can only complete once.
+            if self.done():
+                raise RuntimeError('set_exception can only be called once.')
+
+            # Set the exception.
+            self._exception = exception
 
-        # Set the exception and trigger the future.
-        self._exception = exception
+        # Trigger the future.
         self._trigger()
 
     def _trigger(self):
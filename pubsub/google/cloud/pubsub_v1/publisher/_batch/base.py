@@ -130,6 +130,22 @@ class Batch(object):
         # Okay, everything is good.
         return True
 
+    def drop(self, future):
+        """Remove a message which is not yet being sent from the batch.
+
+        This is used by publisher flow control to make room for newer
+        messages. Batches which cannot remove messages return :data:`False`.
+
+        Args:
+            future (~google.api_core.future.Future): The future returned when
+                the message was published to this batch.
+
+        Returns:
+            bool: Whether the message was removed. The caller is then
+            responsible for completing its future.
+        """
+        return False
+
     @abc.abstractmethod
     def publish(self, message):
         """Publish a single message.
@@ -81,15 +81,11 @@ class Batch(base.Batch):
         self._size = 0
         self._status = base.BatchStatus.ACCEPTING_MESSAGES
 
-        # If max latency is specified, start a thread to monitor the batch and
-        # commit when the max latency is reached.
-        self._thread = None
+        # If max latency is specified, have the client's timer thread commit
+        # the batch when the max latency is reached.
         if autocommit and self._settings.max_latency < float('inf'):
-            self._thread = threading.Thread(
-                name='Thread-MonitorBatchPublisher',
-                target=self.monitor,
-            )
-            self._thread.start()
+            self._client._commit_scheduler.call_later(
+                self._settings.max_latency, self.monitor)
 
     @staticmethod
     def make_lock():
@@ -145,11 +141,12 @@ class Batch(base.Batch):
 
         .. note::
 
-            This method is non-blocking. It opens a new thread, which calls
-            :meth:`_commit`, which does block.
+            This method is non-blocking. It hands :meth:`_commit`, which does
+            block, to the client's pool of commit threads.
 
-        This synchronously sets the batch status to "starting", and then opens
-        a new thread, which handles actually sending the messages to Pub/Sub.
+        This synchronously sets the batch status to "starting", and then
+        schedules the actual sending of the messages to Pub/Sub on one of the
+        commit threads, which are shared by all of the client's batches.
 
         If the current batch is **not** accepting messages, this method
         does nothing.
@@ -162,12 +159,8 @@ class Batch(base.Batch):
             else:
                 return
 
-        # Start a new thread to actually handle the commit.
-        commit_thread = threading.Thread(
-            name='Thread-CommitBatchPublisher',
-            target=self._commit,
-        )
-        commit_thread.start()
+        # Have a commit thread actually handle the commit.
+        self._client._commit_scheduler.submit(self._commit)
 
     def _commit(self):
         """Actually publish all of the messages on the active batch.
@@ -197,66 +190,90 @@ class Batch(base.Batch):
                 self._status = base.BatchStatus.SUCCESS
                 return
 
-            # Begin the request to publish these messages.
-            # Log how long the underlying request takes.
-            start = time.time()
+        # The batch no longer accepts messages, so the request is made without
+        # the lock held; the client opens a new batch for the topic meanwhile.
+        # Begin the request to publish these messages.
+        # Log how long the underlying request takes.
+        start = time.time()
 
-            try:
-                response = self._client.api.publish(
-                    self._topic,
-                    self._messages,
-                )
-            except google.api_core.exceptions.GoogleAPICallError as exc:
-                # We failed to publish, set the exception on all futures and
-                # exit.
+        try:
+            response = self._client.api.publish(
+                self._topic,
+                self._messages,
+            )
+        except google.api_core.exceptions.GoogleAPICallError as exc:
+            # We failed to publish, set the exception on all futures and
+            # exit.
+            with self._state_lock:
                 self._status = base.BatchStatus.ERROR
 
-                for future in self._futures:
-                    future.set_exception(exc)
+            for future in self._futures:
+                future.set_exception(exc)
 
-                _LOGGER.exception(
-                    'Failed to publish %s messages.', len(self._futures))
-                return
+            _LOGGER.exception(
+                'Failed to publish %s messages.', len(self._futures))
+            return
 
-            end = time.time()
-            _LOGGER.debug('gRPC Publish took %s seconds.', end - start)
+        end = time.time()
+        _LOGGER.debug('gRPC Publish took %s seconds.', end - start)
 
-            if len(response.message_ids) == len(self._futures):
-                # Iterate over the futures on the queue and return the response
-                # IDs. We are trusting that there is a 1:1 mapping, and raise
-                # an exception if not.
+        if len(response.message_ids) == len(self._futures):
+            # Iterate over the futures on the queue and return the response
+            # IDs. We are trusting that there is a 1:1 mapping, and raise
+            # an exception if not.
+            with self._state_lock:
                 self._status = base.BatchStatus.SUCCESS
-                zip_iter = six.moves.zip(response.message_ids, self._futures)
-                for message_id, future in zip_iter:
-                    future.set_result(message_id)
-            else:
-                # Sanity check: If the number of message IDs is not equal to
-                # the number of futures I have, then something went wrong.
+            zip_iter = six.moves.zip(response.message_ids, self._futures)
+            for message_id, future in zip_iter:
+                future.set_result(message_id)
+        else:
+            # Sanity check: If the number of message IDs is not equal to
+            # the number of futures I have, then something went wrong.
+            with self._state_lock:
                 self._status = base.BatchStatus.ERROR
-                exception = exceptions.PublishError(
-                    'Some messages were not successfully published.')
+            exception = exceptions.PublishError(
+                'Some messages were not successfully published.')
 
-                for future in self._futures:
-                    future.set_exception(exception)
+            for future in self._futures:
+                future.set_exception(exception)
 
-                _LOGGER.error(
-                    'Only %s of %s messages were published.',
-                    len(response.message_ids), len(self._futures))
+            _LOGGER.error(
+                'Only %s of %s messages were published.',
+                len(response.message_ids), len(self._futures))
 
-    def monitor(self):
-        """Commit this batch after sufficient time has elapsed.
+    def drop(self, future):
+        """Remove a message which is not yet being sent from the batch.
+
+        Args:
+            future (~.pubsub_v1.publisher.futures.Future): The future returned
+                when the message was published to this batch.
 
-        This simply sleeps for ``self._settings.max_latency`` seconds,
-        and then calls commit unless the batch has already been committed.
+        Returns:
+            bool: Whether the message was removed. This is :data:`False` once
+            the commit of the batch is under way.
         """
-        # NOTE: This blocks; it is up to the calling code to call it
-        #       in a separate thread.
+        with self._state_lock:
+            if self._status not in _CAN_COMMIT:
+                return False
+
+            try:
+                index = self._futures.index(future)
+            except ValueError:
+                return False
 
-        # Sleep for however long we should be waiting.
-        time.sleep(self._settings.max_latency)
+            del self._futures[index]
+            message = self._messages.pop(index)
+            self._size -= message.ByteSize()
+            return True
 
+    def monitor(self):
+        """Commit this batch once ``self._settings.max_latency`` has elapsed.
+
+        This is called by the client's timer thread, and starts a commit
+        unless the batch has already been committed.
+        """
         _LOGGER.debug('Monitor is waking up')
-        return self._commit()
+        self.commit()
 
     def publish(self, message):
         """Publish a single message.
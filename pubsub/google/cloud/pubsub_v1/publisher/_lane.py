@@ -0,0 +1,210 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _LaneBatch(thread.Batch):
+    """A batch of an ordered lane, which the lane commits in turn.
+
+    Committing the batch only closes it to new messages; the lane then sends
+    it once the batches before it are done.
+    """
+    def __init__(self, client, topic, settings):
+        super(_LaneBatch, self).__init__(
+            client, topic, settings, autocommit=False)
+
+    def commit(self):
+        """Close the batch to new messages, leaving the send to the lane."""
+        with self._state_lock:
+            if self._status == base.BatchStatus.ACCEPTING_MESSAGES:
+                self._status = base.BatchStatus.STARTING
+
+    def fail(self, exception):
+        """Fail all of the futures of a batch which will not be sent.
+
+        Args:
+            exception (Exception): The exception set on the futures.
+        """
+        with self._state_lock:
+            if self._status not in (base.BatchStatus.ACCEPTING_MESSAGES,
+                                    base.BatchStatus.STARTING):
+                return
+            self._status = base.BatchStatus.ERROR
+
+        for future in self._futures:
+            future.set_exception(exception)
+
+
+class OrderedLane(object):
+    """Publishes the messages of one ordering key of a topic in order.
+
+    The messages are batched as usual, but a batch is only sent once the
+    batch before it is done, so that one ``Publish`` request at a time is
+    in flight for the key. Lanes of other keys send their batches in
+    parallel, on the client's commit threads.
+
+    If a batch fails, the lane is paused: the futures of the messages after
+    it fail, and publishing with the key raises
+    :class:`~.pubsub_v1.publisher.exceptions.PublishToPausedOrderingKeyError`
+    until :meth:`resume` is called.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client.
+        topic (str): The topic.
+        ordering_key (str): The ordering key.
+    """
+    def __init__(self, client, topic, ordering_key):
+        self._client = client
+        self._topic = topic
+        self._ordering_key = ordering_key
+        self._lock = threading.Lock()
+        # The batches waiting to be sent, oldest first; while ``_in_flight``
+        # is set, the first one is being sent.
+        self._batches = collections.deque()
+        self._in_flight = False
+        self._paused = False
+        self._closed = False
+
+    @property
+    def paused(self):
+        """bool: Whether a failure has paused the lane."""
+        return self._paused
+
+    def publish(self, message):
+        """Publish a single message after the earlier ones of the lane.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            Optional[~.pubsub_v1.publisher.futures.Future]: The future of the
+            message, or :data:`None` if the lane has been closed, because it
+            was idle, and a new lane is needed.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.PublishToPausedOrderingKeyError:
+                If the lane is paused.
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            if self._paused:
+                raise exceptions.PublishToPausedOrderingKeyError(
+                    'Publishing to ordering key {!r} of topic {!r} is paused '
+                    'after a failure; call resume_publish() to '
+                    'continue.'.format(self._ordering_key, self._topic))
+
+            future = None
+            if self._batches:
+                future = self._batches[-1].publish(message)
+            while future is None:
+                batch = self._open_batch()
+                future = batch.publish(message)
+
+            self._maybe_send()
+
+        return future
+
+    def _open_batch(self):
+        """Add a new batch to the lane.
+
+        This must be called with the lock held.
+        """
+        settings = self._client.batch_settings
+        batch = _LaneBatch(self._client, self._topic, settings)
+        self._batches.append(batch)
+        if settings.max_latency < float('inf'):
+            self._client._commit_scheduler.call_later(
+                settings.max_latency, lambda: self._on_timer(batch))
+        return batch
+
+    def _on_timer(self, batch):
+        """Close a batch once its max latency has elapsed."""
+        batch.commit()
+        with self._lock:
+            self._maybe_send()
+
+    def _maybe_send(self):
+        """Send the first batch, if it is closed and nothing is in flight.
+
+        This must be called with the lock held.
+        """
+        if self._in_flight or self._paused or not self._batches:
+            return
+        batch = self._batches[0]
+        if batch.status != base.BatchStatus.STARTING:
+            return
+        self._in_flight = True
+        self._client._commit_scheduler.submit(self._send, batch)
+
+    def _send(self, batch):
+        """Send a batch, then the next one, or pause the lane on failure."""
+        batch._commit()
+
+        failed = batch.status == base.BatchStatus.ERROR
+        with self._lock:
+            self._batches.popleft()
+            self._in_flight = False
+            if failed:
+                self._paused = True
+                pending, self._batches = self._batches, collections.deque()
+            else:
+                pending = ()
+                self._maybe_send()
+            idle = not self._batches and not self._paused
+            if idle:
+                self._closed = True
+
+        if failed:
+            _LOGGER.error(
+                'Publishing to ordering key %r of topic %r failed; pausing.',
+                self._ordering_key, self._topic)
+            exception = exceptions.PublishToPausedOrderingKeyError(
+                'An earlier message with ordering key {!r} failed to '
+                'publish.'.format(self._ordering_key))
+            for pending_batch in pending:
+                pending_batch.fail(exception)
+        if idle:
+            self._client._remove_lane(self._topic, self._ordering_key, self)
+
+    def resume(self):
+        """Resume publishing after a failure paused the lane."""
+        with self._lock:
+            self._paused = False
+            idle = not self._batches
+            if idle:
+                self._closed = True
+
+        if idle:
+            self._client._remove_lane(self._topic, self._ordering_key, self)
+
+    def drop(self, future):
+        """Keep all messages, since dropping one would break the ordering.
+
+        Returns:
+            bool: Always :data:`False`.
+        """
+        return False
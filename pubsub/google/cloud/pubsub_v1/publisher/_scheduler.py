@@ -0,0 +1,125 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+
+
+_LOGGER = logging.getLogger(__name__)
+_TIMER_NAME = 'Thread-TimerBatchPublisher'
+
+
+def _make_commit_executor(max_workers):
+    # Python 2.7 and 3.6+ have the thread_name_prefix argument, which is useful
+    # for debugging.
+    executor_kwargs = {}
+    if sys.version_info[:2] == (2, 7) or sys.version_info >= (3, 6):
+        executor_kwargs['thread_name_prefix'] = (
+            'ThreadPoolExecutor-CommitBatchPublisher')
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        **executor_kwargs
+    )
+
+
+class CommitScheduler(object):
+    """Runs the batch timers and commits of a publisher client.
+
+    All of the batches of a client, whatever their topic, share a single
+    timer thread and a bounded pool of commit threads, instead of each batch
+    starting threads of its own. Several batches of the same topic may be
+    committing at once, up to the size of the pool.
+
+    The timer thread only runs while timers are pending, and is not a daemon
+    thread, so that a process does not exit before its open batches have
+    been committed.
+
+    Args:
+        max_workers (int): The maximum number of batches committed at once.
+        executor (Optional[concurrent.futures.Executor]): The executor used
+            to run commits. If not specified, a thread pool of
+            ``max_workers`` threads is created.
+    """
+    def __init__(self, max_workers=10, executor=None):
+        if executor is None:
+            executor = _make_commit_executor(max_workers)
+        self._executor = executor
+        self._condition = threading.Condition()
+        # The pending timers, as a heap of ``(deadline, sequence, callback)``;
+        # the sequence keeps timers with equal deadlines in FIFO order.
+        self._timers = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+    def call_later(self, delay, callback):
+        """Call ``callback`` on the timer thread after ``delay`` seconds.
+
+        The callback should return quickly, as it holds up any later timers;
+        blocking work belongs in :meth:`submit`.
+
+        Args:
+            delay (float): The number of seconds to wait.
+            callback (Callable[[], None]): The function to call.
+        """
+        entry = (time.time() + delay, next(self._sequence), callback)
+        with self._condition:
+            heapq.heappush(self._timers, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name=_TIMER_NAME,
+                    target=self._run_timers,
+                )
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def submit(self, callback, *args, **kwargs):
+        """Run ``callback`` on the commit thread pool.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            concurrent.futures.Future: The future of the call.
+        """
+        return self._executor.submit(callback, *args, **kwargs)
+
+    def _run_timers(self):
+        """Call the timers as they become due, until none are pending."""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._timers:
+                        self._thread = None
+                        return
+                    deadline = self._timers[0][0]
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                _, _, callback = heapq.heappop(self._timers)
+
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception('Batch timer callback failed.')
@@ -26,6 +26,9 @@ from google.api_core import grpc_helpers
 from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
+from google.cloud.pubsub_v1.publisher import _lane
+from google.cloud.pubsub_v1.publisher import _scheduler
+from google.cloud.pubsub_v1.publisher import flow_controller
 from google.cloud.pubsub_v1.publisher._batch import thread
 
 
@@ -43,6 +46,10 @@ class Client(object):
     Args:
         batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
             settings for batch publishing.
+        flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            limits on the messages outstanding across all topics, and what
+            to do when publishing would exceed them. By default the limits
+            are ignored.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
@@ -53,7 +60,7 @@ class Client(object):
     """
     _batch_class = thread.Batch
 
-    def __init__(self, batch_settings=(), **kwargs):
+    def __init__(self, batch_settings=(), flow_control=(), **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -80,11 +87,22 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self._flow_controller = flow_controller.FlowController(
+            types.PublishFlowControl(*flow_control))
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
         self._batch_lock = self._batch_class.make_lock()
         self._batches = {}
+        # Messages with an ordering key go through one ordered lane for each
+        # topic and ordering key instead.
+        self._lanes = {}
+
+        # All of the batches share one timer thread and a bounded pool of
+        # threads to commit them.
+        self._commit_scheduler = _scheduler.CommitScheduler(
+            max_workers=self.batch_settings.max_concurrent_commits,
+        )
 
     @property
     def target(self):
@@ -95,6 +113,18 @@ class Client(object):
         """
         return publisher_client.PublisherClient.SERVICE_ADDRESS
 
+    @property
+    def flow_controller(self):
+        """Return the flow controller of the client.
+
+        It reports the messages currently outstanding, across all topics.
+
+        Returns:
+            ~.pubsub_v1.publisher.flow_controller.FlowController: The flow
+            controller.
+        """
+        return self._flow_controller
+
     def _batch(self, topic, create=False, autocommit=True):
         """Return the current batch for the provided topic.
 
@@ -133,7 +163,56 @@ class Client(object):
 
         return batch
 
-    def publish(self, topic, data, **attrs):
+    def _lane(self, topic, ordering_key, closed=None):
+        """Return the ordered lane for the provided topic and ordering key.
+
+        This will create a new lane if no lane currently exists, or if the
+        current one is ``closed``.
+
+        Args:
+            topic (str): A string representing the topic.
+            ordering_key (str): The ordering key.
+            closed (~.pubsub_v1.publisher._lane.OrderedLane): A lane which
+                refused a message because it closed, to be replaced unless
+                that has happened already.
+
+        Returns:
+            ~.pubsub_v1.publisher._lane.OrderedLane: The lane object.
+        """
+        key = (topic, ordering_key)
+        with self._batch_lock:
+            lane = self._lanes.get(key)
+            if lane is None or lane is closed:
+                lane = _lane.OrderedLane(self, topic, ordering_key)
+                self._lanes[key] = lane
+
+        return lane
+
+    def _remove_lane(self, topic, ordering_key, lane):
+        """Forget a lane which closed because it was idle."""
+        key = (topic, ordering_key)
+        with self._batch_lock:
+            if self._lanes.get(key) is lane:
+                del self._lanes[key]
+
+    def resume_publish(self, topic, ordering_key):
+        """Resume publishing with an ordering key after a failure.
+
+        When a message with an ordering key fails to publish, the messages
+        with that key published after it fail too, and further publishing
+        with the key raises :class:`.PublishToPausedOrderingKeyError` until
+        this is called. Other ordering keys are not affected.
+
+        Args:
+            topic (str): The topic.
+            ordering_key (str): The paused ordering key.
+        """
+        with self._batch_lock:
+            lane = self._lanes.get((topic, ordering_key))
+        if lane is not None:
+            lane.resume()
+
+    def publish(self, topic, data, ordering_key='', **attrs):
         """Publish a single message.
 
         .. note::
@@ -159,16 +238,38 @@ class Client(object):
             >>> data = b'The rain in Wales falls mainly on the snails.'
             >>> response = client.publish(topic, data, username='guido')
 
+        Messages published with the same non-empty ``ordering_key`` to a
+        topic are sent in the order they were published: each batch of them
+        is sent once the batch before it is done. Messages with different
+        ordering keys are still batched and sent in parallel. If a message
+        with an ordering key fails to publish, the key is paused; see
+        :meth:`resume_publish`.
+
+        .. warning::
+            This is a breaking change: ``ordering_key`` used to be sent as
+            an ordinary message attribute, like any other keyword argument.
+            It now sets the ordering key of the message instead, and a
+            message attribute named ``ordering_key`` can no longer be
+            published.
+
         Args:
             topic (str): The topic to publish messages to.
             data (bytes): A bytestring representing the message body. This
                 must be a bytestring.
+            ordering_key (str): (Optional) The ordering key of the message.
             attrs (Mapping[str, str]): A dictionary of attributes to be
                 sent as metadata. (These may be text strings or byte strings.)
 
         Returns:
             ~concurrent.futures.Future: An object conforming to the
             ``concurrent.futures.Future`` interface.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                flow control behavior is ``ERROR`` and publishing the message
+                would exceed the flow control limits.
+            ~.pubsub_v1.publisher.exceptions.PublishToPausedOrderingKeyError:
+                If ``ordering_key`` is paused after a failure.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -193,12 +294,36 @@ class Client(object):
         # Create the Pub/Sub message object.
         message = types.PubsubMessage(data=data, attributes=attrs)
 
-        # Delegate the publishing to the batch.
-        batch = self._batch(topic)
-        future = None
-        while future is None:
-            future = batch.publish(message)
-            if future is None:
-                batch = self._batch(topic, create=True)
+        # Apply flow control; this may block, raise, or drop older messages.
+        flow_control = self._flow_controller.settings
+        controlled = (flow_control.limit_exceeded_behavior !=
+                      types.LimitExceededBehavior.IGNORE)
+        if controlled:
+            size = message.ByteSize()
+            self._flow_controller.add(size)
+
+        # Delegate the publishing to the batch, or to the ordered lane of
+        # the ordering key.
+        try:
+            if ordering_key:
+                batch = self._lane(topic, ordering_key)
+                future = batch.publish(message)
+                while future is None:
+                    batch = self._lane(topic, ordering_key, closed=batch)
+                    future = batch.publish(message)
+            else:
+                batch = self._batch(topic)
+                future = None
+                while future is None:
+                    future = batch.publish(message)
+                    if future is None:
+                        batch = self._batch(topic, create=True)
+        except Exception:
+            if controlled:
+                self._flow_controller.release(size)
+            raise
+
+        if controlled:
+            self._flow_controller.track(future, size, batch)
 
         return future
@@ -22,7 +22,17 @@ class PublishError(GoogleAPICallError):
     pass
 
 
+class FlowControlLimitError(Exception):
+    """A message was refused or dropped by publisher flow control."""
+
+
+class PublishToPausedOrderingKeyError(Exception):
+    """An ordering key is paused after one of its messages failed."""
+
+
 __all__ = (
+    'FlowControlLimitError',
     'PublishError',
+    'PublishToPausedOrderingKeyError',
     'TimeoutError',
 )
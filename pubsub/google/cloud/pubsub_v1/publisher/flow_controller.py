@@ -0,0 +1,192 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+
+
+_LOGGER = logging.getLogger(__name__)
+_Outstanding = collections.namedtuple('_Outstanding', ['size', 'batch'])
+
+
+class FlowController(object):
+    """Limits the messages a publisher client has outstanding.
+
+    A message is outstanding from the time it is published until its future
+    is done. The limits apply to all of the topics of the client together.
+
+    Args:
+        settings (~.pubsub_v1.types.PublishFlowControl): The flow control
+            settings.
+    """
+    def __init__(self, settings):
+        self._settings = settings
+        self._condition = threading.Condition()
+        # The futures of the tracked outstanding messages, oldest first.
+        self._outstanding = collections.OrderedDict()
+        self._messages = 0
+        self._bytes = 0
+
+    @property
+    def settings(self):
+        """~.pubsub_v1.types.PublishFlowControl: The flow control settings."""
+        return self._settings
+
+    @property
+    def outstanding_messages(self):
+        """int: The number of messages currently outstanding."""
+        return self._messages
+
+    @property
+    def outstanding_bytes(self):
+        """int: The total size of the messages currently outstanding."""
+        return self._bytes
+
+    @property
+    def load(self):
+        """Return the current load.
+
+        The load is represented as a float, where 1.0 represents having
+        hit one of the flow control limits, and values between 0.0 and 1.0
+        represent how close we are to them. (0.5 means we have exactly half
+        of what the flow control setting allows, for example.)
+
+        There are (currently) two flow control settings; this property
+        computes how close the client is to each of them, and returns
+        whichever value is higher. (It does not matter that we have lots of
+        running room on setting A if setting B is over.)
+
+        Returns:
+            float: The load value.
+        """
+        return max([
+            self._messages / float(self._settings.message_limit),
+            self._bytes / float(self._settings.byte_limit),
+        ])
+
+    def _would_overflow(self, size):
+        """Return True if a message of ``size`` bytes would break a limit.
+
+        A message is always let through when nothing is outstanding, so that
+        a message larger than ``byte_limit`` can still be published.
+        """
+        if not self._messages:
+            return False
+        return (self._messages + 1 > self._settings.message_limit or
+                self._bytes + size > self._settings.byte_limit)
+
+    def add(self, size):
+        """Reserve room for a message, applying the overflow behavior.
+
+        Args:
+            size (int): The size of the message, in bytes.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                behavior is ``ERROR`` and the message would break a limit.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        dropped = []
+        with self._condition:
+            if behavior == types.LimitExceededBehavior.ERROR:
+                if self._would_overflow(size):
+                    raise exceptions.FlowControlLimitError(
+                        'Publishing this message would exceed the flow '
+                        'control limits of {} messages and {} bytes.'.format(
+                            self._settings.message_limit,
+                            self._settings.byte_limit))
+            elif behavior == types.LimitExceededBehavior.DROP_OLDEST:
+                dropped = self._drop_oldest(size)
+
+            # Messages which could not be dropped are waited for, as with
+            # the ``BLOCK`` behavior.
+            while self._would_overflow(size):
+                self._condition.wait()
+
+            self._messages += 1
+            self._bytes += size
+
+        # Fail the dropped futures without the lock held, since done
+        # callbacks may publish.
+        for future in dropped:
+            future.set_exception(exceptions.FlowControlLimitError(
+                'The message was dropped to make room for newer messages.'))
+
+    def _drop_oldest(self, size):
+        """Drop the oldest messages not yet being sent, until ``size`` fits.
+
+        This must be called with the lock held.
+
+        Returns:
+            List[~.pubsub_v1.publisher.futures.Future]: The futures of the
+            dropped messages.
+        """
+        dropped = []
+        for future, outstanding in list(self._outstanding.items()):
+            if not self._would_overflow(size):
+                break
+            if outstanding.batch.drop(future):
+                del self._outstanding[future]
+                self._messages -= 1
+                self._bytes -= outstanding.size
+                dropped.append(future)
+
+        if dropped:
+            _LOGGER.debug(
+                'Dropped %s messages to stay within flow control limits.',
+                len(dropped))
+        return dropped
+
+    def release(self, size):
+        """Release the room of a message which was not published.
+
+        Args:
+            size (int): The size of the message, in bytes.
+        """
+        with self._condition:
+            self._messages -= 1
+            self._bytes -= size
+            self._condition.notify_all()
+
+    def track(self, future, size, batch):
+        """Keep a message outstanding until its future is done.
+
+        Args:
+            future (~.pubsub_v1.publisher.futures.Future): The future of the
+                published message.
+            size (int): The size of the message, in bytes.
+            batch (~.pubsub_v1.publisher._batch.base.Batch): The batch which
+                holds the message, which drops it if the behavior is
+                ``DROP_OLDEST``.
+        """
+        with self._condition:
+            self._outstanding[future] = _Outstanding(size, batch)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        """Release the room of a message once its future is done."""
+        with self._condition:
+            outstanding = self._outstanding.pop(future, None)
+            if outstanding is None:
+                # The message was dropped, and is already released.
+                return
+            self._messages -= 1
+            self._bytes -= outstanding.size
+            self._condition.notify_all()
@@ -0,0 +1,251 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+import time
+
+from google.cloud.pubsub_v1 import types
+
+
+_LOGGER = logging.getLogger(__name__)
+_COALESCER_WORKER_NAME = 'Thread-AckCoalescer'
+_ACK_IDS_BATCH_SIZE = 2500
+"""The maximum number of ack IDs sent in a single StreamingPullRequest."""
+_MAX_REQUEST_BYTES = 512 * 1024
+"""The maximum size of the ack IDs and deadlines in a single request."""
+_ACK_ID_OVERHEAD = 3
+"""The bytes added to each ack ID by its field tag and length."""
+_DEADLINE_BYTES = 5
+"""The most bytes taken by each packed deadline."""
+
+
+def _make_requests(ack_ids, deadlines):
+    """Build requests for acks and modacks, within the service limits.
+
+    Args:
+        ack_ids (Sequence[str]): The ack IDs to acknowledge.
+        deadlines (Sequence[Tuple[str, int]]): The ack IDs to modify the
+            deadline of, with the new deadline in seconds.
+
+    Returns:
+        List[~.pubsub_v1.types.StreamingPullRequest]: The requests.
+    """
+    result = []
+    acks = []
+    modacks = []
+    count = 0
+    size = 0
+    items = [(ack_id, None) for ack_id in ack_ids]
+    items.extend(deadlines)
+    for ack_id, seconds in items:
+        item_size = len(ack_id) + _ACK_ID_OVERHEAD
+        if seconds is not None:
+            item_size += _DEADLINE_BYTES
+        if count and (count >= _ACK_IDS_BATCH_SIZE or
+                      size + item_size > _MAX_REQUEST_BYTES):
+            result.append(_make_request(acks, modacks))
+            acks = []
+            modacks = []
+            count = 0
+            size = 0
+
+        if seconds is None:
+            acks.append(ack_id)
+        else:
+            modacks.append((ack_id, seconds))
+        count += 1
+        size += item_size
+
+    if count:
+        result.append(_make_request(acks, modacks))
+    return result
+
+
+def _make_request(acks, modacks):
+    return types.StreamingPullRequest(
+        ack_ids=acks,
+        modify_deadline_ack_ids=[ack_id for ack_id, _ in modacks],
+        modify_deadline_seconds=[seconds for _, seconds in modacks],
+    )
+
+
+class AckCoalescer(object):
+    """Merges acks and modacks into few requests.
+
+    Acks and modacks are held for up to ``max_ack_batch_latency`` seconds
+    of the manager's flow control settings, and then sent together, split
+    into requests within the service limits. A modack for a message which
+    is acked meanwhile is not sent, and only the latest modack for a
+    message is.
+
+    Args:
+        manager (~.streaming_pull_manager.StreamingPullManager): The
+            manager which sends the requests.
+    """
+    def __init__(self, manager):
+        self._manager = manager
+        self._thread = None
+        self._operational_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._stopping = False
+
+        self._acks = collections.OrderedDict()
+        """OrderedDict[str, None]: The ack IDs to acknowledge."""
+        self._modacks = collections.OrderedDict()
+        """OrderedDict[str, int]: The ack IDs to modify the deadline of,
+            with the new deadline in seconds."""
+        self._first_pending = None
+        """float: When the oldest pending ack or modack was added."""
+
+    @property
+    def pending(self):
+        """int: The number of acks and modacks waiting to be sent."""
+        return len(self._acks) + len(self._modacks)
+
+    def _added(self):
+        """Record that acks or modacks were added.
+
+        This must be called with the lock held.
+        """
+        if not self.pending:
+            return
+        if self._first_pending is None:
+            self._first_pending = time.time()
+            self._condition.notify()
+        elif self.pending >= _ACK_IDS_BATCH_SIZE:
+            # A full request can go out without waiting.
+            self._condition.notify()
+
+    def ack(self, ack_ids):
+        """Acknowledge messages, superseding their pending modacks.
+
+        Args:
+            ack_ids (Sequence[str]): The ack IDs.
+        """
+        with self._condition:
+            for ack_id in ack_ids:
+                self._modacks.pop(ack_id, None)
+                self._acks[ack_id] = None
+            self._added()
+
+    def modify_ack_deadline(self, items):
+        """Modify the ack deadline of messages which are not being acked.
+
+        Args:
+            items (Sequence[ModAckRequest]): The ack IDs and deadlines.
+        """
+        with self._condition:
+            for item in items:
+                if item.ack_id not in self._acks:
+                    self._modacks[item.ack_id] = item.seconds
+            self._added()
+
+    def _take(self):
+        """Take the pending acks and modacks.
+
+        This must be called with the lock held.
+        """
+        ack_ids = list(self._acks)
+        deadlines = list(self._modacks.items())
+        self._acks.clear()
+        self._modacks.clear()
+        self._first_pending = None
+        return ack_ids, deadlines
+
+    def _send(self, ack_ids, deadlines):
+        # This does not check that the manager is active: the final flush
+        # runs while the manager closes, after its consumer is gone, and
+        # the acks must still be sent.
+        if not (ack_ids or deadlines):
+            return
+        requests = _make_requests(ack_ids, deadlines)
+        _LOGGER.debug(
+            'Sending %d acks and %d modacks in %d requests.',
+            len(ack_ids), len(deadlines), len(requests))
+        for request in requests:
+            self._manager.send(request)
+
+    def flush(self):
+        """Send the pending acks and modacks now."""
+        with self._condition:
+            ack_ids, deadlines = self._take()
+        self._send(ack_ids, deadlines)
+
+    def _wait_for_batch(self, latency):
+        """Wait for a batch to be due, and take it.
+
+        Returns:
+            Optional[Tuple[List[str], List[Tuple[str, int]]]]: The acks and
+            modacks to send, or :data:`None` once stopping.
+        """
+        with self._condition:
+            while not self.pending and not self._stopping:
+                self._condition.wait()
+            while not self._stopping and self.pending < _ACK_IDS_BATCH_SIZE:
+                remaining = self._first_pending + latency - time.time()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if self._stopping:
+                return None
+            return self._take()
+
+    def _run(self, latency):
+        while True:
+            batch = self._wait_for_batch(latency)
+            if batch is None:
+                break
+            try:
+                self._send(*batch)
+            except Exception as exc:
+                _LOGGER.exception('Error sending acks and modacks: %s', exc)
+
+        # Send whatever is left before exiting.
+        self.flush()
+        _LOGGER.debug('Exiting the %s.', _COALESCER_WORKER_NAME)
+
+    def start(self):
+        """Start a thread to send the acks and modacks as they are due."""
+        with self._operational_lock:
+            if self._thread is not None:
+                raise ValueError('Ack coalescer is already running.')
+
+            latency = self._manager.flow_control.max_ack_batch_latency
+            with self._condition:
+                self._stopping = False
+            thread = threading.Thread(
+                name=_COALESCER_WORKER_NAME,
+                target=self._run,
+                args=(latency,),
+            )
+            thread.daemon = True
+            thread.start()
+            _LOGGER.debug('Started helper thread %s', thread.name)
+            self._thread = thread
+
+    def stop(self):
+        """Send the pending acks and modacks, and stop the thread."""
+        with self._operational_lock:
+            with self._condition:
+                self._stopping = True
+                self._condition.notify()
+
+            if self._thread is not None:
+                self._thread.join()
+
+            self._thread = None
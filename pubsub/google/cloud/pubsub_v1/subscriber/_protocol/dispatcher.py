@@ -18,7 +18,7 @@ import collections
 import logging
 import threading
 
-from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import ack_coalescer
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
@@ -33,15 +33,20 @@ class Dispatcher(object):
         self._queue = queue
         self._thread = None
         self._operational_lock = threading.Lock()
+        # Acks and modacks are merged across callbacks before being sent.
+        self._ack_coalescer = ack_coalescer.AckCoalescer(manager)
 
     def start(self):
         """Start a thread to dispatch requests queued up by callbacks.
-        Spawns a thread to run :meth:`dispatch_callback`.
+        Spawns a thread to run :meth:`dispatch_callback`, and the thread of
+        the ack coalescer.
         """
         with self._operational_lock:
             if self._thread is not None:
                 raise ValueError('Dispatcher is already running.')
 
+            self._ack_coalescer.start()
+
             flow_control = self._manager.flow_control
             worker = helper_threads.QueueCallbackWorker(
                 self._queue,
@@ -66,6 +71,8 @@ class Dispatcher(object):
                 self._queue.put(helper_threads.STOP)
                 self._thread.join()
 
+            # Stop the coalescer once the acks of the queue are dispatched.
+            self._ack_coalescer.stop()
             self._thread = None
 
     def dispatch_callback(self, items):
@@ -116,9 +123,7 @@ class Dispatcher(object):
             if time_to_ack is not None:
                 self._manager.ack_histogram.add(time_to_ack)
 
-        ack_ids = [item.ack_id for item in items]
-        request = types.StreamingPullRequest(ack_ids=ack_ids)
-        self._manager.send(request)
+        self._ack_coalescer.ack([item.ack_id for item in items])
 
         # Remove the message from lease management.
         self.drop(items)
@@ -144,17 +149,13 @@ class Dispatcher(object):
     def modify_ack_deadline(self, items):
         """Modify the ack deadline for the given messages.
 
+        Modacks for messages which are acked before they are sent are
+        superseded by the ack.
+
         Args:
             items(Sequence[ModAckRequest]): The items to modify.
         """
-        ack_ids = [item.ack_id for item in items]
-        seconds = [item.seconds for item in items]
-
-        request = types.StreamingPullRequest(
-            modify_deadline_ack_ids=ack_ids,
-            modify_deadline_seconds=seconds,
-        )
-        self._manager.send(request)
+        self._ack_coalescer.modify_ack_deadline(items)
 
     def nack(self, items):
         """Explicitly deny receipt of messages.
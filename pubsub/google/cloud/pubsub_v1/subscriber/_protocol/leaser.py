@@ -15,24 +15,29 @@
 from __future__ import absolute_import
 
 import collections
-import copy
+import heapq
 import logging
-import random
 import threading
 import time
 
-import six
-
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
 
 _LOGGER = logging.getLogger(__name__)
 _LEASE_WORKER_NAME = 'Thread-LeaseMaintainer'
+_BUCKET_SECONDS = 1
+"""int: The width, in seconds, of the buckets that leases are renewed in.
+Leases due for renewal within the same bucket are renewed together."""
+_RENEW_FRACTION = 0.9
+"""float: The fraction of its ack deadline after which a lease is renewed."""
+_MAX_SNOOZE = _RENEW_FRACTION * 10
+"""float: The longest the maintainer sleeps, in seconds. No lease added while
+it sleeps can be due sooner, as ack deadlines are at least 10 seconds."""
 
 
 _LeasedMessage = collections.namedtuple(
     '_LeasedMessage',
-    ['added_time', 'size'])
+    ['added_time', 'size', 'bucket'])
 
 
 class Leaser(object):
@@ -42,11 +47,22 @@ class Leaser(object):
         self._manager = manager
 
         self._leased_messages = {}
-        """dict[str, float]: A mapping of ack IDs to the local time when the
-            ack ID was initially leased in seconds since the epoch."""
+        """dict[str, _LeasedMessage]: A mapping of ack IDs to the local time
+            when the ack ID was initially leased in seconds since the epoch,
+            the message size and the renewal bucket of the lease."""
         self._bytes = 0
         """int: The total number of bytes consumed by leased messages."""
 
+        # Leases are renewed shortly before their ack deadline expires. They
+        # are grouped in buckets by the time of their next renewal, so that
+        # each renewal only touches the leases which are due.
+        self._buckets = {}
+        """dict[int, set[str]]: The ack IDs due for renewal, by the start of
+            the bucket in seconds since the epoch."""
+        self._bucket_heap = []
+        """list[int]: A heap of the keys of ``_buckets``."""
+        self._lock = threading.Lock()
+
         self._stop_event = threading.Event()
 
     @property
@@ -64,41 +80,106 @@ class Leaser(object):
         """int: The total size, in bytes, of all leased messages."""
         return self._bytes
 
+    def _schedule(self, ack_id, now, deadline):
+        """Put a lease in the bucket of its next renewal.
+
+        This must be called with the lock held.
+
+        Returns:
+            int: The bucket.
+        """
+        due = now + deadline * _RENEW_FRACTION
+        bucket = int(due // _BUCKET_SECONDS) * _BUCKET_SECONDS
+        ack_ids = self._buckets.get(bucket)
+        if ack_ids is None:
+            ack_ids = self._buckets[bucket] = set()
+            heapq.heappush(self._bucket_heap, bucket)
+        ack_ids.add(ack_id)
+        return bucket
+
     def add(self, items):
         """Add messages to be managed by the leaser."""
-        for item in items:
-            # Add the ack ID to the set of managed ack IDs, and increment
-            # the size counter.
-            if item.ack_id not in self._leased_messages:
-                self._leased_messages[item.ack_id] = _LeasedMessage(
-                    added_time=time.time(),
-                    size=item.byte_size)
-                self._bytes += item.byte_size
-            else:
-                _LOGGER.debug(
-                    'Message %s is already lease managed', item.ack_id)
+        # New messages had their ack deadline set to the current p99 when
+        # they were received.
+        deadline = self._manager.ack_histogram.percentile(99)
+        now = time.time()
+        with self._lock:
+            for item in items:
+                # Add the ack ID to the set of managed ack IDs, and increment
+                # the size counter.
+                if item.ack_id not in self._leased_messages:
+                    bucket = self._schedule(item.ack_id, now, deadline)
+                    self._leased_messages[item.ack_id] = _LeasedMessage(
+                        added_time=now,
+                        size=item.byte_size,
+                        bucket=bucket)
+                    self._bytes += item.byte_size
+                else:
+                    _LOGGER.debug(
+                        'Message %s is already lease managed', item.ack_id)
 
     def remove(self, items):
         """Remove messages from lease management."""
         # Remove the ack ID from lease management, and decrement the
         # byte counter.
-        for item in items:
-            if self._leased_messages.pop(item.ack_id, None) is not None:
-                self._bytes -= item.byte_size
-            else:
-                _LOGGER.debug('Item %s was not managed.', item.ack_id)
+        with self._lock:
+            for item in items:
+                leased = self._leased_messages.pop(item.ack_id, None)
+                if leased is not None:
+                    self._bytes -= item.byte_size
+                    ack_ids = self._buckets.get(leased.bucket)
+                    if ack_ids is not None:
+                        ack_ids.discard(item.ack_id)
+                else:
+                    _LOGGER.debug('Item %s was not managed.', item.ack_id)
+
+            if self._bytes < 0:
+                _LOGGER.debug(
+                    'Bytes was unexpectedly negative: %d', self._bytes)
+                self._bytes = 0
+
+    def _take_due(self, now, deadline):
+        """Take the leases due for renewal, and schedule the next renewal.
 
-        if self._bytes < 0:
-            _LOGGER.debug(
-                'Bytes was unexpectedly negative: %d', self._bytes)
-            self._bytes = 0
+        Leases held beyond the max lease duration are not renewed, and are
+        returned to be dropped instead.
+
+        Args:
+            now (float): The current time, in seconds since the epoch.
+            deadline (int): The ack deadline the leases are renewed for.
+
+        Returns:
+            Tuple[List[str], List[DropRequest], Optional[int]]: The ack IDs
+            to renew, the leases to drop, and the start of the next bucket
+            due for renewal, if any.
+        """
+        cutoff = now - self._manager.flow_control.max_lease_duration
+        to_renew = []
+        to_drop = []
+        with self._lock:
+            while self._bucket_heap and self._bucket_heap[0] <= now:
+                bucket = heapq.heappop(self._bucket_heap)
+                for ack_id in self._buckets.pop(bucket, ()):
+                    leased = self._leased_messages[ack_id]
+                    if leased.added_time < cutoff:
+                        # Once dropped, the lease is removed by remove().
+                        to_drop.append(
+                            requests.DropRequest(ack_id, leased.size))
+                        continue
+                    to_renew.append(ack_id)
+                    self._leased_messages[ack_id] = leased._replace(
+                        bucket=self._schedule(ack_id, now, deadline))
+
+            next_bucket = self._bucket_heap[0] if self._bucket_heap else None
+
+        return to_renew, to_drop, next_bucket
 
     def maintain_leases(self):
         """Maintain all of the leases being managed.
 
-        This method modifies the ack deadline for all of the managed
-        ack IDs, then waits for most of that time (but with jitter), and
-        repeats.
+        This method modifies the ack deadline of the managed ack IDs as
+        their deadlines approach, then waits until the next ones are due,
+        and repeats. Each cycle only touches the leases that are due.
         """
         while self._manager.is_active and not self._stop_event.is_set():
             # Determine the appropriate duration for the lease. This is
@@ -107,39 +188,20 @@ class Leaser(object):
             p99 = self._manager.ack_histogram.percentile(99)
             _LOGGER.debug('The current p99 value is %d seconds.', p99)
 
-            # Make a copy of the leased messages. This is needed because it's
-            # possible for another thread to modify the dictionary while
-            # we're iterating over it.
-            leased_messages = copy.copy(self._leased_messages)
+            now = time.time()
+            ack_ids, to_drop, next_bucket = self._take_due(now, p99)
 
             # Drop any leases that are well beyond max lease time. This
             # ensures that in the event of a badly behaving actor, we can
             # drop messages and allow Pub/Sub to resend them.
-            cutoff = (
-                time.time() -
-                self._manager.flow_control.max_lease_duration)
-            to_drop = [
-                requests.DropRequest(ack_id, item.size)
-                for ack_id, item
-                in six.iteritems(leased_messages)
-                if item.added_time < cutoff]
-
             if to_drop:
                 _LOGGER.warning(
                     'Dropping %s items because they were leased too long.',
                     len(to_drop))
                 self._manager.dispatcher.drop(to_drop)
 
-            # Remove dropped items from our copy of the leased messages (they
-            # have already been removed from the real one by
-            # self._manager.drop(), which calls self.remove()).
-            for item in to_drop:
-                leased_messages.pop(item.ack_id)
-
-            # Create a streaming pull request.
-            # We do not actually call `modify_ack_deadline` over and over
-            # because it is more efficient to make a single request.
-            ack_ids = leased_messages.keys()
+            # The dispatcher splits the renewals into requests within the
+            # service limits.
             if ack_ids:
                 _LOGGER.debug('Renewing lease for %d ack IDs.', len(ack_ids))
 
@@ -151,13 +213,10 @@ class Leaser(object):
                 self._manager.dispatcher.modify_ack_deadline([
                     requests.ModAckRequest(ack_id, p99) for ack_id in ack_ids])
 
-            # Now wait an appropriate period of time and do this again.
-            #
-            # We determine the appropriate period of time based on a random
-            # period between 0 seconds and 90% of the lease. This use of
-            # jitter (http://bit.ly/2s2ekL7) helps decrease contention in cases
-            # where there are many clients.
-            snooze = random.uniform(0.0, p99 * 0.9)
+            # Now wait until the next leases are due.
+            snooze = _MAX_SNOOZE
+            if next_bucket is not None:
+                snooze = min(max(next_bucket - now, 0.0), snooze)
             _LOGGER.debug('Snoozing lease management for %f seconds.', snooze)
             self._stop_event.wait(timeout=snooze)
 
@@ -413,8 +413,9 @@ class StreamingPullManager(object):
             'Scheduling callbacks for %s messages.',
             len(response.received_messages))
 
-        # Immediately modack the messages we received, as this tells the server
-        # that we've received them.
+        # Modack the messages we received, as this tells the server that
+        # we've received them. The dispatcher sends the modacks with the
+        # next batch of acks.
         items = [
             requests.ModAckRequest(
                 message.ack_id, self._ack_histogram.percentile(99))
@@ -37,12 +37,13 @@ from google.cloud.pubsub_v1.proto import pubsub_pb2
 # The defaults should be fine for most use cases.
 BatchSettings = collections.namedtuple(
     'BatchSettings',
-    ['max_bytes', 'max_latency', 'max_messages'],
+    ['max_bytes', 'max_latency', 'max_messages', 'max_concurrent_commits'],
 )
 BatchSettings.__new__.__defaults__ = (
     1000 * 1000 * 10,  # max_bytes: documented "10 MB", enforced 10000000
     0.05,              # max_latency: 0.05 seconds
     1000,              # max_messages: 1,000
+    10,                # max_concurrent_commits: 10, shared by all topics
 )
 
 # Define the type class and default values for flow control settings.
@@ -54,7 +55,7 @@ FlowControl = collections.namedtuple(
     'FlowControl',
     ['max_bytes', 'max_messages', 'resume_threshold', 'max_requests',
      'max_request_batch_size', 'max_request_batch_latency',
-     'max_lease_duration'],
+     'max_lease_duration', 'max_ack_batch_latency'],
 )
 FlowControl.__new__.__defaults__ = (
     100 * 1024 * 1024,    # max_bytes: 100mb
@@ -64,6 +65,40 @@ FlowControl.__new__.__defaults__ = (
     100,                  # max_request_batch_size: 100
     0.01,                 # max_request_batch_latency: 0.01s
     2 * 60 * 60,          # max_lease_duration: 2 hours.
+    0.1,                  # max_ack_batch_latency: 0.1s
+)
+
+
+class LimitExceededBehavior(object):
+    """An enum-like class of the behaviors of publisher flow control.
+
+    When publishing a message would exceed the limits, the publisher client
+    either ignores the limits (``IGNORE``), blocks until enough outstanding
+    messages are done (``BLOCK``), raises
+    :class:`~.pubsub_v1.publisher.exceptions.FlowControlLimitError`
+    (``ERROR``), or drops the oldest messages which are not yet being sent,
+    failing their futures with that error (``DROP_OLDEST``; this blocks if
+    no message can be dropped).
+    """
+    IGNORE = 'ignore'
+    BLOCK = 'block'
+    ERROR = 'error'
+    DROP_OLDEST = 'drop_oldest'
+
+
+# Define the type class and default values for publisher flow control.
+#
+# This class is used when creating a publisher client, and these settings
+# bound the messages that the client holds, for all topics together, from
+# the time they are published until their futures are done.
+PublishFlowControl = collections.namedtuple(
+    'PublishFlowControl',
+    ['message_limit', 'byte_limit', 'limit_exceeded_behavior'],
+)
+PublishFlowControl.__new__.__defaults__ = (
+    10 * BatchSettings.__new__.__defaults__[2],  # message_limit: 10,000
+    10 * BatchSettings.__new__.__defaults__[0],  # byte_limit: 100 MB
+    LimitExceededBehavior.IGNORE,                # limit_exceeded_behavior
 )
 
 
@@ -84,7 +119,10 @@ _local_modules = [
 ]
 
 
-names = ['BatchSettings', 'FlowControl']
+names = [
+    'BatchSettings', 'FlowControl', 'LimitExceededBehavior',
+    'PublishFlowControl',
+]
 
 
 for module in _shared_modules:
@@ -76,3 +76,14 @@ def test_will_not_accept_number():
     )
     message = types.PubsubMessage(data=b'abc')
     assert batch.will_accept(message) is False
+
+
+def test_drop_not_supported():
+    from google.cloud.pubsub_v1.publisher._batch import base
+
+    batch = create_batch(status=BatchStatus.ACCEPTING_MESSAGES)
+    future = batch.publish(types.PubsubMessage(data=b'foo'))
+
+    # Batch classes which do not override ``drop`` keep their messages.
+    assert base.Batch.drop(batch, future) is False
+    assert len(batch) == 1
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import threading
-import time
 
 import mock
 
@@ -51,26 +50,27 @@ def create_batch(autocommit=False, **batch_settings):
 
 
 def test_init():
-    """Establish that a monitor thread is usually created on init."""
+    """Establish that the batch usually schedules its own commit on init."""
     client = create_client()
 
-    # Do not actually create a thread, but do verify that one was created;
+    # Do not actually start a timer, but do verify that one was scheduled;
     # it should be running the batch's "monitor" method (which commits the
     # batch once time elapses).
-    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+    with mock.patch.object(client._commit_scheduler, 'call_later') as later:
         batch = Batch(client, 'topic_name', types.BatchSettings())
-        Thread.assert_called_once_with(
-            name='Thread-MonitorBatchPublisher',
-            target=batch.monitor,
-        )
+        later.assert_called_once_with(0.05, batch.monitor)
 
     # New batches start able to accept messages by default.
     assert batch.status == BatchStatus.ACCEPTING_MESSAGES
 
 
 def test_init_infinite_latency():
-    batch = create_batch(max_latency=float('inf'))
-    assert batch._thread is None
+    client = create_client()
+    with mock.patch.object(client._commit_scheduler, 'call_later') as later:
+        Batch(client, 'topic_name',
+              types.BatchSettings(max_latency=float('inf')))
+
+    later.assert_not_called()
 
 
 @mock.patch.object(threading, 'Lock')
@@ -89,15 +89,12 @@ def test_client():
 
 def test_commit():
     batch = create_batch()
-    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+    scheduler = batch.client._commit_scheduler
+    with mock.patch.object(scheduler, 'submit') as submit:
         batch.commit()
 
-        # A thread should have been created to do the actual commit.
-        Thread.assert_called_once_with(
-            name='Thread-CommitBatchPublisher',
-            target=batch._commit,
-        )
-        Thread.return_value.start.assert_called_once_with()
+        # The actual commit should have been handed to a commit thread.
+        submit.assert_called_once_with(batch._commit)
 
     # The batch's status needs to be something other than "accepting messages",
     # since the commit started.
@@ -108,11 +105,12 @@ def test_commit():
 def test_commit_no_op():
     batch = create_batch()
     batch._status = BatchStatus.IN_PROGRESS
-    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+    scheduler = batch.client._commit_scheduler
+    with mock.patch.object(scheduler, 'submit') as submit:
         batch.commit()
 
-    # Make sure a thread was not created.
-    Thread.assert_not_called()
+    # Make sure a commit was not scheduled.
+    submit.assert_not_called()
 
     # Check that batch status is unchanged.
     assert batch.status == BatchStatus.IN_PROGRESS
@@ -224,32 +222,45 @@ def test_block__commmit_api_error():
 
 def test_monitor():
     batch = create_batch(max_latency=5.0)
-    with mock.patch.object(time, 'sleep') as sleep:
-        with mock.patch.object(type(batch), '_commit') as _commit:
-            batch.monitor()
-
-    # The monitor should have waited the given latency.
-    sleep.assert_called_once_with(5.0)
+    with mock.patch.object(type(batch), 'commit') as commit:
+        batch.monitor()
 
-    # Since `monitor` runs in its own thread, it should call
-    # the blocking commit implementation.
-    _commit.assert_called_once_with()
+    # Since `monitor` runs on the shared timer thread, it should call
+    # the non-blocking commit implementation.
+    commit.assert_called_once_with()
 
 
 def test_monitor_already_committed():
     batch = create_batch(max_latency=5.0)
     status = 'something else'
     batch._status = status
-    with mock.patch.object(time, 'sleep') as sleep:
+    with mock.patch.object(batch.client._commit_scheduler, 'submit') as submit:
         batch.monitor()
 
-    # The monitor should have waited the given latency.
-    sleep.assert_called_once_with(5.0)
+    submit.assert_not_called()
 
     # The status should not have changed.
     assert batch._status == status
 
 
+def test_blocking__commit_does_not_hold_lock():
+    batch = create_batch()
+    future = batch.publish({'data': b'blah blah blah'})
+
+    def publish(topic, messages):
+        # New messages are rejected, rather than waiting for the request.
+        assert batch.publish({'data': b'too late'}) is None
+        return types.PublishResponse(message_ids=['a'])
+
+    patch = mock.patch.object(
+        type(batch.client.api), 'publish', side_effect=publish)
+    with patch:
+        batch._commit()
+
+    assert future.result() == 'a'
+    assert batch.status == BatchStatus.SUCCESS
+
+
 def test_publish():
     batch = create_batch()
     messages = (
@@ -322,3 +333,25 @@ def test_publish_dict():
         data=b'foobarbaz', attributes={'spam': 'eggs'})
     assert batch.messages == [expected_message]
     assert batch._futures == [future]
+
+
+def test_drop():
+    batch = create_batch()
+    future1 = batch.publish({'data': b'one'})
+    future2 = batch.publish({'data': b'two'})
+
+    assert batch.drop(future1) is True
+
+    assert batch.messages == [types.PubsubMessage(data=b'two')]
+    assert batch._futures == [future2]
+    assert batch.size == types.PubsubMessage(data=b'two').ByteSize()
+    assert batch.drop(future1) is False
+
+
+def test_drop_in_progress():
+    batch = create_batch()
+    future = batch.publish({'data': b'one'})
+    batch._status = BatchStatus.IN_PROGRESS
+
+    assert batch.drop(future) is False
+    assert batch._futures == [future]
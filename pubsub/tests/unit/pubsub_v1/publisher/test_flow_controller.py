@@ -0,0 +1,195 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher._batch import base
+
+
+def make_controller(behavior, message_limit=2, byte_limit=100):
+    settings = types.PublishFlowControl(
+        message_limit=message_limit,
+        byte_limit=byte_limit,
+        limit_exceeded_behavior=behavior,
+    )
+    return flow_controller.FlowController(settings)
+
+
+def add_tracked(controller, size, batch=None):
+    if batch is None:
+        batch = mock.create_autospec(base.Batch, instance=True)
+        batch.drop.return_value = False
+    controller.add(size)
+    future = futures.Future()
+    controller.track(future, size, batch)
+    return future
+
+
+def test_defaults():
+    settings = types.PublishFlowControl()
+
+    assert settings.message_limit == 10000
+    assert settings.byte_limit == 100 * 1000 * 1000
+    assert settings.limit_exceeded_behavior == (
+        types.LimitExceededBehavior.IGNORE)
+
+
+def test_add_and_release():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK)
+
+    controller.add(10)
+    controller.add(30)
+    assert controller.outstanding_messages == 2
+    assert controller.outstanding_bytes == 40
+    assert controller.load == 1.0
+
+    controller.release(30)
+    assert controller.outstanding_messages == 1
+    assert controller.outstanding_bytes == 10
+    assert controller.load == 0.5
+
+
+def test_load_bytes():
+    controller = make_controller(
+        types.LimitExceededBehavior.BLOCK, message_limit=10)
+
+    controller.add(75)
+    assert controller.load == 0.75
+
+
+def test_track_released_when_done():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK)
+    future = add_tracked(controller, 10)
+    assert controller.outstanding_messages == 1
+
+    future.set_result('1')
+
+    assert controller.outstanding_messages == 0
+    assert controller.outstanding_bytes == 0
+
+
+def test_track_already_done():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK)
+    controller.add(10)
+    future = futures.Future()
+    future.set_exception(ValueError('failed'))
+
+    controller.track(future, 10, mock.sentinel.batch)
+
+    assert controller.outstanding_messages == 0
+
+
+def test_large_message_allowed_when_idle():
+    controller = make_controller(types.LimitExceededBehavior.ERROR)
+
+    controller.add(1000)
+
+    assert controller.outstanding_bytes == 1000
+
+
+def test_error():
+    controller = make_controller(types.LimitExceededBehavior.ERROR)
+    controller.add(10)
+    controller.add(10)
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(10)
+
+    assert controller.outstanding_messages == 2
+
+
+def test_error_bytes():
+    controller = make_controller(types.LimitExceededBehavior.ERROR)
+    controller.add(60)
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(41)
+
+    controller.add(40)
+    assert controller.outstanding_bytes == 100
+
+
+def test_block():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK)
+    future = add_tracked(controller, 10)
+    add_tracked(controller, 10)
+    added = threading.Event()
+
+    def add():
+        controller.add(10)
+        added.set()
+
+    thread = threading.Thread(target=add)
+    thread.start()
+
+    # The third message waits for room.
+    assert not added.wait(0.1)
+
+    future.set_result('1')
+    assert added.wait(5)
+    thread.join()
+    assert controller.outstanding_messages == 2
+
+
+def test_drop_oldest():
+    controller = make_controller(types.LimitExceededBehavior.DROP_OLDEST)
+    in_flight = mock.create_autospec(base.Batch, instance=True)
+    in_flight.drop.return_value = False
+    accepting = mock.create_autospec(base.Batch, instance=True)
+    accepting.drop.return_value = True
+
+    first = add_tracked(controller, 10, batch=in_flight)
+    second = add_tracked(controller, 20, batch=accepting)
+
+    controller.add(30)
+
+    # The first message is already being sent, so the second is dropped.
+    in_flight.drop.assert_called_once_with(first)
+    accepting.drop.assert_called_once_with(second)
+    assert not first.done()
+    assert isinstance(second.exception(), exceptions.FlowControlLimitError)
+    assert controller.outstanding_messages == 2
+    assert controller.outstanding_bytes == 40
+
+    # Completing the first message releases only its own room.
+    first.set_result('1')
+    assert controller.outstanding_messages == 1
+    assert controller.outstanding_bytes == 30
+
+
+def test_drop_oldest_nothing_to_drop_blocks():
+    controller = make_controller(types.LimitExceededBehavior.DROP_OLDEST)
+    future = add_tracked(controller, 10)
+    add_tracked(controller, 10)
+    added = threading.Event()
+
+    def add():
+        controller.add(10)
+        added.set()
+
+    thread = threading.Thread(target=add)
+    thread.start()
+
+    assert not added.wait(0.1)
+
+    future.set_result('1')
+    assert added.wait(5)
+    thread.join()
@@ -0,0 +1,266 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+
+import mock
+import pytest
+
+import google.api_core.exceptions
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+
+
+class FakeScheduler(object):
+    """Hold timers and commits until a test runs them."""
+
+    def __init__(self):
+        self.timers = []
+        self.submitted = []
+
+    def call_later(self, delay, callback):
+        self.timers.append(callback)
+
+    def submit(self, callback, *args):
+        self.submitted.append((callback, args))
+
+    def fire_timers(self):
+        timers, self.timers = self.timers, []
+        for callback in timers:
+            callback()
+
+    def run_next(self):
+        callback, args = self.submitted.pop(0)
+        callback(*args)
+
+
+def create_client(**batch_settings):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        credentials=creds,
+        batch_settings=types.BatchSettings(**batch_settings),
+    )
+    client._commit_scheduler = FakeScheduler()
+    return client
+
+
+def publish_response(request_messages):
+    return types.PublishResponse(
+        message_ids=[message.data for message in request_messages])
+
+
+def test_publish_waits_for_latency():
+    client = create_client()
+
+    future = client.publish('topic', b'one', ordering_key='key')
+
+    lane = client._lanes[('topic', 'key')]
+    assert len(lane._batches) == 1
+    assert len(client._commit_scheduler.timers) == 1
+    assert client._commit_scheduler.submitted == []
+    assert not future.done()
+    assert client._batches == {}
+
+
+def test_send_and_close():
+    client = create_client()
+    futures = [
+        client.publish('topic', b'one', ordering_key='key'),
+        client.publish('topic', b'two', ordering_key='key'),
+    ]
+    lane = client._lanes[('topic', 'key')]
+
+    client._commit_scheduler.fire_timers()
+    patch = mock.patch.object(
+        type(client.api), 'publish',
+        side_effect=lambda topic, messages: publish_response(messages))
+    with patch as publish:
+        client._commit_scheduler.run_next()
+
+    publish.assert_called_once_with('topic', [
+        types.PubsubMessage(data=b'one'),
+        types.PubsubMessage(data=b'two'),
+    ])
+    assert [future.result() for future in futures] == ['one', 'two']
+
+    # The idle lane is closed and forgotten.
+    assert client._lanes == {}
+    assert lane.publish(types.PubsubMessage(data=b'late')) is None
+
+
+def test_batches_of_a_key_are_sent_in_turn():
+    client = create_client(max_messages=3)
+    scheduler = client._commit_scheduler
+    futures = [
+        client.publish('topic', data, ordering_key='key')
+        for data in (b'one', b'two', b'three')
+    ]
+
+    # The first batch filled up and is sent; the second waits for it, even
+    # once its latency has elapsed.
+    assert len(scheduler.submitted) == 1
+    scheduler.fire_timers()
+    assert len(scheduler.submitted) == 1
+
+    patch = mock.patch.object(
+        type(client.api), 'publish',
+        side_effect=lambda topic, messages: publish_response(messages))
+    with patch as publish:
+        scheduler.run_next()
+        assert publish.call_count == 1
+        assert len(scheduler.submitted) == 1
+        scheduler.run_next()
+
+    assert publish.mock_calls == [
+        mock.call('topic', [
+            types.PubsubMessage(data=b'one'),
+            types.PubsubMessage(data=b'two'),
+        ]),
+        mock.call('topic', [types.PubsubMessage(data=b'three')]),
+    ]
+    assert [future.result() for future in futures] == [
+        'one', 'two', 'three']
+
+
+def test_keys_are_sent_in_parallel():
+    client = create_client()
+    scheduler = client._commit_scheduler
+    client.publish('topic', b'one', ordering_key='a')
+    client.publish('topic', b'two', ordering_key='b')
+    client.publish('topic', b'three')
+
+    scheduler.fire_timers()
+
+    # Both lanes and the unordered batch are sent at once.
+    assert len(client._lanes) == 2
+    assert len(scheduler.submitted) == 3
+    assert client._batches['topic'].status == BatchStatus.STARTING
+
+
+def test_failure_pauses_key():
+    client = create_client(max_messages=2)
+    scheduler = client._commit_scheduler
+    failed = client.publish('topic', b'one', ordering_key='key')
+    pending = client.publish('topic', b'two', ordering_key='key')
+    other = client.publish('topic', b'three', ordering_key='other')
+
+    error = google.api_core.exceptions.InternalServerError('uh oh')
+    patch = mock.patch.object(
+        type(client.api), 'publish', side_effect=error)
+    with patch:
+        scheduler.run_next()
+
+    assert failed.exception() is error
+    assert isinstance(
+        pending.exception(), exceptions.PublishToPausedOrderingKeyError)
+    assert client._lanes[('topic', 'key')].paused
+    with pytest.raises(exceptions.PublishToPausedOrderingKeyError):
+        client.publish('topic', b'four', ordering_key='key')
+
+    # Other keys are not affected.
+    client.publish('topic', b'five', ordering_key='other')
+    assert not other.done()
+
+    client.resume_publish('topic', 'key')
+    assert ('topic', 'key') not in client._lanes
+    future = client.publish('topic', b'six', ordering_key='key')
+    assert not future.done()
+    assert not client._lanes[('topic', 'key')].paused
+
+
+def test_resume_unknown_key():
+    client = create_client()
+
+    client.resume_publish('topic', 'key')
+
+    assert client._lanes == {}
+
+
+def test_replace_closed_lane_once():
+    client = create_client()
+    closed = client._lane('topic', 'key')
+
+    replacement = client._lane('topic', 'key', closed=closed)
+    assert replacement is not closed
+    assert client._lane('topic', 'key', closed=closed) is replacement
+
+
+def test_messages_are_not_dropped():
+    client = create_client()
+    lane = client._lane('topic', 'key')
+    future = lane.publish(types.PubsubMessage(data=b'one'))
+
+    assert lane.drop(future) is False
+    assert len(lane._batches[0].messages) == 1
+
+
+def test_publish_replaces_lane_closed_meanwhile():
+    client = create_client()
+    closed = client._lane('topic', 'key')
+    # The lane closed as idle, but is not forgotten yet.
+    closed._closed = True
+
+    future = client.publish('topic', b'one', ordering_key='key')
+
+    lane = client._lanes[('topic', 'key')]
+    assert lane is not closed
+    assert lane._batches[0]._futures == [future]
+    assert closed._batches == collections.deque()
+
+
+def test_fail_finished_batch():
+    client = create_client()
+    lane = client._lane('topic', 'key')
+    future = lane.publish(types.PubsubMessage(data=b'one'))
+    batch = lane._batches[0]
+    batch._status = BatchStatus.SUCCESS
+
+    batch.fail(ValueError('late'))
+
+    assert batch.status == BatchStatus.SUCCESS
+    assert not future.done()
+
+
+def test_publish_wo_max_latency():
+    client = create_client(max_latency=float('inf'))
+
+    client.publish('topic', b'one', ordering_key='key')
+
+    assert len(client._lanes[('topic', 'key')]._batches) == 1
+    assert client._commit_scheduler.timers == []
+
+
+def test_resume_keeps_lane_w_pending_batches():
+    client = create_client()
+    lane = client._lane('topic', 'key')
+    lane.publish(types.PubsubMessage(data=b'one'))
+    lane._paused = True
+
+    client.resume_publish('topic', 'key')
+
+    assert not lane.paused
+    assert client._lanes[('topic', 'key')] is lane
+
+
+def test_remove_replaced_lane():
+    client = create_client()
+    closed = client._lane('topic', 'key')
+    replacement = client._lane('topic', 'key', closed=closed)
+
+    client._remove_lane('topic', 'key', closed)
+
+    assert client._lanes[('topic', 'key')] is replacement
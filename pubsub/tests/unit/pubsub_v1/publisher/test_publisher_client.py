@@ -22,6 +22,7 @@ import pytest
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
 
 
 def test_init():
@@ -34,6 +35,9 @@ def test_init():
     assert client.batch_settings.max_bytes == 10 * 1000 * 1000
     assert client.batch_settings.max_latency == 0.05
     assert client.batch_settings.max_messages == 1000
+    assert client.batch_settings.max_concurrent_commits == 10
+    assert client._commit_scheduler._executor._max_workers == 10
+    assert client.flow_controller.settings == types.PublishFlowControl()
 
 
 def test_init_emulator(monkeypatch):
@@ -50,6 +54,20 @@ def test_init_emulator(monkeypatch):
     assert channel.target().decode('utf8') == '/foo/bar/'
 
 
+def test_batches_share_commit_scheduler():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    with mock.patch.object(client._commit_scheduler, 'call_later') as later:
+        batch1 = client._batch('topic/one')
+        batch2 = client._batch('topic/two')
+
+    later.assert_has_calls([
+        mock.call(client.batch_settings.max_latency, batch1.monitor),
+        mock.call(client.batch_settings.max_latency, batch2.monitor),
+    ])
+
+
 def test_batch_create():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
@@ -195,6 +213,91 @@ def test_publish_new_batch_needed():
     batch2.publish.assert_called_once_with(message_pb)
 
 
+def create_flow_controlled_client(behavior, message_limit=2):
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=message_limit,
+        limit_exceeded_behavior=behavior,
+    )
+    return publisher.Client(credentials=creds, flow_control=flow_control)
+
+
+def test_publish_flow_control_ignored_by_default():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    topic = 'topic/path'
+    client._batch(topic, autocommit=False)
+
+    client.publish(topic, b'foo')
+
+    assert client.flow_controller.outstanding_messages == 0
+
+
+def test_publish_flow_control_tracks_outstanding():
+    client = create_flow_controlled_client(
+        types.LimitExceededBehavior.ERROR)
+    topic = 'topic/path'
+    batch = client._batch(topic, autocommit=False)
+
+    future = client.publish(topic, b'foo')
+    assert client.flow_controller.outstanding_messages == 1
+    assert client.flow_controller.outstanding_bytes == batch.size
+
+    future.set_result('1')
+    assert client.flow_controller.outstanding_messages == 0
+    assert client.flow_controller.outstanding_bytes == 0
+
+
+def test_publish_flow_control_error():
+    client = create_flow_controlled_client(
+        types.LimitExceededBehavior.ERROR)
+    topic = 'topic/path'
+    batch = client._batch(topic, autocommit=False)
+    client.publish(topic, b'one')
+    client.publish(topic, b'two')
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish('other/topic', b'three')
+
+    assert len(batch.messages) == 2
+    assert client.flow_controller.outstanding_messages == 2
+
+
+def test_publish_flow_control_drop_oldest():
+    client = create_flow_controlled_client(
+        types.LimitExceededBehavior.DROP_OLDEST)
+    topic = 'topic/path'
+    batch = client._batch(topic, autocommit=False)
+    future1 = client.publish(topic, b'one')
+    future2 = client.publish(topic, b'two')
+
+    future3 = client.publish(topic, b'three')
+
+    assert isinstance(future1.exception(), exceptions.FlowControlLimitError)
+    assert not future2.done()
+    assert batch.messages == [
+        types.PubsubMessage(data=b'two'),
+        types.PubsubMessage(data=b'three'),
+    ]
+    assert batch._futures == [future2, future3]
+    assert client.flow_controller.outstanding_messages == 2
+
+
+def test_publish_flow_control_released_on_error():
+    client = create_flow_controlled_client(
+        types.LimitExceededBehavior.BLOCK)
+    topic = 'topic/path'
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = ValueError('boom')
+    client._batches[topic] = batch
+
+    with pytest.raises(ValueError):
+        client.publish(topic, b'foo')
+
+    assert client.flow_controller.outstanding_messages == 0
+    assert client.flow_controller.outstanding_bytes == 0
+
+
 def test_publish_attrs_type_error():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
@@ -0,0 +1,110 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+
+import mock
+
+from google.cloud.pubsub_v1.publisher import _scheduler
+
+
+def test_constructor_defaults():
+    scheduler = _scheduler.CommitScheduler()
+
+    assert isinstance(
+        scheduler._executor, concurrent.futures.ThreadPoolExecutor)
+    assert scheduler._thread is None
+
+
+def test_submit():
+    executor = mock.create_autospec(concurrent.futures.Executor)
+    scheduler = _scheduler.CommitScheduler(executor=executor)
+
+    future = scheduler.submit(mock.sentinel.callback, 1, two=2)
+
+    assert future is executor.submit.return_value
+    executor.submit.assert_called_once_with(mock.sentinel.callback, 1, two=2)
+
+
+def test_call_later_order():
+    scheduler = _scheduler.CommitScheduler(
+        executor=mock.sentinel.executor)
+    called = []
+    done = threading.Event()
+
+    def make_callback(name):
+        def callback():
+            called.append(name)
+            if len(called) == 3:
+                done.set()
+        return callback
+
+    scheduler.call_later(0.2, make_callback('last'))
+    scheduler.call_later(0.0, make_callback('first'))
+    scheduler.call_later(0.0, make_callback('second'))
+
+    assert done.wait(5)
+    assert called == ['first', 'second', 'last']
+
+
+def test_call_later_one_timer_thread():
+    scheduler = _scheduler.CommitScheduler(
+        executor=mock.sentinel.executor)
+    thread_names = []
+    done = threading.Event()
+
+    def callback():
+        thread_names.append(threading.current_thread().name)
+        if len(thread_names) == 20:
+            done.set()
+
+    for _ in range(20):
+        scheduler.call_later(0.01, callback)
+
+    assert done.wait(5)
+    assert set(thread_names) == {_scheduler._TIMER_NAME}
+
+
+def test_timer_thread_exits_when_idle():
+    scheduler = _scheduler.CommitScheduler(
+        executor=mock.sentinel.executor)
+    done = threading.Event()
+
+    scheduler.call_later(0.0, done.set)
+    thread = scheduler._thread
+
+    assert done.wait(5)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert scheduler._thread is None
+
+    # A later timer starts a new thread.
+    again = threading.Event()
+    scheduler.call_later(0.0, again.set)
+    assert again.wait(5)
+
+
+@mock.patch.object(_scheduler, '_LOGGER')
+def test_timer_callback_error(_LOGGER):
+    scheduler = _scheduler.CommitScheduler(
+        executor=mock.sentinel.executor)
+    done = threading.Event()
+
+    scheduler.call_later(0.0, mock.Mock(side_effect=ValueError('oops')))
+    scheduler.call_later(0.0, done.set)
+
+    # A failing callback does not stop the later ones.
+    assert done.wait(5)
+    _LOGGER.exception.assert_called_once_with('Batch timer callback failed.')
@@ -0,0 +1,287 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import ack_coalescer
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+
+def create_manager(max_ack_batch_latency=0.1):
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    manager.is_active = True
+    manager.flow_control = types.FlowControl(
+        max_ack_batch_latency=max_ack_batch_latency)
+    return manager
+
+
+def modack(ack_id, seconds=60):
+    return requests.ModAckRequest(ack_id=ack_id, seconds=seconds)
+
+
+def test_flow_control_default():
+    assert types.FlowControl().max_ack_batch_latency == 0.1
+
+
+def test_make_requests():
+    result = ack_coalescer._make_requests(['a', 'b'], [('c', 10)])
+
+    assert result == [types.StreamingPullRequest(
+        ack_ids=['a', 'b'],
+        modify_deadline_ack_ids=['c'],
+        modify_deadline_seconds=[10],
+    )]
+
+
+@mock.patch.object(ack_coalescer, '_ACK_IDS_BATCH_SIZE', 2)
+def test_make_requests_splits_by_count():
+    result = ack_coalescer._make_requests(
+        ['a', 'b', 'c'], [('d', 10), ('e', 20)])
+
+    assert result == [
+        types.StreamingPullRequest(ack_ids=['a', 'b']),
+        types.StreamingPullRequest(
+            ack_ids=['c'],
+            modify_deadline_ack_ids=['d'],
+            modify_deadline_seconds=[10],
+        ),
+        types.StreamingPullRequest(
+            modify_deadline_ack_ids=['e'],
+            modify_deadline_seconds=[20],
+        ),
+    ]
+
+
+@mock.patch.object(ack_coalescer, '_MAX_REQUEST_BYTES', 20)
+def test_make_requests_splits_by_size():
+    ack_ids = ['x' * 8, 'y' * 8, 'z' * 30]
+
+    result = ack_coalescer._make_requests(ack_ids, [])
+
+    # An ack ID over the limit is still sent, on its own.
+    assert result == [
+        types.StreamingPullRequest(ack_ids=[ack_ids[0]]),
+        types.StreamingPullRequest(ack_ids=[ack_ids[1]]),
+        types.StreamingPullRequest(ack_ids=[ack_ids[2]]),
+    ]
+
+
+def test_make_requests_empty():
+    assert ack_coalescer._make_requests([], []) == []
+
+
+def test_ack_supersedes_modack():
+    manager = create_manager()
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.modify_ack_deadline([modack('a'), modack('b')])
+    coalescer.ack(['a'])
+    assert coalescer.pending == 2
+    coalescer.flush()
+
+    manager.send.assert_called_once_with(types.StreamingPullRequest(
+        ack_ids=['a'],
+        modify_deadline_ack_ids=['b'],
+        modify_deadline_seconds=[60],
+    ))
+    assert coalescer.pending == 0
+
+
+def test_modack_after_ack_is_skipped():
+    manager = create_manager()
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.ack(['a'])
+    coalescer.modify_ack_deadline([modack('a', seconds=0)])
+    coalescer.flush()
+
+    manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=['a']))
+
+
+def test_latest_modack_wins():
+    manager = create_manager()
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.modify_ack_deadline([modack('a', seconds=10)])
+    coalescer.modify_ack_deadline([modack('a', seconds=0)])
+    coalescer.flush()
+
+    manager.send.assert_called_once_with(types.StreamingPullRequest(
+        modify_deadline_ack_ids=['a'],
+        modify_deadline_seconds=[0],
+    ))
+
+
+def test_flush_nothing_pending():
+    manager = create_manager()
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.flush()
+
+    manager.send.assert_not_called()
+
+
+def test_ack_nothing():
+    coalescer = ack_coalescer.AckCoalescer(create_manager())
+
+    coalescer.ack([])
+
+    assert coalescer.pending == 0
+    assert coalescer._first_pending is None
+
+
+def test_flush_inactive_manager():
+    manager = create_manager()
+    manager.is_active = False
+    coalescer = ack_coalescer.AckCoalescer(manager)
+    coalescer.ack(['a'])
+
+    coalescer.flush()
+
+    manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=['a']))
+    assert coalescer.pending == 0
+
+
+def test_start_and_stop():
+    manager = create_manager(max_ack_batch_latency=0.05)
+    sent = threading.Event()
+    manager.send.side_effect = lambda request: sent.set()
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.start()
+    try:
+        coalescer.ack(['a'])
+        coalescer.modify_ack_deadline([modack('b')])
+        assert sent.wait(5)
+    finally:
+        coalescer.stop()
+
+    # Both were sent together, once the latency elapsed.
+    manager.send.assert_called_once_with(types.StreamingPullRequest(
+        ack_ids=['a'],
+        modify_deadline_ack_ids=['b'],
+        modify_deadline_seconds=[60],
+    ))
+    assert coalescer._thread is None
+
+
+def test_stop_flushes_pending():
+    manager = create_manager(max_ack_batch_latency=60)
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.start()
+    coalescer.ack(['a'])
+    coalescer.stop()
+
+    manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=['a']))
+
+
+def test_stop_flushes_pending_once_inactive():
+    # The manager drops its consumer before stopping the dispatcher.
+    manager = create_manager(max_ack_batch_latency=60)
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.start()
+    coalescer.ack(['a'])
+    coalescer.modify_ack_deadline([modack('b')])
+    manager.is_active = False
+    coalescer.stop()
+
+    manager.send.assert_called_once_with(types.StreamingPullRequest(
+        ack_ids=['a'],
+        modify_deadline_ack_ids=['b'],
+        modify_deadline_seconds=[60],
+    ))
+
+
+@mock.patch.object(ack_coalescer, '_ACK_IDS_BATCH_SIZE', 2)
+def test_full_batch_sent_early():
+    manager = create_manager(max_ack_batch_latency=60)
+    sent = threading.Event()
+    manager.send.side_effect = lambda request: sent.set()
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.start()
+    try:
+        coalescer.ack(['a', 'b'])
+        assert sent.wait(5)
+    finally:
+        coalescer.stop()
+
+    manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=['a', 'b']))
+
+
+@mock.patch.object(ack_coalescer, '_ACK_IDS_BATCH_SIZE', 2)
+def test_batch_filled_across_calls_sent_early():
+    manager = create_manager(max_ack_batch_latency=60)
+    sent = threading.Event()
+    manager.send.side_effect = lambda request: sent.set()
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.start()
+    try:
+        coalescer.ack(['a'])
+        coalescer.modify_ack_deadline([modack('b')])
+        assert sent.wait(5)
+    finally:
+        coalescer.stop()
+
+    manager.send.assert_called_once_with(types.StreamingPullRequest(
+        ack_ids=['a'],
+        modify_deadline_ack_ids=['b'],
+        modify_deadline_seconds=[60],
+    ))
+
+
+@mock.patch('threading.Thread', autospec=True)
+def test_start_already_started(thread):
+    coalescer = ack_coalescer.AckCoalescer(create_manager())
+    coalescer._thread = mock.sentinel.thread
+
+    with pytest.raises(ValueError):
+        coalescer.start()
+
+    thread.assert_not_called()
+
+
+def test_send_error_is_logged():
+    manager = create_manager(max_ack_batch_latency=0)
+    sent = threading.Event()
+
+    def send(request):
+        sent.set()
+        raise ValueError('failed')
+
+    manager.send.side_effect = send
+    coalescer = ack_coalescer.AckCoalescer(manager)
+
+    coalescer.start()
+    try:
+        coalescer.ack(['a'])
+        assert sent.wait(5)
+    finally:
+        coalescer.stop()
+
+    # The thread survives the error and exits cleanly.
+    assert coalescer._thread is None
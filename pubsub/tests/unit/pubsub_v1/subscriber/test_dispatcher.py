@@ -64,6 +64,7 @@ def test_ack():
     items = [requests.AckRequest(
         ack_id='ack_id_string', byte_size=0, time_to_ack=20)]
     dispatcher_.ack(items)
+    dispatcher_._ack_coalescer.flush()
 
     manager.send.assert_called_once_with(types.StreamingPullRequest(
         ack_ids=['ack_id_string'],
@@ -82,6 +83,7 @@ def test_ack_no_time():
     items = [requests.AckRequest(
         ack_id='ack_id_string', byte_size=0, time_to_ack=None)]
     dispatcher_.ack(items)
+    dispatcher_._ack_coalescer.flush()
 
     manager.send.assert_called_once_with(types.StreamingPullRequest(
         ack_ids=['ack_id_string'],
@@ -121,6 +123,7 @@ def test_nack():
 
     items = [requests.NackRequest(ack_id='ack_id_string', byte_size=10)]
     dispatcher_.nack(items)
+    dispatcher_._ack_coalescer.flush()
 
     manager.send.assert_called_once_with(types.StreamingPullRequest(
         modify_deadline_ack_ids=['ack_id_string'],
@@ -135,6 +138,7 @@ def test_modify_ack_deadline():
 
     items = [requests.ModAckRequest(ack_id='ack_id_string', seconds=60)]
     dispatcher_.modify_ack_deadline(items)
+    dispatcher_._ack_coalescer.flush()
 
     manager.send.assert_called_once_with(types.StreamingPullRequest(
         modify_deadline_ack_ids=['ack_id_string'],
@@ -142,18 +146,40 @@ def test_modify_ack_deadline():
     ))
 
 
+def test_modify_ack_deadline_superseded_by_ack():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    dispatcher_.modify_ack_deadline([
+        requests.ModAckRequest(ack_id='acked', seconds=60),
+        requests.ModAckRequest(ack_id='leased', seconds=60),
+    ])
+    dispatcher_.ack([
+        requests.AckRequest(ack_id='acked', byte_size=0, time_to_ack=None)])
+    dispatcher_._ack_coalescer.flush()
+
+    manager.send.assert_called_once_with(types.StreamingPullRequest(
+        ack_ids=['acked'],
+        modify_deadline_ack_ids=['leased'],
+        modify_deadline_seconds=[60],
+    ))
+
+
 @mock.patch('threading.Thread', autospec=True)
 def test_start(thread):
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True)
     dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
 
-    dispatcher_.start()
+    with mock.patch.object(dispatcher_._ack_coalescer, 'start') as start:
+        dispatcher_.start()
 
     thread.assert_called_once_with(
         name=dispatcher._CALLBACK_WORKER_NAME, target=mock.ANY)
 
     thread.return_value.start.assert_called_once()
+    start.assert_called_once_with()
 
     assert dispatcher_._thread is not None
 
@@ -177,10 +203,12 @@ def test_stop():
     thread = mock.create_autospec(threading.Thread, instance=True)
     dispatcher_._thread = thread
 
-    dispatcher_.stop()
+    with mock.patch.object(dispatcher_._ack_coalescer, 'stop') as stop:
+        dispatcher_.stop()
 
     assert queue_.get() is helper_threads.STOP
     thread.join.assert_called_once()
+    stop.assert_called_once_with()
     assert dispatcher_._thread is None
 
 
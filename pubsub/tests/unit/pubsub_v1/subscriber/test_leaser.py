@@ -26,8 +26,19 @@ import mock
 import pytest
 
 
+def create_manager(flow_control=types.FlowControl()):
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    manager.dispatcher = mock.create_autospec(
+        dispatcher.Dispatcher, instance=True)
+    manager.is_active = True
+    manager.flow_control = flow_control
+    manager.ack_histogram = histogram.Histogram()
+    return manager
+
+
 def test_add_and_remove():
-    leaser_ = leaser.Leaser(mock.sentinel.manager)
+    leaser_ = leaser.Leaser(create_manager())
 
     leaser_.add([
         requests.LeaseRequest(ack_id='ack1', byte_size=50)])
@@ -49,7 +60,7 @@ def test_add_and_remove():
 def test_add_already_managed(caplog):
     caplog.set_level(logging.DEBUG)
 
-    leaser_ = leaser.Leaser(mock.sentinel.manager)
+    leaser_ = leaser.Leaser(create_manager())
 
     leaser_.add([
         requests.LeaseRequest(ack_id='ack1', byte_size=50)])
@@ -73,7 +84,7 @@ def test_remove_not_managed(caplog):
 def test_remove_negative_bytes(caplog):
     caplog.set_level(logging.DEBUG)
 
-    leaser_ = leaser.Leaser(mock.sentinel.manager)
+    leaser_ = leaser.Leaser(create_manager())
 
     leaser_.add([
         requests.LeaseRequest(ack_id='ack1', byte_size=50)])
@@ -84,15 +95,18 @@ def test_remove_negative_bytes(caplog):
     assert 'unexpectedly negative' in caplog.text
 
 
-def create_manager(flow_control=types.FlowControl()):
-    manager = mock.create_autospec(
-        streaming_pull_manager.StreamingPullManager, instance=True)
-    manager.dispatcher = mock.create_autospec(
-        dispatcher.Dispatcher, instance=True)
-    manager.is_active = True
-    manager.flow_control = flow_control
-    manager.ack_histogram = histogram.Histogram()
-    return manager
+def test_remove_after_bucket_taken():
+    leaser_ = leaser.Leaser(create_manager())
+    leaser_.add([
+        requests.LeaseRequest(ack_id='ack1', byte_size=50)])
+    # A renewal took the bucket, and dropped the lease as too old.
+    leaser_._buckets.clear()
+
+    leaser_.remove([
+        requests.DropRequest(ack_id='ack1', byte_size=50)])
+
+    assert leaser_.message_count == 0
+    assert leaser_.bytes == 0
 
 
 def test_maintain_leases_inactive(caplog):
@@ -129,12 +143,16 @@ def make_sleep_mark_manager_as_inactive(leaser):
     leaser._stop_event.wait = trigger_inactive
 
 
-def test_maintain_leases_ack_ids():
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_ack_ids(time):
     manager = create_manager()
     leaser_ = leaser.Leaser(manager)
     make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 100
     leaser_.add([requests.LeaseRequest(ack_id='my ack id', byte_size=50)])
 
+    # The lease is renewed at 90% of its 10 second deadline.
+    time.return_value = 109
     leaser_.maintain_leases()
 
     manager.dispatcher.modify_ack_deadline.assert_called_once_with([
@@ -145,6 +163,58 @@ def test_maintain_leases_ack_ids():
     ])
 
 
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_not_due(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    waits = []
+    time.return_value = 100
+    leaser_.add([requests.LeaseRequest(ack_id='my ack id', byte_size=50)])
+
+    def trigger_inactive(timeout):
+        waits.append(timeout)
+        manager.is_active = False
+
+    leaser_._stop_event.wait = trigger_inactive
+    time.return_value = 108.5
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_not_called()
+    # The maintainer sleeps until the lease is due.
+    assert waits == [0.5]
+
+
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_only_due(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 100
+    leaser_.add([requests.LeaseRequest(ack_id='early', byte_size=50)])
+    time.return_value = 105
+    leaser_.add([requests.LeaseRequest(ack_id='late', byte_size=50)])
+    leaser_.add([requests.LeaseRequest(ack_id='acked', byte_size=50)])
+    leaser_.remove([requests.DropRequest(ack_id='acked', byte_size=50)])
+
+    time.return_value = 112
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with([
+        requests.ModAckRequest(ack_id='early', seconds=10)])
+
+    # The renewed lease is due again 9 seconds later, with the other one.
+    manager.is_active = True
+    manager.dispatcher.modify_ack_deadline.reset_mock()
+    time.return_value = 121
+    leaser_.maintain_leases()
+
+    (renewed,), _ = manager.dispatcher.modify_ack_deadline.call_args
+    assert sorted(renewed) == [
+        requests.ModAckRequest(ack_id='early', seconds=10),
+        requests.ModAckRequest(ack_id='late', seconds=10),
+    ]
+
+
 def test_maintain_leases_no_ack_ids():
     manager = create_manager()
     leaser_ = leaser.Leaser(manager)
@@ -167,7 +237,7 @@ def test_maintain_leases_outdated_items(time):
         requests.LeaseRequest(ack_id='ack1', byte_size=50)])
 
     # Add another item at towards end of the timeline
-    time.return_value = manager.flow_control.max_lease_duration - 1
+    time.return_value = manager.flow_control.max_lease_duration - 9
     leaser_.add([
         requests.LeaseRequest(ack_id='ack2', byte_size=50)])
 
@@ -0,0 +1,90 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the peak memory used by multipart uploads of in-memory data.
+
+Measures ``Blob.upload_from_string`` against the previous approach of
+copying the data into a ``BytesIO`` and building the whole request body,
+with requests answered by a fake transport, so no project or credentials
+are needed.  Requires Python 3 (for ``tracemalloc``).
+"""
+
+import io
+import json
+import sys
+import tracemalloc
+
+import requests
+from google.auth.credentials import AnonymousCredentials
+from google.resumable_media.requests import MultipartUpload
+
+from google.cloud import storage
+
+SIZE_MB = 8
+
+
+class FakeTransport(object):
+    """Consume request bodies the way ``http.client`` sends them."""
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        if isinstance(data, bytes):
+            sent = len(data)
+        else:
+            sent = sum(len(chunk) for chunk in data)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {'name': 'blob', 'size': str(sent)}).encode('utf-8')
+        return response
+
+
+def copying_upload(transport, data):
+    """Upload the way ``upload_from_string`` used to."""
+    stream = io.BytesIO(bytes(data))
+    upload = MultipartUpload(
+        'https://www.googleapis.com/upload/storage/v1/b/bucket/o'
+        '?uploadType=multipart')
+    upload.transmit(
+        transport, stream.read(), {'name': 'blob'}, 'text/plain')
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(size_mb=SIZE_MB):
+    transport = FakeTransport()
+    client = storage.Client(
+        project='project', credentials=AnonymousCredentials(),
+        _http=transport)
+    blob = client.bucket('bucket').blob('blob')
+    data = bytearray(size_mb * 1024 * 1024)
+    megabyte = 1024.0 * 1024.0
+
+    results = [
+        ('copying upload', measure(copying_upload, transport, data)),
+        ('upload_from_string', measure(blob.upload_from_string, data)),
+        ('  with md5 check', measure(
+            lambda: blob.upload_from_string(data, checksum='md5'))),
+    ]
+    for label, peak in results:
+        print('{:<20} peak {:6.1f} MB'.format(label, peak / megabyte))
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
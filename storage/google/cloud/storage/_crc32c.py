@@ -0,0 +1,206 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""CRC32C (Castagnoli) checksums, as reported by Cloud Storage.
+
+If the ``crcmod`` package is installed (with its C extension), it is used
+to compute checksums; otherwise a much slower pure-Python implementation is
+used. Install it with the ``crcmod`` extra of ``google-cloud-storage``.
+"""
+
+import base64
+import struct
+
+try:
+    import crcmod.predefined
+    from crcmod.crcmod import _usingExtension as _CRCMOD_EXTENSION
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+    _CRCMOD_EXTENSION = False
+
+
+_POLYNOMIAL = 0x82F63B78  # Reversed Castagnoli polynomial.
+_MASK = 0xFFFFFFFF
+
+
+def _make_table():
+    """Build the lookup table for byte-at-a-time computation."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ _POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+_TABLE = _make_table()
+
+
+def _py_extend(crc, data):
+    """Pure-Python implementation of :func:`extend`."""
+    table = _TABLE
+    crc ^= _MASK
+    for byte in bytearray(data):
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ _MASK
+
+
+if crcmod is not None:  # pragma: NO COVER
+    _crcmod_fun = crcmod.predefined.mkPredefinedCrcFun('crc-32c')
+
+    def _extend(crc, data):
+        return _crcmod_fun(data, crc)
+else:  # pragma: NO COVER
+    _extend = _py_extend
+
+
+def is_fast():
+    """Check whether checksums are computed by compiled code.
+
+    :rtype: bool
+    :returns: True if ``crcmod`` is installed with its C extension. The
+              pure-Python implementations compute only a few megabytes per
+              second, holding the GIL.
+    """
+    return _CRCMOD_EXTENSION
+
+
+def extend(crc, data):
+    """Update a checksum with more data.
+
+    :type crc: int
+    :param crc: The CRC32C of the data so far (``0`` for no data).
+
+    :type data: bytes
+    :param data: The bytes which follow the data so far.
+
+    :rtype: int
+    :returns: The CRC32C of the data so far followed by ``data``.
+    """
+    return _extend(crc, data)
+
+
+def _gf2_matrix_times(matrix, vector):
+    total = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return total
+
+
+def _gf2_matrix_square(matrix):
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def combine(crc1, crc2, length2):
+    """Combine the checksums of two consecutive pieces of data.
+
+    This is the same technique as zlib's ``crc32_combine``, so slices of an
+    object can be checksummed independently and then joined in order.
+
+    :type crc1: int
+    :param crc1: The CRC32C of the first piece.
+
+    :type crc2: int
+    :param crc2: The CRC32C of the second piece.
+
+    :type length2: int
+    :param length2: The length, in bytes, of the second piece.
+
+    :rtype: int
+    :returns: The CRC32C of the first piece followed by the second.
+    """
+    if length2 <= 0:
+        return crc1
+
+    # Operator for one zero bit, then for two and four zero bits.
+    odd = [_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply ``length2`` zero bytes to ``crc1``, squaring the operator for
+    # each bit of the length.
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+    return crc1 ^ crc2
+
+
+def to_base64(crc):
+    """Encode a checksum the way the ``crc32c`` object property does.
+
+    :type crc: int
+    :param crc: A CRC32C value.
+
+    :rtype: str
+    :returns: The base64-encoded, big-endian bytes of ``crc``.
+    """
+    return base64.b64encode(struct.pack('>I', crc)).decode('ascii')
+
+
+def from_base64(value):
+    """Decode a checksum from the form of the ``crc32c`` object property.
+
+    :type value: str
+    :param value: The base64-encoded, big-endian bytes of a CRC32C.
+
+    :rtype: int
+    :returns: The CRC32C value.
+    """
+    return struct.unpack('>I', base64.b64decode(value))[0]
+
+
+class Hash(object):
+    """Compute a CRC32C incrementally, like the hash objects of ``hashlib``.
+    """
+
+    name = 'crc32c'
+
+    def __init__(self):
+        self.crc = 0
+
+    def update(self, data):
+        """Add more data to the checksum.
+
+        :type data: bytes
+        :param data: The bytes which follow the data so far.
+        """
+        self.crc = extend(self.crc, data)
+
+    def digest(self):
+        """Get the checksum of the data so far.
+
+        :rtype: bytes
+        :returns: The big-endian bytes of the CRC32C.
+        """
+        return struct.pack('>I', self.crc)
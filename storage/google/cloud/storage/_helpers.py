@@ -185,6 +185,18 @@ class _PropertyMixin(object):
         self._set_properties(api_response)
 
 
+def _get_metadata_cache(client):
+    """Get the metadata cache used by a client.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client.
+
+    :rtype: :class:`~google.cloud.storage.metadata_cache.MetadataCache`
+    :returns: The client's cache, or ``None`` if it has none.
+    """
+    return getattr(client, 'metadata_cache', None)
+
+
 def _scalar_property(fieldname):
     """Create a property descriptor around the :class:`_PropertyMixin` helpers.
     """
@@ -609,3 +609,26 @@ class ObjectACL(ACL):
     def user_project(self):
         """Compute the user project charged for API requests for this ACL."""
         return self.blob.user_project
+
+    def _save(self, acl, predefined, client):
+        """Helper for :meth:`save` and :meth:`save_predefined`.
+
+        Also removes the blob from the client's metadata cache.
+
+        :type acl: :class:`google.cloud.storage.acl.ACL`, or a compatible list.
+        :param acl: The ACL object to save.  If left blank, this will save
+                    current entries.
+
+        :type predefined: str
+        :param predefined:
+            (Optional) An identifier for a predefined ACL.  Must be one of the
+            keys in :attr:`PREDEFINED_JSON_ACLS` If passed, `acl` must be None.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the ACL's parent.
+        """
+        client = self._require_client(client)
+        super(ObjectACL, self)._save(acl, predefined, client)
+        self.blob._uncache_properties(client)
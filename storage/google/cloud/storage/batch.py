@@ -15,13 +15,14 @@
 
 See https://cloud.google.com/storage/docs/json_api/v1/how-tos/batch
 """
+import concurrent.futures
 from email.encoders import encode_noop
 from email.generator import Generator
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
-from email.parser import Parser
 import io
 import json
+import re
 
 import requests
 import six
@@ -139,19 +140,32 @@ class Batch(Connection):
 
     :type client: :class:`google.cloud.storage.client.Client`
     :param client: The client to use for making connections.
+
+    :type raise_exception: bool
+    :param raise_exception:
+        (Optional) If True (the default), :meth:`finish` raises an
+        exception for the first deferred request which failed.  If False,
+        callers are expected to check the status of each response
+        returned by :meth:`finish`.
+    """
+    _MAX_BATCH_SIZE = 100
+    """Maximum number of calls sent in one batch request.
+
+    More calls can be deferred; they are sent as several batch requests.
     """
-    _MAX_BATCH_SIZE = 1000
 
-    def __init__(self, client):
+    _MAX_CONCURRENT_REQUESTS = 4
+    """Maximum number of batch requests sent at once."""
+
+    def __init__(self, client, raise_exception=True):
         super(Batch, self).__init__(client)
         self._requests = []
         self._target_objects = []
+        self._raise_exception = raise_exception
 
     def _do_request(self, method, url, headers, data, target_object):
         """Override Connection:  defer actual HTTP request.
 
-        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred.
-
         :type method: str
         :param method: The HTTP method to use in the request.
 
@@ -174,9 +188,6 @@ class Batch(Connection):
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
         """
-        if len(self._requests) >= self._MAX_BATCH_SIZE:
-            raise ValueError("Too many deferred requests (max %d)" %
-                             self._MAX_BATCH_SIZE)
         self._requests.append((method, url, headers, data))
         result = _FutureDict()
         self._target_objects.append(target_object)
@@ -184,19 +195,22 @@ class Batch(Connection):
             target_object._properties = result
         return _FutureResponse(result)
 
-    def _prepare_batch_request(self):
+    def _prepare_batch_request(self, requests):
         """Prepares headers and body for a batch request.
 
+        :type requests: list
+        :param requests: The deferred requests to send.
+
         :rtype: tuple (dict, str)
         :returns: The pair of headers and body of the batch request to be sent.
-        :raises: :class:`ValueError` if no requests have been deferred.
+        :raises: :class:`ValueError` if ``requests`` is empty.
         """
-        if len(self._requests) == 0:
+        if len(requests) == 0:
             raise ValueError("No deferred requests")
 
         multi = MIMEMultipart()
 
-        for method, uri, headers, body in self._requests:
+        for method, uri, headers, body in requests:
             subrequest = MIMEApplicationHTTP(method, uri, headers, body)
             multi.attach(subrequest)
 
@@ -239,16 +253,19 @@ class Batch(Connection):
                 except ValueError:
                     target_object._properties = subresponse.content
 
-        if exception_args is not None:
+        if exception_args is not None and self._raise_exception:
             raise exceptions.from_http_response(exception_args)
 
-    def finish(self):
-        """Submit a single `multipart/mixed` request with deferred requests.
+    def _send_batch_request(self, requests):
+        """Submit a single `multipart/mixed` request.
 
-        :rtype: list of tuples
-        :returns: one ``(headers, payload)`` tuple per deferred request.
+        :type requests: list
+        :param requests: The deferred requests to send.
+
+        :rtype: list
+        :returns: one response per request.
         """
-        headers, body = self._prepare_batch_request()
+        headers, body = self._prepare_batch_request(requests)
 
         url = '%s/batch/storage/v1' % self.API_BASE_URL
 
@@ -257,7 +274,38 @@ class Batch(Connection):
         # current batch.
         response = self._client._base_connection._make_request(
             'POST', url, data=body, headers=headers)
-        responses = list(_unpack_batch_response(response))
+        return list(_unpack_batch_response(response))
+
+    def finish(self):
+        """Submit `multipart/mixed` requests with the deferred requests.
+
+        If more than ``_MAX_BATCH_SIZE`` requests have been deferred, they
+        are split into several batch requests, up to
+        ``_MAX_CONCURRENT_REQUESTS`` of which are sent at once.
+
+        :rtype: list of tuples
+        :returns: one ``(headers, payload)`` tuple per deferred request.
+        :raises: :class:`ValueError` if no requests have been deferred.
+        """
+        if len(self._requests) == 0:
+            raise ValueError("No deferred requests")
+
+        size = self._MAX_BATCH_SIZE
+        groups = [self._requests[start:start + size]
+                  for start in range(0, len(self._requests), size)]
+        if len(groups) == 1:
+            responses = self._send_batch_request(groups[0])
+        else:
+            max_workers = min(self._MAX_CONCURRENT_REQUESTS, len(groups))
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers) as executor:
+                responses = [
+                    response
+                    for group_responses in executor.map(
+                        self._send_batch_request, groups)
+                    for response in group_responses
+                ]
+
         self._finish_futures(responses)
         return responses
 
@@ -277,28 +325,35 @@ class Batch(Connection):
             self._client._pop_batch()
 
 
-def _generate_faux_mime_message(parser, response):
-    """Convert response, content -> (multipart) email.message.
+_BOUNDARY_RE = re.compile(br'boundary="?([^";]+)"?')
+_HEADERS_END_RE = re.compile(br'\r?\n\r?\n')
+
+
+def _split_headers(data):
+    """Split MIME or HTTP headers from the content following them.
 
-    Helper for _unpack_batch_response.
+    :type data: bytes
+    :param data: Header lines, a blank line, then content.
+
+    :rtype: tuple (dict, bytes)
+    :returns: The headers, and the content.
     """
-    # We coerce to bytes to get consistent concat across
-    # Py2 and Py3. Percent formatting is insufficient since
-    # it includes the b in Py3.
-    content_type = _helpers._to_bytes(
-        response.headers.get('content-type', ''))
+    if data.startswith(b'\n') or data.startswith(b'\r\n'):
+        return {}, data.partition(b'\n')[2]
 
-    faux_message = b''.join([
-        b'Content-Type: ',
-        content_type,
-        b'\nMIME-Version: 1.0\n\n',
-        response.content,
-    ])
+    match = _HEADERS_END_RE.search(data)
+    if match is None:
+        header_data, content = data, b''
+    else:
+        header_data, content = data[:match.start()], data[match.end():]
 
-    if six.PY2:
-        return parser.parsestr(faux_message)
-    else:  # pragma: NO COVER  Python3
-        return parser.parsestr(faux_message.decode('utf-8'))
+    headers = {}
+    for line in header_data.splitlines():
+        name, _, value = line.partition(b':')
+        if value:
+            headers[name.strip().decode('latin-1')] = (
+                value.strip().decode('latin-1'))
+    return headers, content
 
 
 def _unpack_batch_response(response):
@@ -307,22 +362,35 @@ def _unpack_batch_response(response):
     Creates a generator of tuples of emulating the responses to
     :meth:`requests.Session.request`.
 
+    The parts of the response are split on the boundary as bytes, rather
+    than parsed as a whole with :mod:`email`, so each is only copied once.
+
     :type response: :class:`requests.Response`
     :param response: HTTP response / headers from a request.
-    """
-    parser = Parser()
-    message = _generate_faux_mime_message(parser, response)
 
-    if not isinstance(message._payload, list):
+    :raises: :class:`ValueError` if the response is not ``multipart``.
+    """
+    content_type = _helpers._to_bytes(
+        response.headers.get('content-type', ''))
+    match = _BOUNDARY_RE.search(content_type)
+    if not content_type.startswith(b'multipart/') or match is None:
         raise ValueError('Bad response:  not multi-part')
 
-    for subrequest in message._payload:
-        status_line, rest = subrequest._payload.split('\n', 1)
-        _, status, _ = status_line.split(' ', 2)
-        sub_message = parser.parsestr(rest)
-        payload = sub_message._payload
-        msg_headers = dict(sub_message._headers)
-        content_id = msg_headers.get('Content-ID')
+    delimiter = b'--' + match.group(1)
+    # The first part is the preamble; a part starting with '--' follows the
+    # closing delimiter.
+    for part in response.content.split(delimiter)[1:]:
+        if part.startswith(b'--'):
+            break
+
+        # Skip the rest of the delimiter line.
+        part = part.partition(b'\n')[2]
+        part_headers, http_response = _split_headers(part)
+        status_line, _, rest = http_response.partition(b'\n')
+        _, status, _ = status_line.split(b' ', 2)
+        msg_headers, payload = _split_headers(rest)
+        content_id = part_headers.get(
+            'Content-ID', msg_headers.get('Content-ID'))
 
         subresponse = requests.Response()
         subresponse.request = requests.Request(
@@ -330,6 +398,11 @@ def _unpack_batch_response(response):
             url='contentid://{}'.format(content_id)).prepare()
         subresponse.status_code = int(status)
         subresponse.headers.update(msg_headers)
-        subresponse._content = payload.encode('utf-8')
+        # The line break before a delimiter belongs to the delimiter.
+        if payload.endswith(b'\r\n'):
+            payload = payload[:-2]
+        elif payload.endswith(b'\n'):
+            payload = payload[:-1]
+        subresponse._content = payload
 
         yield subresponse
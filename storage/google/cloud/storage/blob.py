@@ -26,14 +26,19 @@
 """
 
 import base64
+import concurrent.futures
 import copy
 import hashlib
 from io import BytesIO
+import logging
 import mimetypes
 import os
 import time
+import uuid
 import warnings
 
+import requests
+import six
 from six.moves.urllib.parse import parse_qsl
 from six.moves.urllib.parse import quote
 from six.moves.urllib.parse import urlencode
@@ -45,6 +50,7 @@ from google.resumable_media.requests import ChunkedDownload
 from google.resumable_media.requests import Download
 from google.resumable_media.requests import MultipartUpload
 from google.resumable_media.requests import ResumableUpload
+from google.resumable_media import _upload as _media_upload
 
 from google.cloud import exceptions
 from google.cloud._helpers import _rfc3339_to_datetime
@@ -52,13 +58,16 @@ from google.cloud._helpers import _to_bytes
 from google.cloud._helpers import _bytes_to_unicode
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
+from google.cloud.storage import _crc32c
 from google.cloud.storage._helpers import _PropertyMixin
+from google.cloud.storage._helpers import _get_metadata_cache
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._signing import generate_signed_url
 from google.cloud.storage.acl import ACL
 from google.cloud.storage.acl import ObjectACL
 
 
+_LOGGER = logging.getLogger(__name__)
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
 _DEFAULT_CONTENT_TYPE = u'application/octet-stream'
 _DOWNLOAD_URL_TEMPLATE = (
@@ -94,8 +103,44 @@ _READ_LESS_THAN_SIZE = (
     'Size {:d} was specified but the file-like object only had '
     '{:d} bytes remaining.')
 
+_CRC32C_MISMATCH = (
+    'Checksum mismatch while downloading:\n\n  {}\n\n'
+    'The X-Goog-Hash header indicated a CRC32C checksum of:\n\n  {}\n\n'
+    'but the actual CRC32C checksum of the downloaded contents was:\n\n  {}\n')
+
+_CRC32C_UPLOAD_MISMATCH = (
+    'Checksum mismatch after composing {}: the CRC32C checksum of the '
+    'uploaded file was {}, but the composed object has {}.')
+
+_CHECKSUM_MISMATCH = (
+    'Checksum mismatch after uploading {}: the {} checksum of the data '
+    'sent was {}, but the uploaded object has {}.')
+
+_SLOW_CRC32C_WARNING = (
+    'Skipping the CRC32C checksum of the {}, since the crcmod package is not '
+    'installed with its C extension. Install google-cloud-storage[crcmod] '
+    'to verify it, or pass checksum=True to verify it with a slower, '
+    'pure-Python implementation.')
+
+_CHECKSUM_FIELDS = {
+    'md5': 'md5Hash',
+    'crc32c': 'crc32c',
+}
+
 _DEFAULT_CHUNKSIZE = 104857600  # 1024 * 1024 B * 100 = 100 MB
 _MAX_MULTIPART_SIZE = 8388608  # 8 MB
+_DEFAULT_SLICE_WORKERS = 8
+_MAX_COMPOSE_COMPONENTS = 32
+_COMPOSITE_UPLOAD_PREFIX = u'.composite-upload-tmp/'
+_READ_CHUNK_SIZE = 1048576  # 1 MB
+_SLICE_CHUNK_SIZE = 8388608  # 8 MB
+_MAX_SLICE_ATTEMPTS = 5
+# Errors after which a slice download resumes from its last received byte.
+_RESUMABLE_SLICE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
 
 
 class Blob(_PropertyMixin):
@@ -356,6 +401,101 @@ class Blob(_PropertyMixin):
             response_disposition=response_disposition,
             generation=generation)
 
+    def _cache_properties(self, client):
+        """Store the blob's properties in the client's metadata cache.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client whose cache is updated.
+        """
+        cache = _get_metadata_cache(client)
+        if cache is not None:
+            cache.put(self.bucket.name, self.name, self._properties)
+
+    def _uncache_properties(self, client):
+        """Remove the blob from the client's metadata cache.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client whose cache is updated.
+        """
+        cache = _get_metadata_cache(client)
+        if cache is not None:
+            cache.invalidate(self.bucket.name, self.name)
+
+    def _get_cached_properties(self, client):
+        """Look up the blob's properties in the client's metadata cache.
+
+        Entries older than the generation and metageneration already known
+        are ignored, as is the cache while a batch is in progress.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client whose cache is used.
+
+        :rtype: dict
+        :returns: The cached properties, or ``None``.
+        """
+        cache = _get_metadata_cache(client)
+        if cache is None or client.current_batch is not None:
+            return None
+        return cache.get(
+            self.bucket.name, self.name,
+            min_generation=self.generation,
+            min_metageneration=self.metageneration)
+
+    def reload(self, client=None):
+        """Reload properties from Cloud Storage.
+
+        If the client has a
+        :class:`~google.cloud.storage.metadata_cache.MetadataCache`, fresh
+        properties are taken from it instead.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current object.
+        """
+        client = self._require_client(client)
+        cached = self._get_cached_properties(client)
+        if cached is not None:
+            self._set_properties(cached)
+            return
+
+        super(Blob, self).reload(client=client)
+        self._cache_properties(client)
+
+    def patch(self, client=None):
+        """Sends all changed properties in a PATCH request.
+
+        Updates the ``_properties`` with the response from the backend.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current object.
+        """
+        client = self._require_client(client)
+        super(Blob, self).patch(client=client)
+        self._cache_properties(client)
+
+    def update(self, client=None):
+        """Sends all properties in a PUT request.
+
+        Updates the ``_properties`` with the response from the backend.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current object.
+        """
+        client = self._require_client(client)
+        super(Blob, self).update(client=client)
+        self._cache_properties(client)
+
     def exists(self, client=None):
         """Determines whether or not this blob exists.
 
@@ -371,6 +511,9 @@ class Blob(_PropertyMixin):
         :returns: True if the blob exists in Cloud Storage.
         """
         client = self._require_client(client)
+        if self._get_cached_properties(client) is not None:
+            return True
+
         # We only need the status code (200 or not) so we seek to
         # minimize the returned payload.
         query_params = {'fields': 'name'}
@@ -389,6 +532,7 @@ class Blob(_PropertyMixin):
             #       raised.
             return True
         except NotFound:
+            self._uncache_properties(client)
             return False
 
     def delete(self, client=None):
@@ -542,10 +686,138 @@ class Blob(_PropertyMixin):
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
+    def _download_slice(self, transport, filename, download_url, headers,
+                        start, end, checksum=True):
+        """Download one byte range of the blob into its place in a file.
+
+        If the connection fails part way through, the download resumes from
+        the last byte written, up to :data:`_MAX_SLICE_ATTEMPTS` times.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type filename: str
+        :param filename: The (preallocated) file to write the slice into.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Headers to be sent with the request(s).
+
+        :type start: int
+        :param start: The first byte of the slice.
+
+        :type end: int
+        :param end: The last byte of the slice.
+
+        :type checksum: bool
+        :param checksum: Whether to compute the CRC32C of the slice.
+
+        :rtype: int
+        :returns: The CRC32C checksum of the slice, or :data:`None` if
+                  ``checksum`` is false.
+        """
+        with open(filename, 'r+b') as file_obj:
+            file_obj.seek(start)
+            stream = _ChecksummingWriter(file_obj, checksum=checksum)
+            attempt = 1
+            while True:
+                download = ChunkedDownload(
+                    download_url, min(_SLICE_CHUNK_SIZE, end - start + 1),
+                    stream, headers=dict(headers),
+                    start=start + stream.bytes_written, end=end)
+                try:
+                    while not download.finished:
+                        download.consume_next_chunk(transport)
+                    return stream.crc32c
+                except _RESUMABLE_SLICE_ERRORS:
+                    if attempt == _MAX_SLICE_ATTEMPTS:
+                        raise
+                    attempt += 1
+
+    def _do_sliced_download(self, client, filename, slice_size, max_workers,
+                            checksum=True):
+        """Download the blob into a file as byte ranges, concurrently.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type filename: str
+        :param filename: A filename to be passed to ``open``.
+
+        :type slice_size: int
+        :param slice_size: The number of bytes in each range.
+
+        :type max_workers: int
+        :param max_workers: The number of ranges to download at once.
+
+        :type checksum: bool
+        :param checksum: Whether to verify the CRC32C of the whole download.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the download does not match the blob's.
+        """
+        size = self.size
+        ranges = [(start, min(start + slice_size, size) - 1)
+                  for start in range(0, size, slice_size)]
+        max_workers = min(max_workers, len(ranges))
+        expected = self.crc32c
+        checksum = checksum and expected is not None
+
+        transport = self._get_transport(client)
+        _ensure_connection_pool(transport, max_workers)
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+
+        with open(filename, 'wb') as file_obj:
+            file_obj.truncate(size)
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers)
+        futures = []
+        try:
+            for start, end in ranges:
+                futures.append(executor.submit(
+                    self._download_slice, transport, filename,
+                    download_url, headers, start, end, checksum))
+            checksums = [future.result() for future in futures]
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+        finally:
+            for future in futures:
+                future.cancel()
+            # Wait for running slices, so the file is no longer written to.
+            executor.shutdown(wait=True)
+
+        if not checksum:
+            return
+
+        actual = 0
+        for (start, end), slice_checksum in zip(ranges, checksums):
+            actual = _crc32c.combine(actual, slice_checksum, end - start + 1)
+        actual = _crc32c.to_base64(actual)
+        if actual != expected:
+            raise resumable_media.DataCorruption(
+                None, _CRC32C_MISMATCH.format(download_url, expected, actual))
+
     def download_to_filename(self, filename, client=None,
-                             start=None, end=None):
+                             start=None, end=None, slice_size=None,
+                             max_workers=_DEFAULT_SLICE_WORKERS,
+                             checksum=None):
         """Download the contents of this blob into a named file.
 
+        If ``slice_size`` is passed, a blob larger than that is downloaded
+        as ranges of ``slice_size`` bytes, up to ``max_workers`` at a time,
+        each written straight to its place in the file. The CRC32C checksum
+        of the ranges is then checked against the blob's, by default only
+        if the ``crcmod`` package is installed with its C extension, e.g.
+        with ``pip install google-cloud-storage[crcmod]``.
+
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
@@ -563,12 +835,44 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type slice_size: int
+        :param slice_size: Optional. Download the blob in ranges of this many
+                           bytes, concurrently. Cannot be combined with
+                           ``start`` or ``end``.
+
+        :type max_workers: int
+        :param max_workers: Optional. The number of ranges to download at
+                            once, when ``slice_size`` is passed.
+
+        :type checksum: bool
+        :param checksum: Optional. Whether to verify the CRC32C checksum of
+                         a sliced download. By default, it is verified if
+                         ``crcmod`` is installed with its C extension, and
+                         a :exc:`RuntimeWarning` is issued otherwise.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
+        :raises: :exc:`ValueError` if ``slice_size`` is combined with
+                 ``start`` or ``end``.
         """
+        if slice_size is not None:
+            if start is not None or end is not None:
+                raise ValueError(
+                    'A sliced download cannot have a start or an end.')
+            if self.size is None or self.media_link is None:
+                self.reload(client=client)
+
         try:
-            with open(filename, 'wb') as file_obj:
-                self.download_to_file(
-                    file_obj, client=client, start=start, end=end)
+            if (slice_size is not None and self.size > slice_size and
+                    self.content_encoding != 'gzip'):
+                # Ranges of gzip-encoded blobs apply to the compressed data,
+                # so those are always downloaded with a single request.
+                self._do_sliced_download(
+                    client, filename, slice_size, max_workers,
+                    checksum=_use_crc32c(checksum, 'sliced download'))
+            else:
+                with open(filename, 'wb') as file_obj:
+                    self.download_to_file(
+                        file_obj, client=client, start=start, end=end)
         except resumable_media.DataCorruption:
             # Delete the corrupt downloaded file.
             os.remove(filename)
@@ -577,7 +881,7 @@ class Blob(_PropertyMixin):
         updated = self.updated
         if updated is not None:
             mtime = time.mktime(updated.timetuple())
-            os.utime(file_obj.name, (mtime, mtime))
+            os.utime(filename, (mtime, mtime))
 
     def download_as_string(self, client=None, start=None, end=None):
         """Download the contents of this blob as a string.
@@ -605,6 +909,81 @@ class Blob(_PropertyMixin):
             string_buffer, client=client, start=start, end=end)
         return string_buffer.getvalue()
 
+    def open(self, mode='r', chunk_size=None, encoding=None, errors=None,
+             newline=None, client=None, **kwargs):
+        """Create a file-like object for streaming the blob's contents.
+
+        In read mode, the blob is downloaded in chunks as it is read, and can
+        be seeked.  In write mode, the data is uploaded in chunks as it is
+        written, and the blob is created when the file is closed.  See
+        :class:`~google.cloud.storage.fileio.BlobReader` and
+        :class:`~google.cloud.storage.fileio.BlobWriter`.
+
+        For example:
+
+        .. code-block:: python
+
+           with blob.open('r') as lines:
+               for line in lines:
+                   print(line)
+
+        :type mode: str
+        :param mode: (Optional) One of ``'r'`` or ``'w'`` for text, or
+                     ``'rb'`` or ``'wb'`` for bytes.  Defaults to ``'r'``.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes to download or
+                           upload with each request.  For writing, must be a
+                           multiple of 256 KB.
+
+        :type encoding: str
+        :param encoding: (Optional) In text mode, the encoding of the data.
+                         Defaults to ``'utf-8'``.
+
+        :type errors: str
+        :param errors: (Optional) In text mode, how encoding errors are
+                       handled, as for :func:`io.open`.
+
+        :type newline: str
+        :param newline: (Optional) In text mode, how line endings are
+                        handled, as for :func:`io.open`.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type kwargs: dict
+        :param kwargs: Other keyword arguments, passed to
+                       :class:`~google.cloud.storage.fileio.BlobReader` or
+                       :class:`~google.cloud.storage.fileio.BlobWriter`.
+
+        :rtype: :class:`io.IOBase`
+        :returns: The file-like object: a
+                  :class:`~google.cloud.storage.fileio.BlobTextWrapper` in
+                  text mode.
+        :raises: :exc:`ValueError` if ``mode`` is not supported.
+        """
+        # Imported here because fileio depends on this module.
+        from google.cloud.storage.fileio import BlobReader
+        from google.cloud.storage.fileio import BlobTextWrapper
+        from google.cloud.storage.fileio import BlobWriter
+
+        if chunk_size is not None:
+            kwargs['chunk_size'] = chunk_size
+        if mode in ('r', 'rb'):
+            file_obj = BlobReader(self, client=client, **kwargs)
+        elif mode in ('w', 'wb'):
+            file_obj = BlobWriter(self, client=client, **kwargs)
+        else:
+            raise ValueError('Unsupported mode: {!r}'.format(mode))
+
+        if mode.endswith('b'):
+            return file_obj
+        return BlobTextWrapper(
+            file_obj, encoding=encoding or 'utf-8', errors=errors,
+            newline=newline)
+
     def _get_content_type(self, content_type, filename=None):
         """Determine the content type from the current object.
 
@@ -691,7 +1070,8 @@ class Blob(_PropertyMixin):
         return headers, object_metadata, content_type
 
     def _do_multipart_upload(self, client, stream, content_type,
-                             size, num_retries, predefined_acl):
+                             size, num_retries, predefined_acl,
+                             checksum=None):
         """Perform a multipart upload.
 
         The content type of the upload will be determined in order
@@ -701,6 +1081,9 @@ class Blob(_PropertyMixin):
         - The value stored on the current blob
         - The default value ('application/octet-stream')
 
+        If ``stream`` holds its data in memory, as :class:`io.BytesIO` does,
+        the data is sent from its buffer without being copied.
+
         :type client: :class:`~google.cloud.storage.client.Client`
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
@@ -723,19 +1106,20 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: object
+        :param checksum: (Optional) A hash object, as from :mod:`hashlib`,
+                         updated with the data as it is sent.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the multipart
                   upload request.
         :raises: :exc:`ValueError` if ``size`` is not :data:`None` but the
                  ``stream`` has fewer than ``size`` bytes remaining.
         """
-        if size is None:
-            data = stream.read()
-        else:
-            data = stream.read(size)
-            if len(data) < size:
-                msg = _READ_LESS_THAN_SIZE.format(size, len(data))
-                raise ValueError(msg)
+        data = _read_buffer(stream, size)
+        if size is not None and len(data) < size:
+            msg = _READ_LESS_THAN_SIZE.format(size, len(data))
+            raise ValueError(msg)
 
         transport = self._get_transport(client)
         info = self._get_upload_arguments(content_type)
@@ -755,7 +1139,8 @@ class Blob(_PropertyMixin):
             name_value_pairs.append(('predefinedAcl', predefined_acl))
 
         upload_url = _add_query_parameters(base_url, name_value_pairs)
-        upload = MultipartUpload(upload_url, headers=headers)
+        upload = _BufferMultipartUpload(
+            upload_url, headers=headers, checksum=checksum)
 
         if num_retries is not None:
             upload._retry_strategy = resumable_media.RetryStrategy(
@@ -858,7 +1243,8 @@ class Blob(_PropertyMixin):
         return upload, transport
 
     def _do_resumable_upload(self, client, stream, content_type,
-                             size, num_retries, predefined_acl):
+                             size, num_retries, predefined_acl,
+                             checksum=None):
         """Perform a resumable upload.
 
         Assumes ``chunk_size`` is not :data:`None` on the current blob.
@@ -892,10 +1278,16 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: object
+        :param checksum: (Optional) A hash object, as from :mod:`hashlib`,
+                         updated with the data as it is read.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
         """
+        if checksum is not None:
+            stream = _ChecksumReader(stream, checksum)
         upload, transport = self._initiate_resumable_upload(
             client, stream, content_type, size, num_retries,
             predefined_acl=predefined_acl)
@@ -906,7 +1298,7 @@ class Blob(_PropertyMixin):
         return response
 
     def _do_upload(self, client, stream, content_type,
-                   size, num_retries, predefined_acl):
+                   size, num_retries, predefined_acl, checksum=None):
         """Determine an upload strategy and then perform the upload.
 
         If the size of the data to be uploaded exceeds 5 MB a resumable media
@@ -942,6 +1334,10 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: object
+        :param checksum: (Optional) A hash object, as from :mod:`hashlib`,
+                         updated with the data uploaded.
+
         :rtype: dict
         :returns: The parsed JSON from the "200 OK" response. This will be the
                   **only** response in the multipart case and it will be the
@@ -950,17 +1346,17 @@ class Blob(_PropertyMixin):
         if size is not None and size <= _MAX_MULTIPART_SIZE:
             response = self._do_multipart_upload(
                 client, stream, content_type,
-                size, num_retries, predefined_acl)
+                size, num_retries, predefined_acl, checksum=checksum)
         else:
             response = self._do_resumable_upload(
                 client, stream, content_type, size,
-                num_retries, predefined_acl)
+                num_retries, predefined_acl, checksum=checksum)
 
         return response.json()
 
     def upload_from_file(self, file_obj, rewind=False, size=None,
                          content_type=None, num_retries=None, client=None,
-                         predefined_acl=None):
+                         predefined_acl=None, checksum=None):
         """Upload the contents of this blob from a file-like object.
 
         The content type of the upload will be determined in order
@@ -1021,8 +1417,16 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) Either ``'md5'`` or ``'crc32c'``.  If
+                         passed, that checksum of the data is computed as it
+                         is sent, and compared with the one the service
+                         reports for the new object.
+
         :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
                  if the upload response returns an error status.
+        :raises: :class:`~google.resumable_media.DataCorruption` if the
+                 checksums do not match.
 
         .. _object versioning: https://cloud.google.com/storage/\
                                docs/object-versioning
@@ -1034,17 +1438,194 @@ class Blob(_PropertyMixin):
 
         _maybe_rewind(file_obj, rewind=rewind)
         predefined_acl = ACL.validate_predefined(predefined_acl)
+        hash_obj = _make_checksum(checksum)
 
         try:
             created_json = self._do_upload(
                 client, file_obj, content_type,
-                size, num_retries, predefined_acl)
+                size, num_retries, predefined_acl, checksum=hash_obj)
             self._set_properties(created_json)
+            self._cache_properties(self._require_client(client))
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
+        if hash_obj is not None:
+            field = _CHECKSUM_FIELDS[hash_obj.name]
+            expected = base64.b64encode(hash_obj.digest()).decode('ascii')
+            actual = created_json.get(field)
+            # Some objects, such as those encrypted with KMS keys, have no
+            # MD5 hash.
+            if actual is not None and actual != expected:
+                raise resumable_media.DataCorruption(
+                    None, _CHECKSUM_MISMATCH.format(
+                        self.name, hash_obj.name, expected, actual))
+
+    def _upload_slice(self, client, filename, start, size, name,
+                      checksum=True):
+        """Upload one byte range of a file as a new blob.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type start: int
+        :param start: The first byte of the range.
+
+        :type size: int
+        :param size: The number of bytes in the range.
+
+        :type name: str
+        :param name: The name of the blob to create, in this blob's bucket.
+
+        :type checksum: bool
+        :param checksum: Whether to compute the CRC32C of the range as it is
+                         sent, and check it against the new blob's.
+
+        :rtype: tuple
+        :returns: The new :class:`Blob` and the CRC32C of the range (or
+                  :data:`None` if ``checksum`` is false).
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the new blob does not match the range's.
+        """
+        component = Blob(name, bucket=self.bucket, chunk_size=self.chunk_size)
+        with open(filename, 'rb') as file_obj:
+            # The range is read from disk once, hashed as it is sent.
+            component.upload_from_file(
+                _SliceReader(file_obj, start, size), size=size,
+                content_type=_DEFAULT_CONTENT_TYPE, client=client,
+                checksum='crc32c' if checksum else None)
+
+        crc32c = None
+        if checksum and component.crc32c is not None:
+            crc32c = _crc32c.from_base64(component.crc32c)
+        return component, crc32c
+
+    def _do_composite_upload(self, client, filename, content_type, size,
+                             slice_size, max_workers, predefined_acl,
+                             checksum=True):
+        """Upload a file as concurrently uploaded, then composed, slices.
+
+        Slices are uploaded as temporary blobs, which are composed into
+        this one, :data:`_MAX_COMPOSE_COMPONENTS` at a time, through
+        intermediate temporary blobs if needed. Temporary blobs are
+        deleted whether or not the upload succeeds.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type size: int
+        :param size: The size of the file.
+
+        :type slice_size: int
+        :param slice_size: The number of bytes in each slice.
+
+        :type max_workers: int
+        :param max_workers: The number of uploads or compositions to run at
+                            once.
+
+        :type predefined_acl: str
+        :param predefined_acl: (Optional) predefined access control list
+
+        :type checksum: bool
+        :param checksum: Whether to verify the CRC32C checksum of each slice
+                         and of the composed blob.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the composed blob does not match the file's.
+        """
+        client = self._require_client(client)
+        ranges = [(start, min(slice_size, size - start))
+                  for start in range(0, size, slice_size)]
+        max_workers = min(max_workers, len(ranges))
+        _ensure_connection_pool(self._get_transport(client), max_workers)
+
+        prefix = u'{}{}/'.format(_COMPOSITE_UPLOAD_PREFIX, uuid.uuid4().hex)
+        temporaries = []
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers)
+        futures = []
+        try:
+            for index, (start, length) in enumerate(ranges):
+                name = u'{}0/{:d}'.format(prefix, index)
+                temporaries.append(name)
+                futures.append(executor.submit(
+                    self._upload_slice, client, filename, start, length,
+                    name, checksum=checksum))
+            results = [future.result() for future in futures]
+            components = [component for component, _ in results]
+
+            level = 0
+            while len(components) > _MAX_COMPOSE_COMPONENTS:
+                level += 1
+                futures = []
+                for index, first in enumerate(range(
+                        0, len(components), _MAX_COMPOSE_COMPONENTS)):
+                    name = u'{}{:d}/{:d}'.format(prefix, level, index)
+                    temporaries.append(name)
+                    intermediate = Blob(name, bucket=self.bucket)
+                    futures.append(executor.submit(
+                        _compose_and_return, intermediate,
+                        components[first:first + _MAX_COMPOSE_COMPONENTS],
+                        client))
+                components = [future.result() for future in futures]
+
+            destination = self._get_writable_metadata()
+            destination['contentType'] = content_type
+            self._compose(components, destination, client=client,
+                          predefined_acl=predefined_acl)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self._delete_temporaries(temporaries, client)
+
+        checksums = [crc32c for _, crc32c in results]
+        if not checksum or self.crc32c is None or None in checksums:
+            return
+
+        expected = 0
+        for (_, length), crc32c in zip(ranges, checksums):
+            expected = _crc32c.combine(expected, crc32c, length)
+        expected = _crc32c.to_base64(expected)
+        if self.crc32c != expected:
+            raise resumable_media.DataCorruption(
+                None, _CRC32C_UPLOAD_MISMATCH.format(
+                    self.name, expected, self.crc32c))
+
+    def _delete_temporaries(self, names, client):
+        """Delete the temporary blobs of a composite upload.
+
+        Errors are logged rather than raised, so that they do not hide the
+        outcome of the upload.
+
+        :type names: list
+        :param names: The names of the temporary blobs.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.
+        """
+        try:
+            self.bucket.delete_blobs(
+                names, on_error=lambda blob: None, client=client)
+        except Exception:
+            _LOGGER.exception(
+                'Failed to delete the temporary blobs of the composite '
+                'upload of %s.', self.name)
+
     def upload_from_filename(self, filename, content_type=None, client=None,
-                             predefined_acl=None):
+                             predefined_acl=None, slice_size=None,
+                             max_workers=_DEFAULT_SLICE_WORKERS,
+                             checksum=None):
         """Upload this blob's contents from the content of a named file.
 
         The content type of the upload will be determined in order
@@ -1081,17 +1662,45 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type slice_size: int
+        :param slice_size: (Optional) Upload a file larger than this many
+                           bytes as a parallel composite upload, in slices of
+                           this size.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of slices to upload at once,
+                            when ``slice_size`` is passed.
+
+        :type checksum: bool
+        :param checksum: (Optional) Whether to verify the CRC32C checksums of
+                         a parallel composite upload. By default, they are
+                         verified if ``crcmod`` is installed with its C
+                         extension, and a :exc:`RuntimeWarning` is issued
+                         otherwise.
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
         with open(filename, 'rb') as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
-            self.upload_from_file(
-                file_obj, content_type=content_type, client=client,
-                size=total_bytes, predefined_acl=predefined_acl)
+            # Composition needs the same customer-supplied key (or KMS key)
+            # for every component, which :meth:`compose` does not send.
+            if (slice_size is None or total_bytes <= slice_size or
+                    self._encryption_key is not None or
+                    self.kms_key_name is not None):
+                self.upload_from_file(
+                    file_obj, content_type=content_type, client=client,
+                    size=total_bytes, predefined_acl=predefined_acl)
+                return
+
+        predefined_acl = ACL.validate_predefined(predefined_acl)
+        self._do_composite_upload(
+            client, filename, content_type, total_bytes, slice_size,
+            max_workers, predefined_acl,
+            checksum=_use_crc32c(checksum, 'parallel composite upload'))
 
     def upload_from_string(self, data, content_type='text/plain', client=None,
-                           predefined_acl=None):
+                           predefined_acl=None, checksum=None):
         """Upload contents of this blob from the provided string.
 
         .. note::
@@ -1110,7 +1719,11 @@ class Blob(_PropertyMixin):
 
         :type data: bytes or str
         :param data: The data to store in this blob.  If the value is
-                     text, it will be encoded as UTF-8.
+                     text, it will be encoded as UTF-8.  Any other object
+                     supporting the buffer protocol, such as a
+                     :class:`bytearray`, :class:`memoryview` or
+                     :class:`mmap.mmap`, is uploaded without being copied
+                     into a multipart request.
 
         :type content_type: str
         :param content_type: Optional type of content being uploaded. Defaults
@@ -1123,13 +1736,18 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type checksum: str
+        :param checksum: (Optional) Either ``'md5'`` or ``'crc32c'``, to
+                         verify the upload (see :meth:`upload_from_file`).
         """
-        data = _to_bytes(data, encoding='utf-8')
-        string_buffer = BytesIO(data)
+        if isinstance(data, six.text_type):
+            data = data.encode('utf-8')
+        stream = _BufferReader(data)
         self.upload_from_file(
-            file_obj=string_buffer, size=len(data),
+            file_obj=stream, size=len(stream),
             content_type=content_type, client=client,
-            predefined_acl=predefined_acl)
+            predefined_acl=predefined_acl, checksum=checksum)
 
     def create_resumable_upload_session(
             self,
@@ -1378,15 +1996,38 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
         """
+        self._compose(sources, self._properties.copy(), client=client)
+
+    def _compose(self, sources, destination, client=None,
+                 predefined_acl=None):
+        """Concatenate source blobs into this one, with the given metadata.
+
+        :type sources: list of :class:`Blob`
+        :param sources: blobs whose contents will be composed into this blob.
+
+        :type destination: dict
+        :param destination: The metadata of the composed object.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type predefined_acl: str
+        :param predefined_acl: (Optional) predefined access control list
+        """
         client = self._require_client(client)
         query_params = {}
 
         if self.user_project is not None:
             query_params['userProject'] = self.user_project
 
+        if predefined_acl is not None:
+            query_params['destinationPredefinedAcl'] = predefined_acl
+
         request = {
             'sourceObjects': [{'name': source.name} for source in sources],
-            'destination': self._properties.copy(),
+            'destination': destination,
         }
         api_response = client._connection.api_request(
             method='POST',
@@ -1395,8 +2036,10 @@ class Blob(_PropertyMixin):
             data=request,
             _target_object=self)
         self._set_properties(api_response)
+        self._cache_properties(client)
 
-    def rewrite(self, source, token=None, client=None):
+    def rewrite(self, source, token=None, client=None,
+                max_bytes_per_call=None):
         """Rewrite source blob into this one.
 
         If :attr:`user_project` is set on the bucket, bills the API request
@@ -1415,6 +2058,13 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type max_bytes_per_call: int
+        :param max_bytes_per_call: Optional. The maximum number of bytes to
+                                   rewrite in this call, a multiple of 1 MiB.
+                                   Only honored when the rewrite copies data
+                                   between locations or storage classes.
+                                   Continuing calls must pass the same value.
+
         :rtype: tuple
         :returns: ``(token, bytes_rewritten, total_bytes)``, where ``token``
                   is a rewrite token (``None`` if the rewrite is complete),
@@ -1438,6 +2088,9 @@ class Blob(_PropertyMixin):
         if self.kms_key_name is not None:
             query_params['destinationKmsKeyName'] = self.kms_key_name
 
+        if max_bytes_per_call is not None:
+            query_params['maxBytesRewrittenPerCall'] = max_bytes_per_call
+
         api_response = client._connection.api_request(
             method='POST',
             path=source.path + '/rewriteTo' + self.path,
@@ -1453,8 +2106,10 @@ class Blob(_PropertyMixin):
         # in this case.
         if api_response['done']:
             self._set_properties(api_response['resource'])
+            self._cache_properties(client)
             return None, rewritten, size
 
+        self._uncache_properties(client)
         return api_response['rewriteToken'], rewritten, size
 
     def update_storage_class(self, new_class, client=None):
@@ -1495,6 +2150,7 @@ class Blob(_PropertyMixin):
             headers=headers,
             _target_object=self)
         self._set_properties(api_response['resource'])
+        self._cache_properties(client)
 
     cache_control = _scalar_property('cacheControl')
     """HTTP 'Cache-Control' header for this object.
@@ -1861,6 +2517,392 @@ def _get_encryption_headers(key, source=False):
     }
 
 
+class _ChecksummingWriter(object):
+    """Write to a file, keeping a running count and CRC32C of the data.
+
+    :type file_obj: file
+    :param file_obj: The file to write to.
+
+    :type checksum: bool
+    :param checksum: Whether to compute the CRC32C. If not,
+                     :attr:`crc32c` stays :data:`None`.
+    """
+
+    def __init__(self, file_obj, checksum=True):
+        self._file_obj = file_obj
+        self.bytes_written = 0
+        self.crc32c = 0 if checksum else None
+
+    def write(self, data):
+        self._file_obj.write(data)
+        self.bytes_written += len(data)
+        if self.crc32c is not None:
+            self.crc32c = _crc32c.extend(self.crc32c, data)
+
+
+class _SliceReader(object):
+    """Read a byte range of a file as a stream of its own.
+
+    Positions are relative to the start of the range, so an upload can
+    treat the range as a whole file.
+
+    :type file_obj: file
+    :param file_obj: A file open for reading.
+
+    :type start: int
+    :param start: The first byte of the range.
+
+    :type size: int
+    :param size: The number of bytes in the range.
+    """
+
+    def __init__(self, file_obj, start, size):
+        self._file_obj = file_obj
+        self._start = start
+        self._size = size
+        self._position = 0
+
+    def read(self, size=-1):
+        remaining = self._size - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        self._file_obj.seek(self._start + self._position)
+        data = self._file_obj.read(size)
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._position = max(0, min(offset, self._size))
+        return self._position
+
+
+def _byte_view(data):
+    """Get a flat view of the bytes of an object.
+
+    :type data: object
+    :param data: An object supporting the buffer protocol.
+
+    :rtype: :class:`memoryview`
+    :returns: A one-dimensional view of ``data``, with one item per byte.
+    :raises: :exc:`TypeError` if ``data`` does not support the buffer
+             protocol.
+    """
+    view = memoryview(data)
+    if view.ndim != 1 or view.itemsize != 1:
+        view = view.cast('B')
+    return view
+
+
+def _read_buffer(stream, size):
+    """Read from a stream, without copying data already in memory.
+
+    :type stream: IO[bytes]
+    :param stream: A bytes IO object open for reading.  If it has a
+                   ``getbuffer`` method, like :class:`io.BytesIO`, a view
+                   of its buffer is returned.
+
+    :type size: int
+    :param size: The number of bytes to read, or :data:`None` to read to
+                 the end of the stream.
+
+    :rtype: bytes or :class:`memoryview`
+    :returns: At most ``size`` bytes from the stream.
+    """
+    getbuffer = getattr(stream, 'getbuffer', None)
+    if getbuffer is None:
+        if size is None:
+            return stream.read()
+        return stream.read(size)
+
+    start = stream.tell()
+    view = _byte_view(getbuffer())
+    if size is None:
+        view = view[start:]
+    else:
+        view = view[start:start + size]
+    stream.seek(start + len(view))
+    return view
+
+
+def _make_checksum(checksum):
+    """Create the hash object for the ``checksum`` argument of an upload.
+
+    :type checksum: str
+    :param checksum: ``'md5'``, ``'crc32c'`` or :data:`None`.
+
+    :rtype: object
+    :returns: A new hash object, or :data:`None` if ``checksum`` is.
+    :raises: :exc:`ValueError` for any other value.
+    """
+    if checksum is None:
+        return None
+    if checksum == 'md5':
+        return hashlib.md5()
+    if checksum == 'crc32c':
+        return _crc32c.Hash()
+    raise ValueError(
+        "checksum must be 'md5', 'crc32c' or None, not %r" % (checksum,))
+
+
+def _use_crc32c(checksum, transfer):
+    """Decide whether a sliced transfer computes CRC32C checksums.
+
+    :type checksum: bool
+    :param checksum: The ``checksum`` argument of the transfer. If
+                     :data:`None`, checksums are computed only if that is
+                     fast, and a warning is issued otherwise.
+
+    :type transfer: str
+    :param transfer: Description of the transfer, for the warning.
+
+    :rtype: bool
+    :returns: Whether to compute the checksums.
+    """
+    if checksum is not None:
+        return checksum
+    if _crc32c.is_fast():
+        return True
+    warnings.warn(
+        _SLOW_CRC32C_WARNING.format(transfer), RuntimeWarning, stacklevel=3)
+    return False
+
+
+class _ChecksumTracker(object):
+    """Update a hash object with each byte of a stream of data, once.
+
+    Data already hashed, such as data sent again after a failure, is
+    skipped, so that the hash covers each byte exactly once.
+
+    :type hash_obj: object
+    :param hash_obj: A hash object, as from :mod:`hashlib`.
+    """
+
+    def __init__(self, hash_obj):
+        self.hash_obj = hash_obj
+        self._hashed = 0
+
+    def update(self, offset, data):
+        """Hash the part of ``data`` not hashed already.
+
+        :type offset: int
+        :param offset: The position of ``data`` in the whole stream.
+
+        :type data: bytes
+        :param data: The data found at ``offset``.
+        """
+        skip = self._hashed - offset
+        if 0 <= skip < len(data):
+            self.hash_obj.update(data[skip:])
+            self._hashed = offset + len(data)
+
+
+class _ChecksumReader(object):
+    """Hash the data read from a stream.
+
+    :type stream: IO[bytes]
+    :param stream: A bytes IO object open for reading.
+
+    :type hash_obj: object
+    :param hash_obj: A hash object, as from :mod:`hashlib`.
+    """
+
+    def __init__(self, stream, hash_obj):
+        self._stream = stream
+        self._start = stream.tell()
+        self._tracker = _ChecksumTracker(hash_obj)
+
+    def read(self, size=-1):
+        offset = self._stream.tell() - self._start
+        data = self._stream.read(size)
+        self._tracker.update(offset, data)
+        return data
+
+    def tell(self):
+        return self._stream.tell()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._stream.seek(offset, whence)
+
+
+class _BufferReader(object):
+    """Read an object supporting the buffer protocol as a stream.
+
+    :meth:`read` copies the bytes it returns, but :meth:`getbuffer` gives
+    a view of the whole buffer, as :meth:`io.BytesIO.getbuffer` does.
+
+    :type data: object
+    :param data: An object supporting the buffer protocol.
+    """
+
+    def __init__(self, data):
+        self._view = _byte_view(data)
+        self._position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def getbuffer(self):
+        return self._view
+
+    def read(self, size=-1):
+        start = self._position
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(start + size, len(self._view))
+        self._position = max(start, end)
+        return self._view[start:end].tobytes()
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, offset)
+        return self._position
+
+
+class _MultipartBody(object):
+    """Body of a multipart upload request, sent without copying the data.
+
+    Iterating over the body yields the multipart headers, then slices of the
+    data, then the closing boundary, which ``requests`` sends one by one.
+    Each iteration starts from the beginning, so the request can be retried.
+
+    :type head: bytes
+    :param head: Everything before the data.
+
+    :type data: :class:`memoryview`
+    :param data: The data being uploaded.
+
+    :type tail: bytes
+    :param tail: Everything after the data.
+
+    :type checksum: object
+    :param checksum: (Optional) A hash object, as from :mod:`hashlib`,
+                     updated with the data as it is sent.
+    """
+
+    def __init__(self, head, data, tail, checksum=None):
+        self._head = head
+        self._data = data
+        self._tail = tail
+        self._tracker = None
+        if checksum is not None:
+            self._tracker = _ChecksumTracker(checksum)
+
+    def __len__(self):
+        return len(self._head) + len(self._data) + len(self._tail)
+
+    def __iter__(self):
+        yield self._head
+        for start in six.moves.range(0, len(self._data), _READ_CHUNK_SIZE):
+            chunk = self._data[start:start + _READ_CHUNK_SIZE]
+            if self._tracker is not None:
+                self._tracker.update(start, chunk)
+            yield chunk
+        yield self._tail
+
+    def tobytes(self):
+        """Copy the whole body into a single string.
+
+        :rtype: bytes
+        :returns: The body.
+        """
+        if self._tracker is not None:
+            self._tracker.update(0, self._data)
+        return self._head + self._data.tobytes() + self._tail
+
+
+class _BufferMultipartUpload(MultipartUpload):
+    """Multipart upload of bytes-like data, sent without copying it.
+
+    :type upload_url: str
+    :param upload_url: The URL where the content will be uploaded.
+
+    :type headers: dict
+    :param headers: Extra headers that should be sent with the request.
+
+    :type checksum: object
+    :param checksum: (Optional) A hash object, as from :mod:`hashlib`,
+                     updated with the data as it is sent.
+    """
+
+    def __init__(self, upload_url, headers=None, checksum=None):
+        super(_BufferMultipartUpload, self).__init__(
+            upload_url, headers=headers)
+        self._checksum = checksum
+
+    def _prepare_request(self, data, metadata, content_type):
+        """Prepare the request, with a body made of ``data`` and its parts.
+
+        :type data: bytes
+        :param data: The data to upload, or any object supporting the buffer
+                     protocol.
+
+        :rtype: tuple
+        :returns: The HTTP method, URL, body and headers of the request.
+        """
+        if self.finished:
+            raise ValueError(u'An upload can only be used once.')
+
+        content, boundary = _media_upload.construct_multipart_request(
+            b'', metadata, content_type)
+        tail = b'\r\n--' + boundary + b'--'
+        body = _MultipartBody(
+            content[:-len(tail)], _byte_view(data), tail,
+            checksum=self._checksum)
+        if six.PY2:
+            # Python 2's ``httplib`` cannot send an iterable body, and
+            # its ``str.join`` does not accept memoryviews.
+            body = body.tobytes()
+        self._headers[_media_upload._CONTENT_TYPE_HEADER] = (
+            _media_upload._RELATED_HEADER + boundary + b'"')
+        return _media_upload._POST, self.upload_url, body, self._headers
+
+
+def _compose_and_return(blob, sources, client):
+    """Compose ``sources`` into ``blob`` and return it."""
+    blob.compose(sources, client=client)
+    return blob
+
+
+def _ensure_connection_pool(transport, size):
+    """Make sure a session can keep ``size`` connections open at once.
+
+    ``requests`` keeps at most 10 connections per host by default; beyond
+    that, connections used by concurrent requests are discarded.
+
+    :type transport: :class:`requests.Session`
+    :param transport: The session to be shared by concurrent requests.
+
+    :type size: int
+    :param size: The number of requests which will run concurrently.
+    """
+    if not isinstance(transport, requests.Session):
+        return
+
+    # Plain HTTP is only used by local test servers, but those are where
+    # concurrent transfers get benchmarked.
+    for prefix in ('https://', 'http://'):
+        adapter = transport.get_adapter(prefix)
+        # Leave adapters with custom behavior, e.g. for mutual TLS, alone.
+        if (type(adapter) is requests.adapters.HTTPAdapter and
+                adapter._pool_maxsize < size):
+            transport.mount(prefix, requests.adapters.HTTPAdapter(
+                pool_connections=size, pool_maxsize=size))
+
+
 def _quote(value):
     """URL-quote a string.
 
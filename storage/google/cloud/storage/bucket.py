@@ -15,15 +15,20 @@
 """Create / interact with Google Cloud Storage buckets."""
 
 import base64
+import collections
+import concurrent.futures
 import copy
 import datetime
 import json
+import threading
 import warnings
 
 import six
+from six.moves import queue
 
 from google.api_core import page_iterator
 from google.api_core import datetime_helpers
+from google.cloud import exceptions
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
@@ -31,6 +36,7 @@ from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
 from google.cloud.storage import _signing
 from google.cloud.storage._helpers import _PropertyMixin
+from google.cloud.storage._helpers import _get_metadata_cache
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
 from google.cloud.storage.acl import BucketACL
@@ -45,6 +51,46 @@ _LOCATION_SETTER_MESSAGE = (
     "Assignment to 'Bucket.location' is deprecated, as it is only "
     "valid before the bucket is created. Instead, pass the location "
     "to `Bucket.create`.")
+_DEFAULT_DELETE_WORKERS = 4
+_DEFAULT_LIST_WORKERS = 8
+_LIGHTWEIGHT_LIST_FIELDS = 'items(name,size,generation),prefixes,nextPageToken'
+_SHARD_DONE = object()
+
+BlobListing = collections.namedtuple(
+    'BlobListing', ['name', 'size', 'generation'])
+"""Name, size and generation of a listed blob.
+
+Yielded by :meth:`Bucket.list_blobs_parallel` in ``lightweight`` mode.
+"""
+
+
+def _blob_name(blob):
+    """Return the name of a blob, or the blob itself if it is a name."""
+    if isinstance(blob, six.string_types):
+        return blob
+    return blob.name
+
+
+def _chunk(items, size):
+    """Split an iterable into lists of at most ``size`` items.
+
+    :type items: iterable
+    :param items: The items to split.  Only consumed as chunks are needed.
+
+    :type size: int
+    :param size: The maximum number of items in each chunk.
+
+    :rtype: iterator
+    :returns: Iterator of non-empty lists.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 def _blobs_page_start(iterator, page, response):
@@ -86,6 +132,154 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _item_to_blob_listing(iterator, item):
+    """Convert a JSON blob to a :class:`BlobListing`.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The iterator that has retrieved the item.
+
+    :type item: dict
+    :param item: An item to be converted.
+
+    :rtype: :class:`BlobListing`
+    :returns: The next blob in the page.
+    """
+    size = item.get('size')
+    generation = item.get('generation')
+    return BlobListing(
+        item.get('name'),
+        int(size) if size is not None else None,
+        int(generation) if generation is not None else None)
+
+
+class _ShardedListing(object):
+    """List several shards of a bucket's keyspace concurrently.
+
+    Pages are fetched ahead by a pool of workers, up to ``prefetch_pages``
+    per worker, and their items yielded in the order the pages arrive.
+
+    :type bucket: :class:`Bucket`
+    :param bucket: The bucket to list.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client to use.
+
+    :type extra_params: dict
+    :param extra_params: Query parameters shared by all the shards.
+
+    :type item_to_value: callable
+    :param item_to_value: Converts each JSON item into the value yielded.
+
+    :type max_workers: int
+    :param max_workers: The maximum number of shards listed at once.
+
+    :type prefetch_pages: int
+    :param prefetch_pages: The number of pages fetched ahead per worker.
+    """
+
+    def __init__(self, bucket, client, extra_params, item_to_value,
+                 max_workers, prefetch_pages):
+        self._bucket = bucket
+        self._client = client
+        self._extra_params = extra_params
+        self._item_to_value = item_to_value
+        self._max_workers = max_workers
+        self._queue = queue.Queue(maxsize=max_workers * prefetch_pages)
+        self._stopped = threading.Event()
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _put(self, result):
+        """Queue a result, unless iteration was abandoned.
+
+        :rtype: bool
+        :returns: Whether the result was queued.
+        """
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(result, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _submit(self, params, fan_out=False):
+        """Schedule the listing of a shard."""
+        with self._lock:
+            self._pending += 1
+        self._executor.submit(self._list_shard, params, fan_out)
+
+    def _list_shard(self, params, fan_out):
+        """List one shard, queueing each page of items.
+
+        :type params: dict
+        :param params: Query parameters selecting the shard.
+
+        :type fan_out: bool
+        :param fan_out: Whether to list each prefix found as another shard.
+        """
+        if self._stopped.is_set():
+            # Iteration was abandoned before the shard was started.
+            return
+
+        try:
+            query_params = dict(self._extra_params)
+            query_params.update(params)
+            iterator = page_iterator.HTTPIterator(
+                client=self._client,
+                api_request=self._client._connection.api_request,
+                path=self._bucket.path + '/o',
+                item_to_value=self._item_to_value,
+                extra_params=query_params,
+                page_start=_blobs_page_start)
+            iterator.bucket = self._bucket
+            iterator.prefixes = set()
+            for page in iterator.pages:
+                if fan_out:
+                    for prefix in page.prefixes:
+                        if not self._stopped.is_set():
+                            self._submit({'prefix': prefix})
+                if not self._put(list(page)):
+                    return
+        except Exception as exc:
+            self._put(exc)
+        finally:
+            self._put(_SHARD_DONE)
+
+    def iterate(self, shards):
+        """Yield the items of all the shards.
+
+        :type shards: list
+        :param shards: ``(params, fan_out)`` pairs for :meth:`_list_shard`.
+
+        :rtype: iterator
+        :returns: Items from all the shards, in no particular order.
+        """
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers)
+        try:
+            for params, fan_out in shards:
+                self._submit(params, fan_out)
+
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        break
+                result = self._queue.get()
+                if result is _SHARD_DONE:
+                    with self._lock:
+                        self._pending -= 1
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    for item in result:
+                        yield item
+        finally:
+            self._stopped.set()
+            self._executor.shutdown(wait=False)
+
+
 def _item_to_notification(iterator, item):
     """Convert a JSON blob to the native object.
 
@@ -292,6 +486,12 @@ class Bucket(_PropertyMixin):
     This is used in Bucket.delete() and Bucket.make_public().
     """
 
+    _MAX_DELETES_PER_BATCH = 100
+    """Maximum number of deletes sent in a single batch request.
+
+    This is used in Bucket.delete_blobs().
+    """
+
     _STORAGE_CLASSES = (
         'MULTI_REGIONAL',
         'REGIONAL',
@@ -572,6 +772,11 @@ class Bucket(_PropertyMixin):
             query_params['userProject'] = self.user_project
         blob = Blob(bucket=self, name=blob_name, encryption_key=encryption_key,
                     **kwargs)
+        cached = blob._get_cached_properties(client)
+        if cached is not None:
+            blob._set_properties(cached)
+            return blob
+
         try:
             headers = _get_encryption_headers(encryption_key)
             response = client._connection.api_request(
@@ -583,11 +788,13 @@ class Bucket(_PropertyMixin):
             )
             # NOTE: We assume response.get('name') matches `blob_name`.
             blob._set_properties(response)
+            blob._cache_properties(client)
             # NOTE: This will not fail immediately in a batch. However, when
             #       Batch.finish() is called, the resulting `NotFound` will be
             #       raised.
             return blob
         except NotFound:
+            blob._uncache_properties(client)
             return None
 
     def list_blobs(self, max_results=None, page_token=None, prefix=None,
@@ -668,6 +875,116 @@ class Bucket(_PropertyMixin):
         iterator.prefixes = set()
         return iterator
 
+    def list_blobs_parallel(self, shards=None, prefix=None, delimiter='/',
+                            versions=None, projection='noAcl', fields=None,
+                            lightweight=False,
+                            max_workers=_DEFAULT_LIST_WORKERS,
+                            prefetch_pages=2, client=None):
+        """Find blobs in the bucket by listing shards of it concurrently.
+
+        Unlike :meth:`list_blobs`, blobs are not yielded in name order.
+
+        If ``shards`` is not passed, the bucket is first listed with
+        ``delimiter``, as with :meth:`list_blobs`, and each prefix found is
+        then listed as a separate shard.  This suits buckets whose blobs are
+        spread across many "directories".  Otherwise, each shard is either a
+        string, which is appended to ``prefix``, or a ``(start, end)`` pair
+        of blob names, which lists the blobs from ``start`` (inclusive) to
+        ``end`` (exclusive) whose names start with ``prefix``.  Either end of
+        a range may be ``None``.  Shards should not overlap.
+
+        If :attr:`user_project` is set, bills the API requests to that
+        project.
+
+        :type shards: list
+        :param shards: (Optional) The shards to list concurrently.
+
+        :type prefix: str
+        :param prefix: (Optional) prefix used to filter blobs.
+
+        :type delimiter: str
+        :param delimiter: (Optional) Delimiter used to find shards when
+                          ``shards`` is not passed.  Defaults to ``'/'``.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate blobs.
+
+        :type projection: str
+        :param projection: (Optional) If used, must be 'full' or 'noAcl'.
+                           Defaults to ``'noAcl'``. Specifies the set of
+                           properties to return.
+
+        :type fields: str
+        :param fields: (Optional) Selector specifying which fields to include
+                       in a partial response.  It must include
+                       ``nextPageToken`` and, if ``shards`` is not passed,
+                       ``prefixes``.
+
+        :type lightweight: bool
+        :param lightweight: (Optional) If true, yield :class:`BlobListing`
+                            tuples rather than blobs.  Unless ``fields`` is
+                            passed, only the fields they need are requested.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of shards listed at
+                            once.
+
+        :type prefetch_pages: int
+        :param prefetch_pages: (Optional) The number of pages fetched ahead of
+                               the caller for each worker.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: iterator
+        :returns: Iterator of :class:`~google.cloud.storage.blob.Blob`, or of
+                  :class:`BlobListing` if ``lightweight`` is true.
+        """
+        extra_params = {'projection': projection}
+
+        if versions is not None:
+            extra_params['versions'] = versions
+
+        if fields is None and lightweight:
+            fields = _LIGHTWEIGHT_LIST_FIELDS
+
+        if fields is not None:
+            extra_params['fields'] = fields
+
+        if self.user_project is not None:
+            extra_params['userProject'] = self.user_project
+
+        prefix = prefix or ''
+        if shards is None:
+            shard_params = [({'delimiter': delimiter}, True)]
+            if prefix:
+                shard_params[0][0]['prefix'] = prefix
+        else:
+            shard_params = []
+            for shard in shards:
+                params = {}
+                if isinstance(shard, six.string_types):
+                    shard_prefix = prefix + shard
+                else:
+                    shard_prefix = prefix
+                    start, end = shard
+                    if start is not None:
+                        params['startOffset'] = start
+                    if end is not None:
+                        params['endOffset'] = end
+                if shard_prefix:
+                    params['prefix'] = shard_prefix
+                shard_params.append((params, False))
+
+        client = self._require_client(client)
+        listing = _ShardedListing(
+            self, client, extra_params,
+            _item_to_blob_listing if lightweight else _item_to_blob,
+            max_workers, prefetch_pages)
+        return listing.iterate(shard_params)
+
     def list_notifications(self, client=None):
         """List Pub / Sub notifications for this bucket.
 
@@ -694,22 +1011,25 @@ class Bucket(_PropertyMixin):
         iterator.bucket = self
         return iterator
 
-    def delete(self, force=False, client=None):
+    def delete(self, force=False, client=None, max_objects=None):
         """Delete this bucket.
 
         The bucket **must** be empty in order to submit a delete request. If
         ``force=True`` is passed, this will first attempt to delete all the
-        objects / blobs in the bucket (i.e. try to empty the bucket).
+        objects / blobs in the bucket (i.e. try to empty the bucket), using
+        concurrent batch requests (see :meth:`delete_blobs`).
 
         If the bucket doesn't exist, this will raise
         :class:`google.cloud.exceptions.NotFound`.  If the bucket is not empty
         (and ``force=False``), will raise
         :class:`google.cloud.exceptions.Conflict`.
 
-        If ``force=True`` and the bucket contains more than 256 objects / blobs
-        this will cowardly refuse to delete the objects (or the bucket). This
-        is to prevent accidental bucket deletion and to prevent extremely long
-        runtime of this method.
+        If ``force=True`` and the bucket contains more than ``max_objects``
+        objects / blobs (256 by default) this will cowardly refuse to delete
+        the objects (or the bucket). This is to prevent accidental bucket
+        deletion. Since the objects are deleted concurrently, a larger
+        ``max_objects`` can be passed to empty large buckets; their names are
+        listed before any is deleted.
 
         If :attr:`user_project` is set, bills the API request to that project.
 
@@ -721,8 +1041,12 @@ class Bucket(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_objects: int
+        :param max_objects: Optional. The most objects / blobs which ``force``
+                            deletes. Defaults to 256.
+
         :raises: :class:`ValueError` if ``force`` is ``True`` and the bucket
-                 contains more than 256 objects / blobs.
+                 contains more than ``max_objects`` objects / blobs.
         """
         client = self._require_client(client)
         query_params = {}
@@ -731,16 +1055,18 @@ class Bucket(_PropertyMixin):
             query_params['userProject'] = self.user_project
 
         if force:
+            if max_objects is None:
+                max_objects = self._MAX_OBJECTS_FOR_ITERATION
             blobs = list(self.list_blobs(
-                max_results=self._MAX_OBJECTS_FOR_ITERATION + 1,
-                client=client))
-            if len(blobs) > self._MAX_OBJECTS_FOR_ITERATION:
+                max_results=max_objects + 1, client=client))
+            if len(blobs) > max_objects:
                 message = (
                     'Refusing to delete bucket with more than '
                     '%d objects. If you actually want to delete '
-                    'this bucket, please delete the objects '
-                    'yourself before calling Bucket.delete().'
-                ) % (self._MAX_OBJECTS_FOR_ITERATION,)
+                    'this bucket, pass a larger max_objects, or '
+                    'delete the objects yourself before calling '
+                    'Bucket.delete().'
+                ) % (max_objects,)
                 raise ValueError(message)
 
             # Ignore 404 errors on delete.
@@ -793,6 +1119,10 @@ class Bucket(_PropertyMixin):
         if self.user_project is not None:
             query_params['userProject'] = self.user_project
 
+        cache = _get_metadata_cache(client)
+        if cache is not None:
+            cache.invalidate(self.name, blob_name)
+
         blob_path = Blob.path_helper(self.path, blob_name)
         # We intentionally pass `_target_object=None` since a DELETE
         # request has no response value (whether in a standard request or
@@ -803,10 +1133,18 @@ class Bucket(_PropertyMixin):
             query_params=query_params,
             _target_object=None)
 
-    def delete_blobs(self, blobs, on_error=None, client=None):
+    def delete_blobs(self, blobs, on_error=None, client=None,
+                     max_workers=_DEFAULT_DELETE_WORKERS, on_progress=None):
         """Deletes a list of blobs from the current bucket.
 
-        Uses :meth:`delete_blob` to delete each individual blob.
+        The deletes are grouped into batch requests of up to
+        ``_MAX_DELETES_PER_BATCH`` blobs each, and up to ``max_workers``
+        batch requests are sent concurrently.  ``blobs`` is consumed
+        lazily, so it may be a (long) iterator such as the result of
+        :meth:`list_blobs`.
+
+        If called while a batch is active on the client, the deletes are
+        instead added to that batch using :meth:`delete_blob`.
 
         If :attr:`user_project` is set, bills the API request to that project.
 
@@ -824,20 +1162,116 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of batch requests
+                            in flight at once.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Takes single argument: the number of
+                            blobs processed so far (deleted, or passed to
+                            ``on_error``).  Called after each batch request
+                            completes.
+
         :raises: :class:`~google.cloud.exceptions.NotFound` (if
-                 `on_error` is not passed).
+                 `on_error` is not passed), or the error for the first
+                 other failed delete.
         """
-        for blob in blobs:
+        client = self._require_client(client)
+
+        if client.current_batch is not None:
+            for blob in blobs:
+                try:
+                    self.delete_blob(_blob_name(blob), client=client)
+                except NotFound:
+                    if on_error is not None:
+                        on_error(blob)
+                    else:
+                        raise
+            return
+
+        processed = 0
+        chunks = _chunk(blobs, self._MAX_DELETES_PER_BATCH)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            pending = collections.deque()
             try:
-                blob_name = blob
-                if not isinstance(blob_name, six.string_types):
-                    blob_name = blob.name
-                self.delete_blob(blob_name, client=client)
-            except NotFound:
-                if on_error is not None:
-                    on_error(blob)
-                else:
-                    raise
+                for chunk in chunks:
+                    pending.append(
+                        executor.submit(self._delete_batch, chunk, client))
+                    # Keep one more batch queued than there are workers, so
+                    # that none of them is idle while results are handled.
+                    while len(pending) > max_workers:
+                        processed = self._finish_delete_batch(
+                            pending.popleft().result(), processed,
+                            on_error, on_progress)
+
+                while pending:
+                    processed = self._finish_delete_batch(
+                        pending.popleft().result(), processed,
+                        on_error, on_progress)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _delete_batch(self, blobs, client):
+        """Delete blobs using a single batch request.
+
+        :type blobs: list
+        :param blobs: Blobs or blob names to delete.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :rtype: list
+        :returns: ``(blob, response)`` pairs, one for each blob.
+        """
+        query_params = {}
+
+        if self.user_project is not None:
+            query_params['userProject'] = self.user_project
+
+        # The batch is used directly, rather than as a context manager, so
+        # that it does not become the current batch of the client.
+        cache = _get_metadata_cache(client)
+        batch = client.batch(raise_exception=False)
+        for blob in blobs:
+            if cache is not None:
+                cache.invalidate(self.name, _blob_name(blob))
+            batch.api_request(
+                method='DELETE',
+                path=Blob.path_helper(self.path, _blob_name(blob)),
+                query_params=query_params,
+                _target_object=None)
+        return list(zip(blobs, batch.finish()))
+
+    @staticmethod
+    def _finish_delete_batch(results, processed, on_error, on_progress):
+        """Handle the responses to a batch of deletes.
+
+        :type results: list
+        :param results: ``(blob, response)`` pairs from :meth:`_delete_batch`.
+
+        :type processed: int
+        :param processed: The number of blobs processed in earlier batches.
+
+        :type on_error: callable
+        :param on_error: (Optional) Called for each blob which was not found.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Called with the updated count.
+
+        :rtype: int
+        :returns: The number of blobs processed, including this batch.
+        """
+        for blob, response in results:
+            if response.status_code == 404 and on_error is not None:
+                on_error(blob)
+            elif not 200 <= response.status_code < 300:
+                raise exceptions.from_http_response(response)
+
+        processed += len(results)
+        if on_progress is not None:
+            on_progress(processed)
+        return processed
 
     def copy_blob(self, blob, destination_bucket, new_name=None,
                   client=None, preserve_acl=True, source_generation=None):
@@ -896,6 +1330,7 @@ class Bucket(_PropertyMixin):
             new_blob.acl.save(acl={}, client=client)
 
         new_blob._set_properties(copy_result)
+        new_blob._cache_properties(client)
         return new_blob
 
     def rename_blob(self, blob, new_name, client=None):
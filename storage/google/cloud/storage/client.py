@@ -51,6 +51,11 @@ class Client(ClientWithProject):
                   ``credentials`` for the current object.
                   This parameter should be considered private, and could
                   change in the future.
+
+    :type metadata_cache:
+        :class:`~google.cloud.storage.metadata_cache.MetadataCache`
+    :param metadata_cache: (Optional) Cache of blob metadata used to answer
+                           lookups without a request.  Not used by default.
     """
 
     SCOPE = ('https://www.googleapis.com/auth/devstorage.full_control',
@@ -58,7 +63,8 @@ class Client(ClientWithProject):
              'https://www.googleapis.com/auth/devstorage.read_write')
     """The scopes required for authenticating as a Cloud Storage consumer."""
 
-    def __init__(self, project=_marker, credentials=None, _http=None):
+    def __init__(self, project=_marker, credentials=None, _http=None,
+                 metadata_cache=None):
         self._base_connection = None
         if project is None:
             no_project = True
@@ -73,6 +79,7 @@ class Client(ClientWithProject):
             self.project = None
         self._connection = Connection(self)
         self._batch_stack = _LocalStack()
+        self.metadata_cache = metadata_cache
 
     @classmethod
     def create_anonymous_client(cls):
@@ -188,17 +195,23 @@ class Client(ClientWithProject):
         """
         return Bucket(client=self, name=bucket_name, user_project=user_project)
 
-    def batch(self):
+    def batch(self, raise_exception=True):
         """Factory constructor for batch object.
 
         .. note::
           This will not make an HTTP request; it simply instantiates
           a batch object owned by this client.
 
+        :type raise_exception: bool
+        :param raise_exception:
+            (Optional) If False, the batch does not raise an exception for
+            failed requests when finished; see
+            :class:`~google.cloud.storage.batch.Batch`.
+
         :rtype: :class:`google.cloud.storage.batch.Batch`
         :returns: The batch object created.
         """
-        return Batch(client=self)
+        return Batch(client=self, raise_exception=raise_exception)
 
     def get_bucket(self, bucket_name):
         """Get a bucket by name.
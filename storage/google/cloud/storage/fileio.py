@@ -0,0 +1,501 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-like objects for streaming the contents of blobs.
+
+Usually created with :meth:`~google.cloud.storage.blob.Blob.open`.
+"""
+
+import concurrent.futures
+import io
+import os
+import threading
+
+from google import resumable_media
+from google.resumable_media.requests import ChunkedDownload
+
+from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.blob import _raise_from_invalid_response
+
+
+DEFAULT_CHUNK_SIZE = 40 * 1024 * 1024  # 40 MB
+"""Default number of bytes read or sent with each request."""
+
+_CLOSED_MESSAGE = 'I/O operation on closed file.'
+
+
+def _result(function, *args):
+    """Call ``function``, re-raising errors from ``google-resumable-media``.
+
+    ``function`` may also be the ``result`` method of a future.
+    """
+    try:
+        return function(*args)
+    except resumable_media.InvalidResponse as exc:
+        _raise_from_invalid_response(exc)
+
+
+class BlobReader(io.BufferedIOBase):
+    """A seekable, readable file-like object for the contents of a blob.
+
+    The blob is read in ranges of ``chunk_size`` bytes, each with its own
+    request, so only about two chunks are held in memory at once.  While a
+    chunk is being consumed, the next one is downloaded in the background.
+
+    Reads come from the generation of the blob current when the first read
+    is made, even if the blob is overwritten later.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to read.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes to download with each
+                       request.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type read_ahead: bool
+    :param read_ahead: (Optional) If True (the default), download the chunk
+                       following the one being read in the background.
+    """
+
+    def __init__(self, blob, chunk_size=DEFAULT_CHUNK_SIZE, client=None,
+                 read_ahead=True):
+        super(BlobReader, self).__init__()
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._read_ahead = read_ahead
+        self._transport = None
+        self._buffer = b''
+        self._buffer_start = 0
+        self._position = 0
+        self._prefetch = None
+        self._executor = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    @property
+    def size(self):
+        """The size of the blob, loading its metadata if needed.
+
+        :rtype: int
+        :returns: The size of the blob, in bytes.
+        """
+        if self._blob.size is None or self._blob.generation is None:
+            self._blob.reload(client=self._client)
+        return self._blob.size
+
+    def _fetch(self, start):
+        """Download the chunk starting at ``start``.
+
+        :type start: int
+        :param start: The position of the first byte of the chunk.
+
+        :rtype: bytes
+        :returns: The contents of the chunk.
+        """
+        end = min(start + self._chunk_size, self.size) - 1
+        stream = io.BytesIO()
+        download = ChunkedDownload(
+            self._blob._get_download_url(), end - start + 1, stream,
+            headers=_get_encryption_headers(self._blob._encryption_key),
+            start=start, end=end)
+        download.consume_next_chunk(self._transport)
+        return stream.getvalue()
+
+    def _cancel_prefetch(self):
+        if self._prefetch is not None:
+            self._prefetch[1].cancel()
+            self._prefetch = None
+
+    def _next_chunk(self, start):
+        """Get the chunk starting at ``start``, and prefetch the next one.
+
+        :type start: int
+        :param start: The position of the first byte of the chunk.
+
+        :rtype: bytes
+        :returns: The contents of the chunk.
+        """
+        if self._transport is None:
+            self._transport = self._blob._get_transport(self._client)
+
+        if self._prefetch is not None and self._prefetch[0] == start:
+            future = self._prefetch[1]
+            self._prefetch = None
+            chunk = _result(future.result)
+        else:
+            self._cancel_prefetch()
+            chunk = _result(self._fetch, start)
+
+        following = start + len(chunk)
+        if self._read_ahead and following < self.size:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(1)
+            self._prefetch = (
+                following, self._executor.submit(self._fetch, following))
+        return chunk
+
+    def _fill_buffer(self):
+        """Make sure the buffer holds the byte at the current position.
+
+        :rtype: int
+        :returns: The offset of the current position in the buffer.
+        """
+        offset = self._position - self._buffer_start
+        if not 0 <= offset < len(self._buffer):
+            self._buffer = self._next_chunk(self._position)
+            self._buffer_start = self._position
+            offset = 0
+        return offset
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes from the blob.
+
+        :type size: int
+        :param size: (Optional) The number of bytes to read.  If negative or
+                     not passed, read to the end of the blob.
+
+        :rtype: bytes
+        :returns: The data read; empty at the end of the blob.
+        """
+        if self.closed:
+            raise ValueError(_CLOSED_MESSAGE)
+        if size is None or size < 0:
+            size = self.size - self._position
+
+        pieces = []
+        while size > 0 and self._position < self.size:
+            offset = self._fill_buffer()
+            piece = self._buffer[offset:offset + size]
+            pieces.append(piece)
+            self._position += len(piece)
+            size -= len(piece)
+        return b''.join(pieces)
+
+    def read1(self, size=-1):
+        """Read up to ``size`` bytes, making at most one request.
+
+        :type size: int
+        :param size: (Optional) The number of bytes to read.  If negative or
+                     not passed, read to the end of the current chunk.
+
+        :rtype: bytes
+        :returns: The data read; empty at the end of the blob.
+        """
+        if self.closed:
+            raise ValueError(_CLOSED_MESSAGE)
+        if size == 0 or self._position >= self.size:
+            return b''
+
+        offset = self._fill_buffer()
+        if size is None or size < 0:
+            size = len(self._buffer)
+        piece = self._buffer[offset:offset + size]
+        self._position += len(piece)
+        return piece
+
+    def peek(self, size=0):
+        """Return buffered bytes from the current position, without moving.
+
+        :type size: int
+        :param size: (Optional) Ignored; at least one byte is returned, unless
+                     at the end of the blob.
+
+        :rtype: bytes
+        :returns: The rest of the current chunk.
+        """
+        if self.closed:
+            raise ValueError(_CLOSED_MESSAGE)
+        if self._position >= self.size:
+            return b''
+        offset = self._fill_buffer()
+        return self._buffer[offset:]
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the position from which the blob is read.
+
+        Seeking within the current chunk does not make a request.
+
+        :type offset: int
+        :param offset: The new position, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) One of :data:`os.SEEK_SET` (the default),
+                       :data:`os.SEEK_CUR` or :data:`os.SEEK_END`.
+
+        :rtype: int
+        :returns: The new position.
+
+        :raises: :exc:`ValueError` if the new position would be negative.
+        """
+        if self.closed:
+            raise ValueError(_CLOSED_MESSAGE)
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        elif whence != os.SEEK_SET:
+            raise ValueError('Invalid whence: {}'.format(whence))
+        if offset < 0:
+            raise ValueError('Negative seek position {}'.format(offset))
+
+        self._position = offset
+        return offset
+
+    def close(self):
+        if not self.closed:
+            self._cancel_prefetch()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._buffer = b''
+        super(BlobReader, self).close()
+
+
+class _SlidingBuffer(object):
+    """Stream of the data written, holding only data not yet uploaded.
+
+    It is written to by a :class:`BlobWriter` while being read by a
+    resumable upload in another thread.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def write(self, data):
+        with self._lock:
+            self._buffer.extend(data)
+
+    def read(self, size=-1):
+        with self._lock:
+            offset = self._position - self._buffer_start
+            if size is None or size < 0:
+                data = bytes(self._buffer[offset:])
+            else:
+                data = bytes(self._buffer[offset:offset + size])
+            self._position += len(data)
+            return data
+
+    def tell(self):
+        return self._position
+
+    def seek(self, position, whence=os.SEEK_SET):
+        """Move to a position which has not been discarded yet."""
+        if whence != os.SEEK_SET:
+            raise ValueError('Only os.SEEK_SET is supported.')
+        with self._lock:
+            end = self._buffer_start + len(self._buffer)
+            if not self._buffer_start <= position <= end:
+                raise ValueError(
+                    'Cannot seek to {}: only positions {} to {} are '
+                    'buffered.'.format(position, self._buffer_start, end))
+            self._position = position
+        return position
+
+    @property
+    def unread(self):
+        """The number of bytes after the current position."""
+        with self._lock:
+            return len(self._buffer) - (self._position - self._buffer_start)
+
+    def discard(self, position):
+        """Discard the data before ``position``, which is uploaded."""
+        with self._lock:
+            del self._buffer[:position - self._buffer_start]
+            self._buffer_start = position
+
+
+class BlobWriter(io.BufferedIOBase):
+    """A writable file-like object which uploads to a blob.
+
+    Data is sent in chunks of ``chunk_size`` bytes with a resumable upload,
+    each chunk in the background while the next one is written, so only
+    about two chunks are held in memory at once.  If less than one chunk is
+    written in total, it is sent with a single request when the writer is
+    closed instead.
+
+    The blob is only created (or replaced) when the writer is closed.  If
+    the writer is used as a context manager and its block raises an
+    exception, the upload is abandoned.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to write.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes to send with each
+                       request.  Must be a multiple of 256 KB.  Defaults to
+                       the ``chunk_size`` of the blob, if set.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type content_type: str
+    :param content_type: (Optional) Type of content being uploaded.
+
+    :type predefined_acl: str
+    :param predefined_acl: (Optional) predefined access control list
+
+    :raises: :exc:`ValueError` if ``chunk_size`` is not a multiple of 256 KB.
+    """
+
+    def __init__(self, blob, chunk_size=None, client=None, content_type=None,
+                 predefined_acl=None):
+        super(BlobWriter, self).__init__()
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or DEFAULT_CHUNK_SIZE
+        if chunk_size % blob._CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError(
+                'Chunk size must be a multiple of %d.' % (
+                    blob._CHUNK_SIZE_MULTIPLE,))
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._content_type = content_type
+        self._predefined_acl = predefined_acl
+        self._buffer = _SlidingBuffer()
+        self._written = 0
+        self._upload = None
+        self._transport = None
+        self._pending = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(1)
+
+    def writable(self):
+        return True
+
+    def _transmit(self, transmit_all=False):
+        """Send the buffered data, starting the upload if needed.
+
+        :type transmit_all: bool
+        :param transmit_all: If True, send everything and finish the upload.
+                             Otherwise, only send whole chunks.
+
+        :rtype: :class:`requests.Response`
+        :returns: The response to the last request sent.
+        """
+        if self._upload is None:
+            self._upload, self._transport = (
+                self._blob._initiate_resumable_upload(
+                    self._client, self._buffer, self._content_type, None,
+                    None, predefined_acl=self._predefined_acl,
+                    chunk_size=self._chunk_size))
+
+        upload = self._upload
+        response = None
+        while not upload.finished and (
+                transmit_all or self._buffer.unread >= self._chunk_size):
+            # The service may not have kept all of the last chunk.
+            if upload.bytes_uploaded != self._buffer.tell():
+                self._buffer.seek(upload.bytes_uploaded)
+            response = upload.transmit_next_chunk(self._transport)
+            self._buffer.discard(upload.bytes_uploaded)
+        return response
+
+    def _wait(self):
+        """Wait for chunks being sent, raising any error sending them."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            _result(pending.result)
+
+    def write(self, data):
+        """Write data, sending each whole chunk in the background.
+
+        If a chunk is still being sent once the next one is complete, waits
+        for it to be sent.
+
+        :type data: bytes
+        :param data: The data to write.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        if self.closed:
+            raise ValueError(_CLOSED_MESSAGE)
+        self._buffer.write(data)
+        self._written += len(data)
+        if self._buffer.unread >= self._chunk_size:
+            self._wait()
+            self._pending = self._executor.submit(self._transmit)
+        return len(data)
+
+    def tell(self):
+        return self._written
+
+    def close(self):
+        """Send the remaining data, creating the blob.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError` if the
+                 upload fails.
+        """
+        if self.closed:
+            return
+        try:
+            self._wait()
+            if self._upload is None:
+                self._blob.upload_from_file(
+                    self._buffer, size=self._buffer.unread,
+                    content_type=self._content_type, client=self._client,
+                    predefined_acl=self._predefined_acl)
+            else:
+                response = _result(self._transmit, True)
+                self._blob._set_properties(response.json())
+        finally:
+            self._abandon()
+
+    def _abandon(self):
+        """Close without sending anything more."""
+        self._executor.shutdown(wait=True)
+        self._pending = None
+        self._buffer = None
+        super(BlobWriter, self).close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif not self.closed:
+            self._abandon()
+
+
+class BlobTextWrapper(io.TextIOWrapper):
+    """A text file-like object for reading or writing a blob.
+
+    Like :class:`BlobWriter`, if used as a context manager and its block
+    raises an exception, the upload is abandoned rather than finished with
+    the data written so far.
+
+    :type buffer: :class:`BlobReader` or :class:`BlobWriter`
+    :param buffer: The binary file-like object of the blob.
+
+    Other arguments are as for :class:`io.TextIOWrapper`.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and not self.closed:
+            # Buffered text is not flushed into an abandoned upload.
+            self.buffer.__exit__(exc_type, exc_value, traceback)
+        return super(BlobTextWrapper, self).__exit__(
+            exc_type, exc_value, traceback)
@@ -0,0 +1,172 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local cache of blob metadata, shared by the users of a client.
+
+Pass a :class:`MetadataCache` to
+:class:`~google.cloud.storage.client.Client` to have
+:meth:`~google.cloud.storage.bucket.Bucket.get_blob`,
+:meth:`~google.cloud.storage.blob.Blob.reload` and
+:meth:`~google.cloud.storage.blob.Blob.exists` answer from the cache while
+its entries are fresh:
+
+.. code-block:: python
+
+   from google.cloud import storage
+   from google.cloud.storage.metadata_cache import MetadataCache
+
+   client = storage.Client(metadata_cache=MetadataCache(ttl=30))
+
+Writes made through the same client (uploads, patches, deletes, rewrites,
+copies and ACL changes) update or invalidate the cache, but changes made by
+anything else are only seen once the entry expires.
+"""
+
+import collections
+import copy
+import threading
+import time
+
+
+def _version(properties):
+    """Get the ``(generation, metageneration)`` of blob properties."""
+    return (int(properties.get('generation') or 0),
+            int(properties.get('metageneration') or 0))
+
+
+class MetadataCache(object):
+    """Least recently used cache of blob properties, with expiry.
+
+    Safe to use from several threads at once.
+
+    :type max_size: int
+    :param max_size: (Optional) The maximum number of blobs to cache.  The
+                     least recently used blob is evicted beyond that.
+
+    :type ttl: float
+    :param ttl: (Optional) The number of seconds for which an entry is used
+                after it is stored.
+    """
+
+    def __init__(self, max_size=1024, ttl=60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        """The number of lookups answered from the cache."""
+        self.misses = 0
+        """The number of lookups not answered from the cache."""
+        self.evictions = 0
+        """The number of entries evicted to stay within ``max_size``."""
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, bucket_name, blob_name, min_generation=None,
+            min_metageneration=None):
+        """Look up the properties of a blob.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the blob's bucket.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob.
+
+        :type min_generation: int
+        :param min_generation: (Optional) Ignore an entry for an older
+                               generation of the blob than this.
+
+        :type min_metageneration: int
+        :param min_metageneration: (Optional) Ignore an entry for an older
+                                   metageneration of ``min_generation``.
+
+        :rtype: dict
+        :returns: A copy of the cached properties, or ``None`` if there is
+                  no fresh entry.
+        """
+        key = (bucket_name, blob_name)
+        minimum = (min_generation or 0, min_metageneration or 0)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires, properties = entry
+            if expires <= time.time():
+                self.misses += 1
+                return None
+
+            # Re-insert the entry to mark it as most recently used.
+            self._entries[key] = entry
+            if _version(properties) < minimum:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return copy.deepcopy(properties)
+
+    def put(self, bucket_name, blob_name, properties):
+        """Store the properties of a blob.
+
+        If the cache holds a newer version of the blob, it is kept.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the blob's bucket.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob.
+
+        :type properties: dict
+        :param properties: The properties, as returned by the API.  Anything
+                           else, such as the placeholder of a request
+                           deferred in a batch, invalidates the entry.
+        """
+        if not isinstance(properties, dict):
+            self.invalidate(bucket_name, blob_name)
+            return
+
+        key = (bucket_name, blob_name)
+        properties = copy.deepcopy(properties)
+        # Access controls are only returned by some requests.
+        properties.pop('acl', None)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if (entry is not None and entry[0] > time.time() and
+                    _version(entry[1]) > _version(properties)):
+                self._entries[key] = entry
+                return
+
+            self._entries[key] = (time.time() + self.ttl, properties)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, bucket_name, blob_name):
+        """Remove the entry for a blob, if any.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the blob's bucket.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob.
+        """
+        with self._lock:
+            self._entries.pop((bucket_name, blob_name), None)
+
+    def clear(self):
+        """Remove all entries, leaving the counters unchanged."""
+        with self._lock:
+            self._entries.clear()
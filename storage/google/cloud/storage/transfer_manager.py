@@ -0,0 +1,738 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Upload, download and rewrite many blobs concurrently.
+
+The functions in this module run one transfer per blob on a pool of
+threads, all sharing the HTTP session (and so the connection pool) of a
+single :class:`~google.cloud.storage.client.Client`.  Each file is uploaded
+with a multipart request, a resumable upload or, if it is larger than
+``slice_size``, a parallel composite upload; each blob is downloaded with a
+single request or, if it is larger than ``slice_size``, in concurrent
+ranges.
+
+For example, to copy a directory tree into a bucket:
+
+.. code-block:: python
+
+   from google.cloud import storage
+   from google.cloud.storage import transfer_manager
+
+   client = storage.Client()
+   bucket = client.bucket('my-bucket')
+   summary = transfer_manager.upload_directory(
+       bucket, 'data/', blob_name_prefix='backups/data/')
+   print('%d bytes/s' % summary.throughput)
+
+All requests are made through ``client._http``, so the transfers can be
+benchmarked against a local fake server by creating the client with an
+``_http`` session whose adapters forward to that server.
+
+Blobs can also be copied or moved between buckets, locations and storage
+classes without passing through the client, by running many
+:meth:`~google.cloud.storage.blob.Blob.rewrite` loops at once with
+:func:`rewrite_many`.  Progress can be saved to a
+:class:`RewriteCheckpoint`, so that an interrupted migration resumes where
+it stopped:
+
+.. code-block:: python
+
+   checkpoint = transfer_manager.RewriteCheckpoint('migration.jsonl')
+   pairs = [
+       (blob, archive.blob(blob.name))
+       for blob in bucket.list_blobs(prefix='logs/')
+   ]
+   summary = transfer_manager.rewrite_many(pairs, checkpoint=checkpoint)
+"""
+
+import concurrent.futures
+import functools
+import json
+import os
+import threading
+import time
+
+from google.cloud import exceptions
+from google.cloud.storage.blob import _MAX_MULTIPART_SIZE
+from google.cloud.storage.blob import _DEFAULT_SLICE_WORKERS
+from google.cloud.storage.blob import _ensure_connection_pool
+
+
+DEFAULT_MAX_WORKERS = 8
+"""Default number of blobs transferred at once."""
+
+MULTIPART = 'multipart'
+"""Method for a file uploaded with a single multipart request."""
+
+RESUMABLE = 'resumable'
+"""Method for a file uploaded with a resumable upload."""
+
+SIMPLE = 'simple'
+"""Method for a blob downloaded with a single request."""
+
+SLICED = 'sliced'
+"""Method for a blob transferred as concurrent slices."""
+
+REWRITE = 'rewrite'
+"""Method for a blob copied with :meth:`Blob.rewrite`."""
+
+
+class TransferResult(object):
+    """The outcome of transferring one blob.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob uploaded, downloaded or rewritten.
+
+    :type filename: str
+    :param filename: The local file uploaded or downloaded, or ``None`` for
+                     a rewrite.
+
+    :type method: str
+    :param method: How the blob was transferred: one of :data:`MULTIPART`,
+                   :data:`RESUMABLE`, :data:`SIMPLE`, :data:`SLICED` or
+                   :data:`REWRITE`, or ``None`` if the transfer failed
+                   before it was chosen.
+
+    :type size: int
+    :param size: The number of bytes transferred.
+
+    :type elapsed: float
+    :param elapsed: The time taken by the transfer, in seconds.
+
+    :type error: Exception
+    :param error: (Optional) The exception raised by the transfer, if it
+                  failed.
+
+    :type source: :class:`~google.cloud.storage.blob.Blob`
+    :param source: (Optional) The blob rewritten into ``blob``.
+    """
+
+    def __init__(self, blob, filename, method, size, elapsed, error=None,
+                 source=None):
+        self.blob = blob
+        self.filename = filename
+        self.method = method
+        self.size = size
+        self.elapsed = elapsed
+        self.error = error
+        self.source = source
+
+
+class TransferSummary(object):
+    """The outcome of transferring many blobs.
+
+    :type results: list
+    :param results: A :class:`TransferResult` for each blob, in the order
+                    the blobs were passed.
+
+    :type elapsed: float
+    :param elapsed: The time taken by all the transfers, in seconds.
+    """
+
+    def __init__(self, results, elapsed):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def errors(self):
+        """The results of the transfers which failed.
+
+        :rtype: list
+        :returns: :class:`TransferResult` instances with an ``error``.
+        """
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def bytes_transferred(self):
+        """The total size of the blobs transferred successfully.
+
+        :rtype: int
+        :returns: A number of bytes.
+        """
+        return sum(
+            result.size for result in self.results if result.error is None)
+
+    @property
+    def throughput(self):
+        """The aggregate rate of all the transfers.
+
+        :rtype: float
+        :returns: Bytes transferred per second of elapsed time.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.bytes_transferred / float(self.elapsed)
+
+
+class RewriteCheckpoint(object):
+    """Progress of rewrites, saved to a file after every call.
+
+    Each call appends one line of JSON to the file, so saving does not slow
+    down as more rewrites are tracked.  The file is read when the checkpoint
+    is created, and compacted to the latest line of each rewrite, so that
+    passing the checkpoint of an interrupted :func:`rewrite_many` to a new
+    one continues each unfinished rewrite from its last token, and skips the
+    finished ones.
+
+    :type filename: str
+    :param filename: The file to load and save.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._rewrites = {}
+        if os.path.exists(filename):
+            self._load()
+            self._compact()
+
+    def _load(self):
+        """Read the saved progress, the last line of each rewrite winning."""
+        with open(self.filename) as file_obj:
+            for line in file_obj:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line is cut short if the process stopped
+                    # while writing it.
+                    continue
+                self._rewrites[json.dumps(entry.pop('key'))] = entry
+
+    @staticmethod
+    def _line(key, progress):
+        entry = dict(progress, key=json.loads(key))
+        return json.dumps(entry, sort_keys=True) + '\n'
+
+    @staticmethod
+    def _key(source, destination):
+        """Identify the rewrite of ``source`` into ``destination``."""
+        return json.dumps([source.bucket.name, source.name,
+                           destination.bucket.name, destination.name])
+
+    def get(self, source, destination):
+        """Get the saved progress of a rewrite.
+
+        :type source: :class:`~google.cloud.storage.blob.Blob`
+        :param source: The blob being rewritten.
+
+        :type destination: :class:`~google.cloud.storage.blob.Blob`
+        :param destination: The blob being rewritten into.
+
+        :rtype: dict
+        :returns: The ``rewriteToken`` (``None`` once the rewrite is done),
+                  ``totalBytesRewritten`` and ``objectSize`` of the last
+                  call, or ``None`` if the rewrite was not started.
+        """
+        with self._lock:
+            progress = self._rewrites.get(self._key(source, destination))
+            return dict(progress) if progress is not None else None
+
+    def update(self, source, destination, token, bytes_rewritten,
+               total_bytes):
+        """Save the progress of a rewrite.
+
+        :type source: :class:`~google.cloud.storage.blob.Blob`
+        :param source: The blob being rewritten.
+
+        :type destination: :class:`~google.cloud.storage.blob.Blob`
+        :param destination: The blob being rewritten into.
+
+        :type token: str
+        :param token: The token to continue the rewrite, or ``None`` if it
+                      is done.
+
+        :type bytes_rewritten: int
+        :param bytes_rewritten: The number of bytes rewritten so far.
+
+        :type total_bytes: int
+        :param total_bytes: The size of the blob.
+        """
+        key = self._key(source, destination)
+        progress = {
+            'rewriteToken': token,
+            'totalBytesRewritten': bytes_rewritten,
+            'objectSize': total_bytes,
+        }
+        line = self._line(key, progress)
+        with self._lock:
+            self._rewrites[key] = progress
+            with open(self.filename, 'a') as file_obj:
+                file_obj.write(line)
+
+    def _compact(self):
+        """Replace the file with one line per rewrite."""
+        temporary = self.filename + '.tmp'
+        with open(temporary, 'w') as file_obj:
+            for key, progress in self._rewrites.items():
+                file_obj.write(self._line(key, progress))
+        if os.path.exists(self.filename) and not hasattr(os, 'replace'):
+            # Python 2 cannot rename over an existing file on Windows.
+            os.remove(self.filename)
+        getattr(os, 'replace', os.rename)(temporary, self.filename)
+
+
+def _upload_method(blob, size, slice_size):
+    """Choose how :meth:`Blob.upload_from_filename` uploads a file.
+
+    This mirrors the choices made by
+    :meth:`~google.cloud.storage.blob.Blob.upload_from_filename`.
+    """
+    if (slice_size is not None and size > slice_size and
+            blob._encryption_key is None and blob.kms_key_name is None):
+        return SLICED
+    if blob.chunk_size is None and size <= _MAX_MULTIPART_SIZE:
+        return MULTIPART
+    return RESUMABLE
+
+
+def _download_method(blob, slice_size):
+    """Tell how :meth:`Blob.download_to_filename` downloaded a blob."""
+    if (slice_size is not None and blob.size > slice_size and
+            blob.content_encoding != 'gzip'):
+        return SLICED
+    return SIMPLE
+
+
+def _upload(filename, blob, client, slice_size, slice_workers):
+    """Upload a file, timing the upload.
+
+    :rtype: :class:`TransferResult`
+    :returns: The outcome of the upload.
+    """
+    started = time.time()
+    method = size = None
+    try:
+        size = os.path.getsize(filename)
+        method = _upload_method(blob, size, slice_size)
+        blob.upload_from_filename(
+            filename, client=client, slice_size=slice_size,
+            max_workers=slice_workers)
+    except Exception as exc:
+        return TransferResult(
+            blob, filename, method, size, time.time() - started, error=exc)
+    return TransferResult(blob, filename, method, size, time.time() - started)
+
+
+def _download(blob, filename, client, slice_size, slice_workers):
+    """Download a blob, timing the download.
+
+    :rtype: :class:`TransferResult`
+    :returns: The outcome of the download.
+    """
+    started = time.time()
+    try:
+        blob.download_to_filename(
+            filename, client=client, slice_size=slice_size,
+            max_workers=slice_workers)
+        method = _download_method(blob, slice_size)
+        size = os.path.getsize(filename)
+    except Exception as exc:
+        return TransferResult(
+            blob, filename, None, None, time.time() - started, error=exc)
+    return TransferResult(blob, filename, method, size, time.time() - started)
+
+
+def _rewrite(source, destination, client, max_bytes_per_call, checkpoint):
+    """Rewrite a blob until done, timing the rewrite.
+
+    :rtype: :class:`TransferResult`
+    :returns: The outcome of the rewrite.  Its size only counts the bytes
+              rewritten by this call.
+    """
+    started = time.time()
+    token = None
+    resumed_bytes = 0
+    if checkpoint is not None:
+        progress = checkpoint.get(source, destination)
+        if progress is not None:
+            token = progress['rewriteToken']
+            resumed_bytes = progress['totalBytesRewritten']
+            if token is None:
+                return TransferResult(
+                    destination, None, REWRITE, 0, 0.0, source=source)
+
+    resumed = token is not None
+    try:
+        while True:
+            try:
+                token, rewritten, total = destination.rewrite(
+                    source, token=token, client=client,
+                    max_bytes_per_call=max_bytes_per_call)
+            except exceptions.BadRequest:
+                # A saved token is rejected if the source changed, or if
+                # the rewrite parameters differ: start again.
+                if not resumed:
+                    raise
+                token = None
+                resumed = False
+                resumed_bytes = 0
+                continue
+
+            resumed = False
+
+            if checkpoint is not None:
+                checkpoint.update(source, destination, token, rewritten, total)
+            if token is None:
+                break
+    except Exception as exc:
+        return TransferResult(
+            destination, None, REWRITE, None, time.time() - started,
+            error=exc, source=source)
+    return TransferResult(
+        destination, None, REWRITE, total - resumed_bytes,
+        time.time() - started, source=source)
+
+
+def _connections(max_workers, slice_size, slice_workers):
+    """Count the connections used by concurrent sliced transfers."""
+    if slice_size is None:
+        return max_workers
+    return max_workers * slice_workers
+
+
+def _transfer_many(transfer, pairs, client, max_workers, connections,
+                   raise_exception, on_progress):
+    """Run ``transfer`` for each pair, up to ``max_workers`` at a time.
+
+    :type transfer: callable
+    :param transfer: Called with the two items of each pair.
+
+    :type pairs: list
+    :param pairs: The arguments for each call to ``transfer``.
+
+    :type connections: int
+    :param connections: The number of connections to pool for ``client``.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of the transfers.
+    :raises: The error of the first failed transfer (in the order of
+             ``pairs``), if ``raise_exception`` is True.
+    """
+    if not pairs:
+        return TransferSummary([], 0.0)
+
+    _ensure_connection_pool(client._http, connections)
+
+    started = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(transfer, first, second)
+            for first, second in pairs
+        ]
+        if on_progress is not None:
+            for future in concurrent.futures.as_completed(futures):
+                on_progress(future.result())
+        results = [future.result() for future in futures]
+
+    summary = TransferSummary(results, time.time() - started)
+    errors = summary.errors
+    if raise_exception and errors:
+        raise errors[0].error
+    return summary
+
+
+def upload_many(file_blob_pairs, client=None,
+                max_workers=DEFAULT_MAX_WORKERS, slice_size=None,
+                slice_workers=_DEFAULT_SLICE_WORKERS, raise_exception=False,
+                on_progress=None):
+    """Upload many files concurrently.
+
+    Files no larger than 8 MB are uploaded with a single multipart request,
+    larger ones with a resumable upload, and those larger than
+    ``slice_size`` with a parallel composite upload (see
+    :meth:`~google.cloud.storage.blob.Blob.upload_from_filename`).
+
+    :type file_blob_pairs: iterable
+    :param file_blob_pairs: ``(filename, blob)`` pairs, each naming a local
+                            file and the
+                            :class:`~google.cloud.storage.blob.Blob` to
+                            upload it to.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` of the first blob's bucket.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of files uploaded at once.
+
+    :type slice_size: int
+    :param slice_size: (Optional) Upload files larger than this many bytes
+                       as concurrent slices of this size.
+
+    :type slice_workers: int
+    :param slice_workers: (Optional) The number of slices of each file
+                          uploaded at once.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the error of the first
+                            failed upload once all of them have finished.
+                            Otherwise (the default), failures are only
+                            reported in the returned summary.
+
+    :type on_progress: callable
+    :param on_progress: (Optional) Takes single argument: a
+                        :class:`TransferResult`.  Called as each upload
+                        finishes.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of the uploads, in the order they were passed.
+    """
+    file_blob_pairs = list(file_blob_pairs)
+    if client is None and file_blob_pairs:
+        client = file_blob_pairs[0][1].client
+    upload = functools.partial(
+        _upload, client=client, slice_size=slice_size,
+        slice_workers=slice_workers)
+    return _transfer_many(
+        upload, file_blob_pairs, client, max_workers,
+        _connections(max_workers, slice_size, slice_workers),
+        raise_exception, on_progress)
+
+
+def download_many(blob_file_pairs, client=None,
+                  max_workers=DEFAULT_MAX_WORKERS, slice_size=None,
+                  slice_workers=_DEFAULT_SLICE_WORKERS, raise_exception=False,
+                  on_progress=None):
+    """Download many blobs concurrently.
+
+    Blobs larger than ``slice_size`` are downloaded in concurrent ranges
+    (see :meth:`~google.cloud.storage.blob.Blob.download_to_filename`).
+
+    :type blob_file_pairs: iterable
+    :param blob_file_pairs: ``(blob, filename)`` pairs, each naming a
+                            :class:`~google.cloud.storage.blob.Blob` and
+                            the local file to download it to.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` of the first blob's bucket.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of blobs downloaded at once.
+
+    :type slice_size: int
+    :param slice_size: (Optional) Download blobs larger than this many bytes
+                       as concurrent ranges of this size.
+
+    :type slice_workers: int
+    :param slice_workers: (Optional) The number of ranges of each blob
+                          downloaded at once.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the error of the first
+                            failed download once all of them have finished.
+                            Otherwise (the default), failures are only
+                            reported in the returned summary.
+
+    :type on_progress: callable
+    :param on_progress: (Optional) Takes single argument: a
+                        :class:`TransferResult`.  Called as each download
+                        finishes.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of the downloads, in the order they were passed.
+    """
+    blob_file_pairs = list(blob_file_pairs)
+    if client is None and blob_file_pairs:
+        client = blob_file_pairs[0][0].client
+    download = functools.partial(
+        _download, client=client, slice_size=slice_size,
+        slice_workers=slice_workers)
+    return _transfer_many(
+        download, blob_file_pairs, client, max_workers,
+        _connections(max_workers, slice_size, slice_workers),
+        raise_exception, on_progress)
+
+
+def rewrite_many(source_destination_pairs, client=None,
+                 max_workers=DEFAULT_MAX_WORKERS, max_bytes_per_call=None,
+                 checkpoint=None, raise_exception=False, on_progress=None):
+    """Rewrite many blobs concurrently.
+
+    Each source blob is copied into its destination by calling
+    :meth:`~google.cloud.storage.blob.Blob.rewrite` until it is done.  The
+    properties of the destination blob, such as its ``storage_class`` or
+    ``kms_key_name``, are applied to the copy, so this can be used to move
+    blobs to other buckets, locations and storage classes.
+
+    :type source_destination_pairs: iterable
+    :param source_destination_pairs: ``(source, destination)`` pairs of
+                                     :class:`~google.cloud.storage.blob.Blob`.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` of the first destination's bucket.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of blobs rewritten at once.
+
+    :type max_bytes_per_call: int
+    :param max_bytes_per_call: (Optional) The maximum number of bytes
+                               rewritten by each call, a multiple of 1 MiB.
+                               Smaller values make more, shorter calls, and
+                               so more frequent checkpoints.
+
+    :type checkpoint: :class:`RewriteCheckpoint`
+    :param checkpoint: (Optional) Where to save the progress of each
+                       rewrite, and load the progress of earlier ones.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the error of the first
+                            failed rewrite once all of them have finished.
+                            Otherwise (the default), failures are only
+                            reported in the returned summary.
+
+    :type on_progress: callable
+    :param on_progress: (Optional) Takes single argument: a
+                        :class:`TransferResult`.  Called as each rewrite
+                        finishes.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of the rewrites, in the order they were passed.
+              Its throughput is the number of bytes rewritten per second.
+    """
+    source_destination_pairs = list(source_destination_pairs)
+    if client is None and source_destination_pairs:
+        client = source_destination_pairs[0][1].client
+    rewrite = functools.partial(
+        _rewrite, client=client, max_bytes_per_call=max_bytes_per_call,
+        checkpoint=checkpoint)
+    return _transfer_many(
+        rewrite, source_destination_pairs, client, max_workers, max_workers,
+        raise_exception, on_progress)
+
+
+def upload_many_from_filenames(bucket, filenames, source_directory='',
+                               blob_name_prefix='', **kwargs):
+    """Upload many files to blobs named after them.
+
+    The blob for each file is named ``blob_name_prefix`` followed by the
+    filename, with path separators replaced by ``/``.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to upload to.
+
+    :type filenames: iterable
+    :param filenames: The names of the files to upload, relative to
+                      ``source_directory``.
+
+    :type source_directory: str
+    :param source_directory: (Optional) The directory containing the files.
+
+    :type blob_name_prefix: str
+    :param blob_name_prefix: (Optional) A prefix for each blob name.
+
+    :type kwargs: dict
+    :param kwargs: Other keyword arguments, passed to :func:`upload_many`.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of the uploads.
+    """
+    pairs = [
+        (os.path.join(source_directory, filename),
+         bucket.blob(blob_name_prefix + filename.replace(os.sep, '/')))
+        for filename in filenames
+    ]
+    return upload_many(pairs, **kwargs)
+
+
+def upload_directory(bucket, source_directory, blob_name_prefix='',
+                     **kwargs):
+    """Upload all the files in a directory tree.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to upload to.
+
+    :type source_directory: str
+    :param source_directory: The directory to upload.
+
+    :type blob_name_prefix: str
+    :param blob_name_prefix: (Optional) A prefix for each blob name, which
+                             is otherwise the path of the file relative to
+                             ``source_directory``.
+
+    :type kwargs: dict
+    :param kwargs: Other keyword arguments, passed to :func:`upload_many`.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of the uploads.
+    """
+    filenames = []
+    for dirpath, dirnames, names in os.walk(source_directory):
+        dirnames.sort()
+        relative = os.path.relpath(dirpath, source_directory)
+        for name in sorted(names):
+            if relative != os.curdir:
+                name = os.path.join(relative, name)
+            filenames.append(name)
+    return upload_many_from_filenames(
+        bucket, filenames, source_directory=source_directory,
+        blob_name_prefix=blob_name_prefix, **kwargs)
+
+
+def download_many_to_path(bucket, blob_names, destination_directory='',
+                          blob_name_prefix='', create_directories=True,
+                          **kwargs):
+    """Download many blobs to files named after them.
+
+    Each blob named ``blob_name_prefix`` followed by a name in
+    ``blob_names`` is downloaded to that name, with ``/`` replaced by the
+    path separator, relative to ``destination_directory``.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to download from.
+
+    :type blob_names: iterable
+    :param blob_names: The names of the blobs, without ``blob_name_prefix``.
+
+    :type destination_directory: str
+    :param destination_directory: (Optional) The directory to download to.
+
+    :type blob_name_prefix: str
+    :param blob_name_prefix: (Optional) A prefix for each blob name.
+
+    :type create_directories: bool
+    :param create_directories: (Optional) If True (the default), create any
+                               missing directories for the files.
+
+    :type kwargs: dict
+    :param kwargs: Other keyword arguments, passed to :func:`download_many`.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of the downloads.
+
+    :raises: :exc:`ValueError` if a blob name, such as ``../x``, would be
+             downloaded outside of ``destination_directory``. Nothing is
+             downloaded then.
+    """
+    # Check every name before creating any directory.
+    root = os.path.join(os.path.abspath(destination_directory), '')
+    files = []
+    for blob_name in blob_names:
+        filename = os.path.join(
+            destination_directory, *blob_name.split('/'))
+        if not os.path.abspath(filename).startswith(root):
+            raise ValueError(
+                'Blob name {!r} would be downloaded outside of {!r}.'.format(
+                    blob_name, root))
+        files.append((blob_name, filename))
+
+    pairs = []
+    for blob_name, filename in files:
+        if create_directories:
+            directory = os.path.dirname(filename)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+        pairs.append((bucket.blob(blob_name_prefix + blob_name), filename))
+    return download_many(pairs, **kwargs)
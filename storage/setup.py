@@ -34,6 +34,7 @@ dependencies = [
     'google-resumable-media>=0.3.1',
 ]
 extras = {
+    'crcmod': 'crcmod>=1.7',
 }
 
 
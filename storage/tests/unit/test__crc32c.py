@@ -0,0 +1,126 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class Test_extend(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage._crc32c import extend
+
+        return extend(*args, **kwargs)
+
+    def test_check_value(self):
+        self.assertEqual(self._call_fut(0, b'123456789'), 0xE3069283)
+
+    def test_wo_data(self):
+        self.assertEqual(self._call_fut(0, b''), 0)
+
+    def test_incremental(self):
+        crc = self._call_fut(0, b'1234')
+        crc = self._call_fut(crc, memoryview(b'56789'))
+
+        self.assertEqual(crc, 0xE3069283)
+
+    def test_pure_python(self):
+        from google.cloud.storage._crc32c import _py_extend
+
+        self.assertEqual(_py_extend(0, b'123456789'), 0xE3069283)
+
+
+class Test_is_fast(unittest.TestCase):
+
+    def test_it(self):
+        import mock
+        from google.cloud.storage import _crc32c
+
+        with mock.patch.object(_crc32c, '_CRCMOD_EXTENSION', new=False):
+            self.assertFalse(_crc32c.is_fast())
+        with mock.patch.object(_crc32c, '_CRCMOD_EXTENSION', new=True):
+            self.assertTrue(_crc32c.is_fast())
+
+
+class Test_combine(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage._crc32c import combine
+
+        return combine(*args, **kwargs)
+
+    def test_w_pieces(self):
+        from google.cloud.storage._crc32c import extend
+
+        data = b'The quick brown fox jumps over the lazy dog' * 3
+        for split in (1, 7, 64, len(data) - 1):
+            first, second = data[:split], data[split:]
+            self.assertEqual(
+                self._call_fut(
+                    extend(0, first), extend(0, second), len(second)),
+                extend(0, data))
+
+    def test_w_empty_second(self):
+        self.assertEqual(self._call_fut(0xE3069283, 0, 0), 0xE3069283)
+
+
+class Test_to_base64(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage._crc32c import to_base64
+
+        return to_base64(*args, **kwargs)
+
+    def test_it(self):
+        self.assertEqual(self._call_fut(0xE3069283), '4waSgw==')
+        self.assertEqual(self._call_fut(0), 'AAAAAA==')
+
+
+class Test_from_base64(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage._crc32c import from_base64
+
+        return from_base64(*args, **kwargs)
+
+    def test_it(self):
+        self.assertEqual(self._call_fut('4waSgw=='), 0xE3069283)
+        self.assertEqual(self._call_fut('AAAAAA=='), 0)
+
+
+class TestHash(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._crc32c import Hash
+
+        return Hash
+
+    def _make_one(self):
+        return self._get_target_class()()
+
+    def test_it(self):
+        import struct
+
+        hash_obj = self._make_one()
+        self.assertEqual(hash_obj.name, 'crc32c')
+        self.assertEqual(hash_obj.digest(), b'\0\0\0\0')
+
+        hash_obj.update(b'1234')
+        hash_obj.update(memoryview(b'56789'))
+
+        self.assertEqual(hash_obj.digest(), struct.pack('>I', 0xE3069283))
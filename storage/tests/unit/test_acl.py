@@ -854,6 +854,21 @@ class Test_ObjectACL(unittest.TestCase):
         blob.user_project = USER_PROJECT
         self.assertEqual(acl.user_project, USER_PROJECT)
 
+    def test_save_uncaches_blob(self):
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        connection = _Connection({'acl': []})
+        client = _Client(connection)
+        bucket = _Bucket(NAME)
+        blob = _Blob(bucket, BLOB_NAME)
+        acl = self._make_one(blob)
+        acl.loaded = True
+        acl.save(client=client)
+        self.assertEqual(blob._uncached, [client])
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'PATCH')
+        self.assertEqual(kw['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
+
 
 class _Blob(object):
 
@@ -862,6 +877,10 @@ class _Blob(object):
     def __init__(self, bucket, blob):
         self.bucket = bucket
         self.blob = blob
+        self._uncached = []
+
+    def _uncache_properties(self, client):
+        self._uncached.append(client)
 
     @property
     def path(self):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import unittest
 
 import mock
@@ -92,6 +93,15 @@ class TestMIMEApplicationHTTP(unittest.TestCase):
         mah = self._make_one(METHOD, PATH, HEADERS, BODY)
         self.assertEqual(mah.get_payload().splitlines(), LINES)
 
+    def test_ctor_py2(self):
+        with mock.patch('six.PY2', True):
+            mah = self._make_one('DELETE', '/path/to/api', {}, None)
+
+        self.assertEqual(mah.get_content_type(), 'application/http')
+        self.assertEqual(
+            mah.get_payload().splitlines(),
+            ['DELETE /path/to/api HTTP/1.1', ''])
+
 
 class TestBatch(unittest.TestCase):
 
@@ -236,7 +246,7 @@ class TestBatch(unittest.TestCase):
         self.assertEqual(request_url, url)
         self.assertIsNone(request_data)
 
-    def test__make_request_POST_too_many_requests(self):
+    def test__make_request_POST_many_requests(self):
         url = 'http://example.com/api'
         http = _make_requests_session([])
         connection = _Connection(http=http)
@@ -244,9 +254,73 @@ class TestBatch(unittest.TestCase):
 
         batch._MAX_BATCH_SIZE = 1
         batch._requests.append(('POST', url, {}, {'bar': 2}))
+        batch._make_request('POST', url, data={'foo': 1})
+
+        self.assertEqual(len(batch._requests), 2)
+
+    def test_finish_w_many_requests(self):
+        import re
+        import threading
+
+        lock = threading.Lock()
+        bodies = []
+
+        def request(method, url, data=None, headers=None):
+            with lock:
+                bodies.append(data)
+            urls = re.findall(r'^GET (\S+) HTTP/1.1', data, re.MULTILINE)
+            parts = [
+                _SUBRESPONSE_TEMPLATE % (len(url) + 9, url) for url in urls]
+            content = '--DEADBEEF=\r\n%s--DEADBEEF=--\r\n' % (
+                '--DEADBEEF=\r\n'.join(parts),)
+            return _make_response(
+                content=content.encode('utf-8'),
+                headers={
+                    'content-type': 'multipart/mixed; boundary=DEADBEEF='})
+
+        http = _make_requests_session([])
+        http.request.side_effect = request
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client)
+        batch._MAX_BATCH_SIZE = 2
+        urls = ['http://api.example.com/%d' % (index,) for index in range(5)]
+        targets = [_MockObject() for _ in urls]
+
+        for url, target in zip(urls, targets):
+            batch._do_request('GET', url, {}, None, target)
+        responses = batch.finish()
+
+        self.assertEqual(len(bodies), 3)
+        self.assertEqual(
+            sorted(body.count('HTTP/1.1') for body in bodies), [1, 2, 2])
+        self.assertEqual(len(responses), 5)
+        self.assertEqual(
+            [target._properties for target in targets],
+            [{'url': url} for url in urls])
+
+    def test__prepare_batch_request_empty(self):
+        batch = self._make_one(_Client(_Connection()))
 
         with self.assertRaises(ValueError):
-            batch._make_request('POST', url, data={'foo': 1})
+            batch._prepare_batch_request([])
+
+    def test__prepare_batch_request_py2(self):
+        batch = self._make_one(_Client(_Connection()))
+        # The ``email`` package writes native strings, which are bytes on
+        # Python 2.
+        fake_io = mock.Mock(spec=['BytesIO'])
+        fake_io.BytesIO.side_effect = io.StringIO
+
+        with mock.patch('six.PY3', False):
+            with mock.patch('google.cloud.storage.batch.io', new=fake_io):
+                headers, body = batch._prepare_batch_request(
+                    [('DELETE', '/path/to/api', {}, None)])
+
+        fake_io.BytesIO.assert_called_once_with()
+        self.assertTrue(
+            headers['Content-Type'].startswith('multipart/mixed'))
+        self.assertIn('DELETE /path/to/api HTTP/1.1', body)
 
     def test_finish_empty(self):
         http = _make_requests_session([])
@@ -414,6 +488,30 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[0], 'GET', url, {})
         self._check_subrequest_payload(chunks[1], 'GET', url, {})
 
+    def test_finish_nonempty_with_status_failure_wo_raise_exception(self):
+        url = 'http://api.example.com/other_api'
+        expected_response = _make_response(
+            content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            headers={'content-type': 'multipart/mixed; boundary="DEADBEEF="'})
+        http = _make_requests_session([expected_response])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, raise_exception=False)
+        batch.API_BASE_URL = 'http://api.example.com'
+        target1 = _MockObject()
+        target2 = _MockObject()
+
+        batch._do_request('GET', url, {}, None, target1)
+        batch._do_request('GET', url, {}, None, target2)
+        target2_future_before = target2._properties
+
+        responses = batch.finish()
+
+        self.assertEqual(
+            [response.status_code for response in responses], [200, 404])
+        self.assertEqual(target1._properties, {'foo': 1, 'bar': 2})
+        self.assertIs(target2._properties, target2_future_before)
+
     def test_finish_nonempty_non_multipart_response(self):
         url = 'http://api.example.com/other_api'
         http = _make_requests_session([_make_response()])
@@ -533,6 +631,69 @@ class Test__unpack_batch_response(unittest.TestCase):
         CONTENT = _THREE_PART_MIME_RESPONSE
         self._unpack_helper(RESPONSE, CONTENT)
 
+    def test_crlf_w_preamble(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary=batch_abc'}
+        CONTENT = (
+            b'preamble\r\n'
+            b'--batch_abc\r\n'
+            b'Content-Type: application/http\r\n'
+            b'Content-ID: <response-1>\r\n'
+            b'\r\n'
+            b'HTTP/1.1 200 OK\r\n'
+            b'Content-Type: application/json\r\n'
+            b'\r\n'
+            b'{"a": 1}\r\n'
+            b'--batch_abc\r\n'
+            b'\r\n'
+            b'HTTP/1.1 204 No Content\r\n'
+            b'\r\n'
+            b'\r\n'
+            b'--batch_abc--\r\n'
+            b'epilogue')
+
+        first, second = self._call_fut(RESPONSE, CONTENT)
+
+        self.assertEqual(first.status_code, http_client.OK)
+        self.assertEqual(first.headers['Content-Type'], 'application/json')
+        self.assertEqual(first.content, b'{"a": 1}')
+        self.assertEqual(first.request.url, 'contentid://<response-1>')
+        self.assertEqual(second.status_code, http_client.NO_CONTENT)
+        self.assertEqual(second.content, b'')
+        self.assertEqual(second.request.url, 'contentid://None')
+
+    def test_wo_closing_delimiter(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary=batch_abc'}
+        CONTENT = (
+            b'--batch_abc\n'
+            b'\n'
+            b'HTTP/1.1 404 Not Found\n'
+            b'Malformed header line\n'
+            b'Content-Type: text/plain')
+
+        response, = self._call_fut(RESPONSE, CONTENT)
+
+        self.assertEqual(response.status_code, http_client.NOT_FOUND)
+        self.assertEqual(
+            dict(response.headers), {'Content-Type': 'text/plain'})
+        self.assertEqual(response.content, b'')
+
+    def test_not_multipart(self):
+        RESPONSE = {'content-type': 'application/json'}
+
+        with self.assertRaises(ValueError):
+            list(self._call_fut(RESPONSE, b'{}'))
+
+
+_SUBRESPONSE_TEMPLATE = (
+    'Content-Type: application/http\r\n'
+    'Content-ID: <response-1>\r\n'
+    '\r\n'
+    'HTTP/1.1 200 OK\r\n'
+    'Content-Type: application/json; charset=UTF-8\r\n'
+    'Content-Length: %d\r\n'
+    '\r\n'
+    '{"url": "%s"}\r\n'
+)
 
 _TWO_PART_MIME_RESPONSE_WITH_FAIL = b"""\
 --DEADBEEF=
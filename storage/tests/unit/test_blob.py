@@ -561,6 +561,115 @@ class Test_Blob(unittest.TestCase):
             '_target_object': None,
         })
 
+    def _make_cached_client(self, *responses):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        return client
+
+    def test_reload_w_metadata_cache(self):
+        BLOB_NAME = 'blob-name'
+        RESOURCE = {'name': BLOB_NAME, 'generation': '1', 'size': '10'}
+        client = self._make_cached_client(({'status': http_client.OK},
+                                           RESOURCE))
+        bucket = _Bucket(client)
+        blob = self._make_one(BLOB_NAME, bucket=bucket)
+        other = self._make_one(BLOB_NAME, bucket=bucket)
+
+        blob.reload()
+        other.reload()
+
+        self.assertEqual(len(client._connection._requested), 1)
+        self.assertEqual(other.size, 10)
+        self.assertEqual(client.metadata_cache.hits, 1)
+        self.assertEqual(client.metadata_cache.misses, 1)
+
+    def test_reload_w_metadata_cache_stale_entry(self):
+        BLOB_NAME = 'blob-name'
+        RESOURCE = {'name': BLOB_NAME, 'generation': '2'}
+        client = self._make_cached_client(({'status': http_client.OK},
+                                           RESOURCE))
+        client.metadata_cache.put(
+            'name', BLOB_NAME, {'name': BLOB_NAME, 'generation': '1'})
+        bucket = _Bucket(client)
+        blob = self._make_one(BLOB_NAME, bucket=bucket)
+        blob._properties['generation'] = '2'
+
+        blob.reload()
+
+        self.assertEqual(len(client._connection._requested), 1)
+        self.assertEqual(
+            client.metadata_cache.get('name', BLOB_NAME), RESOURCE)
+
+    def test_reload_w_metadata_cache_in_batch(self):
+        BLOB_NAME = 'blob-name'
+        RESOURCE = {'name': BLOB_NAME, 'generation': '1'}
+        client = self._make_cached_client(({'status': http_client.OK},
+                                           RESOURCE))
+        client.metadata_cache.put('name', BLOB_NAME, RESOURCE)
+        client.current_batch = object()
+        bucket = _Bucket(client)
+        blob = self._make_one(BLOB_NAME, bucket=bucket)
+
+        blob.reload()
+
+        self.assertEqual(len(client._connection._requested), 1)
+
+    def test_patch_w_metadata_cache(self):
+        BLOB_NAME = 'blob-name'
+        RESOURCE = {'name': BLOB_NAME, 'metageneration': '2',
+                    'contentType': 'text/plain'}
+        client = self._make_cached_client(({'status': http_client.OK},
+                                           RESOURCE))
+        client.metadata_cache.put(
+            'name', BLOB_NAME, {'name': BLOB_NAME, 'metageneration': '1'})
+        bucket = _Bucket(client)
+        blob = self._make_one(BLOB_NAME, bucket=bucket)
+        blob.content_type = 'text/plain'
+
+        blob.patch()
+
+        self.assertEqual(
+            client.metadata_cache.get('name', BLOB_NAME), RESOURCE)
+
+    def test_update_w_metadata_cache(self):
+        BLOB_NAME = 'blob-name'
+        RESOURCE = {'name': BLOB_NAME, 'metageneration': '2',
+                    'contentType': 'text/plain'}
+        client = self._make_cached_client(({'status': http_client.OK},
+                                           RESOURCE))
+        client.metadata_cache.put(
+            'name', BLOB_NAME, {'name': BLOB_NAME, 'metageneration': '1'})
+        bucket = _Bucket(client)
+        blob = self._make_one(BLOB_NAME, bucket=bucket)
+        blob.content_type = 'text/plain'
+
+        blob.update()
+
+        self.assertEqual(
+            client._connection._requested[0]['method'], 'PUT')
+        self.assertEqual(
+            client.metadata_cache.get('name', BLOB_NAME), RESOURCE)
+
+    def test_exists_w_metadata_cache(self):
+        BLOB_NAME = 'blob-name'
+        client = self._make_cached_client(({'status': http_client.NOT_FOUND},
+                                           b''))
+        client.metadata_cache.put('name', BLOB_NAME, {'name': BLOB_NAME})
+        bucket = _Bucket(client)
+        blob = self._make_one(BLOB_NAME, bucket=bucket)
+
+        self.assertTrue(blob.exists())
+        self.assertEqual(client._connection._requested, [])
+
+        client.metadata_cache.ttl = 0
+        client.metadata_cache.put('name', BLOB_NAME, {'name': BLOB_NAME})
+        self.assertFalse(blob.exists())
+        self.assertEqual(len(client._connection._requested), 1)
+        self.assertEqual(len(client.metadata_cache), 0)
+
     def test_delete(self):
         BLOB_NAME = 'blob-name'
         not_found_response = ({'status': http_client.NOT_FOUND}, b'')
@@ -1094,6 +1203,300 @@ class Test_Blob(unittest.TestCase):
         self._check_session_mocks(
             client, transport, media_link, headers=key_headers)
 
+    def _mock_ranged_download_transport(self, data):
+        import threading
+
+        lock = threading.Lock()
+        ranges = []
+
+        def request(method, url, data=None, headers=None):
+            first, last = headers['range'][len('bytes='):].split('-')
+            first, last = int(first), min(int(last), len(content) - 1)
+            with lock:
+                ranges.append((first, last))
+            return self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {'content-length': str(last - first + 1),
+                 'content-range': 'bytes {}-{}/{}'.format(
+                     first, last, len(content))},
+                content=content[first:last + 1])
+
+        content = data
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = request
+        transport.ranges = ranges
+        return transport
+
+    def _make_sliced_blob(self, transport, data, **properties):
+        from google.cloud.storage import _crc32c
+
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        properties.setdefault('mediaLink', 'http://example.com/media/')
+        properties.setdefault('size', str(len(data)))
+        properties.setdefault(
+            'crc32c', _crc32c.to_base64(_crc32c.extend(0, data)))
+        return self._make_one('blob-name', bucket=bucket,
+                              properties=properties)
+
+    def test_download_to_filename_sliced(self):
+        import time
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = os.urandom(1000)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(
+            transport, data, updated='2014-12-06T13:13:50.690Z')
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(
+                temp.name, slice_size=300, max_workers=3)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+            mtime = os.path.getmtime(temp.name)
+
+        self.assertEqual(wrote, data)
+        self.assertEqual(mtime, time.mktime(blob.updated.timetuple()))
+        self.assertEqual(
+            sorted(transport.ranges),
+            [(0, 299), (300, 599), (600, 899), (900, 999)])
+        for call in transport.request.mock_calls:
+            self.assertEqual(call[1][:2], ('GET', blob.media_link))
+            self.assertNotIn('accept-encoding', call[2]['headers'])
+
+    def test_download_to_filename_sliced_w_key(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = os.urandom(100)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+        blob._encryption_key = b'aa426195405adee2c8081bb9e7e74b19'
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(temp.name, slice_size=60)
+            with open(temp.name, 'rb') as file_obj:
+                self.assertEqual(file_obj.read(), data)
+
+        for call in transport.request.mock_calls:
+            self.assertEqual(
+                call[2]['headers']['X-Goog-Encryption-Algorithm'], 'AES256')
+
+    def test_download_to_filename_sliced_reloads_metadata(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = os.urandom(100)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+        properties = dict(blob._properties)
+        blob._properties.clear()
+
+        def reload(client=None):
+            blob._properties.update(properties)
+
+        with mock.patch.object(blob, 'reload', side_effect=reload):
+            with _NamedTemporaryFile() as temp:
+                blob.download_to_filename(temp.name, slice_size=60)
+                with open(temp.name, 'rb') as file_obj:
+                    self.assertEqual(file_obj.read(), data)
+
+        self.assertEqual(
+            sorted(transport.ranges), [(0, 59), (60, 99)])
+
+    def test_download_to_filename_sliced_small_blob(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = b'abcdef'
+        transport = self._mock_download_transport()
+        blob = self._make_sliced_blob(transport, data)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(temp.name, slice_size=6)
+            with open(temp.name, 'rb') as file_obj:
+                self.assertEqual(file_obj.read(), data)
+
+        self._check_session_mocks(None, transport, blob.media_link)
+
+    def test_download_to_filename_sliced_gzip_blob(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = b'abcdef'
+        transport = self._mock_download_transport()
+        blob = self._make_sliced_blob(
+            transport, data, contentEncoding='gzip')
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(temp.name, slice_size=2)
+            with open(temp.name, 'rb') as file_obj:
+                self.assertEqual(file_obj.read(), data)
+
+        self._check_session_mocks(None, transport, blob.media_link)
+
+    def test_download_to_filename_sliced_w_range(self):
+        blob = self._make_sliced_blob(None, b'abcdef')
+
+        with self.assertRaises(ValueError):
+            blob.download_to_filename('unused', start=1, slice_size=2)
+
+    def test_download_to_filename_sliced_corrupted(self):
+        from google.resumable_media import DataCorruption
+
+        data = os.urandom(100)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, crc32c='AAAAAA==')
+
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+        with self.assertRaises(DataCorruption):
+            blob.download_to_filename(
+                filename, slice_size=30, checksum=True)
+
+        # Make sure the file was cleaned up.
+        self.assertFalse(os.path.exists(filename))
+
+    def test_download_to_filename_sliced_default_checksum_w_crcmod(self):
+        from google.resumable_media import DataCorruption
+
+        data = os.urandom(100)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, crc32c='AAAAAA==')
+
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+        patch = mock.patch(
+            'google.cloud.storage._crc32c.is_fast', return_value=True)
+        with patch, self.assertRaises(DataCorruption):
+            blob.download_to_filename(filename, slice_size=30)
+
+        self.assertFalse(os.path.exists(filename))
+
+    def test_download_to_filename_sliced_default_checksum_wo_crcmod(self):
+        import warnings
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = os.urandom(100)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, crc32c='AAAAAA==')
+
+        patch = mock.patch(
+            'google.cloud.storage._crc32c.is_fast', return_value=False)
+        with _NamedTemporaryFile() as temp:
+            with patch, warnings.catch_warnings(record=True) as warned:
+                warnings.simplefilter('always')
+                blob.download_to_filename(temp.name, slice_size=30)
+            with open(temp.name, 'rb') as file_obj:
+                self.assertEqual(file_obj.read(), data)
+
+        self.assertEqual(len(warned), 1)
+        self.assertIs(warned[0].category, RuntimeWarning)
+        self.assertIn('crcmod', str(warned[0].message))
+
+    def test_download_to_filename_sliced_wo_checksum(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = os.urandom(100)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, crc32c='AAAAAA==')
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(
+                temp.name, slice_size=30, checksum=False)
+            with open(temp.name, 'rb') as file_obj:
+                self.assertEqual(file_obj.read(), data)
+
+    def test_download_to_filename_sliced_w_failure(self):
+        from google.cloud import exceptions
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.NOT_FOUND, {'Content-Length': '9'},
+            content=b'Not found')
+        blob = self._make_sliced_blob(transport, b'x' * 100)
+
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+        try:
+            with self.assertRaises(exceptions.NotFound):
+                blob.download_to_filename(filename, slice_size=30)
+        finally:
+            os.remove(filename)
+
+    def test__download_slice_resumes(self):
+        import requests
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage import _crc32c
+
+        data = os.urandom(20)
+        transport = self._mock_ranged_download_transport(data)
+        request = transport.request.side_effect
+        calls = []
+
+        def flaky_request(method, url, data=None, headers=None):
+            calls.append(headers['range'])
+            if len(calls) == 2:
+                raise requests.exceptions.ConnectionError('reset')
+            return request(method, url, data=data, headers=headers)
+
+        transport.request.side_effect = flaky_request
+        blob = self._make_sliced_blob(transport, data)
+
+        patch = mock.patch(
+            'google.cloud.storage.blob._SLICE_CHUNK_SIZE', new=4)
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'\0' * 20)
+            with patch:
+                checksum = blob._download_slice(
+                    transport, temp.name, blob.media_link, {}, 5, 14)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(checksum, _crc32c.extend(0, data[5:15]))
+        self.assertEqual(wrote, b'\0' * 5 + data[5:15] + b'\0' * 5)
+        self.assertEqual(
+            calls, ['bytes=5-8', 'bytes=9-12', 'bytes=9-12', 'bytes=13-14'])
+
+    def test__download_slice_wo_checksum(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = os.urandom(20)
+        transport = self._mock_ranged_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'\0' * 20)
+            checksum = blob._download_slice(
+                transport, temp.name, blob.media_link, {}, 0, 19,
+                checksum=False)
+            with open(temp.name, 'rb') as file_obj:
+                self.assertEqual(file_obj.read(), data)
+
+        self.assertIsNone(checksum)
+
+    def test__download_slice_gives_up(self):
+        import requests
+        from google.cloud._testing import _NamedTemporaryFile
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = (
+            requests.exceptions.ConnectionError('reset'))
+        blob = self._make_sliced_blob(transport, b'x' * 10)
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'\0' * 10)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                blob._download_slice(
+                    transport, temp.name, blob.media_link, {}, 0, 9)
+
+        self.assertEqual(
+            transport.request.call_count,
+            google.cloud.storage.blob._MAX_SLICE_ATTEMPTS)
+
     def test_download_as_string(self):
         blob_name = 'blob-name'
         transport = self._mock_download_transport()
@@ -1112,6 +1515,50 @@ class Test_Blob(unittest.TestCase):
 
         self._check_session_mocks(client, transport, media_link)
 
+    def test_open_binary(self):
+        from google.cloud.storage.fileio import BlobReader
+        from google.cloud.storage.fileio import BlobWriter
+
+        client = mock.Mock(spec=[])
+        blob = self._make_one('blob-name', bucket=_Bucket(client))
+
+        reader = blob.open('rb', chunk_size=1024, client=client,
+                           read_ahead=False)
+        writer = blob.open('wb', content_type='text/csv')
+
+        self.assertIsInstance(reader, BlobReader)
+        self.assertIs(reader._blob, blob)
+        self.assertEqual(reader._chunk_size, 1024)
+        self.assertIs(reader._client, client)
+        self.assertFalse(reader._read_ahead)
+        self.assertIsInstance(writer, BlobWriter)
+        self.assertEqual(writer._content_type, 'text/csv')
+        writer._abandon()
+
+    def test_open_text(self):
+        from google.cloud.storage.fileio import BlobReader
+        from google.cloud.storage.fileio import BlobTextWrapper
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one('blob-name', bucket=_Bucket(None))
+
+        reader = blob.open()
+        writer = blob.open('w', encoding='latin-1', newline='')
+
+        self.assertIsInstance(reader, BlobTextWrapper)
+        self.assertIsInstance(reader.buffer, BlobReader)
+        self.assertEqual(reader.encoding, 'utf-8')
+        self.assertIsInstance(writer, BlobTextWrapper)
+        self.assertIsInstance(writer.buffer, BlobWriter)
+        self.assertEqual(writer.encoding, 'latin-1')
+        writer.buffer._abandon()
+
+    def test_open_invalid_mode(self):
+        blob = self._make_one('blob-name', bucket=_Bucket(None))
+
+        with self.assertRaises(ValueError):
+            blob.open('a')
+
     def test__get_content_type_explicit(self):
         blob = self._make_one(u'blob-name', bucket=None)
 
@@ -1263,7 +1710,10 @@ class Test_Blob(unittest.TestCase):
             b'\r\n--==0==--')
         headers = {'content-type': b'multipart/related; boundary="==0=="'}
         transport.request.assert_called_once_with(
-            'POST', upload_url, data=payload, headers=headers)
+            'POST', upload_url, data=mock.ANY, headers=headers)
+        body = transport.request.call_args[1]['data']
+        self.assertEqual(len(body), len(payload))
+        self.assertEqual(b''.join(body), payload)
 
     @mock.patch(u'google.resumable_media._upload.get_boundary',
                 return_value=b'==0==')
@@ -1619,13 +2069,13 @@ class Test_Blob(unittest.TestCase):
                 size <= google.cloud.storage.blob._MAX_MULTIPART_SIZE:
             blob._do_multipart_upload.assert_called_once_with(
                 client, stream, content_type, size, num_retries,
-                predefined_acl)
+                predefined_acl, checksum=None)
             blob._do_resumable_upload.assert_not_called()
         else:
             blob._do_multipart_upload.assert_not_called()
             blob._do_resumable_upload.assert_called_once_with(
                 client, stream, content_type, size, num_retries,
-                predefined_acl)
+                predefined_acl, checksum=None)
 
     def test__do_upload_uses_multipart(self):
         self._do_upload_helper(
@@ -1671,7 +2121,7 @@ class Test_Blob(unittest.TestCase):
         num_retries = kwargs.get('num_retries')
         blob._do_upload.assert_called_once_with(
             client, stream, content_type,
-            len(data), num_retries, predefined_acl)
+            len(data), num_retries, predefined_acl, checksum=None)
         return stream
 
     def test_upload_from_file_success(self):
@@ -1722,7 +2172,7 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(pos_args[3], size)
         self.assertIsNone(pos_args[4])  # num_retries
         self.assertIsNone(pos_args[5])  # predefined_acl
-        self.assertEqual(kwargs, {})
+        self.assertEqual(kwargs, {'checksum': None})
 
         return pos_args[1]
 
@@ -1757,6 +2207,201 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, 'rb')
         self.assertEqual(stream.name, temp.name)
 
+    def _composite_upload_helper(self, data, slice_size, **kwargs):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage.bucket import Bucket
+
+        storage = _FakeStorage()
+        client = mock.Mock(
+            _http=mock.Mock(spec=['request']),
+            _connection=mock.Mock(spec=['api_request']),
+            current_batch=None,
+            spec=['_http', '_connection', 'batch', 'current_batch'])
+        client._connection.api_request.side_effect = storage.api_request
+        client.batch.side_effect = storage.batch
+        bucket = Bucket(client, name='name')
+        blob = self._make_one('blob-name', bucket=bucket)
+
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob._do_upload', autospec=True,
+            side_effect=storage.do_upload)
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(data)
+            with patch as do_upload:
+                blob.upload_from_filename(
+                    temp.name, content_type='text/csv', client=client,
+                    slice_size=slice_size, max_workers=4, **kwargs)
+
+        return blob, storage, do_upload
+
+    def test_upload_from_filename_composite(self):
+        data = os.urandom(100)
+        patch = mock.patch(
+            'google.cloud.storage.blob._MAX_COMPOSE_COMPONENTS', new=4)
+        with patch:
+            blob, storage, do_upload = self._composite_upload_helper(
+                data, 10, predefined_acl='private')
+
+        self.assertEqual(do_upload.call_count, 10)
+        self.assertEqual(storage.checksums, ['crc32c'] * 10)
+        # Only the composed blob is left.
+        self.assertEqual(list(storage.objects), ['blob-name'])
+        self.assertEqual(storage.objects['blob-name'], data)
+        self.assertEqual(blob.content_type, 'text/csv')
+        # 10 slices -> 3 intermediate blobs -> the blob.
+        composes = [
+            kw for _, kw in
+            blob.client._connection.api_request.call_args_list
+            if kw['path'].endswith('/compose')]
+        self.assertEqual(len(composes), 4)
+        final = composes[-1]
+        self.assertEqual(final['path'], '/b/name/o/blob-name/compose')
+        self.assertEqual(len(final['data']['sourceObjects']), 3)
+        self.assertEqual(
+            final['data']['destination'],
+            {'name': 'blob-name', 'contentType': 'text/csv'})
+        self.assertEqual(
+            final['query_params'], {'destinationPredefinedAcl': 'private'})
+        for sources in composes[:-1]:
+            self.assertLessEqual(len(sources['data']['sourceObjects']), 4)
+
+    def test_upload_from_filename_composite_wo_checksum(self):
+        data = os.urandom(30)
+
+        blob, storage, do_upload = self._composite_upload_helper(
+            data, 10, checksum=False)
+
+        self.assertEqual(storage.objects['blob-name'], data)
+        self.assertEqual(storage.checksums, [None, None, None])
+
+    def test_upload_from_filename_composite_corrupted(self):
+        from google.resumable_media import DataCorruption
+
+        data = os.urandom(30)
+        patch = mock.patch.object(
+            _FakeStorage, 'composed_crc32c', new='AAAAAA==')
+        with patch:
+            with self.assertRaises(DataCorruption):
+                self._composite_upload_helper(data, 10)
+
+    def test_upload_from_filename_composite_reads_slices_once(self):
+        from google.cloud.storage.blob import _SliceReader
+
+        data = os.urandom(30)
+        read = mock.patch.object(
+            _SliceReader, 'read', autospec=True,
+            side_effect=_SliceReader.read)
+        with read as read_mock:
+            self._composite_upload_helper(data, 10, checksum=True)
+
+        self.assertEqual(read_mock.call_count, 3)
+
+    def test_upload_from_filename_composite_slice_corrupted(self):
+        from google.resumable_media import DataCorruption
+
+        def corrupt_upload(*args, **kwargs):
+            response = storage_upload(*args, **kwargs)
+            response['crc32c'] = 'AAAAAA=='
+            return response
+
+        storage_upload = _FakeStorage.do_upload
+        patch = mock.patch.object(
+            _FakeStorage, 'do_upload', new=corrupt_upload)
+        with patch:
+            with self.assertRaises(DataCorruption):
+                self._composite_upload_helper(os.urandom(30), 10)
+
+        # The uploaded slices were deleted.
+        self.assertEqual(_FakeStorage.last.objects, {})
+
+    def test_upload_from_filename_composite_default_checksum_wo_crcmod(self):
+        import warnings
+
+        data = os.urandom(30)
+        patch = mock.patch(
+            'google.cloud.storage._crc32c.is_fast', return_value=False)
+        with patch, warnings.catch_warnings(record=True) as warned:
+            warnings.simplefilter('always')
+            blob, storage, _ = self._composite_upload_helper(data, 10)
+
+        self.assertEqual(storage.objects['blob-name'], data)
+        self.assertEqual(storage.checksums, [None, None, None])
+        self.assertEqual(len(warned), 1)
+        self.assertIs(warned[0].category, RuntimeWarning)
+
+    def test_upload_from_filename_composite_wo_slice_checksum(self):
+        data = os.urandom(30)
+
+        def upload_wo_crc32c(*args, **kwargs):
+            response = storage_upload(*args, **kwargs)
+            del response['crc32c']
+            return response
+
+        storage_upload = _FakeStorage.do_upload
+        patch = mock.patch.object(
+            _FakeStorage, 'do_upload', new=upload_wo_crc32c)
+        compose = mock.patch.object(
+            _FakeStorage, 'composed_crc32c', new='AAAAAA==')
+        with patch, compose:
+            blob, storage, _ = self._composite_upload_helper(
+                data, 10, checksum=True)
+
+        # Without the checksums of the slices, the result is not checked.
+        self.assertEqual(storage.objects['blob-name'], data)
+
+    def test_upload_from_filename_composite_w_cleanup_error(self):
+        from google.cloud import exceptions
+
+        patch = mock.patch.object(_FakeStorage, 'failing_suffix', new='/0/2')
+        delete = mock.patch(
+            'google.cloud.storage.bucket.Bucket.delete_blobs',
+            side_effect=exceptions.Forbidden('no delete'))
+        logger = mock.patch('google.cloud.storage.blob._LOGGER')
+        with patch, delete, logger as logger_mock:
+            # The upload error is raised, not the cleanup error.
+            with self.assertRaises(exceptions.ServiceUnavailable):
+                self._composite_upload_helper(os.urandom(50), 10)
+
+        logger_mock.exception.assert_called_once()
+
+    def test_upload_from_filename_composite_w_failure(self):
+        from google.cloud import exceptions
+
+        patch = mock.patch.object(_FakeStorage, 'failing_suffix', new='/0/2')
+        with patch:
+            with self.assertRaises(exceptions.ServiceUnavailable):
+                self._composite_upload_helper(os.urandom(50), 10)
+
+        storage = _FakeStorage.last
+        # The uploaded slices were deleted, and nothing was composed.
+        self.assertEqual(storage.objects, {})
+        self.assertEqual(len(storage.deleted), 5)
+
+    def test_upload_from_filename_composite_small_file(self):
+        blob, storage, do_upload = self._composite_upload_helper(
+            b'abc', 10)
+
+        self.assertEqual(do_upload.call_count, 1)
+        self.assertEqual(storage.objects, {'blob-name': b'abc'})
+        blob.client._connection.api_request.assert_not_called()
+
+    def test_upload_from_filename_composite_w_kms_key(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one(
+            'blob-name', bucket=None, kms_key_name='key')
+        blob.upload_from_file = mock.Mock(spec=[])
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'x' * 30)
+            blob.upload_from_filename(temp.name, slice_size=10)
+
+        blob.upload_from_file.assert_called_once()
+        _, kwargs = blob.upload_from_file.call_args
+        self.assertEqual(kwargs['size'], 30)
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -1779,8 +2424,7 @@ class Test_Blob(unittest.TestCase):
         payload = _to_bytes(data, encoding='utf-8')
         stream = self._do_upload_mock_call_helper(
             blob, client, 'text/plain', len(payload))
-        self.assertIsInstance(stream, io.BytesIO)
-        self.assertEqual(stream.getvalue(), payload)
+        self.assertEqual(stream.read(), payload)
 
     def test_upload_from_string_w_bytes(self):
         data = b'XB]jb\xb8tad\xe0'
@@ -1790,6 +2434,110 @@ class Test_Blob(unittest.TestCase):
         data = u'\N{snowman} \N{sailboat}'
         self._upload_from_string_helper(data)
 
+    def test_upload_from_string_w_bytearray(self):
+        data = bytearray(b'XB]jb\xb8tad\xe0')
+        blob = self._make_one('blob-name', bucket=None)
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+
+        blob.upload_from_string(memoryview(data), client=mock.sentinel.client)
+
+        stream = self._do_upload_mock_call_helper(
+            blob, mock.sentinel.client, 'text/plain', len(data))
+        # The stream is a view of the data, not a copy.
+        self.assertIs(stream.getbuffer().obj, data)
+        self.assertEqual(stream.read(), bytes(data))
+
+    def test_upload_from_string_w_bad_type(self):
+        blob = self._make_one('blob-name', bucket=None)
+
+        with self.assertRaises(TypeError):
+            blob.upload_from_string(object())
+
+    def _upload_w_checksum_helper(self, checksum, response_data):
+        import json
+
+        bucket = _Bucket(name='w00t')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        sent = []
+
+        def request(method, url, data=None, headers=None):
+            sent.append(b''.join(data))
+            # Sending the body again must not change the checksum.
+            sent.append(b''.join(data))
+            return self._mock_requests_response(
+                http_client.OK, {},
+                content=json.dumps(response_data).encode('utf-8'))
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = request
+        client = mock.Mock(_http=transport, spec=['_http'])
+        data = bytearray(b'data here hear hier' * 100)
+
+        blob.upload_from_string(data, client=client, checksum=checksum)
+
+        self.assertIn(bytes(data), sent[0])
+        self.assertEqual(sent[0], sent[1])
+        return blob
+
+    def test_upload_from_string_w_md5(self):
+        import base64
+        import hashlib
+
+        data = b'data here hear hier' * 100
+        md5 = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+
+        blob = self._upload_w_checksum_helper('md5', {'md5Hash': md5})
+
+        self.assertEqual(blob.md5_hash, md5)
+
+    def test_upload_from_string_w_crc32c_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        with self.assertRaises(DataCorruption):
+            self._upload_w_checksum_helper('crc32c', {'crc32c': 'AAAAAA=='})
+
+    def test_upload_from_string_w_checksum_not_reported(self):
+        blob = self._upload_w_checksum_helper('md5', {'name': 'blob-name'})
+
+        self.assertIsNone(blob.md5_hash)
+
+    def test_upload_from_string_w_bad_checksum(self):
+        blob = self._make_one('blob-name', bucket=None)
+
+        with self.assertRaises(ValueError):
+            blob.upload_from_string(b'data', checksum='sha1')
+
+    def test__do_resumable_upload_w_checksum(self):
+        import hashlib
+
+        blob = self._make_one(u'blob-name', bucket=None)
+        stream = io.BytesIO(b'0123456789')
+        checksum = hashlib.md5()
+
+        def transmit(transport):
+            # Read part of the data, then send it again as after an error.
+            upload._stream.read(4)
+            upload._stream.seek(2)
+            upload._stream.read()
+            upload.finished = True
+            return mock.sentinel.response
+
+        upload = mock.Mock(finished=False, spec=['finished', '_stream'])
+        upload.transmit_next_chunk = transmit
+
+        def initiate(client, stream, *args, **kwargs):
+            upload._stream = stream
+            return upload, mock.sentinel.transport
+
+        blob._initiate_resumable_upload = initiate
+
+        response = blob._do_resumable_upload(
+            None, stream, None, None, None, None, checksum=checksum)
+
+        self.assertIs(response, mock.sentinel.response)
+        self.assertEqual(
+            checksum.digest(), hashlib.md5(b'0123456789').digest())
+
     def _create_resumable_upload_session_helper(self, origin=None,
                                                 side_effect=None):
         bucket = _Bucket(name='alex-trebek')
@@ -2281,6 +3029,63 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(rewritten, 33)
         self.assertEqual(size, 42)
 
+    def test_rewrite_w_max_bytes_per_call(self):
+        RESPONSE = {
+            'totalBytesRewritten': 1048576,
+            'objectSize': 4194304,
+            'done': False,
+            'rewriteToken': 'NEXT',
+        }
+        response = ({'status': http_client.OK}, RESPONSE)
+        connection = _Connection(response)
+        client = _Client(connection)
+        bucket = _Bucket(client=client)
+        source_blob = self._make_one('source', bucket=bucket)
+        dest_blob = self._make_one('dest', bucket=bucket)
+
+        token, rewritten, size = dest_blob.rewrite(
+            source_blob, token='TOKEN', max_bytes_per_call=1048576)
+
+        self.assertEqual(token, 'NEXT')
+        self.assertEqual(rewritten, 1048576)
+        self.assertEqual(size, 4194304)
+        kw, = connection._requested
+        self.assertEqual(kw['query_params'], {
+            'rewriteToken': 'TOKEN',
+            'maxBytesRewrittenPerCall': 1048576,
+        })
+
+    def test_rewrite_w_metadata_cache(self):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        DEST_BLOB = 'dest'
+        RESOURCE = {'name': DEST_BLOB, 'generation': '2'}
+        partial = ({'status': http_client.OK}, {
+            'totalBytesRewritten': 33,
+            'objectSize': 42,
+            'done': False,
+            'rewriteToken': 'TOKEN',
+        })
+        done = ({'status': http_client.OK}, {
+            'totalBytesRewritten': 42,
+            'objectSize': 42,
+            'done': True,
+            'resource': RESOURCE,
+        })
+        connection = _Connection(partial, done)
+        client = _Client(connection)
+        client.metadata_cache = cache = MetadataCache()
+        cache.put('name', DEST_BLOB, {'name': DEST_BLOB, 'generation': '1'})
+        bucket = _Bucket(client=client)
+        source_blob = self._make_one('source', bucket=bucket)
+        dest_blob = self._make_one(DEST_BLOB, bucket=bucket)
+
+        token, _, _ = dest_blob.rewrite(source_blob)
+        self.assertEqual(len(cache), 0)
+
+        dest_blob.rewrite(source_blob, token=token)
+        self.assertEqual(cache.get('name', DEST_BLOB), RESOURCE)
+
     def test_rewrite_other_bucket_other_name_no_encryption_partial(self):
         SOURCE_BLOB = 'source'
         DEST_BLOB = 'dest'
@@ -2990,6 +3795,271 @@ class Test_Blob(unittest.TestCase):
         self.assertIsNone(blob.updated)
 
 
+class Test__SliceReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import _SliceReader
+
+        return _SliceReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_read(self):
+        stream = self._make_one(io.BytesIO(b'0123456789'), 2, 5)
+
+        self.assertEqual(stream.read(2), b'23')
+        self.assertEqual(stream.tell(), 2)
+        self.assertEqual(stream.read(), b'456')
+        self.assertEqual(stream.read(), b'')
+        self.assertEqual(stream.tell(), 5)
+
+    def test_read_past_end(self):
+        stream = self._make_one(io.BytesIO(b'0123456789'), 8, 5)
+
+        self.assertEqual(stream.read(10), b'89')
+
+    def test_seek(self):
+        stream = self._make_one(io.BytesIO(b'0123456789'), 2, 5)
+
+        self.assertEqual(stream.seek(0, os.SEEK_END), 5)
+        self.assertEqual(stream.seek(-2, os.SEEK_CUR), 3)
+        self.assertEqual(stream.read(), b'56')
+        self.assertEqual(stream.seek(1), 1)
+        self.assertEqual(stream.read(1), b'3')
+        self.assertEqual(stream.seek(20), 5)
+
+
+class Test__read_buffer(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.blob import _read_buffer
+
+        return _read_buffer(*args, **kwargs)
+
+    def test_w_buffer(self):
+        stream = io.BytesIO(b'0123456789')
+        stream.seek(2)
+
+        view = self._call_fut(stream, 3)
+
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.tobytes(), b'234')
+        self.assertEqual(stream.tell(), 5)
+        self.assertEqual(self._call_fut(stream, None).tobytes(), b'56789')
+        del view
+
+    def test_wo_buffer(self):
+        from google.cloud.storage.blob import _SliceReader
+
+        stream = _SliceReader(io.BytesIO(b'0123456789'), 2, 5)
+
+        self.assertEqual(self._call_fut(stream, 3), b'234')
+        self.assertEqual(self._call_fut(stream, None), b'56')
+
+
+class Test__BufferReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import _BufferReader
+
+        return _BufferReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_read_and_seek(self):
+        import array
+
+        data = array.array('H', [0x3130, 0x3332, 0x3534])
+        stream = self._make_one(data)
+
+        self.assertEqual(len(stream), 6)
+        self.assertEqual(len(stream.read(4)), 4)
+        self.assertEqual(stream.tell(), 4)
+        self.assertEqual(len(stream.read()), 2)
+        self.assertEqual(stream.read(1), b'')
+        self.assertEqual(stream.seek(-3, os.SEEK_END), 3)
+        self.assertEqual(stream.seek(1, os.SEEK_CUR), 4)
+        self.assertEqual(stream.read(), data.tobytes()[4:])
+        self.assertEqual(stream.getbuffer().tobytes(), data.tobytes())
+
+
+class Test__MultipartBody(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import _MultipartBody
+
+        return _MultipartBody
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_iter(self):
+        import hashlib
+
+        data = b'x' * 2500000
+        checksum = hashlib.md5()
+        body = self._make_one(b'head', memoryview(data), b'tail', checksum)
+
+        chunks = list(body)
+
+        self.assertEqual(len(body), len(data) + 8)
+        self.assertEqual(chunks[0], b'head')
+        self.assertEqual(chunks[-1], b'tail')
+        self.assertEqual(
+            [len(chunk) for chunk in chunks[1:-1]],
+            [1048576, 1048576, 402848])
+        for chunk in chunks[1:-1]:
+            self.assertIsInstance(chunk, memoryview)
+        self.assertEqual(b''.join(body), b'head' + data + b'tail')
+        self.assertEqual(checksum.digest(), hashlib.md5(data).digest())
+
+    def test_tobytes(self):
+        import hashlib
+
+        data = b'x' * 2500000
+        checksum = hashlib.md5()
+        body = self._make_one(b'head', memoryview(data), b'tail', checksum)
+
+        result = body.tobytes()
+
+        self.assertIsInstance(result, bytes)
+        self.assertEqual(result, b'head' + data + b'tail')
+        self.assertEqual(checksum.digest(), hashlib.md5(data).digest())
+
+    def test_tobytes_wo_checksum(self):
+        body = self._make_one(b'head', memoryview(b'data'), b'tail')
+
+        self.assertEqual(body.tobytes(), b'headdatatail')
+
+
+class Test__ChecksumReader(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.blob import _ChecksumReader
+
+        return _ChecksumReader(*args, **kw)
+
+    def test_read_after_seek(self):
+        import hashlib
+
+        data = b'0123456789'
+        checksum = hashlib.md5()
+        reader = self._make_one(io.BytesIO(data), checksum)
+
+        self.assertEqual(reader.read(6), data[:6])
+        # A retried chunk is read again, but only hashed once.
+        self.assertEqual(reader.seek(4), 4)
+        self.assertEqual(reader.tell(), 4)
+        self.assertEqual(reader.read(), data[4:])
+        self.assertEqual(checksum.digest(), hashlib.md5(data).digest())
+
+
+class Test__BufferMultipartUpload(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.blob import _BufferMultipartUpload
+
+        return _BufferMultipartUpload(*args, **kw)
+
+    def test__prepare_request(self):
+        from google.cloud.storage.blob import _MultipartBody
+
+        upload = self._make_one('http://example.com/upload')
+
+        method, url, body, headers = upload._prepare_request(
+            b'data', {'name': 'blob-name'}, 'text/plain')
+
+        self.assertEqual(method, u'POST')
+        self.assertEqual(url, 'http://example.com/upload')
+        self.assertIsInstance(body, _MultipartBody)
+        self.assertTrue(
+            headers['content-type'].startswith(b'multipart/related'))
+
+    def test__prepare_request_py2(self):
+        import hashlib
+
+        data = bytearray(b'data here')
+        checksum = hashlib.md5()
+        upload = self._make_one('http://example.com/upload', checksum=checksum)
+
+        with mock.patch('six.PY2', True):
+            _, _, body, headers = upload._prepare_request(
+                memoryview(data), {'name': 'blob-name'}, 'text/plain')
+
+        boundary = headers['content-type'].split(b'boundary="')[1][:-1]
+        self.assertIsInstance(body, bytes)
+        self.assertTrue(body.startswith(b'--' + boundary + b'\r\n'))
+        self.assertTrue(body.endswith(
+            b'\r\n\r\ndata here\r\n--' + boundary + b'--'))
+        self.assertEqual(checksum.digest(), hashlib.md5(data).digest())
+
+    def test__prepare_request_finished(self):
+        upload = self._make_one('http://example.com/upload')
+        upload._finished = True
+
+        with self.assertRaises(ValueError):
+            upload._prepare_request(b'data', {}, 'text/plain')
+
+
+class Test__ensure_connection_pool(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.blob import _ensure_connection_pool
+
+        return _ensure_connection_pool(*args, **kwargs)
+
+    def test_w_small_pool(self):
+        import requests
+
+        session = requests.Session()
+
+        self._call_fut(session, 32)
+
+        adapter = session.get_adapter('https://example.com')
+        self.assertEqual(adapter._pool_maxsize, 32)
+        adapter = session.get_adapter('http://localhost:9023')
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_w_large_pool(self):
+        import requests
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=64)
+        session.mount('https://', adapter)
+
+        self._call_fut(session, 32)
+
+        self.assertIs(session.get_adapter('https://example.com'), adapter)
+
+    def test_w_custom_adapter(self):
+        import requests
+
+        class _Adapter(requests.adapters.HTTPAdapter):
+            pass
+
+        session = requests.Session()
+        adapter = _Adapter()
+        session.mount('https://', adapter)
+
+        self._call_fut(session, 32)
+
+        self.assertIs(session.get_adapter('https://example.com'), adapter)
+
+    def test_wo_session(self):
+        transport = mock.Mock(spec=['request'])
+
+        self._call_fut(transport, 32)
+
+
 class Test__quote(unittest.TestCase):
 
     @staticmethod
@@ -3115,6 +4185,102 @@ class Test__add_query_parameters(unittest.TestCase):
             '{}&{}'.format(BASE_URL, expected))
 
 
+class _FakeStorage(object):
+    """In-memory objects, for uploads mocked through ``Blob._do_upload``."""
+
+    composed_crc32c = None
+    failing_suffix = None
+    last = None
+
+    def __init__(self):
+        import threading
+
+        self.objects = {}
+        self.deleted = []
+        self.checksums = []
+        self._lock = threading.Lock()
+        _FakeStorage.last = self
+
+    @staticmethod
+    def _crc32c(data):
+        from google.cloud.storage import _crc32c
+
+        return _crc32c.to_base64(_crc32c.extend(0, data))
+
+    def do_upload(self, blob, client, stream, content_type, size,
+                  num_retries, predefined_acl, checksum=None):
+        from google.cloud import exceptions
+
+        if (self.failing_suffix is not None and
+                blob.name.endswith(self.failing_suffix)):
+            raise exceptions.ServiceUnavailable('oops')
+        data = stream.read(size)
+        self.checksums.append(checksum and checksum.name)
+        if checksum is not None:
+            checksum.update(data)
+        with self._lock:
+            self.objects[blob.name] = data
+        return {'name': blob.name, 'crc32c': self._crc32c(data)}
+
+    def batch(self, raise_exception=True):
+        return _FakeStorageBatch(self)
+
+    def api_request(self, method, path, query_params=None, data=None,
+                    _target_object=None):
+        from six.moves.urllib.parse import unquote
+        from google.cloud.exceptions import NotFound
+
+        prefix = '/b/name/o/'
+        assert path.startswith(prefix)
+        if method == 'DELETE':
+            name = unquote(path[len(prefix):])
+            with self._lock:
+                self.deleted.append(name)
+                if name not in self.objects:
+                    raise NotFound(name)
+                del self.objects[name]
+            return None
+
+        assert method == 'POST' and path.endswith('/compose')
+        name = unquote(path[len(prefix):-len('/compose')])
+        with self._lock:
+            content = b''.join(
+                self.objects[source['name']]
+                for source in data['sourceObjects'])
+            self.objects[name] = content
+        crc32c = self.composed_crc32c
+        if crc32c is None or name != 'blob-name':
+            crc32c = self._crc32c(content)
+        return dict(data['destination'], name=name, crc32c=crc32c)
+
+
+class _FakeStorageBatch(object):
+    """Batch which sends each request to a :class:`_FakeStorage` at once."""
+
+    def __init__(self, storage):
+        self._storage = storage
+        self._responses = []
+
+    def api_request(self, **kw):
+        import requests
+        from google.cloud.exceptions import GoogleCloudError
+
+        try:
+            self._storage.api_request(**kw)
+            status = 204
+        except GoogleCloudError as exc:
+            status = exc.code
+        response = requests.Response()
+        response.status_code = status
+        response.request = requests.Request(
+            'BATCH', 'contentid://%d' % (len(self._responses),)).prepare()
+        response._content = b''
+        self._responses.append(response)
+
+    def finish(self):
+        return self._responses
+
+
 class _Connection(object):
 
     API_BASE_URL = 'http://example.com'
@@ -3172,6 +4338,9 @@ class _Signer(object):
 
 class _Client(object):
 
+    current_batch = None
+    metadata_cache = None
+
     def __init__(self, connection):
         self._base_connection = connection
 
@@ -596,6 +596,39 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['method'], 'GET')
         self.assertEqual(kw['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
 
+    def test_get_blob_w_metadata_cache(self):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        RESOURCE = {'name': BLOB_NAME, 'size': '10'}
+        connection = _Connection(RESOURCE)
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        bucket = self._make_one(name=NAME)
+
+        first = bucket.get_blob(BLOB_NAME, client=client)
+        second = bucket.get_blob(BLOB_NAME, client=client)
+
+        self.assertEqual(len(connection._requested), 1)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.size, 10)
+        self.assertEqual(client.metadata_cache.hits, 1)
+
+    def test_get_blob_miss_w_metadata_cache(self):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        NAME = 'name'
+        NONESUCH = 'nonesuch'
+        connection = _Connection()
+        client = _Client(connection)
+        client.metadata_cache = cache = MetadataCache(ttl=0)
+        cache.put(NAME, NONESUCH, {'name': NONESUCH})
+        bucket = self._make_one(name=NAME)
+
+        self.assertIsNone(bucket.get_blob(NONESUCH, client=client))
+        self.assertEqual(len(cache), 0)
+
     def test_get_blob_hit_w_user_project(self):
         NAME = 'name'
         BLOB_NAME = 'blob-name'
@@ -687,6 +720,135 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], EXPECTED)
 
+    def test_list_blobs_parallel_fan_out(self):
+        NAME = 'name'
+        connection = _ListingConnection({
+            ('top/', None, None): {
+                'items': [{'name': 'top/blob'}],
+                'prefixes': ['top/a/', 'top/b/'],
+            },
+            ('top/a/', None, None): {
+                'items': [{'name': 'top/a/1'}],
+                'nextPageToken': 'token',
+            },
+            ('top/a/', None, 'token'): {'items': [{'name': 'top/a/2'}]},
+            ('top/b/', None, None): {'items': [{'name': 'top/b/1'}]},
+        })
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+
+        blobs = list(bucket.list_blobs_parallel(prefix='top/', max_workers=2))
+
+        self.assertEqual(
+            sorted(blob.name for blob in blobs),
+            ['top/a/1', 'top/a/2', 'top/b/1', 'top/blob'])
+        for blob in blobs:
+            self.assertIs(blob.bucket, bucket)
+        self.assertEqual(len(connection._requested), 4)
+        first = [kw for kw in connection._requested
+                 if 'delimiter' in kw['query_params']]
+        self.assertEqual(first[0]['query_params'], {
+            'projection': 'noAcl', 'prefix': 'top/', 'delimiter': '/'})
+
+    def test_list_blobs_parallel_wo_prefix(self):
+        NAME = 'name'
+        connection = _ListingConnection({
+            ('', None, None): {
+                'items': [{'name': 'blob'}],
+                'prefixes': ['a/'],
+            },
+            ('a/', None, None): {'items': [{'name': 'a/1'}]},
+        })
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+
+        blobs = list(bucket.list_blobs_parallel(versions=True))
+
+        self.assertEqual(sorted(blob.name for blob in blobs), ['a/1', 'blob'])
+        params = sorted(
+            (kw['query_params'] for kw in connection._requested),
+            key=lambda params: params.get('prefix', ''))
+        self.assertEqual(params, [
+            {'projection': 'noAcl', 'versions': True, 'delimiter': '/'},
+            {'projection': 'noAcl', 'versions': True, 'prefix': 'a/'},
+        ])
+
+    def test_list_blobs_parallel_w_shards_lightweight(self):
+        from google.cloud.storage.bucket import BlobListing
+        from google.cloud.storage.bucket import _LIGHTWEIGHT_LIST_FIELDS
+
+        NAME = 'name'
+        USER_PROJECT = 'user-project-123'
+        connection = _ListingConnection({
+            ('p/x', None, None): {
+                'items': [{'name': 'p/x1', 'size': '3', 'generation': '7'}],
+            },
+            ('p/', 'p/m', None): {'items': [{'name': 'p/m1'}]},
+        })
+        client = _Client(connection)
+        bucket = self._make_one(
+            client=client, name=NAME, user_project=USER_PROJECT)
+
+        listings = bucket.list_blobs_parallel(
+            shards=['x', ('p/m', 'p/n')], prefix='p/', lightweight=True)
+
+        self.assertEqual(
+            sorted(listings),
+            [BlobListing('p/m1', None, None), BlobListing('p/x1', 3, 7)])
+        params = sorted(
+            (kw['query_params'] for kw in connection._requested),
+            key=lambda params: params['prefix'])
+        self.assertEqual(params, [
+            {
+                'projection': 'noAcl',
+                'fields': _LIGHTWEIGHT_LIST_FIELDS,
+                'userProject': USER_PROJECT,
+                'prefix': 'p/',
+                'startOffset': 'p/m',
+                'endOffset': 'p/n',
+            },
+            {
+                'projection': 'noAcl',
+                'fields': _LIGHTWEIGHT_LIST_FIELDS,
+                'userProject': USER_PROJECT,
+                'prefix': 'p/x',
+            },
+        ])
+
+    def test_list_blobs_parallel_w_error(self):
+        from google.cloud.exceptions import NotFound
+
+        NAME = 'name'
+        connection = _ListingConnection({
+            ('a', None, None): {'items': [{'name': 'a1'}]},
+        })
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+
+        with self.assertRaises(NotFound):
+            list(bucket.list_blobs_parallel(shards=['a', 'b']))
+
+    def test_list_blobs_parallel_abandoned(self):
+        NAME = 'name'
+        pages = {}
+        for index in range(20):
+            token = 'token%d' % (index,) if index else None
+            pages[('', None, token)] = {
+                'items': [{'name': 'blob%d' % (index,)}],
+                'nextPageToken': 'token%d' % (index + 1,),
+            }
+        pages[('', None, 'token20')] = {'items': []}
+        connection = _ListingConnection(pages)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+
+        iterator = bucket.list_blobs_parallel(
+            shards=[(None, None)], max_workers=1, prefetch_pages=1)
+        self.assertEqual(next(iterator).name, 'blob0')
+        iterator.close()
+
+        self.assertLess(len(connection._requested), 21)
+
     def test_list_blobs(self):
         NAME = 'name'
         connection = _Connection({'items': []})
@@ -852,6 +1014,40 @@ class Test_Bucket(unittest.TestCase):
         self.assertRaises(ValueError, bucket.delete, force=True)
         self.assertEqual(connection._deleted_buckets, [])
 
+    def test_delete_w_max_objects(self):
+        NAME = 'name'
+        GET_BLOBS_RESP = {
+            'items': [{'name': 'blob-name%d' % (index,)}
+                      for index in range(3)],
+        }
+        connection = _Connection(GET_BLOBS_RESP, {}, {}, {})
+        connection._delete_bucket = True
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        bucket._MAX_OBJECTS_FOR_ITERATION = 1
+
+        # A larger cap allows deleting more than the default.
+        bucket.delete(force=True, max_objects=3)
+
+        list_request = connection._requested[0]
+        self.assertEqual(list_request['query_params']['maxResults'], 4)
+        self.assertEqual(len(connection._deleted_buckets), 1)
+
+    def test_delete_too_many_w_max_objects(self):
+        NAME = 'name'
+        GET_BLOBS_RESP = {
+            'items': [{'name': 'blob-name1'}, {'name': 'blob-name2'}],
+        }
+        connection = _Connection(GET_BLOBS_RESP)
+        connection._delete_bucket = True
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+
+        with self.assertRaises(ValueError):
+            bucket.delete(force=True, max_objects=1)
+
+        self.assertEqual(connection._deleted_buckets, [])
+
     def test_delete_blob_miss(self):
         from google.cloud.exceptions import NotFound
 
@@ -881,6 +1077,23 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
         self.assertEqual(kw['query_params'], {'userProject': USER_PROJECT})
 
+    def test_delete_blob_w_metadata_cache(self):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        connection = _Connection({})
+        client = _Client(connection)
+        client.metadata_cache = cache = MetadataCache()
+        cache.put(NAME, BLOB_NAME, {'name': BLOB_NAME})
+        cache.put(NAME, 'other', {'name': 'other'})
+        bucket = self._make_one(client=client, name=NAME)
+
+        bucket.delete_blob(BLOB_NAME)
+
+        self.assertIsNone(cache.get(NAME, BLOB_NAME))
+        self.assertIsNotNone(cache.get(NAME, 'other'))
+
     def test_delete_blobs_empty(self):
         NAME = 'name'
         connection = _Connection()
@@ -962,6 +1175,134 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], COPY_PATH)
         self.assertEqual(kw['query_params'], {})
 
+    def test_delete_blobs_w_multiple_batches(self):
+        NAME = 'name'
+        BLOB_NAMES = ['blob-name%d' % (index,) for index in range(5)]
+        connection = _Connection({}, {}, {}, {}, {})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        bucket._MAX_DELETES_PER_BATCH = 2
+        progress = []
+
+        bucket.delete_blobs(
+            iter(BLOB_NAMES), max_workers=1, on_progress=progress.append)
+
+        self.assertEqual(progress, [2, 4, 5])
+        self.assertEqual(
+            [kw['path'] for kw in connection._requested],
+            ['/b/%s/o/%s' % (NAME, blob_name) for blob_name in BLOB_NAMES])
+
+    def test_delete_blobs_w_blobs_and_on_error(self):
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        bucket = self._make_one(client=None, name=NAME)
+        blobs = [Blob('blob-name%d' % (index,), bucket) for index in range(4)]
+        connection = _Connection({}, {})
+        client = _Client(connection)
+        bucket._MAX_DELETES_PER_BATCH = 3
+        errors = []
+        progress = []
+
+        bucket.delete_blobs(
+            blobs, on_error=errors.append, client=client, max_workers=2,
+            on_progress=progress.append)
+
+        self.assertEqual(errors, blobs[2:])
+        self.assertEqual(progress, [3, 4])
+        self.assertEqual(len(connection._requested), 4)
+
+    def test_delete_blobs_w_other_error(self):
+        import requests
+        from google.cloud.exceptions import Forbidden
+
+        NAME = 'name'
+        response = requests.Response()
+        response.status_code = 403
+        response.request = requests.Request(
+            'BATCH', 'contentid://1').prepare()
+        response._content = b''
+        client = mock.Mock(current_batch=None, spec=['batch', 'current_batch'])
+        client.batch.return_value.finish.return_value = [response]
+        bucket = self._make_one(client=client, name=NAME)
+        errors = []
+
+        with self.assertRaises(Forbidden):
+            bucket.delete_blobs(['blob-name'], on_error=errors.append)
+
+        self.assertEqual(errors, [])
+        client.batch.assert_called_once_with(raise_exception=False)
+
+    def test_delete_blobs_w_error_cancels_pending(self):
+        import requests
+        from google.cloud.exceptions import Forbidden
+
+        NAME = 'name'
+        response = requests.Response()
+        response.status_code = 403
+        response.request = requests.Request(
+            'BATCH', 'contentid://1').prepare()
+        response._content = b''
+        client = mock.Mock(current_batch=None, spec=['batch', 'current_batch'])
+        client.batch.return_value.finish.return_value = [response]
+        bucket = self._make_one(client=client, name=NAME)
+        bucket._MAX_DELETES_PER_BATCH = 1
+        cancel = mock.patch(
+            'concurrent.futures.Future.cancel', autospec=True)
+
+        with cancel as cancel_mock:
+            with self.assertRaises(Forbidden):
+                bucket.delete_blobs(['a', 'b', 'c'], max_workers=1)
+
+        # The second batch was queued when the first one failed.
+        cancel_mock.assert_called_once_with(mock.ANY)
+
+    def test_delete_blobs_w_metadata_cache(self):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        NAME = 'name'
+        connection = _Connection({}, {})
+        client = _Client(connection)
+        client.metadata_cache = cache = MetadataCache()
+        cache.put(NAME, 'a', {'name': 'a'})
+        cache.put(NAME, 'b', {'name': 'b'})
+        cache.put(NAME, 'other', {'name': 'other'})
+        bucket = self._make_one(client=client, name=NAME)
+
+        bucket.delete_blobs(['a', 'b'])
+
+        self.assertIsNone(cache.get(NAME, 'a'))
+        self.assertIsNone(cache.get(NAME, 'b'))
+        self.assertIsNotNone(cache.get(NAME, 'other'))
+
+    def test_delete_blobs_w_current_batch(self):
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        NONESUCH = 'nonesuch'
+        connection = _Connection({})
+        client = _Client(connection)
+        client.current_batch = object()
+        client.batch = None
+        bucket = self._make_one(client=client, name=NAME)
+        errors = []
+
+        bucket.delete_blobs([BLOB_NAME, NONESUCH], errors.append)
+
+        self.assertEqual(errors, [NONESUCH])
+        self.assertEqual(len(connection._requested), 2)
+
+    def test_delete_blobs_w_current_batch_miss_no_on_error(self):
+        from google.cloud.exceptions import NotFound
+
+        NAME = 'name'
+        connection = _Connection()
+        client = _Client(connection)
+        client.current_batch = object()
+        bucket = self._make_one(client=client, name=NAME)
+
+        with self.assertRaises(NotFound):
+            bucket.delete_blobs(['nonesuch'])
+
     def test_copy_blobs_source_generation(self):
         SOURCE = 'source'
         DEST = 'dest'
@@ -2534,6 +2875,65 @@ class Test_Bucket(unittest.TestCase):
             })
 
 
+class Test__ShardedListing(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(connection, max_workers=1, prefetch_pages=1):
+        from google.cloud.storage.bucket import Bucket
+        from google.cloud.storage.bucket import _ShardedListing
+        from google.cloud.storage.bucket import _item_to_blob
+
+        client = _Client(connection)
+        bucket = Bucket(client, name='name')
+        return _ShardedListing(
+            bucket, client, {}, _item_to_blob, max_workers, prefetch_pages)
+
+    def test__put_retries_while_full(self):
+        from six.moves import queue
+
+        listing = self._make_one(_ListingConnection({}))
+        listing._queue = mock.Mock(spec=['put'])
+        listing._queue.put.side_effect = [queue.Full(), None]
+
+        self.assertTrue(listing._put(['item']))
+
+        self.assertEqual(listing._queue.put.call_count, 2)
+
+    def test__list_shard_after_stop(self):
+        connection = _ListingConnection({})
+        listing = self._make_one(connection)
+        listing._stopped.set()
+
+        listing._list_shard({}, False)
+
+        self.assertEqual(connection._requested, [])
+        self.assertTrue(listing._queue.empty())
+
+    def test__list_shard_stopped_while_listing(self):
+        connection = _ListingConnection({
+            ('', None, None): {
+                'items': [{'name': 'blob'}],
+                'prefixes': ['a/', 'b/'],
+            },
+        })
+        listing = self._make_one(connection)
+        listing._executor = mock.Mock(spec=['submit'])
+        api_request = connection.api_request
+
+        def stop_after_request(**kw):
+            listing._stopped.set()
+            return api_request(**kw)
+
+        connection.api_request = stop_after_request
+
+        listing._list_shard({'delimiter': '/'}, True)
+
+        # No shard is started for the prefixes, and the page is not queued.
+        listing._executor.submit.assert_not_called()
+        self.assertEqual(len(connection._requested), 1)
+        self.assertTrue(listing._queue.empty())
+
+
 class _Connection(object):
     _delete_bucket = False
 
@@ -2570,9 +2970,66 @@ class _Connection(object):
             return response
 
 
+class _ListingConnection(object):
+    """Answer list requests by prefix, start offset and page token."""
+
+    def __init__(self, pages):
+        import threading
+
+        self._pages = pages
+        self._requested = []
+        self._lock = threading.Lock()
+
+    def api_request(self, **kw):
+        from google.cloud.exceptions import NotFound
+
+        with self._lock:
+            self._requested.append(kw)
+        params = kw['query_params']
+        key = (params.get('prefix', ''), params.get('startOffset'),
+               params.get('pageToken'))
+        try:
+            return self._pages[key]
+        except KeyError:
+            raise NotFound('miss')
+
+
 class _Client(object):
 
     def __init__(self, connection, project=None):
         self._connection = connection
         self._base_connection = connection
         self.project = project
+
+    current_batch = None
+    metadata_cache = None
+
+    def batch(self, raise_exception=True):
+        return _Batch(self._connection)
+
+
+class _Batch(object):
+    """Send each deferred request immediately, recording its status."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._responses = []
+
+    def api_request(self, **kw):
+        import requests
+        from google.cloud.exceptions import GoogleCloudError
+
+        try:
+            self._connection.api_request(**kw)
+            status = 204
+        except GoogleCloudError as exc:
+            status = exc.code
+        response = requests.Response()
+        response.status_code = status
+        response.request = requests.Request(
+            'BATCH', 'contentid://%d' % (len(self._responses),)).prepare()
+        response._content = b''
+        self._responses.append(response)
+
+    def finish(self):
+        return self._responses
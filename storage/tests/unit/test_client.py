@@ -74,6 +74,18 @@ class TestClient(unittest.TestCase):
         self.assertIs(client._connection.credentials, CREDENTIALS)
         self.assertIsNone(client.current_batch)
         self.assertEqual(list(client._batch_stack), [])
+        self.assertIsNone(client.metadata_cache)
+
+    def test_ctor_w_metadata_cache(self):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        CREDENTIALS = _make_credentials()
+        cache = MetadataCache()
+
+        client = self._make_one(
+            project='PROJECT', credentials=CREDENTIALS, metadata_cache=cache)
+
+        self.assertIs(client.metadata_cache, cache)
 
     def test_ctor_wo_project(self):
         from google.cloud.storage._http import Connection
@@ -267,6 +279,14 @@ class TestClient(unittest.TestCase):
         self.assertIsInstance(batch, Batch)
         self.assertIs(batch._client, client)
 
+    def test_batch_wo_raise_exception(self):
+        PROJECT = 'PROJECT'
+        CREDENTIALS = _make_credentials()
+
+        client = self._make_one(project=PROJECT, credentials=CREDENTIALS)
+        batch = client.batch(raise_exception=False)
+        self.assertFalse(batch._raise_exception)
+
     def test_get_bucket_miss(self):
         from google.cloud.exceptions import NotFound
 
@@ -0,0 +1,530 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import unittest
+
+import mock
+from six.moves import http_client
+
+
+def _make_response(status_code, headers=None, content=b''):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.request = requests.Request('GET', 'http://example.com').prepare()
+    response._content = content
+    return response
+
+
+def _make_ranged_transport(content):
+    import threading
+
+    lock = threading.Lock()
+    ranges = []
+
+    def request(method, url, data=None, headers=None):
+        first, last = headers['range'][len('bytes='):].split('-')
+        first, last = int(first), min(int(last), len(content) - 1)
+        with lock:
+            ranges.append((first, last))
+        return _make_response(
+            http_client.PARTIAL_CONTENT,
+            {'content-length': str(last - first + 1),
+             'content-range': 'bytes {}-{}/{}'.format(
+                 first, last, len(content))},
+            content=content[first:last + 1])
+
+    transport = mock.Mock(spec=['request'])
+    transport.request.side_effect = request
+    transport.ranges = ranges
+    return transport
+
+
+def _make_blob(transport=None, **properties):
+    from google.cloud.storage.blob import Blob
+
+    client = mock.Mock(_http=transport, spec=['_http'])
+    bucket = mock.Mock(client=client, user_project=None, spec=[
+        'client', 'user_project', 'path'])
+    bucket.path = '/b/name'
+    properties.setdefault('mediaLink', 'http://example.com/media/')
+    properties.setdefault('generation', '1')
+    blob = Blob('blob-name', bucket)
+    blob._properties.update(properties)
+    return blob
+
+
+class TestBlobReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_reader(self, data, **kwargs):
+        transport = _make_ranged_transport(data)
+        blob = _make_blob(transport, size=str(len(data)))
+        return self._make_one(blob, **kwargs), transport
+
+    def test_read_all(self):
+        data = os.urandom(1000)
+        reader, transport = self._make_reader(data, chunk_size=300)
+
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertEqual(reader.read(), data)
+        self.assertEqual(reader.tell(), 1000)
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(
+            sorted(transport.ranges),
+            [(0, 299), (300, 599), (600, 899), (900, 999)])
+
+    def test_read_in_pieces_wo_read_ahead(self):
+        data = os.urandom(100)
+        reader, transport = self._make_reader(
+            data, chunk_size=40, read_ahead=False)
+
+        self.assertEqual(reader.read(30), data[:30])
+        self.assertEqual(transport.ranges, [(0, 39)])
+        self.assertEqual(reader.read(30), data[30:60])
+        self.assertEqual(reader.read1(), data[60:80])
+        self.assertEqual(reader.read1(5), data[80:85])
+        self.assertEqual(reader.read(100), data[85:])
+        self.assertEqual(reader.read1(), b'')
+        self.assertEqual(transport.ranges, [(0, 39), (40, 79), (80, 99)])
+
+    def test_read_uses_read_ahead(self):
+        data = os.urandom(100)
+        reader, transport = self._make_reader(data, chunk_size=50)
+
+        self.assertEqual(reader.read(10), data[:10])
+        prefetch = reader._prefetch[1]
+        self.assertEqual(prefetch.result(), data[50:])
+        self.assertEqual(reader.read(), data[10:])
+        self.assertEqual(transport.ranges, [(0, 49), (50, 99)])
+        self.assertIsNone(reader._prefetch)
+
+    def test_seek(self):
+        data = os.urandom(100)
+        reader, transport = self._make_reader(
+            data, chunk_size=40, read_ahead=False)
+
+        self.assertEqual(reader.seek(10), 10)
+        self.assertEqual(reader.read(5), data[10:15])
+        self.assertEqual(reader.seek(-5, os.SEEK_CUR), 10)
+        self.assertEqual(reader.read(5), data[10:15])
+        self.assertEqual(transport.ranges, [(10, 49)])
+
+        self.assertEqual(reader.seek(-10, os.SEEK_END), 90)
+        self.assertEqual(reader.read(), data[90:])
+        self.assertEqual(reader.seek(200), 200)
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(transport.ranges, [(10, 49), (90, 99)])
+
+    def test_seek_invalid(self):
+        reader, _ = self._make_reader(b'data')
+
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+        with self.assertRaises(ValueError):
+            reader.seek(0, 3)
+
+    def test_seek_discards_prefetch(self):
+        data = os.urandom(100)
+        reader, transport = self._make_reader(data, chunk_size=20)
+
+        reader.read(1)
+        reader._prefetch[1].result()
+        reader.seek(60)
+
+        self.assertEqual(reader.read(10), data[60:70])
+        self.assertEqual(reader._prefetch[0], 80)
+
+    def test_readline_w_text_wrapper(self):
+        data = b'first line\nsecond line\nthird'
+        reader, _ = self._make_reader(data, chunk_size=8)
+
+        lines = list(io.TextIOWrapper(reader, encoding='utf-8'))
+
+        self.assertEqual(lines, ['first line\n', 'second line\n', 'third'])
+
+    def test_peek(self):
+        data = os.urandom(100)
+        reader, _ = self._make_reader(data, chunk_size=40, read_ahead=False)
+        reader.seek(30)
+
+        self.assertEqual(reader.peek(), data[30:70])
+        self.assertEqual(reader.tell(), 30)
+        reader.seek(100)
+        self.assertEqual(reader.peek(), b'')
+
+    def test_reload_wo_size(self):
+        data = os.urandom(10)
+        transport = _make_ranged_transport(data)
+        blob = _make_blob(transport)
+        client = mock.Mock(_http=transport, spec=['_http'])
+
+        def reload(client=None):
+            blob._properties['size'] = str(len(data))
+
+        patch = mock.patch.object(blob, 'reload', side_effect=reload)
+        reader = self._make_one(blob, client=client)
+
+        with patch as reload_mock:
+            self.assertEqual(reader.read(), data)
+
+        reload_mock.assert_called_once_with(client=client)
+
+    def test_read_w_error(self):
+        from google.cloud.exceptions import NotFound
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = _make_response(
+            http_client.NOT_FOUND)
+        blob = _make_blob(transport, size='10')
+        reader = self._make_one(blob)
+
+        with self.assertRaises(NotFound):
+            reader.read()
+
+    def test_close(self):
+        data = os.urandom(100)
+        reader, _ = self._make_reader(data, chunk_size=50)
+        reader.read(1)
+
+        reader.close()
+
+        self.assertTrue(reader.closed)
+        self.assertIsNone(reader._prefetch)
+        with self.assertRaises(ValueError):
+            reader.read()
+        with self.assertRaises(ValueError):
+            reader.seek(0)
+        with self.assertRaises(ValueError):
+            reader.read1()
+        with self.assertRaises(ValueError):
+            reader.peek()
+        reader.close()
+
+
+class Test_SlidingBuffer(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.fileio import _SlidingBuffer
+
+        return _SlidingBuffer()
+
+    def test_read_all(self):
+        buff = self._make_one()
+        buff.write(b'abcdef')
+
+        self.assertEqual(buff.read(2), b'ab')
+        self.assertEqual(buff.read(), b'cdef')
+        self.assertEqual(buff.tell(), 6)
+
+    def test_seek_after_discard(self):
+        buff = self._make_one()
+        buff.write(b'abcdef')
+        buff.read(4)
+        buff.discard(2)
+
+        self.assertEqual(buff.seek(2), 2)
+        self.assertEqual(buff.unread, 4)
+        self.assertEqual(buff.read(), b'cdef')
+
+    def test_seek_outside_buffer(self):
+        buff = self._make_one()
+        buff.write(b'abcdef')
+        buff.read(4)
+        buff.discard(2)
+
+        with self.assertRaises(ValueError):
+            buff.seek(1)
+        with self.assertRaises(ValueError):
+            buff.seek(7)
+        self.assertEqual(buff.tell(), 4)
+
+    def test_seek_w_whence(self):
+        buff = self._make_one()
+
+        with self.assertRaises(ValueError):
+            buff.seek(0, os.SEEK_END)
+
+
+class _FakeUpload(object):
+    """Resumable upload which reads from a stream like the real one."""
+
+    def __init__(self, stream, chunk_size, keep_short=0):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.keep_short = keep_short
+        self.bytes_uploaded = 0
+        self.finished = False
+        self.received = b''
+        self.chunks = []
+
+    def transmit_next_chunk(self, transport):
+        from google import resumable_media
+
+        assert self.stream.tell() == self.bytes_uploaded
+        data = self.stream.read(self.chunk_size)
+        self.chunks.append(len(data))
+        if len(data) < self.chunk_size:
+            self.received += data
+            self.bytes_uploaded += len(data)
+            self.finished = True
+            return _make_response(http_client.OK, content=b'{"size": "1"}')
+
+        # Simulate the service keeping only part of the chunk, once.
+        kept = len(data) - self.keep_short
+        self.keep_short = 0
+        self.received += data[:kept]
+        self.bytes_uploaded += kept
+        return _make_response(resumable_media.PERMANENT_REDIRECT)
+
+
+class TestBlobWriter(unittest.TestCase):
+
+    CHUNK_SIZE = 256 * 1024
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_writer(self, keep_short=0, **kwargs):
+        blob = _make_blob()
+        uploads = []
+
+        def initiate(client, stream, content_type, size, num_retries,
+                     predefined_acl=None, chunk_size=None):
+            upload = _FakeUpload(stream, chunk_size, keep_short=keep_short)
+            uploads.append(upload)
+            return upload, mock.sentinel.transport
+
+        blob._initiate_resumable_upload = mock.Mock(side_effect=initiate)
+        blob.upload_from_file = mock.Mock(spec=[])
+        kwargs.setdefault('chunk_size', self.CHUNK_SIZE)
+        return self._make_one(blob, **kwargs), blob, uploads
+
+    def test_ctor_w_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_make_blob(), chunk_size=1000)
+
+    def test_ctor_defaults_to_blob_chunk_size(self):
+        blob = _make_blob()
+        blob.chunk_size = 2 * self.CHUNK_SIZE
+
+        writer = self._make_one(blob)
+
+        self.assertEqual(writer._chunk_size, 2 * self.CHUNK_SIZE)
+
+    def test_write_small(self):
+        writer, blob, uploads = self._make_writer(
+            content_type='text/plain', predefined_acl='private')
+
+        self.assertTrue(writer.writable())
+        self.assertEqual(writer.write(b'abc'), 3)
+        self.assertEqual(writer.write(b'def'), 3)
+        self.assertEqual(writer.tell(), 6)
+        blob.upload_from_file.assert_not_called()
+
+        def upload_from_file(stream, size, **kwargs):
+            self.assertEqual(stream.read(size), b'abcdef')
+
+        blob.upload_from_file.side_effect = upload_from_file
+        writer.close()
+
+        self.assertEqual(uploads, [])
+        blob.upload_from_file.assert_called_once_with(
+            mock.ANY, size=6, content_type='text/plain', client=None,
+            predefined_acl='private')
+        self.assertTrue(writer.closed)
+        with self.assertRaises(ValueError):
+            writer.write(b'more')
+        writer.close()
+
+    def _check_large_write(self, data, keep_short=0):
+        writer, blob, uploads = self._make_writer(keep_short=keep_short)
+
+        for start in range(0, len(data), 100000):
+            writer.write(data[start:start + 100000])
+        writer.close()
+
+        upload, = uploads
+        self.assertEqual(upload.received, data)
+        self.assertTrue(upload.finished)
+        self.assertEqual(blob.size, 1)
+        blob.upload_from_file.assert_not_called()
+        blob._initiate_resumable_upload.assert_called_once_with(
+            None, mock.ANY, None, None, None, predefined_acl=None,
+            chunk_size=self.CHUNK_SIZE)
+        return upload
+
+    def test_write_large(self):
+        data = os.urandom(2 * self.CHUNK_SIZE + 1000)
+
+        upload = self._check_large_write(data)
+
+        self.assertEqual(
+            upload.chunks, [self.CHUNK_SIZE, self.CHUNK_SIZE, 1000])
+
+    def test_write_exact_chunks(self):
+        data = os.urandom(2 * self.CHUNK_SIZE)
+
+        upload = self._check_large_write(data)
+
+        self.assertEqual(upload.chunks, [self.CHUNK_SIZE, self.CHUNK_SIZE, 0])
+
+    def test_write_w_partial_chunk_kept(self):
+        data = os.urandom(2 * self.CHUNK_SIZE + 1000)
+
+        upload = self._check_large_write(data, keep_short=10)
+
+        self.assertEqual(
+            upload.chunks, [self.CHUNK_SIZE, self.CHUNK_SIZE, 1010])
+
+    def test_write_discards_uploaded_data(self):
+        writer, _, uploads = self._make_writer()
+
+        writer.write(os.urandom(3 * self.CHUNK_SIZE + 10))
+        writer._wait()
+
+        self.assertEqual(uploads[0].bytes_uploaded, 3 * self.CHUNK_SIZE)
+        self.assertEqual(len(writer._buffer._buffer), 10)
+        writer.close()
+
+    def test_write_w_error(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        writer, blob, _ = self._make_writer()
+        blob._initiate_resumable_upload.side_effect = ServiceUnavailable(
+            'oops')
+
+        writer.write(os.urandom(self.CHUNK_SIZE))
+        with self.assertRaises(ServiceUnavailable):
+            writer.write(os.urandom(self.CHUNK_SIZE))
+
+    def test_context_manager(self):
+        writer, blob, _ = self._make_writer()
+
+        with writer:
+            writer.write(b'data')
+
+        self.assertTrue(writer.closed)
+        blob.upload_from_file.assert_called_once()
+
+    def test_context_manager_w_error(self):
+        writer, blob, uploads = self._make_writer()
+
+        with self.assertRaises(RuntimeError):
+            with writer:
+                writer.write(os.urandom(self.CHUNK_SIZE + 10))
+                raise RuntimeError('oops')
+
+        self.assertTrue(writer.closed)
+        blob.upload_from_file.assert_not_called()
+        self.assertFalse(uploads[0].finished)
+
+    def test_context_manager_w_error_after_close(self):
+        writer, blob, _ = self._make_writer()
+
+        with self.assertRaises(RuntimeError):
+            with writer:
+                writer.close()
+                raise RuntimeError('oops')
+
+        blob.upload_from_file.assert_called_once()
+
+
+class TestBlobTextWrapper(unittest.TestCase):
+
+    CHUNK_SIZE = 256 * 1024
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobTextWrapper
+
+        return BlobTextWrapper
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_writer(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = _make_blob()
+        uploads = []
+
+        def initiate(client, stream, content_type, size, num_retries,
+                     predefined_acl=None, chunk_size=None):
+            upload = _FakeUpload(stream, chunk_size)
+            uploads.append(upload)
+            return upload, mock.sentinel.transport
+
+        blob._initiate_resumable_upload = mock.Mock(side_effect=initiate)
+        blob.upload_from_file = mock.Mock(spec=[])
+        writer = BlobWriter(blob, chunk_size=self.CHUNK_SIZE)
+        return self._make_one(writer, encoding='utf-8'), blob, uploads
+
+    def test_context_manager(self):
+        text, blob, _ = self._make_writer()
+
+        with text:
+            text.write(u'caf\xe9')
+
+        self.assertTrue(text.closed)
+        blob.upload_from_file.assert_called_once()
+        self.assertEqual(blob.upload_from_file.call_args[1]['size'], 5)
+
+    def test_context_manager_w_error(self):
+        text, blob, uploads = self._make_writer()
+
+        with self.assertRaises(RuntimeError):
+            with text:
+                text.write(u'x' * (self.CHUNK_SIZE + 10))
+                text.write(u'partial line')
+                raise RuntimeError('oops')
+
+        self.assertTrue(text.closed)
+        self.assertTrue(text.buffer.closed)
+        blob.upload_from_file.assert_not_called()
+        self.assertFalse(uploads[0].finished)
+
+    def test_context_manager_w_error_while_reading(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        data = b'first line\nsecond line\n'
+        blob = _make_blob(_make_ranged_transport(data), size=str(len(data)))
+        text = self._make_one(BlobReader(blob), encoding='utf-8')
+
+        with self.assertRaises(RuntimeError):
+            with text:
+                self.assertEqual(text.readline(), u'first line\n')
+                raise RuntimeError('oops')
+
+        self.assertTrue(text.closed)
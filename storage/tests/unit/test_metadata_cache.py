@@ -0,0 +1,137 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        return MetadataCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        cache = self._make_one()
+
+        self.assertEqual(cache.max_size, 1024)
+        self.assertEqual(cache.ttl, 60.0)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_get_miss(self):
+        cache = self._make_one()
+
+        self.assertIsNone(cache.get('bucket', 'blob'))
+        self.assertEqual(cache.misses, 1)
+
+    def test_put_and_get(self):
+        cache = self._make_one()
+        properties = {'name': 'blob', 'metadata': {'key': 'value'},
+                      'acl': [{'entity': 'allUsers'}]}
+
+        cache.put('bucket', 'blob', properties)
+        properties['metadata']['key'] = 'changed'
+        found = cache.get('bucket', 'blob')
+        found['metadata']['key'] = 'changed again'
+
+        self.assertEqual(
+            cache.get('bucket', 'blob'),
+            {'name': 'blob', 'metadata': {'key': 'value'}})
+        self.assertEqual(cache.hits, 2)
+        self.assertIsNone(cache.get('other-bucket', 'blob'))
+
+    def test_get_expired(self):
+        cache = self._make_one(ttl=10)
+        with mock.patch('time.time', return_value=100.0):
+            cache.put('bucket', 'blob', {'name': 'blob'})
+
+        with mock.patch('time.time', return_value=109.0):
+            self.assertIsNotNone(cache.get('bucket', 'blob'))
+        with mock.patch('time.time', return_value=110.0):
+            self.assertIsNone(cache.get('bucket', 'blob'))
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 1)
+
+    def test_get_w_minimum_version(self):
+        cache = self._make_one()
+        cache.put('bucket', 'blob', {'generation': '5',
+                                     'metageneration': '2'})
+
+        self.assertIsNotNone(cache.get('bucket', 'blob', min_generation=5,
+                                       min_metageneration=2))
+        self.assertIsNotNone(cache.get('bucket', 'blob', min_generation=4,
+                                       min_metageneration=7))
+        self.assertIsNone(cache.get('bucket', 'blob', min_generation=5,
+                                    min_metageneration=3))
+        self.assertIsNone(cache.get('bucket', 'blob', min_generation=6))
+        self.assertEqual(len(cache), 1)
+
+    def test_put_keeps_newer_version(self):
+        cache = self._make_one()
+        newer = {'generation': '2', 'metageneration': '1'}
+        cache.put('bucket', 'blob', newer)
+
+        cache.put('bucket', 'blob', {'generation': '1',
+                                     'metageneration': '9'})
+        self.assertEqual(cache.get('bucket', 'blob'), newer)
+
+        newest = {'generation': '2', 'metageneration': '2'}
+        cache.put('bucket', 'blob', newest)
+        self.assertEqual(cache.get('bucket', 'blob'), newest)
+
+    def test_put_non_dict_invalidates(self):
+        cache = self._make_one()
+        cache.put('bucket', 'blob', {'name': 'blob'})
+
+        cache.put('bucket', 'blob', object())
+
+        self.assertEqual(len(cache), 0)
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._make_one(max_size=2)
+        cache.put('bucket', 'a', {'name': 'a'})
+        cache.put('bucket', 'b', {'name': 'b'})
+        cache.get('bucket', 'a')
+
+        cache.put('bucket', 'c', {'name': 'c'})
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get('bucket', 'b'))
+        self.assertIsNotNone(cache.get('bucket', 'a'))
+        self.assertIsNotNone(cache.get('bucket', 'c'))
+
+    def test_invalidate_and_clear(self):
+        cache = self._make_one()
+        cache.put('bucket', 'a', {'name': 'a'})
+        cache.put('bucket', 'b', {'name': 'b'})
+
+        cache.invalidate('bucket', 'a')
+        cache.invalidate('bucket', 'missing')
+        self.assertIsNone(cache.get('bucket', 'a'))
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 1)
@@ -0,0 +1,637 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_client():
+    import requests
+
+    return mock.Mock(_http=requests.Session(), spec=['_http'])
+
+
+def _make_blob(name, client=None, size=None, **kwargs):
+    from google.cloud.storage.blob import Blob
+
+    bucket = mock.Mock(client=client, user_project=None, spec=[
+        'client', 'user_project', 'name', 'path'])
+    bucket.name = 'name'
+    bucket.path = '/b/name'
+    blob = Blob(name, bucket, **kwargs)
+    blob._properties['size'] = size
+    return blob
+
+
+class TestTransferSummary(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.transfer_manager import TransferSummary
+
+        return TransferSummary
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_result(size, error=None):
+        from google.cloud.storage.transfer_manager import TransferResult
+
+        return TransferResult(None, 'file', 'multipart', size, 1.0, error)
+
+    def test_totals(self):
+        error = ValueError('oops')
+        results = [
+            self._make_result(10),
+            self._make_result(None, error),
+            self._make_result(30),
+        ]
+        summary = self._make_one(results, 2.0)
+
+        self.assertEqual(summary.errors, [results[1]])
+        self.assertEqual(summary.bytes_transferred, 40)
+        self.assertEqual(summary.throughput, 20.0)
+
+    def test_throughput_wo_elapsed(self):
+        summary = self._make_one([], 0.0)
+
+        self.assertEqual(summary.throughput, 0.0)
+
+
+class Test__upload_method(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args):
+        from google.cloud.storage.transfer_manager import _upload_method
+
+        return _upload_method(*args)
+
+    def test_multipart(self):
+        from google.cloud.storage import transfer_manager
+
+        blob = _make_blob('blob-name')
+
+        self.assertEqual(
+            self._call_fut(blob, 1024, None), transfer_manager.MULTIPART)
+
+    def test_resumable(self):
+        from google.cloud.storage import transfer_manager
+        from google.cloud.storage.blob import _MAX_MULTIPART_SIZE
+
+        blob = _make_blob('blob-name')
+        chunked_blob = _make_blob('blob-name', chunk_size=256 * 1024)
+
+        self.assertEqual(
+            self._call_fut(blob, _MAX_MULTIPART_SIZE + 1, None),
+            transfer_manager.RESUMABLE)
+        self.assertEqual(
+            self._call_fut(chunked_blob, 1024, None),
+            transfer_manager.RESUMABLE)
+
+    def test_sliced(self):
+        from google.cloud.storage import transfer_manager
+
+        blob = _make_blob('blob-name')
+        encrypted_blob = _make_blob('blob-name', encryption_key=b'0' * 32)
+
+        self.assertEqual(
+            self._call_fut(blob, 1024, 512), transfer_manager.SLICED)
+        self.assertEqual(
+            self._call_fut(encrypted_blob, 1024, 512),
+            transfer_manager.MULTIPART)
+
+
+class Test_upload_many(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write_file(self, name, size):
+        filename = os.path.join(self.directory, name)
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(b'x' * size)
+        return filename
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import upload_many
+
+        return upload_many(*args, **kwargs)
+
+    def test_empty(self):
+        summary = self._call_fut([])
+
+        self.assertEqual(summary.results, [])
+        self.assertEqual(summary.bytes_transferred, 0)
+
+    def test_success(self):
+        from google.cloud.storage import transfer_manager
+
+        client = _make_client()
+        pairs = [
+            (self._write_file('small', 10), _make_blob('small', client)),
+            (self._write_file('large', 100), _make_blob('large', client)),
+        ]
+        progress = []
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.upload_from_filename',
+            autospec=True)
+
+        with patch as upload:
+            summary = self._call_fut(
+                pairs, max_workers=4, slice_size=50, slice_workers=3,
+                on_progress=progress.append)
+
+        self.assertEqual(
+            [result.blob for result in summary.results],
+            [blob for _, blob in pairs])
+        self.assertEqual(
+            [result.method for result in summary.results],
+            [transfer_manager.MULTIPART, transfer_manager.SLICED])
+        self.assertEqual(summary.bytes_transferred, 110)
+        self.assertEqual(summary.errors, [])
+        self.assertEqual(
+            sorted(result.filename for result in progress),
+            sorted(filename for filename, _ in pairs))
+        self.assertEqual(upload.call_count, 2)
+        for filename, blob in pairs:
+            upload.assert_any_call(
+                blob, filename, client=client, slice_size=50, max_workers=3)
+        adapter = client._http.get_adapter('https://example.com')
+        self.assertEqual(adapter._pool_maxsize, 12)
+
+    def test_failure(self):
+        from google.cloud.exceptions import NotFound
+
+        client = _make_client()
+        blob = _make_blob('blob', client)
+        pairs = [
+            (os.path.join(self.directory, 'missing'), blob),
+            (self._write_file('file', 10), blob),
+        ]
+        error = NotFound('oops')
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.upload_from_filename',
+            autospec=True, side_effect=[error])
+
+        with patch:
+            summary = self._call_fut(pairs, client=client, max_workers=1)
+
+        missing, uploaded = summary.results
+        self.assertIsInstance(missing.error, OSError)
+        self.assertIsNone(missing.method)
+        self.assertIs(uploaded.error, error)
+        self.assertEqual(summary.errors, [missing, uploaded])
+        self.assertEqual(summary.bytes_transferred, 0)
+
+    def test_failure_w_raise_exception(self):
+        from google.cloud.exceptions import NotFound
+
+        client = _make_client()
+        pairs = [
+            (self._write_file('file1', 10), _make_blob('blob1', client)),
+            (self._write_file('file2', 10), _make_blob('blob2', client)),
+        ]
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.upload_from_filename',
+            autospec=True, side_effect=[None, NotFound('oops')])
+
+        with patch as upload:
+            with self.assertRaises(NotFound):
+                self._call_fut(pairs, max_workers=1, raise_exception=True)
+
+        self.assertEqual(upload.call_count, 2)
+
+    def test_upload_directory(self):
+        from google.cloud.storage.transfer_manager import upload_directory
+
+        self._write_file('top', 1)
+        self._write_file(os.path.join('sub', 'nested'), 2)
+        bucket = mock.Mock(spec=['blob'])
+        bucket.blob.side_effect = lambda name: _make_blob(name, _make_client())
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.upload_from_filename',
+            autospec=True)
+
+        with patch:
+            summary = upload_directory(
+                bucket, self.directory, blob_name_prefix='prefix/')
+
+        self.assertEqual(
+            sorted((result.blob.name, result.filename)
+                   for result in summary.results),
+            [('prefix/sub/nested',
+              os.path.join(self.directory, 'sub', 'nested')),
+             ('prefix/top', os.path.join(self.directory, 'top'))])
+        self.assertEqual(summary.bytes_transferred, 3)
+
+
+class Test_download_many(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def _download(blob, filename, **kwargs):
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(b'x' * blob.size)
+
+    def test_download_many(self):
+        from google.cloud.storage import transfer_manager
+
+        client = _make_client()
+        pairs = [
+            (_make_blob('small', client, size=10),
+             os.path.join(self.directory, 'small')),
+            (_make_blob('large', client, size=100),
+             os.path.join(self.directory, 'large')),
+        ]
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.download_to_filename',
+            autospec=True, side_effect=self._download)
+
+        with patch as download:
+            summary = transfer_manager.download_many(
+                pairs, slice_size=50, slice_workers=2)
+
+        self.assertEqual(
+            [result.method for result in summary.results],
+            [transfer_manager.SIMPLE, transfer_manager.SLICED])
+        self.assertEqual(summary.bytes_transferred, 110)
+        for blob, filename in pairs:
+            download.assert_any_call(
+                blob, filename, client=client, slice_size=50, max_workers=2)
+
+    def test_download_many_empty(self):
+        from google.cloud.storage import transfer_manager
+
+        summary = transfer_manager.download_many([])
+
+        self.assertEqual(summary.results, [])
+
+    def test_download_many_failure(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage import transfer_manager
+
+        client = _make_client()
+        blob = _make_blob('blob', client)
+        error = NotFound('oops')
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.download_to_filename',
+            autospec=True, side_effect=error)
+
+        with patch:
+            summary = transfer_manager.download_many(
+                [(blob, os.path.join(self.directory, 'file'))])
+
+        result, = summary.results
+        self.assertIs(result.error, error)
+        self.assertIsNone(result.size)
+
+    def test_download_many_to_path(self):
+        from google.cloud.storage import transfer_manager
+
+        client = _make_client()
+        bucket = mock.Mock(spec=['blob'])
+        bucket.blob.side_effect = lambda name: _make_blob(
+            name, client, size=len(name))
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.download_to_filename',
+            autospec=True, side_effect=self._download)
+
+        with patch:
+            summary = transfer_manager.download_many_to_path(
+                bucket, ['a/b/c', 'd'], destination_directory=self.directory,
+                blob_name_prefix='prefix/')
+
+        self.assertEqual(
+            [(result.blob.name, result.filename)
+             for result in summary.results],
+            [('prefix/a/b/c', os.path.join(self.directory, 'a', 'b', 'c')),
+             ('prefix/d', os.path.join(self.directory, 'd'))])
+        self.assertEqual(summary.bytes_transferred, 20)
+
+    def test_download_many_to_path_wo_create_directories(self):
+        from google.cloud.storage import transfer_manager
+
+        bucket = mock.Mock(spec=['blob'])
+        patch = mock.patch(
+            'google.cloud.storage.transfer_manager.download_many')
+
+        with patch as download_many:
+            transfer_manager.download_many_to_path(
+                bucket, ['a/b'], destination_directory=self.directory,
+                create_directories=False)
+
+        download_many.assert_called_once()
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'a')))
+
+    def test_download_many_to_path_outside_directory(self):
+        from google.cloud.storage import transfer_manager
+
+        bucket = mock.Mock(spec=['blob'])
+        download = mock.patch(
+            'google.cloud.storage.transfer_manager.download_many')
+
+        for blob_name in ('../x', 'a/../../x', 'a/b/../../..', '..'):
+            with download as download_many:
+                with self.assertRaises(ValueError):
+                    transfer_manager.download_many_to_path(
+                        bucket, ['ok/blob', blob_name],
+                        destination_directory=self.directory)
+
+            download_many.assert_not_called()
+        bucket.blob.assert_not_called()
+        # No directory was created for the names before the bad one.
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'ok')))
+
+    def test_download_many_to_path_w_leading_slash(self):
+        from google.cloud.storage import transfer_manager
+
+        bucket = mock.Mock(spec=['blob'])
+        patch = mock.patch(
+            'google.cloud.storage.transfer_manager.download_many')
+
+        with patch as download_many:
+            transfer_manager.download_many_to_path(
+                bucket, ['/etc/x'], destination_directory=self.directory)
+
+        (pairs,), _ = download_many.call_args
+        self.assertEqual(
+            [filename for _, filename in pairs],
+            [os.path.join(self.directory, 'etc', 'x')])
+
+
+class TestRewriteCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'checkpoint.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.transfer_manager import RewriteCheckpoint
+
+        return RewriteCheckpoint
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_update_and_reload(self):
+        source = _make_blob('source')
+        destination = _make_blob('destination')
+        checkpoint = self._make_one(self.filename)
+        self.assertIsNone(checkpoint.get(source, destination))
+
+        checkpoint.update(source, destination, 'TOKEN', 10, 30)
+        checkpoint.update(source, destination, 'NEXT', 20, 30)
+
+        reloaded = self._make_one(self.filename)
+        self.assertEqual(reloaded.get(source, destination), {
+            'rewriteToken': 'NEXT',
+            'totalBytesRewritten': 20,
+            'objectSize': 30,
+        })
+        self.assertIsNone(reloaded.get(destination, source))
+        self.assertEqual(os.listdir(self.directory), ['checkpoint.json'])
+
+    def _read_lines(self):
+        with open(self.filename) as file_obj:
+            return [json.loads(line) for line in file_obj]
+
+    def test_update_appends(self):
+        source = _make_blob('source')
+        destination = _make_blob('destination')
+        checkpoint = self._make_one(self.filename)
+
+        checkpoint.update(source, destination, 'TOKEN', 10, 30)
+        checkpoint.update(source, destination, None, 30, 30)
+
+        key = ['name', 'source', 'name', 'destination']
+        self.assertEqual(self._read_lines(), [
+            {'key': key, 'rewriteToken': 'TOKEN',
+             'totalBytesRewritten': 10, 'objectSize': 30},
+            {'key': key, 'rewriteToken': None,
+             'totalBytesRewritten': 30, 'objectSize': 30},
+        ])
+
+        # Loading compacts the file to the last line of each rewrite.
+        self._make_one(self.filename)
+        self.assertEqual(self._read_lines(), [
+            {'key': key, 'rewriteToken': None,
+             'totalBytesRewritten': 30, 'objectSize': 30},
+        ])
+
+    def test_load_w_truncated_line(self):
+        source = _make_blob('source')
+        destination = _make_blob('destination')
+        checkpoint = self._make_one(self.filename)
+        checkpoint.update(source, destination, 'TOKEN', 10, 30)
+        with open(self.filename, 'a') as file_obj:
+            file_obj.write('{"key": ["name", "sou')
+
+        reloaded = self._make_one(self.filename)
+
+        self.assertEqual(
+            reloaded.get(source, destination)['rewriteToken'], 'TOKEN')
+        self.assertEqual(len(self._read_lines()), 1)
+
+    def test_load_wo_os_replace(self):
+        from google.cloud.storage import transfer_manager
+
+        source = _make_blob('source')
+        destination = _make_blob('destination')
+        self._make_one(self.filename).update(
+            source, destination, 'TOKEN', 10, 30)
+        # Python 2 has no os.replace.
+        fake_os = mock.Mock(
+            spec=['path', 'remove', 'rename'],
+            path=os.path, remove=os.remove, rename=os.rename)
+
+        with mock.patch.object(transfer_manager, 'os', new=fake_os):
+            reloaded = self._make_one(self.filename)
+
+        self.assertEqual(
+            reloaded.get(source, destination)['rewriteToken'], 'TOKEN')
+        self.assertEqual(os.listdir(self.directory), ['checkpoint.json'])
+
+
+class Test_rewrite_many(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import rewrite_many
+
+        return rewrite_many(*args, **kwargs)
+
+    def test_success(self):
+        from google.cloud.storage import transfer_manager
+
+        client = _make_client()
+        pairs = [
+            (_make_blob('source1'), _make_blob('dest1', client)),
+            (_make_blob('source2'), _make_blob('dest2', client)),
+        ]
+        responses = {
+            ('dest1', None): ('T1', 10, 20),
+            ('dest1', 'T1'): (None, 20, 20),
+            ('dest2', None): (None, 5, 5),
+        }
+
+        def rewrite(blob, source, token=None, **kwargs):
+            return responses[(blob.name, token)]
+
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.rewrite', autospec=True,
+            side_effect=rewrite)
+        progress = []
+
+        with patch as mocked:
+            summary = self._call_fut(
+                pairs, max_bytes_per_call=1048576,
+                on_progress=progress.append)
+
+        self.assertEqual(
+            [(result.source, result.blob) for result in summary.results],
+            pairs)
+        self.assertEqual(
+            [result.method for result in summary.results],
+            [transfer_manager.REWRITE, transfer_manager.REWRITE])
+        self.assertEqual(summary.bytes_transferred, 25)
+        self.assertEqual(len(progress), 2)
+        self.assertEqual(mocked.call_count, 3)
+        source, destination = pairs[0]
+        mocked.assert_any_call(
+            destination, source, token='T1', client=client,
+            max_bytes_per_call=1048576)
+
+    def test_w_checkpoint(self):
+        from google.cloud.storage.transfer_manager import RewriteCheckpoint
+
+        client = _make_client()
+        done = (_make_blob('done'), _make_blob('done-dest', client))
+        partial = (_make_blob('partial'), _make_blob('partial-dest', client))
+        checkpoint = RewriteCheckpoint(
+            os.path.join(self.directory, 'checkpoint.json'))
+        checkpoint.update(done[0], done[1], None, 50, 50)
+        checkpoint.update(partial[0], partial[1], 'TOKEN', 30, 100)
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.rewrite', autospec=True,
+            return_value=(None, 100, 100))
+
+        with patch as mocked:
+            summary = self._call_fut([done, partial], checkpoint=checkpoint)
+
+        mocked.assert_called_once_with(
+            partial[1], partial[0], token='TOKEN', client=client,
+            max_bytes_per_call=None)
+        self.assertEqual(
+            [result.size for result in summary.results], [0, 70])
+        self.assertIsNone(
+            checkpoint.get(partial[0], partial[1])['rewriteToken'])
+        reloaded = RewriteCheckpoint(checkpoint.filename)
+        self.assertIsNone(reloaded.get(*done)['rewriteToken'])
+        self.assertIsNone(reloaded.get(*partial)['rewriteToken'])
+
+    def test_w_checkpoint_new_rewrite(self):
+        from google.cloud.storage.transfer_manager import RewriteCheckpoint
+
+        client = _make_client()
+        source, destination = _make_blob('src'), _make_blob('dest', client)
+        checkpoint = RewriteCheckpoint(
+            os.path.join(self.directory, 'checkpoint.json'))
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.rewrite', autospec=True,
+            return_value=(None, 100, 100))
+
+        with patch as mocked:
+            summary = self._call_fut(
+                [(source, destination)], client=client,
+                checkpoint=checkpoint)
+
+        mocked.assert_called_once_with(
+            destination, source, token=None, client=client,
+            max_bytes_per_call=None)
+        self.assertEqual(summary.results[0].size, 100)
+        self.assertEqual(checkpoint.get(source, destination), {
+            'rewriteToken': None,
+            'totalBytesRewritten': 100,
+            'objectSize': 100,
+        })
+
+    def test_w_checkpoint_stale_token(self):
+        from google.cloud.exceptions import BadRequest
+        from google.cloud.storage.transfer_manager import RewriteCheckpoint
+
+        client = _make_client()
+        source, destination = _make_blob('src'), _make_blob('dest', client)
+        checkpoint = RewriteCheckpoint(
+            os.path.join(self.directory, 'checkpoint.json'))
+        checkpoint.update(source, destination, 'STALE', 30, 100)
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.rewrite', autospec=True,
+            side_effect=[BadRequest('invalid token'), (None, 100, 100)])
+
+        with patch as mocked:
+            summary = self._call_fut(
+                [(source, destination)], checkpoint=checkpoint)
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertIsNone(mocked.call_args[1]['token'])
+        result, = summary.results
+        self.assertIsNone(result.error)
+        self.assertEqual(result.size, 100)
+
+    def test_failure(self):
+        from google.cloud.exceptions import BadRequest
+
+        client = _make_client()
+        pairs = [(_make_blob('src'), _make_blob('dest', client))]
+        error = BadRequest('oops')
+        patch = mock.patch(
+            'google.cloud.storage.blob.Blob.rewrite', autospec=True,
+            side_effect=error)
+
+        with patch:
+            summary = self._call_fut(pairs)
+            with self.assertRaises(BadRequest):
+                self._call_fut(pairs, raise_exception=True)
+
+        result, = summary.results
+        self.assertIs(result.error, error)
+        self.assertIsNone(result.size)